@@ -1,68 +1,98 @@
-from .affinda import AffindaApi
-from .ai21labs import Ai21labsApi
-from .alephalpha import AlephAlphaApi
-from .amazon import AmazonApi
-from .anthropic import AnthropicApi
-from .api4ai import Api4aiApi
-from .assembly import AssemblyApi
-from .astria import AstriaApi
-from .base64 import Base64Api
-from .clarifai import ClarifaiApi
-from .cohere import CohereApi
-from .corticalio import CorticalioApi
-from .dataleon import DataleonApi
-from .deepai import DeepAIApi
-from .deepgram import DeepgramApi
-from .deepl import DeeplApi
-from .eagledoc import EagledocApi
-from .elevenlabs import ElevenlabsApi
-from .emvista import EmvistaApi
-from .extracta import ExtractaApi
-from .facepp import FaceppApi
-from .faker import FakerApi
-from .gladia import GladiaApi
-from .google import GoogleApi
-from .hireability import HireabilityApi
-from .klippa import KlippaApi
-from .lovoai import LovoaiApi
-from .meaningcloud import MeaningcloudApi
-from .meta import MetaApi
-from .microsoft import MicrosoftApi
-from .mindee import MindeeApi
-from .mistral import MistralApi
-from .modernmt import ModernmtApi
-from .nyckel import NyckelApi
-from .oneai import OneaiApi
-from .openai import OpenaiApi
-from .originalityai import OriginalityaiApi
-from .perplexityai import PerplexityApi
-from .photoroom import PhotoroomApi
-from .privateai import PrivateaiApi
-from .prowritingaid import ProWritingAidApi
-from .readyredact import ReadyRedactApi
-from .replicate import ReplicateApi
-from .rossum import RossumApi
-from .sapling import SaplingApi
-from .senseloaf import SenseloafApi
-from .sentisight import SentiSightApi
-from .sightengine import SightEngineApi
-from .smartclick import SmartClickApi
-from .speechmatics import SpeechmaticsApi
-from .stabilityai import StabilityAIApi
-from .symbl import SymblApi
-from .tabscanner import TabscannerApi
-from .tenstorrent import TenstorrentApi
-from .vernai import VernaiApi
-from .veryfi import VeryfiApi
-from .voci import VociApi
-from .voxist import VoxistApi
-from .winstonai import WinstonaiApi
-from .writesonic import WritesonicApi
-from .jina import JinaApi
-from .twelvelabs import TwelveLabsApi
-from .clipdrop import ClipdropApi
-from .leonardo import LeonardoApi
-from .xai import XAiApi
-from .ollama import OllamaApi
+"""
+Providers are imported lazily: `from edenai_apis.apis import GoogleApi` only
+imports the google provider (and its SDKs), not every provider of the package.
 
-# THIS NEEDS TO BE DONE AUTOMATICALLY
+To add a new provider, add its package name and its `ProviderInterface` class name
+to `PROVIDERS` (the package name must be the `provider_name` of the class).
+"""
+from importlib import import_module
+from typing import Dict, List, Type
+
+# provider_name -> name of the provider class, exported by `edenai_apis.apis.<provider_name>`
+PROVIDERS: Dict[str, str] = {
+    "affinda": "AffindaApi",
+    "ai21labs": "Ai21labsApi",
+    "alephalpha": "AlephAlphaApi",
+    "amazon": "AmazonApi",
+    "anthropic": "AnthropicApi",
+    "api4ai": "Api4aiApi",
+    "assembly": "AssemblyApi",
+    "astria": "AstriaApi",
+    "base64": "Base64Api",
+    "clarifai": "ClarifaiApi",
+    "clipdrop": "ClipdropApi",
+    "cohere": "CohereApi",
+    "corticalio": "CorticalioApi",
+    "dataleon": "DataleonApi",
+    "deepai": "DeepAIApi",
+    "deepgram": "DeepgramApi",
+    "deepl": "DeeplApi",
+    "eagledoc": "EagledocApi",
+    "elevenlabs": "ElevenlabsApi",
+    "emvista": "EmvistaApi",
+    "extracta": "ExtractaApi",
+    "facepp": "FaceppApi",
+    "faker": "FakerApi",
+    "gladia": "GladiaApi",
+    "google": "GoogleApi",
+    "hireability": "HireabilityApi",
+    "jina": "JinaApi",
+    "klippa": "KlippaApi",
+    "leonardo": "LeonardoApi",
+    "lovoai": "LovoaiApi",
+    "meaningcloud": "MeaningcloudApi",
+    "meta": "MetaApi",
+    "microsoft": "MicrosoftApi",
+    "mindee": "MindeeApi",
+    "mistral": "MistralApi",
+    "modernmt": "ModernmtApi",
+    "nyckel": "NyckelApi",
+    "ollama": "OllamaApi",
+    "oneai": "OneaiApi",
+    "openai": "OpenaiApi",
+    "originalityai": "OriginalityaiApi",
+    "perplexityai": "PerplexityApi",
+    "photoroom": "PhotoroomApi",
+    "privateai": "PrivateaiApi",
+    "prowritingaid": "ProWritingAidApi",
+    "readyredact": "ReadyRedactApi",
+    "replicate": "ReplicateApi",
+    "rossum": "RossumApi",
+    "sapling": "SaplingApi",
+    "senseloaf": "SenseloafApi",
+    "sentisight": "SentiSightApi",
+    "sightengine": "SightEngineApi",
+    "smartclick": "SmartClickApi",
+    "speechmatics": "SpeechmaticsApi",
+    "stabilityai": "StabilityAIApi",
+    "symbl": "SymblApi",
+    "tabscanner": "TabscannerApi",
+    "tenstorrent": "TenstorrentApi",
+    "twelvelabs": "TwelveLabsApi",
+    "vernai": "VernaiApi",
+    "veryfi": "VeryfiApi",
+    "voci": "VociApi",
+    "voxist": "VoxistApi",
+    "winstonai": "WinstonaiApi",
+    "writesonic": "WritesonicApi",
+    "xai": "XAiApi",
+}
+
+_CLASS_NAME_TO_PROVIDER: Dict[str, str] = {
+    class_name: provider_name for provider_name, class_name in PROVIDERS.items()
+}
+
+__all__ = sorted(PROVIDERS.values())
+
+
+def __getattr__(name: str) -> Type:
+    provider_name = _CLASS_NAME_TO_PROVIDER.get(name)
+    if provider_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    provider_class = getattr(import_module(f".{provider_name}", __name__), name)
+    globals()[name] = provider_class  # next lookups won't go through __getattr__
+    return provider_class
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
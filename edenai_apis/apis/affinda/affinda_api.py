@@ -28,6 +28,8 @@ from .standardization import (
 
 class AffindaApi(ProviderInterface, OcrInterface):
     provider_name = "affinda"
+    # calls switch the workspace of the client and read its last response
+    poolable = False
 
     def __init__(self, api_keys: Dict = {}):
         super().__init__()
@@ -8,7 +8,7 @@ from warnings import warn
 import requests
 
 from edenai_apis.utils.exception import ProviderException
-from edenai_apis.utils.http import HTTPMethod
+from edenai_apis.utils.http import HTTPMethod, http_client
 from .document import DocumentState, FileParameter, QueryBuilder, UploadDocumentParams
 from .models import Document, Organization, Workspace, Collection
 
@@ -127,7 +127,7 @@ class Client:
         Returns:
             dict: The response of the request in json format. If status_code is 204, return { 'status_code': 204 }
         """
-        response: requests.Response = requests.request(
+        response: requests.Response = http_client.request(
             method=method.value,
             url=url,
             data=data,
@@ -1,6 +1,5 @@
 from typing import Dict, Any, List, Optional, Union
 import json
-import requests
 import boto3
 from edenai_apis.features import ProviderInterface, TextInterface
 from edenai_apis.features.text import GenerationDataClass, SummarizeDataClass
@@ -15,9 +14,11 @@ from edenai_apis.features.text.spell_check.spell_check_dataclass import (
 )
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.embeddings import batched_embeddings
 from edenai_apis.utils.types import ResponseType
 from edenai_apis.apis.amazon.helpers import handle_amazon_call
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 
 
 class Ai21labsApi(ProviderInterface, TextInterface):
@@ -77,7 +78,7 @@ class Ai21labsApi(ProviderInterface, TextInterface):
         Returns:
             Union[Dict[str, Any], None]: The JSON response from the API, or None if there's an error.
         """
-        response = requests.post(
+        response = http_client.post(
             f"{self.base_url}/{url}", json=payload, headers=self.headers
         )
         try:
@@ -117,8 +118,8 @@ class Ai21labsApi(ProviderInterface, TextInterface):
             standardized_response=standardized_response,
         )
 
-    def text__embeddings(
-        self, texts: List[str], model: Optional[str] = None
+    def __embeddings_request(
+        self, texts: List[str]
     ) -> ResponseType[EmbeddingsDataClass]:
         payload = {"texts": texts}
         original_response = self.__ai21labs_api_request(url="embed", payload=payload)
@@ -133,3 +134,10 @@ class Ai21labsApi(ProviderInterface, TextInterface):
             original_response=original_response,
             standardized_response=standardized_response,
         )
+
+    def text__embeddings(
+        self, texts: List[str], model: Optional[str] = None
+    ) -> ResponseType[EmbeddingsDataClass]:
+        return batched_embeddings(
+            self.provider_name, texts, self.__embeddings_request, model=model
+        )
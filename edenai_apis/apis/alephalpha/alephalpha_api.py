@@ -1,6 +1,5 @@
 from typing import Dict, Sequence, Optional
 
-import requests
 from aleph_alpha_client import (
     Client,
     Prompt,
@@ -22,6 +21,7 @@ from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.types import ResponseType
+from edenai_apis.utils.http import http_client
 
 
 class AlephAlphaApi(ProviderInterface, TextInterface, ImageInterface):
@@ -48,7 +48,7 @@ class AlephAlphaApi(ProviderInterface, TextInterface, ImageInterface):
             "Authorization": f"Bearer {self.api_key}",
         }
         payload = {"model": model, "document": {"text": text}}
-        response = requests.post(url=self.url_summarise, headers=headers, json=payload)
+        response = http_client.post(url=self.url_summarise, headers=headers, json=payload)
         if response.status_code != 200:
             raise ProviderException(response.text, code=response.status_code)
         original_response = response.json()
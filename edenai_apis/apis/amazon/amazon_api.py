@@ -9,6 +9,7 @@ from edenai_apis.apis.amazon.amazon_video_api import AmazonVideoApi
 from edenai_apis.features.provider.provider_interface import ProviderInterface
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.paginated import KEEP_ORIGINAL_RESPONSE
 from .config import clients, storage_clients
 
 
@@ -29,3 +30,4 @@ class AmazonApi(
         )
         self.clients = clients(self.api_settings)
         self.storage_clients = storage_clients(self.api_settings)
+        self.keep_original_response = KEEP_ORIGINAL_RESPONSE
@@ -6,7 +6,6 @@ from io import BufferedReader, BytesIO
 from pathlib import Path
 from typing import Optional
 
-import requests
 from botocore.exceptions import BotoCoreError, ClientError
 
 from edenai_apis.apis.amazon.helpers import (
@@ -43,6 +42,7 @@ from edenai_apis.utils.upload_s3 import (
     s3_client_load,
     upload_file_bytes_to_s3,
 )
+from edenai_apis.utils.http import http_client
 
 from .config import audio_voices_ids, storage_clients
 
@@ -434,7 +434,7 @@ class AmazonAudioApi(AudioInterface):
                 output_uri.split("/")[-1], URL_LONG_PERIOD
             )
             synthesis_task["OutputUri"] = file_url
-            response_file = requests.get(file_url)
+            response_file = http_client.get(file_url)
             print(response_file.content)
             audio_content = BytesIO(response_file.content)
             audio = base64.b64encode(audio_content.read()).decode("utf-8")
@@ -1,6 +1,5 @@
 import json
-from time import sleep
-from typing import List, Sequence, Dict, Union
+from typing import Callable, Dict, Iterator, List, Sequence, Union
 
 from botocore.exceptions import ClientError
 
@@ -23,10 +22,14 @@ from edenai_apis.features.ocr.invoice_parser.invoice_parser_dataclass import (
     InvoiceParserDataClass,
 )
 from edenai_apis.features.ocr.ocr.ocr_dataclass import Bounding_box, OcrDataClass
-from edenai_apis.features.ocr.ocr_async.ocr_async_dataclass import OcrAsyncDataClass
+from edenai_apis.features.ocr.ocr_async.ocr_async_dataclass import (
+    OcrAsyncDataClass,
+    Page as OcrAsyncPage,
+)
 from edenai_apis.features.ocr.ocr_interface import OcrInterface
 from edenai_apis.features.ocr.ocr_tables_async.ocr_tables_async_dataclass import (
     OcrTablesAsyncDataClass,
+    Page as OcrTablesPage,
 )
 from edenai_apis.features.ocr.receipt_parser.receipt_parser_dataclass import (
     ReceiptParserDataClass,
@@ -34,12 +37,13 @@ from edenai_apis.features.ocr.receipt_parser.receipt_parser_dataclass import (
 from edenai_apis.features.ocr.financial_parser.financial_parser_dataclass import (
     FinancialParserDataClass,
 )
-from edenai_apis.utils.async_to_sync import fibonacci_waiting_call
 from edenai_apis.utils.exception import (
     AsyncJobException,
     AsyncJobExceptionReason,
     ProviderException,
 )
+from edenai_apis.utils.paginated import follow_pagination, keep_items
+from edenai_apis.utils.poller import poll
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -47,9 +51,15 @@ from edenai_apis.utils.types import (
     AsyncResponseType,
     ResponseType,
 )
+from .config import (
+    TEXTRACT_DOCUMENT_POLLING_POLICY,
+    TEXTRACT_EXPENSE_POLLING_POLICY,
+)
 from .helpers import (
     amazon_data_extraction_formatter,
     amazon_ocr_async_formatter,
+    amazon_ocr_async_pages,
+    amazon_ocr_tables_pages,
     amazon_ocr_tables_parser,
     amazon_custom_document_parsing_formatter,
     amazon_invoice_parser_formatter,
@@ -60,6 +70,42 @@ from .helpers import (
 
 
 class AmazonOcrApi(OcrInterface):
+    def _textract_job_responses(
+        self, get_job_result: Callable, job_id: str, first_response: dict
+    ) -> Iterator[dict]:
+        """Responses of a succeeded Textract job, following its `NextToken`
+        pagination: a response is fetched only once the previous one was read"""
+
+        def fetch_next(next_token: str) -> dict:
+            response = handle_amazon_call(
+                get_job_result, JobId=job_id, NextToken=next_token
+            )
+            if response["JobStatus"] == "FAILED":
+                error: str = response.get(
+                    "StatusMessage", "Amazon returned a job status: FAILED"
+                )
+                raise ProviderException(error)
+            return response
+
+        return follow_pagination(first_response, fetch_next)
+
+    def _succeeded_textract_job_responses(
+        self, get_job_result: Callable, job_id: str
+    ) -> Iterator[dict]:
+        """Responses of a Textract job, raises if the job did not succeed yet"""
+        response = handle_amazon_call(get_job_result, JobId=job_id)
+        if response["JobStatus"] == "FAILED":
+            error: str = response.get(
+                "StatusMessage", "Amazon returned a job status: FAILED"
+            )
+            raise ProviderException(error)
+        if response["JobStatus"] != "SUCCEEDED":
+            raise ProviderException(
+                f"Amazon job {job_id} is not finished yet "
+                f"(status: {response['JobStatus']})"
+            )
+        return self._textract_job_responses(get_job_result, job_id, response)
+
     def ocr__ocr(
         self,
         file: str,
@@ -251,33 +297,30 @@ class AmazonOcrApi(OcrInterface):
             )
             raise ProviderException(error)
 
-        pagination_token = response.get("NextToken")
-        pages = [response]
-        if not pagination_token:
-            return AsyncResponseType[OcrTablesAsyncDataClass](
-                original_response=pages,
-                standardized_response=amazon_ocr_tables_parser(pages),
-                provider_job_id=job_id,
-            )
-
-        finished = False
-        while not finished:
-            response = self.clients["textract"].get_document_analysis(
-                JobId=job_id,
-                NextToken=pagination_token,
-            )
-            pages.append(response)
-            if "NextToken" in response:
-                pagination_token = response["NextToken"]
-            else:
-                finished = True
-
+        original_response = [] if self.keep_original_response else None
+        responses = self._textract_job_responses(
+            self.clients["textract"].get_document_analysis, job_id, response
+        )
+        standardized_response = amazon_ocr_tables_parser(
+            keep_items(responses, original_response)
+        )
         return AsyncResponseType[OcrTablesAsyncDataClass](
-            original_response=pages,
-            standardized_response=amazon_ocr_tables_parser(pages),
+            original_response=original_response,
+            standardized_response=standardized_response,
             provider_job_id=job_id,
         )
 
+    def ocr__ocr_tables_async__get_job_pages(
+        self, job_id: str
+    ) -> Iterator[OcrTablesPage]:
+        """Standardized pages of a succeeded job, each one is parsed as soon as its
+        blocks are fetched"""
+        return amazon_ocr_tables_pages(
+            self._succeeded_textract_job_responses(
+                self.clients["textract"].get_document_analysis, job_id
+            )
+        )
+
     def ocr__custom_document_parsing_async__launch_job(
         self, file: str, queries: List[Dict[str, Union[str, str]]], file_url: str = ""
     ) -> AsyncLaunchJobResponseType:
@@ -336,30 +379,16 @@ class AmazonOcrApi(OcrInterface):
             )
             raise ProviderException(error)
 
-        pagination_token = response.get("NextToken")
-        pages = [response]
-        if not pagination_token:
-            return AsyncResponseType[CustomDocumentParsingAsyncDataClass](
-                original_response=pages,
-                standardized_response=amazon_custom_document_parsing_formatter(pages),
-                provider_job_id=provider_job_id,
-            )
-
-        finished = False
-        while not finished:
-            response = self.clients["textract"].get_document_analysis(
-                JobId=provider_job_id,
-                NextToken=pagination_token,
-            )
-            pages.append(response)
-            if "NextToken" in response:
-                pagination_token = response["NextToken"]
-            else:
-                finished = True
-
+        original_response = [] if self.keep_original_response else None
+        responses = self._textract_job_responses(
+            self.clients["textract"].get_document_analysis, provider_job_id, response
+        )
+        standardized_response = amazon_custom_document_parsing_formatter(
+            keep_items(responses, original_response)
+        )
         return AsyncResponseType[CustomDocumentParsingAsyncDataClass](
-            original_response=pages,
-            standardized_response=amazon_custom_document_parsing_formatter(pages),
+            original_response=original_response,
+            standardized_response=standardized_response,
             provider_job_id=provider_job_id,
         )
 
@@ -385,7 +414,14 @@ class AmazonOcrApi(OcrInterface):
 
         # Get job result
         job_id = launch_job_response.get("JobId")
-        get_response = self.clients["textract"].get_expense_analysis(JobId=job_id)
+        get_response = poll(
+            lambda: handle_amazon_call(
+                self.clients["textract"].get_expense_analysis, JobId=job_id
+            ),
+            is_done=lambda response: response["JobStatus"] != "IN_PROGRESS",
+            policy=TEXTRACT_EXPENSE_POLLING_POLICY,
+            provider_name=self.provider_name,
+        )
 
         if get_response["JobStatus"] == "FAILED":
             error: str = get_response.get(
@@ -393,15 +429,6 @@ class AmazonOcrApi(OcrInterface):
             )
             raise ProviderException(error)
 
-        waiting_args = {"JobId": job_id}
-        get_response = fibonacci_waiting_call(
-            max_time=60,
-            status="SUCCEEDED",
-            func=self.clients["textract"].get_expense_analysis,
-            provider_handel_call=handle_amazon_call,
-            **waiting_args,
-        )  # waiting exponentially using fibonacci
-
         # Check if NextToken exist
         pagination_token = get_response.get("NextToken")
         pages = [get_response]
@@ -450,7 +477,14 @@ class AmazonOcrApi(OcrInterface):
 
         # Get job result
         job_id = launch_job_response.get("JobId")
-        get_response = self.clients["textract"].get_expense_analysis(JobId=job_id)
+        get_response = poll(
+            lambda: handle_amazon_call(
+                self.clients["textract"].get_expense_analysis, JobId=job_id
+            ),
+            is_done=lambda response: response["JobStatus"] != "IN_PROGRESS",
+            policy=TEXTRACT_EXPENSE_POLLING_POLICY,
+            provider_name=self.provider_name,
+        )
 
         if get_response["JobStatus"] == "FAILED":
             error: str = get_response.get(
@@ -458,15 +492,6 @@ class AmazonOcrApi(OcrInterface):
             )
             raise ProviderException(error)
 
-        waiting_args = {"JobId": job_id}
-        get_response = fibonacci_waiting_call(
-            max_time=60,
-            status="SUCCEEDED",
-            func=self.clients["textract"].get_expense_analysis,
-            provider_handel_call=handle_amazon_call,
-            **waiting_args,
-        )
-
         # Check if NextToken exist
         pagination_token = get_response.get("NextToken")
         pages = [get_response]
@@ -529,35 +554,34 @@ class AmazonOcrApi(OcrInterface):
             raise ProviderException(error)
 
         if response["JobStatus"] == "SUCCEEDED":
-            pagination_token = response.get("NextToken")
-            responses = [response]
-
-            while pagination_token:
-                payload = {
-                    "JobId": provider_job_id,
-                    "NextToken": pagination_token,
-                }
-                response = handle_amazon_call(
-                    self.clients["textract"].get_document_text_detection, **payload
-                )
-
-                if response["JobStatus"] == "FAILED":
-                    error: str = response.get(
-                        "StatusMessage", "Amazon returned a job status: FAILED"
-                    )
-                    raise ProviderException(error)
-
-                responses.append(response)
-                pagination_token = response.get("NextToken")
-
+            original_response = [] if self.keep_original_response else None
+            responses = self._textract_job_responses(
+                self.clients["textract"].get_document_text_detection,
+                provider_job_id,
+                response,
+            )
+            standardized_response = amazon_ocr_async_formatter(
+                keep_items(responses, original_response)
+            )
             return AsyncResponseType(
-                original_response=responses,
-                standardized_response=amazon_ocr_async_formatter(responses),
+                original_response=original_response,
+                standardized_response=standardized_response,
                 provider_job_id=provider_job_id,
             )
 
         return AsyncPendingResponseType(provider_job_id=response["JobStatus"])
 
+    def ocr__ocr_async__get_job_pages(
+        self, provider_job_id: str
+    ) -> Iterator[OcrAsyncPage]:
+        """Standardized pages of a succeeded job, each one is parsed as soon as its
+        blocks are fetched"""
+        return amazon_ocr_async_pages(
+            self._succeeded_textract_job_responses(
+                self.clients["textract"].get_document_text_detection, provider_job_id
+            )
+        )
+
     def ocr__data_extraction(
         self, file: str, file_url: str = ""
     ) -> ResponseType[DataExtractionDataClass]:
@@ -581,14 +605,14 @@ class AmazonOcrApi(OcrInterface):
                 self.clients["textract"].start_document_analysis, **payload
             )
 
-            waiting_args = {"JobId": launch_job_response["JobId"]}
-            response = fibonacci_waiting_call(
-                max_time=100,
-                status="IN_PROGRESS",
-                func=self.clients["textract"].get_document_analysis,
-                provider_handel_call=handle_amazon_call,
-                status_positif=False,
-                **waiting_args,
+            job_id = launch_job_response["JobId"]
+            response = poll(
+                lambda: handle_amazon_call(
+                    self.clients["textract"].get_document_analysis, JobId=job_id
+                ),
+                is_done=lambda response: response["JobStatus"] != "IN_PROGRESS",
+                policy=TEXTRACT_DOCUMENT_POLLING_POLICY,
+                provider_name=self.provider_name,
             )
 
             if response["JobStatus"] == "FAILED":
@@ -649,7 +673,14 @@ class AmazonOcrApi(OcrInterface):
 
         # Get job result
         job_id = launch_job_response.get("JobId")
-        get_response = self.clients["textract"].get_expense_analysis(JobId=job_id)
+        get_response = poll(
+            lambda: handle_amazon_call(
+                self.clients["textract"].get_expense_analysis, JobId=job_id
+            ),
+            is_done=lambda response: response["JobStatus"] != "IN_PROGRESS",
+            policy=TEXTRACT_EXPENSE_POLLING_POLICY,
+            provider_name=self.provider_name,
+        )
 
         if get_response["JobStatus"] == "FAILED":
             error: str = get_response.get(
@@ -657,15 +688,6 @@ class AmazonOcrApi(OcrInterface):
             )
             raise ProviderException(error)
 
-        waiting_args = {"JobId": job_id}
-        get_response = fibonacci_waiting_call(
-            max_time=60,
-            status="SUCCEEDED",
-            func=self.clients["textract"].get_expense_analysis,
-            provider_handel_call=handle_amazon_call,
-            **waiting_args,
-        )  # waiting exponentially using fibonacci
-
         # Check if NextToken exist
         pagination_token = get_response.get("NextToken")
         pages = [get_response]
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Callable, Optional
 import base64
 from io import BytesIO
 
@@ -24,6 +24,7 @@ from edenai_apis.features.video.video_interface import VideoInterface
 from edenai_apis.utils.exception import (
     ProviderException,
 )
+from edenai_apis.utils.paginated import follow_pagination, keep_items
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -47,6 +48,42 @@ from edenai_apis.utils.upload_s3 import (
 
 
 class AmazonVideoApi(VideoInterface):
+    def _video_job_result(
+        self, get_job_result: Callable, provider_job_id: str, parser: Callable
+    ) -> AsyncBaseResponseType:
+        """Result of a Rekognition video job, each `NextToken` page is fetched once
+        the previous one was parsed"""
+        payload = {"JobId": provider_job_id}
+        response = handle_amazon_call(get_job_result, **payload)
+        if response["JobStatus"] == "FAILED":
+            error: str = response.get(
+                "StatusMessage", "Amazon returned a job status: FAILED"
+            )
+            raise ProviderException(error)
+
+        if response["JobStatus"] != "SUCCEEDED":
+            return AsyncPendingResponseType(provider_job_id=response["JobStatus"])
+
+        def fetch_next(next_token: str) -> dict:
+            response = handle_amazon_call(
+                get_job_result, JobId=provider_job_id, NextToken=next_token
+            )
+            if response["JobStatus"] == "FAILED":
+                error: str = response.get(
+                    "StatusMessage", "Amazon returned a job status: FAILED"
+                )
+                raise ProviderException(error)
+            return response
+
+        original_response = [] if self.keep_original_response else None
+        responses = follow_pagination(response, fetch_next)
+        standardized_response = parser(keep_items(responses, original_response))
+        return AsyncResponseType(
+            original_response=original_response,
+            standardized_response=standardized_response,
+            provider_job_id=provider_job_id,
+        )
+
     # Launch job label detection
     def video__label_detection_async__launch_job(
         self, file: str, file_url: str = ""
@@ -155,233 +192,51 @@ class AmazonVideoApi(VideoInterface):
     def video__label_detection_async__get_job_result(
         self, provider_job_id: str
     ) -> AsyncBaseResponseType[LabelDetectionAsyncDataClass]:
-        payload = {"JobId": provider_job_id}
-        response = handle_amazon_call(
-            self.clients["video"].get_label_detection, **payload
+        return self._video_job_result(
+            self.clients["video"].get_label_detection,
+            provider_job_id,
+            amazon_video_labels_parser,
         )
-        if response["JobStatus"] == "FAILED":
-            error: str = response.get(
-                "StatusMessage", "Amazon returned a job status: FAILED"
-            )
-            raise ProviderException(error)
-
-        if response["JobStatus"] == "SUCCEEDED":
-            pagination_token = response.get("NextToken")
-            responses = [response]
-            while pagination_token:
-                payload = {
-                    "JobId": provider_job_id,
-                    "NextToken": pagination_token,
-                }
-                response = handle_amazon_call(
-                    self.clients["video"].get_label_detection, **payload
-                )
-
-                if response["JobStatus"] == "FAILED":
-                    error: str = response.get(
-                        "StatusMessage", "Amazon returned a job status: FAILED"
-                    )
-                    raise ProviderException(error)
-
-                responses.append(response)
-                pagination_token = response.get("NextToken")
-
-            labels = []
-            for response in responses:
-                labels.extend(amazon_video_labels_parser(response))
-
-            return AsyncResponseType(
-                original_response=responses,
-                standardized_response=LabelDetectionAsyncDataClass(labels=labels),
-                provider_job_id=provider_job_id,
-            )
-        return AsyncPendingResponseType(provider_job_id=response["JobStatus"])
 
     # Get job result for text detection
     def video__text_detection_async__get_job_result(
         self, provider_job_id: str
     ) -> TextDetectionAsyncDataClass:
-        payload = {"JobId": provider_job_id}
-        response = handle_amazon_call(
-            self.clients["video"].get_text_detection, **payload
+        return self._video_job_result(
+            self.clients["video"].get_text_detection,
+            provider_job_id,
+            amazon_video_text_parser,
         )
-        if response["JobStatus"] == "FAILED":
-            error: str = response.get(
-                "StatusMessage", "Amazon returned a job status: FAILED"
-            )
-            raise ProviderException(error)
-
-        if response["JobStatus"] == "SUCCEEDED":
-            pagination_token = response.get("NextToken")
-            responses = [response]
-            while pagination_token:
-                payload = {
-                    "JobId": provider_job_id,
-                    "NextToken": pagination_token,
-                }
-                response = handle_amazon_call(
-                    self.clients["video"].get_text_detection, **payload
-                )
-
-                if response["JobStatus"] == "FAILED":
-                    error: str = response.get(
-                        "StatusMessage", "Amazon returned a job status: FAILED"
-                    )
-                    raise ProviderException(error)
-
-                responses.append(response)
-                pagination_token = response.get("NextToken")
-
-            texts = []
-            for response in responses:
-                texts.extend(amazon_video_text_parser(response))
-
-            return AsyncResponseType(
-                original_response=responses,
-                standardized_response=TextDetectionAsyncDataClass(texts=texts),
-                provider_job_id=provider_job_id,
-            )
-        return AsyncPendingResponseType(provider_job_id=response["JobStatus"])
 
     # Get job result for face detection
     def video__face_detection_async__get_job_result(
         self, provider_job_id: str
     ) -> FaceDetectionAsyncDataClass:
-        payload = {"JobId": provider_job_id}
-        response = handle_amazon_call(
-            self.clients["video"].get_face_detection, **payload
+        return self._video_job_result(
+            self.clients["video"].get_face_detection,
+            provider_job_id,
+            amazon_video_face_parser,
         )
-        if response["JobStatus"] == "FAILED":
-            error: str = response.get(
-                "StatusMessage", "Amazon returned a job status: FAILED"
-            )
-            raise ProviderException(error)
-
-        if response["JobStatus"] == "SUCCEEDED":
-            pagination_token = response.get("NextToken")
-            responses = [response]
-            while pagination_token:
-                payload = {
-                    "JobId": provider_job_id,
-                    "NextToken": pagination_token,
-                }
-                response = handle_amazon_call(
-                    self.clients["video"].get_face_detection, **payload
-                )
-
-                if response["JobStatus"] == "FAILED":
-                    error: str = response.get(
-                        "StatusMessage", "Amazon returned a job status: FAILED"
-                    )
-                    raise ProviderException(error)
-
-                responses.append(response)
-                pagination_token = response.get("NextToken")
-
-            faces = []
-            for response in responses:
-                faces.extend(amazon_video_face_parser(response))
-
-            return AsyncResponseType(
-                original_response=responses,
-                standardized_response=FaceDetectionAsyncDataClass(faces=faces),
-                provider_job_id=provider_job_id,
-            )
-        return AsyncPendingResponseType(provider_job_id=response["JobStatus"])
 
     # Get job result for person tracking
     def video__person_tracking_async__get_job_result(
         self, provider_job_id: str
     ) -> PersonTrackingAsyncDataClass:
-        payload = {"JobId": provider_job_id}
-        response = handle_amazon_call(
-            self.clients["video"].get_person_tracking, **payload
+        return self._video_job_result(
+            self.clients["video"].get_person_tracking,
+            provider_job_id,
+            amazon_video_person_tracking_parser,
         )
-        if response["JobStatus"] == "FAILED":
-            error: str = response.get(
-                "StatusMessage", "Amazon returned a job status: FAILED"
-            )
-            raise ProviderException(error)
-
-        if response["JobStatus"] == "SUCCEEDED":
-            pagination_token = response.get("NextToken")
-            responses = [response]
-            while pagination_token:
-                payload = {
-                    "JobId": provider_job_id,
-                    "NextToken": pagination_token,
-                }
-                response = handle_amazon_call(
-                    self.clients["video"].get_person_tracking, **payload
-                )
-
-                if response["JobStatus"] == "FAILED":
-                    error: str = response.get(
-                        "StatusMessage", "Amazon returned a job status: FAILED"
-                    )
-                    raise ProviderException(error)
-
-                responses.append(response)
-                pagination_token = response.get("NextToken")
-
-            persons = []
-            for response in responses:
-                persons.extend(amazon_video_person_tracking_parser(response))
-
-            return AsyncResponseType(
-                original_response=responses,
-                standardized_response=PersonTrackingAsyncDataClass(persons=persons),
-                provider_job_id=provider_job_id,
-            )
-        return AsyncPendingResponseType(provider_job_id=response["JobStatus"])
 
     # Get job result for explicit content detection
     def video__explicit_content_detection_async__get_job_result(
         self, provider_job_id: str
     ) -> ExplicitContentDetectionAsyncDataClass:
-        payload = {"JobId": provider_job_id}
-        response = handle_amazon_call(
-            self.clients["video"].get_content_moderation, **payload
+        return self._video_job_result(
+            self.clients["video"].get_content_moderation,
+            provider_job_id,
+            amazon_video_explicit_parser,
         )
-        if response["JobStatus"] == "FAILED":
-            error: str = response.get(
-                "StatusMessage", "Amazon returned a job status: FAILED"
-            )
-            raise ProviderException(error)
-
-        if response["JobStatus"] == "SUCCEEDED":
-            pagination_token = response.get("NextToken")
-            responses = [response]
-            while pagination_token:
-                payload = {
-                    "JobId": provider_job_id,
-                    "NextToken": pagination_token,
-                }
-                response = handle_amazon_call(
-                    self.clients["video"].get_content_moderation, **payload
-                )
-
-                if response["JobStatus"] == "FAILED":
-                    error: str = response.get(
-                        "StatusMessage", "Amazon returned a job status: FAILED"
-                    )
-                    raise ProviderException(error)
-
-                responses.append(response)
-                pagination_token = response.get("NextToken")
-
-            moderated_content = []
-            for response in responses:
-                moderated_content.extend(amazon_video_explicit_parser(response))
-
-            return AsyncResponseType(
-                original_response=responses,
-                standardized_response=ExplicitContentDetectionAsyncDataClass(
-                    moderation=moderated_content
-                ),
-                provider_job_id=provider_job_id,
-            )
-        return AsyncPendingResponseType(provider_job_id=response["JobStatus"])
 
     # Get job result for generation
     def video__generation_async__get_job_result(
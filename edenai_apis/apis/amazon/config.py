@@ -2,6 +2,16 @@ from typing import Dict
 
 import boto3
 
+from edenai_apis.utils.poller import PollingPolicy
+
+# Textract Get* operations are limited to a few transactions per second
+TEXTRACT_EXPENSE_POLLING_POLICY = PollingPolicy(
+    initial_delay=1, max_delay=10, timeout=60, min_interval=0.2
+)
+TEXTRACT_DOCUMENT_POLLING_POLICY = PollingPolicy(
+    initial_delay=1, max_delay=10, timeout=100, min_interval=0.2
+)
+
 
 def clients(api_settings: Dict) -> Dict:
     return {
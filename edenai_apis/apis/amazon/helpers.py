@@ -1,11 +1,19 @@
 import urllib
 from pathlib import Path
-from time import time
-from typing import Callable, Dict, List, Optional, Tuple, TypeVar, Sequence
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
-import requests
 from botocore.exceptions import ClientError, ParamValidationError
-from trp import Document
+from trp import Table as TextractTable
 
 from edenai_apis.features.ocr.custom_document_parsing_async.custom_document_parsing_async_dataclass import (
     CustomDocumentParsingAsyncBoundingBox,
@@ -63,32 +71,19 @@ from edenai_apis.features.ocr.financial_parser.financial_parser_dataclass import
     FinancialPaymentInformation,
 )
 from edenai_apis.features.video.explicit_content_detection_async.explicit_content_detection_async_dataclass import (
-    ContentNSFW,
+    ExplicitContentDetectionAsyncDataClass,
 )
 from edenai_apis.features.video.face_detection_async.face_detection_async_dataclass import (
-    FaceAttributes,
-    LandmarksVideo,
-    VideoBoundingBox,
-    VideoFace,
-    VideoFacePoses,
+    FaceDetectionAsyncDataClass,
 )
 from edenai_apis.features.video.label_detection_async.label_detection_async_dataclass import (
-    VideoLabel,
-    VideoLabelBoundingBox,
-    VideoLabelTimeStamp,
+    LabelDetectionAsyncDataClass,
 )
 from edenai_apis.features.video.person_tracking_async.person_tracking_async_dataclass import (
-    PersonLandmarks,
-    PersonTracking,
-    VideoPersonPoses,
-    VideoPersonQuality,
-    VideoTrackingBoundingBox,
-    VideoTrackingPerson,
+    PersonTrackingAsyncDataClass,
 )
 from edenai_apis.features.video.text_detection_async.text_detection_async_dataclass import (
-    VideoText,
-    VideoTextBoundingBox,
-    VideoTextFrames,
+    TextDetectionAsyncDataClass,
 )
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
@@ -103,6 +98,8 @@ from edenai_apis.utils.ssml import convert_audio_attr_in_prosody_tag
 from edenai_apis.utils.types import (
     ResponseType,
 )
+from edenai_apis.utils.http import http_client
+from edenai_apis.utils.upload_s3 import upload_to_s3_bucket
 from .config import storage_clients
 
 
@@ -121,7 +118,7 @@ def check_webhook_result(job_id: str, api_settings: dict) -> Dict:
         f"https://webhook.site/token/{webhook_token}/requests"
         + f"?sorting=newest&query={urllib.parse.quote_plus('content:'+str(job_id))}"
     )
-    webhook_response = requests.get(url=webhook_get_url, headers={"Api-Key": api_key})
+    webhook_response = http_client.get(url=webhook_get_url, headers={"Api-Key": api_key})
     response_status = webhook_response.status_code
     try:
         return webhook_response.json().get("data"), response_status
@@ -129,14 +126,54 @@ def check_webhook_result(job_id: str, api_settings: dict) -> Dict:
         return None, response_status
 
 
+def textract_page_blocks(responses: Iterable[dict]) -> Iterator[List[dict]]:
+    """Blocks of (paginated) Textract responses, grouped by document page
+
+    Textract returns the blocks page after page: a `PAGE` block followed by the
+    blocks of this page, possibly split over several responses. A page is yielded
+    as soon as the next `PAGE` block is read, so responses can be fetched lazily
+    and only the blocks of one page are kept at a time.
+
+    Args:
+        responses (Iterable[dict]): Textract responses (or a single one)
+
+    Returns:
+        Iterator[List[dict]]: blocks of each page, starting with its `PAGE` block
+    """
+    if isinstance(responses, dict):
+        responses = [responses]
+    page_blocks: List[dict] = []
+    for response in responses:
+        for block in response.get("Blocks", []) or []:
+            if block["BlockType"] == "PAGE":
+                if page_blocks:
+                    yield page_blocks
+                page_blocks = [block]
+            elif page_blocks:
+                page_blocks.append(block)
+    if page_blocks:
+        yield page_blocks
+
+
 def amazon_ocr_tables_parser(original_result) -> OcrTablesAsyncDataClass:
-    document = Document(original_result)
-    std_pages = [_ocr_tables_standarize_page(page) for page in document.pages]
+    std_pages = list(amazon_ocr_tables_pages(original_result))
     return OcrTablesAsyncDataClass(pages=std_pages, num_pages=len(std_pages))
 
 
-def _ocr_tables_standarize_page(page) -> OcrTablesPage:
-    std_tables = [_ocr_tables_standarize_table(table) for table in page.tables]
+def amazon_ocr_tables_pages(responses: Iterable[dict]) -> Iterator[OcrTablesPage]:
+    """Standardized pages of Textract tables analysis responses, parsed one page
+    at a time"""
+    for page_blocks in textract_page_blocks(responses):
+        yield _ocr_tables_standarize_page(page_blocks)
+
+
+def _ocr_tables_standarize_page(page_blocks: List[dict]) -> OcrTablesPage:
+    blocks = {block["Id"]: block for block in page_blocks}
+    std_tables = [
+        _ocr_tables_standarize_table(TextractTable(block, blocks))
+        for block in page_blocks
+        if block["BlockType"] == "TABLE"
+    ]
     return OcrTablesPage(tables=std_tables)
 
 
@@ -194,15 +231,15 @@ def _upload_video_file_to_amazon_server(file: str, file_name: str, api_settings:
     :param video:       String that contains the video file path
     :return:            String that contains the filename on the server
     """
-    # Store file in an Amazon server
+    # Store file in an Amazon server, once per content
     file_extension = file.split(".")[-1]
-    filename = str(int(time())) + file_name.stem + "_video_." + file_extension
-    storage_clients(api_settings)["video"].meta.client.upload_file(
-        file, api_settings["bucket_video"], filename
+    return upload_to_s3_bucket(
+        storage_clients(api_settings)["video"].meta.client,
+        file,
+        api_settings["bucket_video"],
+        file_name.stem + "_video_." + file_extension,
     )
 
-    return filename
-
 
 def amazon_get_video_data(file: str):
     api_settings = load_provider(ProviderDataEnum.KEY, "amazon")
@@ -243,56 +280,59 @@ def amazon_custom_document_parsing_formatter(
     Take response form amazon by pages
     Return custom document parser dataclass
     """
-    items = []
-    for index, page in enumerate(pages):
-        for block in page["Blocks"]:
-            if block["BlockType"] == "QUERY_RESULT":
-                if block.get("Geometry"):
-                    left = block["Geometry"]["BoundingBox"]["Left"]
-                    top = block["Geometry"]["BoundingBox"]["Top"]
-                    width = block["Geometry"]["BoundingBox"]["Width"]
-                    height = block["Geometry"]["BoundingBox"]["Height"]
-                else:
-                    left, top, width, height = None, None, None, None
-                bounding_box = CustomDocumentParsingAsyncBoundingBox(
-                    left=left,
-                    top=top,
-                    width=width,
-                    height=height,
-                )
-                query = query_answer_result(page["Blocks"], block["Id"])
-                if not query:
-                    continue
-                item = CustomDocumentParsingAsyncItem(
+    items = [
+        item
+        for page_items in amazon_custom_document_parsing_pages(pages)
+        for item in page_items
+    ]
+    return CustomDocumentParsingAsyncDataClass(items=items)
+
+
+def amazon_custom_document_parsing_pages(
+    responses: Iterable[dict],
+) -> Iterator[List[CustomDocumentParsingAsyncItem]]:
+    """Answers to the queries of each page of Textract queries analysis responses,
+    parsed one page at a time"""
+    for index, page_blocks in enumerate(textract_page_blocks(responses)):
+        # text of the query of each answer
+        queries: Dict[str, str] = {}
+        for block in page_blocks:
+            if block["BlockType"] != "QUERY":
+                continue
+            for relationship in block.get("Relationships") or []:
+                for identifier in relationship["Ids"]:
+                    queries.setdefault(identifier, block["Query"]["Text"])
+
+        items = []
+        for block in page_blocks:
+            if block["BlockType"] != "QUERY_RESULT":
+                continue
+            query = queries.get(block["Id"])
+            if not query:
+                continue
+            if block.get("Geometry"):
+                left = block["Geometry"]["BoundingBox"]["Left"]
+                top = block["Geometry"]["BoundingBox"]["Top"]
+                width = block["Geometry"]["BoundingBox"]["Width"]
+                height = block["Geometry"]["BoundingBox"]["Height"]
+            else:
+                left, top, width, height = None, None, None, None
+            bounding_box = CustomDocumentParsingAsyncBoundingBox(
+                left=left,
+                top=top,
+                width=width,
+                height=height,
+            )
+            items.append(
+                CustomDocumentParsingAsyncItem(
                     confidence=block["Confidence"],
                     value=block["Text"],
                     query=query,
                     page=block.get("Page", index + 1),
                     bounding_box=bounding_box,
                 )
-                items.append(item)
-    return CustomDocumentParsingAsyncDataClass(items=items)
-
-
-def query_answer_result(page: List[dict], identifier: str):
-    """
-    Retrieve the text of a query based on its relationship ID.
-
-    Parameters:
-        page (List[dict]): List of blocks, each representing a query or answer.
-        identifier (str): The relationship ID to match against.
-
-    Returns:
-        str: The text of the query with a matching relationship ID. If no match is found, returns None.
-    """
-    queries = [q for q in page if q["BlockType"] == "QUERY"]
-    for query in queries:
-        relationships = query.get("Relationships")
-        if relationships:
-            for relationship in relationships:
-                if identifier in relationship["Ids"]:
-                    return query["Query"]["Text"]
-    return None
+            )
+        yield items
 
 
 def amazon_invoice_parser_formatter(pages: List[dict]) -> InvoiceParserDataClass:
@@ -745,53 +785,59 @@ def amazon_ocr_async_formatter(responses: list) -> OcrAsyncDataClass:
     Returns
         OcrAsyncDataClass: the formatted response
     """
-    blocks: dict = _convert_response_to_blocks_with_id(responses)
+    pages: Sequence[OcrAsyncPage] = list(amazon_ocr_async_pages(responses))
 
-    pages: Sequence[OcrAsyncPage] = []
-    for _, block in blocks.items():
-        if block["BlockType"] != "PAGE":
-            continue
+    text = ""
+    for page in pages:
+        for line in page.lines:
+            text += line.text + "\n"
 
-        lines: Sequence[Line] = []
-        for block_id in block.get("Relationships", [{}])[0].get("Ids", []):
-            if blocks[block_id]["BlockType"] != "LINE":
-                continue
+    return OcrAsyncDataClass(raw_text=text, pages=pages, number_of_pages=len(pages))
 
-            words: Sequence[Word] = []
-            for word_id in blocks[block_id]["Relationships"][0]["Ids"]:
-                if blocks[word_id]["BlockType"] != "WORD":
-                    continue
 
-                word = Word(
-                    text=blocks[word_id]["Text"],
-                    bounding_box=BoundingBox.from_json(
-                        bounding_box=blocks[word_id]["Geometry"]["BoundingBox"],
-                        modifiers=lambda x: x.title(),
-                    ),
-                    confidence=blocks[word_id]["Confidence"],
-                )
-                words.append(word)
+def amazon_ocr_async_pages(responses: Iterable[dict]) -> Iterator[OcrAsyncPage]:
+    """Standardized pages of Textract text detection responses, parsed one page
+    at a time"""
+    for page_blocks in textract_page_blocks(responses):
+        yield _ocr_async_standardize_page(page_blocks)
 
-            line = Line(
-                text=blocks[block_id]["Text"],
-                words=words,
+
+def _ocr_async_standardize_page(page_blocks: List[dict]) -> OcrAsyncPage:
+    blocks = {block["Id"]: block for block in page_blocks}
+    page_block = page_blocks[0]
+
+    lines: Sequence[Line] = []
+    for block_id in page_block.get("Relationships", [{}])[0].get("Ids", []):
+        if blocks[block_id]["BlockType"] != "LINE":
+            continue
+
+        words: Sequence[Word] = []
+        for word_id in blocks[block_id]["Relationships"][0]["Ids"]:
+            if blocks[word_id]["BlockType"] != "WORD":
+                continue
+
+            word = Word(
+                text=blocks[word_id]["Text"],
                 bounding_box=BoundingBox.from_json(
-                    bounding_box=blocks[block_id]["Geometry"]["BoundingBox"],
+                    bounding_box=blocks[word_id]["Geometry"]["BoundingBox"],
                     modifiers=lambda x: x.title(),
                 ),
-                confidence=blocks[block_id]["Confidence"],
+                confidence=blocks[word_id]["Confidence"],
             )
-            lines.append(line)
-
-        page = OcrAsyncPage(lines=lines)
-        pages.append(page)
-
-    text = ""
-    for page in pages:
-        for line in page.lines:
-            text += line.text + "\n"
+            words.append(word)
+
+        line = Line(
+            text=blocks[block_id]["Text"],
+            words=words,
+            bounding_box=BoundingBox.from_json(
+                bounding_box=blocks[block_id]["Geometry"]["BoundingBox"],
+                modifiers=lambda x: x.title(),
+            ),
+            confidence=blocks[block_id]["Confidence"],
+        )
+        lines.append(line)
 
-    return OcrAsyncDataClass(raw_text=text, pages=pages, number_of_pages=len(pages))
+    return OcrAsyncPage(lines=lines)
 
 
 def amazon_data_extraction_formatter(
@@ -867,209 +913,183 @@ def handle_amazon_call(func: Callable, **kwargs):
     return response
 
 
-def amazon_video_person_tracking_parser(response):
-    # gather all persons with the same index :
-    persons_index = {index["Person"]["Index"] for index in response["Persons"]}
-    tracked_persons = []
-    for index in persons_index:
-        detected_persons = [
-            item for item in response["Persons"] if item["Person"]["Index"] == index
-        ]
-        tracked_person = []
-        for detected_person in detected_persons:
-            if detected_person["Person"].get("BoundingBox"):
-                offset = float(detected_person["Timestamp"] / 1000.0)
-                bounding_box = detected_person.get("Person").get("BoundingBox")
-                bounding_box = VideoTrackingBoundingBox(
-                    top=bounding_box.get("Top", 0),
-                    left=bounding_box.get("Left", 0),
-                    height=bounding_box.get("Height", 0),
-                    width=bounding_box.get("Width", 0),
-                )
-                face = detected_person["Person"].get("Face")
-                # Get landmarks
-                poses = VideoPersonPoses.default()
-                landmarks = PersonLandmarks()
-                quality = VideoPersonQuality.default()
-                if face:
-                    landmarks_dict = {}
-                    for land in face.get("Landmarks", []):
-                        landmarks_dict[land["Type"]] = [land["X"], land["Y"]]
-                    landmarks = PersonLandmarks(
-                        eye_left=landmarks_dict.get("eyeLeft", []),
-                        eye_right=landmarks_dict.get("eyeRight", []),
-                        nose=landmarks_dict.get("nose", []),
-                        mouth_left=landmarks_dict.get("mouthLeft", []),
-                        mouth_right=landmarks_dict.get("mouthRight", []),
-                    )
-                    poses = VideoPersonPoses(
-                        roll=face.get("Pose").get("Roll"),
-                        yaw=face.get("Pose").get("Yaw"),
-                        pitch=face.get("Pose").get("Pitch"),
-                    )
-                    quality = VideoPersonQuality(
-                        brightness=face.get("Quality").get("Brightness"),
-                        sharpness=face.get("Quality").get("Sharpness"),
-                    )
+# Video analysis results are parsed page by page (`NextToken` pagination) into
+# plain dicts validated at once by the dataclass of the whole result, as long
+# videos have tens of thousands of detections.
 
-                tracked_person.append(
-                    PersonTracking(
-                        offset=offset,
-                        bounding_box=bounding_box,
-                        landmarks=landmarks,
-                        poses=poses,
-                        quality=quality,
-                    )
-                )
-        if len(tracked_person) > 0:
-            tracked_persons.append(VideoTrackingPerson(tracked=tracked_person))
-    return tracked_persons
 
+def _video_pages(responses: Iterable[dict]) -> Iterable[dict]:
+    if isinstance(responses, dict):
+        return [responses]
+    return responses
 
-def amazon_video_labels_parser(response):
-    labels = []
-    for label in response["Labels"]:
-        # Category
-        parents = []
-        for parent in label["Label"]["Parents"]:
-            if parent["Name"]:
-                parents.append(parent["Name"])
-
-        # bounding boxes
-        boxes = []
-        for instance in label["Label"]["Instances"]:
-            video_box = VideoLabelBoundingBox(
-                top=instance["BoundingBox"].get("Top", 0),
-                left=instance["BoundingBox"].get("Left", 0),
-                width=instance["BoundingBox"].get("Width", 0),
-                height=instance["BoundingBox"].get("Height", 0),
-            )
-            boxes.append(video_box)
-
-        videolabel = VideoLabel(
-            timestamp=[
-                VideoLabelTimeStamp(start=float(label["Timestamp"]) / 1000.0, end=None)
-            ],
-            confidence=label["Label"].get("Confidence", 0) / 100,
-            name=label["Label"]["Name"],
-            category=parents,
-            bounding_box=boxes,
-        )
-        labels.append(videolabel)
-    return labels
+
+def _video_bounding_box(bounding_box: dict) -> Dict[str, float]:
+    return {
+        "top": bounding_box.get("Top", 0),
+        "left": bounding_box.get("Left", 0),
+        "height": bounding_box.get("Height", 0),
+        "width": bounding_box.get("Width", 0),
+    }
 
 
-def amazon_video_text_parser(response):
-    text_video = []
-    # Get unique values of detected text annotation
-    detected_texts = {
-        text["TextDetection"]["DetectedText"] for text in response["TextDetections"]
+def _video_landmarks(face: dict, only_complete: bool = False) -> Dict[str, list]:
+    landmarks = {}
+    for land in face.get("Landmarks", []):
+        if only_complete and not (land.get("Type") and land.get("X") and land.get("Y")):
+            continue
+        landmarks[land["Type"]] = [land["X"], land["Y"]]
+    return {
+        "eye_left": landmarks.get("eyeLeft", []),
+        "eye_right": landmarks.get("eyeRight", []),
+        "nose": landmarks.get("nose", []),
+        "mouth_left": landmarks.get("mouthLeft", []),
+        "mouth_right": landmarks.get("mouthRight", []),
     }
 
-    # For each unique value, get all the frames where it appears
-    for text in detected_texts:
-        annotations = [
-            item
-            for item in response["TextDetections"]
-            if item["TextDetection"]["DetectedText"] == text
-        ]
-        frames = []
-        for annotation in annotations:
-            timestamp = float(annotation["Timestamp"]) / 1000.0
-            confidence = round(annotation["TextDetection"]["Confidence"] / 100, 2)
-            geometry = annotation["TextDetection"]["Geometry"]["BoundingBox"]
-            bounding_box = VideoTextBoundingBox(
-                top=geometry.get("Top", 0),
-                left=geometry.get("Left", 0),
-                width=geometry.get("Width", 0),
-                height=geometry.get("Height", 0),
-            )
-            frame = VideoTextFrames(
-                timestamp=timestamp,
-                confidence=confidence,
-                bounding_box=bounding_box,
+
+def _person_tracking(detected_person: dict) -> dict:
+    person = detected_person["Person"]
+    tracking = {
+        "offset": float(detected_person["Timestamp"] / 1000.0),
+        "bounding_box": _video_bounding_box(person["BoundingBox"]),
+        "poses": {"roll": None, "yaw": None, "pitch": None},
+        "quality": {"brightness": None, "sharpness": None},
+    }
+    face = person.get("Face")
+    if face:
+        pose = face.get("Pose")
+        quality = face.get("Quality")
+        tracking["landmarks"] = _video_landmarks(face)
+        tracking["poses"] = {
+            "roll": pose.get("Roll"),
+            "yaw": pose.get("Yaw"),
+            "pitch": pose.get("Pitch"),
+        }
+        tracking["quality"] = {
+            "brightness": quality.get("Brightness"),
+            "sharpness": quality.get("Sharpness"),
+        }
+    return tracking
+
+
+def amazon_video_person_tracking_parser(
+    responses: Iterable[dict],
+) -> PersonTrackingAsyncDataClass:
+    """Persons tracked in the pages of a person tracking job, grouped by person
+    index in a single pass over the detections"""
+    # tracked positions of each person index
+    persons: Dict[int, List[dict]] = {}
+    for response in _video_pages(responses):
+        for detected_person in response["Persons"]:
+            if not detected_person["Person"].get("BoundingBox"):
+                continue
+            persons.setdefault(detected_person["Person"]["Index"], []).append(
+                _person_tracking(detected_person)
             )
-            frames.append(frame)
+    return PersonTrackingAsyncDataClass(
+        persons=[{"tracked": persons[index]} for index in sorted(persons)]
+    )
 
-        video_text = VideoText(
-            text=text,
-            frames=frames,
-        )
-        text_video.append(video_text)
 
-    return text_video
+def amazon_video_labels_parser(
+    responses: Iterable[dict],
+) -> LabelDetectionAsyncDataClass:
+    labels = []
+    for response in _video_pages(responses):
+        for label in response["Labels"]:
+            labels.append(
+                {
+                    "timestamp": [
+                        {"start": float(label["Timestamp"]) / 1000.0, "end": None}
+                    ],
+                    "confidence": label["Label"].get("Confidence", 0) / 100,
+                    "name": label["Label"]["Name"],
+                    # Category
+                    "category": [
+                        parent["Name"]
+                        for parent in label["Label"]["Parents"]
+                        if parent["Name"]
+                    ],
+                    "bounding_box": [
+                        _video_bounding_box(instance["BoundingBox"])
+                        for instance in label["Label"]["Instances"]
+                    ],
+                }
+            )
+    return LabelDetectionAsyncDataClass(labels=labels)
+
+
+def amazon_video_text_parser(
+    responses: Iterable[dict],
+) -> TextDetectionAsyncDataClass:
+    """Texts detected in the pages of a text detection job, with all the frames
+    each one appears in, grouped in a single pass over the detections"""
+    # frames of each detected text, in order of first appearance
+    texts: Dict[str, List[dict]] = {}
+    for response in _video_pages(responses):
+        for annotation in response["TextDetections"]:
+            detection = annotation["TextDetection"]
+            texts.setdefault(detection["DetectedText"], []).append(
+                {
+                    "timestamp": float(annotation["Timestamp"]) / 1000.0,
+                    "confidence": round(detection["Confidence"] / 100, 2),
+                    "bounding_box": _video_bounding_box(
+                        detection["Geometry"]["BoundingBox"]
+                    ),
+                }
+            )
+    return TextDetectionAsyncDataClass(
+        texts=[{"text": text, "frames": frames} for text, frames in texts.items()]
+    )
 
 
-def amazon_video_face_parser(response):
+def amazon_video_face_parser(responses: Iterable[dict]) -> FaceDetectionAsyncDataClass:
     faces = []
-    for face in response["Faces"]:
-        # Time stamp
-        offset = float(face["Timestamp"]) / 1000.0  # convert to seconds
-
-        # Bounding box
-        bounding_box = VideoBoundingBox(
-            top=face["Face"]["BoundingBox"].get("Top", 0),
-            left=face["Face"]["BoundingBox"].get("Left", 0),
-            height=face["Face"]["BoundingBox"].get("Height", 0),
-            width=face["Face"]["BoundingBox"].get("Width", 0),
-        )
-
-        # Attributes
-        poses = VideoFacePoses(
-            pitch=face["Face"]["Pose"].get("Pitch", 0) / 100,
-            yawn=face["Face"]["Pose"].get("Yaw", 0) / 100,
-            roll=face["Face"]["Pose"].get("Roll", 0) / 100,
-        )
-        attributes_video = FaceAttributes(
-            pose=poses,
-            brightness=face["Face"]["Quality"].get("Brightness", 0) / 100,
-            sharpness=face["Face"]["Quality"].get("Sharpness", 0) / 100,
-            headwear=None,
-            frontal_gaze=None,
-            eyes_visible=None,
-            glasses=None,
-            mouth_open=None,
-            smiling=None,
-        )
-
-        # Landmarks
-        landmarks_output = {}
-        for land in face["Face"]["Landmarks"]:
-            if land.get("Type") and land.get("X") and land.get("Y"):
-                landmarks_output[land["Type"]] = [land["X"], land["Y"]]
-
-        landmarks_video = LandmarksVideo(
-            eye_left=landmarks_output.get("eyeLeft", []),
-            eye_right=landmarks_output.get("eyeRight", []),
-            mouth_left=landmarks_output.get("mouthLeft", []),
-            mouth_right=landmarks_output.get("mouthRight", []),
-            nose=landmarks_output.get("nose", []),
-        )
-        faces.append(
-            VideoFace(
-                offset=offset,
-                attributes=attributes_video,
-                landmarks=landmarks_video,
-                bounding_box=bounding_box,
+    for response in _video_pages(responses):
+        for face in response["Faces"]:
+            pose = face["Face"]["Pose"]
+            quality = face["Face"]["Quality"]
+            faces.append(
+                {
+                    # convert to seconds
+                    "offset": float(face["Timestamp"]) / 1000.0,
+                    "bounding_box": _video_bounding_box(face["Face"]["BoundingBox"]),
+                    "attributes": {
+                        "pose": {
+                            "pitch": pose.get("Pitch", 0) / 100,
+                            "yawn": pose.get("Yaw", 0) / 100,
+                            "roll": pose.get("Roll", 0) / 100,
+                        },
+                        "brightness": quality.get("Brightness", 0) / 100,
+                        "sharpness": quality.get("Sharpness", 0) / 100,
+                        "headwear": None,
+                        "frontal_gaze": None,
+                        "eyes_visible": None,
+                        "glasses": None,
+                        "mouth_open": None,
+                        "smiling": None,
+                    },
+                    "landmarks": _video_landmarks(face["Face"], only_complete=True),
+                }
             )
-        )
-    return faces
+    return FaceDetectionAsyncDataClass(faces=faces)
 
 
-def amazon_video_explicit_parser(response):
+def amazon_video_explicit_parser(
+    responses: Iterable[dict],
+) -> ExplicitContentDetectionAsyncDataClass:
     moderated_content = []
-    for label in response.get("ModerationLabels"):
-        confidence = label.get("ModerationLabel").get("Confidence")
-        timestamp = float(label.get("Timestamp")) / 1000.0  # convert to seconds
-        if label.get("ModerationLabel").get("ParentName"):
-            category = label.get("ModerationLabel").get("ParentName")
-        else:
-            category = label.get("ModerationLabel").get("Name")
-        moderated_content.append(
-            ContentNSFW(
-                timestamp=timestamp,
-                confidence=confidence / 100,
-                category=category,
+    for response in _video_pages(responses):
+        for label in response.get("ModerationLabels"):
+            moderation_label = label.get("ModerationLabel")
+            moderated_content.append(
+                {
+                    # convert to seconds
+                    "timestamp": float(label.get("Timestamp")) / 1000.0,
+                    "confidence": moderation_label.get("Confidence") / 100,
+                    "category": moderation_label.get("ParentName")
+                    or moderation_label.get("Name"),
+                }
             )
-        )
-    return moderated_content
+    return ExplicitContentDetectionAsyncDataClass(moderation=moderated_content)
@@ -3,7 +3,6 @@ from io import BytesIO
 from json import JSONDecodeError
 from typing import Dict, Sequence, Optional, Any
 
-import requests
 
 from edenai_apis.features import ProviderInterface, ImageInterface, OcrInterface
 from edenai_apis.features.image.anonymization.anonymization_dataclass import (
@@ -51,6 +50,7 @@ from edenai_apis.utils.conversion import standardized_confidence_score
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.types import ResponseType
 from edenai_apis.utils.upload_s3 import upload_file_bytes_to_s3, USER_PROCESS
+from edenai_apis.utils.http import http_client
 from .helpers import get_errors_from_response
 from .types import Api4aiBackgroundRemovalParams
 
@@ -97,7 +97,7 @@ class Api4aiApi(
         """
         with open(file, "rb") as file_:
             files = {"image": file_}
-            response = requests.post(self.urls["object_detection"], files=files)
+            response = http_client.post(self.urls["object_detection"], files=files)
             original_response = response.json()
 
         if "failure" in original_response["results"][0]["status"]["code"]:
@@ -138,7 +138,7 @@ class Api4aiApi(
                 "image": file_,
             }
             # Get response
-            response = requests.post(self.urls["face_detection"], files=payload)
+            response = http_client.post(self.urls["face_detection"], files=payload)
             original_response = response.json()
 
         # Handle errors
@@ -199,7 +199,7 @@ class Api4aiApi(
     ) -> ResponseType[AnonymizationDataClass]:
         with open(file, "rb") as file_:
             files = {"image": file_}
-            response = requests.post(self.urls["anonymization"], files=files)
+            response = http_client.post(self.urls["anonymization"], files=files)
 
             original_response = response.json()
 
@@ -246,7 +246,7 @@ class Api4aiApi(
                 "image": file_,
             }
             # Get response
-            response = requests.post(
+            response = http_client.post(
                 self.urls["logo_detection"].format(model=model), files=payload
             )
             if response.status_code >= 400:
@@ -308,7 +308,7 @@ class Api4aiApi(
                 "image": file_,
             }
             # Get response
-            response = requests.post(self.urls["nsfw"], files=payload)
+            response = http_client.post(self.urls["nsfw"], files=payload)
             try:
                 original_response = response.json()
             except JSONDecodeError as exp:
@@ -364,7 +364,7 @@ class Api4aiApi(
         file_url: str = "",
     ) -> ResponseType[OcrDataClass]:
         with open(file, "rb") as file_:
-            response = requests.post(self.urls["ocr"], files={"image": file_})
+            response = http_client.post(self.urls["ocr"], files={"image": file_})
 
         error = get_errors_from_response(response)
         if error is not None:
@@ -410,7 +410,7 @@ class Api4aiApi(
 
         url: str = self.urls["bg_removal"] + f"&mode={api4ai_params.mode}"
         with open(file, "rb") as f:
-            response = requests.post(url, files={"image": f.read()})
+            response = http_client.post(url, files={"image": f.read()})
 
             error = get_errors_from_response(response)
             if error is not None:
@@ -63,6 +63,7 @@ from edenai_apis.utils.types import (
     ResponseType,
 )
 from edenai_apis.utils.upload_s3 import USER_PROCESS, upload_file_bytes_to_s3
+from edenai_apis.utils.http import http_client
 
 
 class SubfeatureParser(Enum):
@@ -113,7 +114,7 @@ class Base64Api(ProviderInterface, OcrInterface):
 
         headers = {"Content-type": "application/json", "Authorization": self.api_key}
 
-        response = requests.post(url=self.url, headers=headers, json=data)
+        response = http_client.post(url=self.url, headers=headers, json=data)
 
         if response.status_code != 200:
             raise ProviderException(response.text, code=response.status_code)
@@ -190,7 +191,7 @@ class Base64Api(ProviderInterface, OcrInterface):
                 "Authorization": self.api_key,
             }
 
-            response = requests.post(url=self.url, headers=headers, data=payload)
+            response = http_client.post(url=self.url, headers=headers, data=payload)
 
         original_response = self._get_response(response)
 
@@ -353,7 +354,7 @@ class Base64Api(ProviderInterface, OcrInterface):
                     }
                 )
 
-        response = requests.request("POST", url, headers=headers, data=payload)
+        response = http_client.request("POST", url, headers=headers, data=payload)
         original_response = self._get_response(response)
 
         faces = []
@@ -391,7 +392,7 @@ class Base64Api(ProviderInterface, OcrInterface):
                 "Authorization": self.api_key,
             }
 
-            response = requests.post(url=self.url, headers=headers, data=payload)
+            response = http_client.post(url=self.url, headers=headers, data=payload)
 
         original_response = self._get_response(response)
 
@@ -438,7 +439,7 @@ class Base64Api(ProviderInterface, OcrInterface):
                 "Authorization": self.api_key,
             }
 
-            response = requests.post(url=self.url, headers=headers, data=payload)
+            response = http_client.post(url=self.url, headers=headers, data=payload)
             original_response = self._get_response(response)
 
             items: Sequence[ItemBankCheckParsingDataClass] = []
@@ -509,7 +510,7 @@ class Base64Api(ProviderInterface, OcrInterface):
 
         headers = {"Content-Type": "application/json", "Authorization": self.api_key}
 
-        response = requests.post(url=self.url, headers=headers, data=payload)
+        response = http_client.post(url=self.url, headers=headers, data=payload)
 
         original_response = self._get_response(response)
 
@@ -36,9 +36,12 @@ from edenai_apis.features.text.summarize import SummarizeDataClass
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.conversion import construct_word_list
+from edenai_apis.utils.embeddings import batched_embeddings
 from edenai_apis.utils.exception import ProviderException
-from edenai_apis.utils.metrics import METRICS
+from edenai_apis.utils.metrics import top_k_similarities
+from edenai_apis.utils.streaming import iter_json_lines
 from edenai_apis.utils.types import ResponseType
+from edenai_apis.utils.http import http_client
 
 
 class CohereApi(ProviderInterface, TextInterface):
@@ -112,13 +115,10 @@ List of corrected words:
 
     @staticmethod
     def __text_to_json(
-        lst_data: List[str],
+        response: requests.Response,
     ) -> Generator[ChatStreamResponse, None, None]:
-        lst_json = []
-        for token in lst_data:
-            if token != "":
-                lst_json.append(json.loads(token))
-        for elt in lst_json:
+        # the stream is newline delimited JSON events
+        for elt in iter_json_lines(response):
             if elt["event_type"] == "text-generation":
                 yield ChatStreamResponse(
                     text=elt["text"], blocked=False, provider="cohere"
@@ -145,7 +145,7 @@ List of corrected words:
         if max_tokens != 0:
             payload["max_tokens"] = max_tokens
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         if response.status_code >= 500:
             raise ProviderException("Internal Server Error")
 
@@ -185,7 +185,7 @@ List of corrected words:
             "examples": example_dict,
         }
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = response.json()
 
         # Handle provider errors
@@ -234,7 +234,7 @@ List of corrected words:
             "text": text,
         }
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         try:
             original_response = response.json()
         except json.JSONDecodeError as exc:
@@ -317,7 +317,7 @@ Your answer :
             "stop_sequences": ["--"],
             "truncate": "END",
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         if response.status_code != 200:
             raise ProviderException(response.text, response.status_code)
 
@@ -354,7 +354,7 @@ Your answer :
             "truncate": "END",
         }
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = response.json()
 
         if "message" in original_response:
@@ -394,13 +394,12 @@ Your answer :
             standardized_response=SpellCheckDataClass(text=text, items=items),
         )
 
-    def text__embeddings(
-        self, texts: List[str], model: Optional[str] = None
+    def __embeddings_request(
+        self, texts: List[str], model: str
     ) -> ResponseType[EmbeddingsDataClass]:
         url = f"{self.base_url}embed"
-        model = model.split("__")[1]
         payload = {"texts": texts, "model": model}
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         if response.status_code >= 500:
             raise ProviderException("Internal Server Error")
 
@@ -423,6 +422,17 @@ Your answer :
             standardized_response=standardized_response,
         )
 
+    def text__embeddings(
+        self, texts: List[str], model: Optional[str] = None
+    ) -> ResponseType[EmbeddingsDataClass]:
+        model = model.split("__")[1]
+        return batched_embeddings(
+            self.provider_name,
+            texts,
+            lambda batch: self.__embeddings_request(batch, model),
+            model=model,
+        )
+
     def text__search(
         self,
         texts: List[str],
@@ -431,41 +441,35 @@ Your answer :
             "cosine", "hamming", "manhattan", "euclidean"
         ] = "cosine",
         model: Optional[str] = None,
+        top_k: Optional[int] = None,
     ) -> ResponseType[SearchDataClass]:
         if model is None:
             model = "768__embed-multilingual-v2.0"
-        # Import the function
-        function_score = METRICS[similarity_metric]
-
         # Embed the texts & query
-        texts_embed_response = self.text__embeddings(
-            texts=texts, model=model
-        ).original_response
-        query_embed_response = self.text__embeddings(
-            texts=[query], model=model
-        ).original_response
+        texts_embed_result = self.text__embeddings(texts=texts, model=model)
+        query_embed_result = self.text__embeddings(texts=[query], model=model)
+        texts_embed_response = texts_embed_result.original_response
+        query_embed_response = query_embed_result.original_response
 
         # Extracts embeddings from texts & query
-        texts_embed = list(texts_embed_response["embeddings"])
-        query_embed = query_embed_response["embeddings"][0]
+        texts_embed = texts_embed_result.standardized_response.to_array()
+        query_embed = query_embed_result.standardized_response.to_array()[0]
 
-        items = []
-        # Calculate score for each text index
-        for index, text in enumerate(texts_embed):
-            score = function_score(query_embed, text)
-            items.append(
-                InfosSearchDataClass(
-                    object="search_result", document=index, score=score
-                )
+        # Score all texts at once and keep the best ones, sorted by descending score
+        indexes, scores = top_k_similarities(
+            query_embed, texts_embed, similarity_metric, top_k
+        )
+        sorted_items = [
+            InfosSearchDataClass(
+                object="search_result", document=int(index), score=float(score)
             )
-
-        # Sort items by score in descending order
-        sorted_items = sorted(items, key=lambda x: x.score, reverse=True)
+            for index, score in zip(indexes, scores)
+        ]
 
         # Calculate total tokens
         usage = {
-            "total_tokens": texts_embed_response["meta"]["billed_units"]["input_tokens"]
-            + query_embed_response["meta"]["billed_units"]["input_tokens"]
+            "total_tokens": texts_embed_response["usage"]["total_tokens"]
+            + query_embed_response["usage"]["total_tokens"]
         }
         # Build the original response
         original_response = {
@@ -549,8 +553,8 @@ Your answer :
         if not available_tools and not tool_results:
             payload["connectors"] = [{"id": "web-search"}]
 
-        response = requests.post(
-            f"{self.base_url}chat", headers=self.headers, json=payload
+        response = http_client.post(
+            f"{self.base_url}chat", headers=self.headers, json=payload, stream=stream
         )
 
         if response.status_code != 200:
@@ -595,11 +599,9 @@ Your answer :
                     standardized_response=standardized_response,
                 )
             else:
-                data = response.text
-                lst_data = data.split("\n")
                 return ResponseType[StreamChat](
                     original_response=None,
                     standardized_response=StreamChat(
-                        stream=self.__text_to_json(lst_data)
+                        stream=self.__text_to_json(response)
                     ),
                 )
@@ -1,6 +1,5 @@
 from typing import Dict, Sequence, Optional, Any, List
 
-import requests
 
 from edenai_apis.features import ProviderInterface, OcrInterface
 from edenai_apis.features.ocr import (
@@ -28,6 +27,7 @@ from edenai_apis.utils.conversion import convert_string_to_number
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.types import ResponseType
 from edenai_apis.apis.dataleon.dataleon_ocr_normalizer import dataleon_financial_parser
+from edenai_apis.utils.http import http_client
 
 
 class DataleonApi(ProviderInterface, OcrInterface):
@@ -110,7 +110,7 @@ class DataleonApi(ProviderInterface, OcrInterface):
         self, file: str, language: str, file_url: str = ""
     ) -> ResponseType[InvoiceParserDataClass]:
         with open(file, "rb") as file_:
-            response = requests.post(
+            response = http_client.post(
                 url=self.url_invoice, headers=self.headers, files={"file": file_}
             )
 
@@ -211,7 +211,7 @@ class DataleonApi(ProviderInterface, OcrInterface):
         self, file: str, language: str, file_url: str = ""
     ) -> ResponseType[ReceiptParserDataClass]:
         with open(file, "rb") as file_:
-            response = requests.post(
+            response = http_client.post(
                 url=self.url_receipt, headers=self.headers, files={"file": file_}
             )
 
@@ -278,7 +278,7 @@ class DataleonApi(ProviderInterface, OcrInterface):
             url = self.url_invoice
 
         with open(file, "rb") as file_:
-            response = requests.post(
+            response = http_client.post(
                 url=url,
                 headers=self.headers,
                 files={"file": file_},
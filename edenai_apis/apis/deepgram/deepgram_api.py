@@ -5,7 +5,6 @@ from pathlib import Path
 from time import time
 from typing import Dict, List, Optional
 
-import requests
 
 from edenai_apis.features import AudioInterface, ProviderInterface
 from edenai_apis.features.audio import (
@@ -31,6 +30,7 @@ from edenai_apis.utils.upload_s3 import (
     upload_file_bytes_to_s3,
     upload_file_to_s3,
 )
+from edenai_apis.utils.http import http_client
 
 
 class DeepgramApi(ProviderInterface, AudioInterface):
@@ -96,7 +96,7 @@ class DeepgramApi(ProviderInterface, AudioInterface):
             if isinstance(value, bool):
                 data_config[key] = str(value).lower()
 
-        response = requests.post(
+        response = http_client.post(
             self.url, headers=headers, json=data, params=data_config
         )
         original_response = response.json()
@@ -176,7 +176,7 @@ class DeepgramApi(ProviderInterface, AudioInterface):
         }
 
         payload = {"text": text}
-        response = requests.post(
+        response = http_client.post(
             base_url,
             headers=headers,
             json=payload,
@@ -3,10 +3,8 @@ import http.client
 import json
 import mimetypes
 from io import BytesIO
-from time import sleep
 from typing import Dict
 
-import requests
 
 from edenai_apis.features.provider.provider_interface import ProviderInterface
 from edenai_apis.features.translation.automatic_translation import (
@@ -19,8 +17,13 @@ from edenai_apis.features.translation.translation_interface import TranslationIn
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.poller import PollingPolicy, poll
 from edenai_apis.utils.types import ResponseType
 from edenai_apis.utils.upload_s3 import upload_file_bytes_to_s3, USER_PROCESS
+from edenai_apis.utils.http import http_client
+
+
+DOCUMENT_POLLING_POLICY = PollingPolicy(initial_delay=0.5, max_delay=5, timeout=600)
 
 
 class DeeplApi(ProviderInterface, TranslationInterface):
@@ -47,7 +50,7 @@ class DeeplApi(ProviderInterface, TranslationInterface):
             "target_lang": target_language,
         }
 
-        response = requests.request("POST", url, headers=self.header, data=data)
+        response = http_client.request("POST", url, headers=self.header, data=data)
 
         if response.status_code >= 500:
             raise ProviderException(message=response.text, code=response.status_code)
@@ -92,7 +95,7 @@ class DeeplApi(ProviderInterface, TranslationInterface):
             data = {"target_lang": target_language, "source_lang": source_language}
 
             try:
-                response = requests.post(
+                response = http_client.post(
                     f"{self.url}document", headers=self.header, data=data, files=files
                 )
             except:
@@ -118,23 +121,23 @@ class DeeplApi(ProviderInterface, TranslationInterface):
 
         doc_key = {"document_key": document_key}
 
-        response_status = requests.post(
-            f"{self.url}document/{document_id}", headers=self.header, data=doc_key
-        ).json()
         try:
-            while response_status["status"] != "done":
-                response_status = requests.post(
+            response_status = poll(
+                lambda: http_client.post(
                     f"{self.url}document/{document_id}",
                     headers=self.header,
                     data=doc_key,
-                ).json()
-                if response_status["status"] == "error":
-                    raise ProviderException(response_status["error_message"])
-                sleep(0.5)
+                ).json(),
+                is_done=lambda status: status["status"] in ("done", "error"),
+                policy=DOCUMENT_POLLING_POLICY,
+                provider_name=self.provider_name,
+            )
+            if response_status["status"] == "error":
+                raise ProviderException(response_status["error_message"])
         except KeyError as exc:
             raise ProviderException("Internal server error", 500) from exc
 
-        response = requests.post(
+        response = http_client.post(
             f"{self.url}document/{document_id}/result",
             headers=self.header,
             data=doc_key,
@@ -2,7 +2,6 @@ from io import BufferedReader
 from json import JSONDecodeError
 from typing import Dict
 
-import requests
 
 from edenai_apis.apis.eagledoc.eagledoc_ocr_normalizer import (
     eagledoc_financial_parser,
@@ -18,6 +17,7 @@ from edenai_apis.features.ocr.receipt_parser import ReceiptParserDataClass
 from edenai_apis.loaders.loaders import ProviderDataEnum, load_provider
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.types import ResponseType
+from edenai_apis.utils.http import http_client
 
 
 class EagledocApi(ProviderInterface, OcrInterface):
@@ -41,7 +41,7 @@ class EagledocApi(ProviderInterface, OcrInterface):
             "file": file,
         }
 
-        response = requests.post(
+        response = http_client.post(
             url=self.url + endpoint,
             headers=self.headers,
             files=files,
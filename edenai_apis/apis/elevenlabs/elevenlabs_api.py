@@ -2,7 +2,6 @@ import base64
 from io import BytesIO
 from typing import Dict
 
-import requests
 
 from edenai_apis.features import AudioInterface
 from edenai_apis.features.audio.text_to_speech.text_to_speech_dataclass import (
@@ -14,6 +13,7 @@ from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.types import ResponseType
 from edenai_apis.utils.upload_gcs import BUCKET, upload_file_bytes_to_gcs
+from edenai_apis.utils.http import http_client
 from .config import voice_ids
 
 
@@ -72,7 +72,7 @@ class ElevenlabsApi(ProviderInterface, AudioInterface):
             "model_id": model,
             "voice_settings": {"stability": 0.9, "similarity_boost": 0.9},
         }
-        response = requests.post(url, json=data, headers=self.headers)
+        response = http_client.post(url, json=data, headers=self.headers)
 
         if response.status_code != 200:
             raise ProviderException(response.text, code=response.status_code)
@@ -1,7 +1,6 @@
 import json
 from typing import Dict, Tuple, Any, List, Optional, Literal
 
-import requests
 
 from edenai_apis.features import TextInterface
 from edenai_apis.features.provider.provider_interface import ProviderInterface
@@ -23,6 +22,7 @@ from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException, LanguageException
 from edenai_apis.utils.types import ResponseType
+from edenai_apis.utils.http import http_client
 from .emvista_tags import tags
 
 
@@ -53,7 +53,7 @@ class EmvistaApi(ProviderInterface, TextInterface):
     def _make_request(
         self, endpoint: str, headers: Dict[str, str], files: Dict[str, Any]
     ):
-        response = requests.post(
+        response = http_client.post(
             f"{self.base_url}{endpoint}", headers=headers, json=files
         )
         try:
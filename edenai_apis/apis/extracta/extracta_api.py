@@ -3,7 +3,6 @@ import json
 import mimetypes
 from typing import List, Dict, Union
 
-import requests
 
 from edenai_apis.apis.extracta.extracta_ocr_normalizer import (
     extracta_resume_parser,
@@ -34,6 +33,7 @@ from edenai_apis.utils.types import (
     AsyncResponseType,
     ResponseType,
 )
+from edenai_apis.utils.http import http_client
 
 
 class ExtractaApi(
@@ -108,7 +108,7 @@ class ExtractaApi(
         }
 
         # call api
-        response = requests.post(
+        response = http_client.post(
             url=self.url + self.uploadFileRoute, headers=headers, data=payload
         )
 
@@ -146,7 +146,7 @@ class ExtractaApi(
         }
 
         # call api
-        response = requests.post(
+        response = http_client.post(
             url=self.url + self.getResultRoute, headers=headers, data=payload
         )
 
@@ -264,7 +264,7 @@ class ExtractaApi(
         }
 
         # call api
-        response = requests.post(
+        response = http_client.post(
             url=self.url + self.processFileRoute, headers=headers, data=payload
         )
 
@@ -326,7 +326,7 @@ class ExtractaApi(
         }
 
         # call api
-        response = requests.post(
+        response = http_client.post(
             url=self.url + self.processFileRoute, headers=headers, data=payload
         )
 
@@ -395,7 +395,7 @@ class ExtractaApi(
         }
 
         # call api
-        response = requests.post(
+        response = http_client.post(
             url=self.url + self.processFileRoute, headers=headers, data=payload
         )
 
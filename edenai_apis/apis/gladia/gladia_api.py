@@ -3,7 +3,6 @@ from pathlib import Path
 from time import time
 from typing import Dict, List, Optional
 
-import requests
 
 from edenai_apis.features import ProviderInterface, AudioInterface
 from edenai_apis.features.audio import SpeechDiarizationEntry, SpeechDiarization
@@ -20,6 +19,7 @@ from edenai_apis.utils.types import (
     AsyncResponseType,
 )
 from edenai_apis.utils.upload_s3 import upload_file_to_s3
+from edenai_apis.utils.http import http_client
 
 
 class GladiaApi(ProviderInterface, AudioInterface):
@@ -65,7 +65,7 @@ class GladiaApi(ProviderInterface, AudioInterface):
         if language:
             data.update({"detect_language": False, "language": language})
         data.update(provider_params)
-        response = requests.post(self.url, headers=headers, json=data)
+        response = http_client.post(self.url, headers=headers, json=data)
         if response.status_code != 201:
             raise ProviderException(message=response.text, code=response.status_code)
         try:
@@ -82,7 +82,7 @@ class GladiaApi(ProviderInterface, AudioInterface):
         if not provider_job_id:
             raise ProviderException("Job id None or empty!")
         headers = {"x-gladia-key": self.api_key, "accept": "application/json"}
-        response = requests.get(self.url + provider_job_id, headers=headers)
+        response = http_client.get(self.url + provider_job_id, headers=headers)
         print(response.text)
         if response.status_code != 200:
             raise ProviderException(message=response.text, code=response.status_code)
@@ -4,7 +4,6 @@ import re
 from typing import List, Sequence
 from typing import Tuple
 from http import HTTPStatus
-import requests
 
 import google
 import google.auth
@@ -51,6 +50,7 @@ from edenai_apis.features.ocr.financial_parser.financial_parser_dataclass import
     FinancialLineItem,
     FinancialParserObjectDataClass,
 )
+from edenai_apis.utils.http import http_client
 
 
 class GoogleVideoFeatures(enum.Enum):
@@ -435,7 +435,7 @@ def get_access_token(location: str):
         location = "/path/to/credentials.json"
         access_token = get_access_token(location)
         # Use the access_token for API REST calls
-        response = requests.get(url, headers={"Authorization": f"Bearer {access_token}"})
+        response = http_client.get(url, headers={"Authorization": f"Bearer {access_token}"})
 
     """
     scopes = ["https://www.googleapis.com/auth/cloud-platform"]
@@ -608,7 +608,7 @@ def calculate_usage_tokens(original_response: dict) -> dict:
 
 def gemini_request(payload: dict, model: str, api_key: str):
     url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}"
-    response = requests.post(url, json=payload)
+    response = http_client.post(url, json=payload)
     try:
         original_response = response.json()
     except json.JSONDecodeError as exc:
@@ -634,7 +634,7 @@ def palm_request(payload: dict, model: str, location: str, token: str, project_i
     }
     url = f"https://{url_subdomain}.googleapis.com/v1/projects/{project_id}/locations/{location}/publishers/google/models/{model}:predict"
 
-    response = requests.post(url=url, headers=headers, json=payload)
+    response = http_client.post(url=url, headers=headers, json=payload)
     try:
         original_response = response.json()
     except json.JSONDecodeError as exc:
@@ -3,7 +3,6 @@ from http import HTTPStatus
 import json
 from typing import Sequence, Optional, BinaryIO, Dict
 import numpy as np
-import requests
 from PIL import Image as Img, UnidentifiedImageError
 from google.cloud import vision
 from google.cloud.vision_v1.types.image_annotator import AnnotateImageResponse
@@ -61,6 +60,7 @@ from edenai_apis.features.image.embeddings import (
     EmbeddingsDataClass,
     EmbeddingDataClass,
 )
+from edenai_apis.utils.http import http_client
 
 
 class GoogleImageApi(ImageInterface):
@@ -428,7 +428,7 @@ class GoogleImageApi(ImageInterface):
                 },
             }
 
-            response = requests.post(url, json=payload)
+            response = http_client.post(url, json=payload)
 
             try:
                 original_response = response.json()
@@ -488,7 +488,7 @@ class GoogleImageApi(ImageInterface):
                 "parameters": {"dimension": embedding_dimension},
             }
 
-            response = requests.post(url, json=payload, headers=headers)
+            response = http_client.post(url, json=payload, headers=headers)
             try:
                 original_response = response.json()
             except json.JSONDecodeError as exc:
@@ -13,6 +13,7 @@ from edenai_apis.features.multimodal.multimodal_interface import MultimodalInter
 from edenai_apis.utils.types import ResponseType
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.apis.google.google_helpers import calculate_usage_tokens
+from edenai_apis.utils.http import http_client
 
 
 class GoogleMultimodalApi(MultimodalInterface):
@@ -144,7 +145,7 @@ class GoogleMultimodalApi(MultimodalInterface):
             }
 
         if stream is False:
-            response = requests.post(url, json=payload)
+            response = http_client.post(url, json=payload)
             try:
                 original_response = response.json()
             except json.JSONDecodeError as exc:
@@ -172,7 +173,7 @@ class GoogleMultimodalApi(MultimodalInterface):
             )
         else:
             url.replace("generateContent", "streamGenerateContent?alt=sse")
-            response = requests.post(url, json=payload, stream=True)
+            response = http_client.post(url, json=payload, stream=True)
             try:
                 original_response = response.json()
             except json.JSONDecodeError as exc:
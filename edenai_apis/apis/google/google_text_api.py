@@ -51,10 +51,13 @@ from edenai_apis.features.text.topic_extraction.topic_extraction_dataclass impor
     TopicExtractionDataClass,
 )
 from edenai_apis.utils.conversion import standardized_confidence_score
+from edenai_apis.utils.embeddings import batched_embeddings
 from edenai_apis.utils.exception import ProviderException
-from edenai_apis.utils.metrics import METRICS
+from edenai_apis.utils.metrics import top_k_similarities
 from edenai_apis.utils.parsing import extract
+from edenai_apis.utils.streaming import iter_sse_data
 from edenai_apis.utils.types import ResponseType
+from edenai_apis.utils.http import http_client
 
 from google.cloud import language_v1
 from google.cloud.language import Document as GoogleDocument
@@ -274,7 +277,7 @@ class GoogleTextApi(TextInterface):
             },
         }
 
-        response = requests.post(url=url, headers=headers, json=payload)
+        response = http_client.post(url=url, headers=headers, json=payload)
 
         try:
             original_response = response.json()
@@ -497,21 +500,16 @@ class GoogleTextApi(TextInterface):
         Yields:
             Generator[ChatStreamResponse]: Generator of messages
         """
-        for resp in response.iter_lines():
-            raw_data = resp.decode()
-            if "data: " in raw_data:
-                _, content = raw_data.split("data: ")
-                try:
-                    content_json = json.loads(content)
-                    yield ChatStreamResponse(
-                        text=content_json["candidates"][0]["content"]["parts"][0][
-                            "text"
-                        ],
-                        blocked=False,
-                        provider="google",
-                    )
-                except Exception as exc:
-                    return
+        for content in iter_sse_data(response, done=None):
+            try:
+                content_json = json.loads(content)
+                yield ChatStreamResponse(
+                    text=content_json["candidates"][0]["content"]["parts"][0]["text"],
+                    blocked=False,
+                    provider="google",
+                )
+            except Exception as exc:
+                return
 
     def _gemini_pro_chat_prepare_payload(
         self,
@@ -583,7 +581,7 @@ class GoogleTextApi(TextInterface):
             )
             api_key = self.api_settings.get("genai_api_key")
             base_url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}"
-            response = requests.post(url=base_url, json=payload)
+            response = http_client.post(url=base_url, json=payload)
             try:
                 original_response = response.json()
                 if "error" in original_response:
@@ -619,7 +617,7 @@ class GoogleTextApi(TextInterface):
                 "Authorization": f"Bearer {token}",
             }
 
-            response = requests.post(url=url, headers=headers, json=payload)
+            response = http_client.post(url=url, headers=headers, json=payload)
             try:
                 original_response = response.json()
                 if "error" in original_response:
@@ -669,7 +667,7 @@ class GoogleTextApi(TextInterface):
             )
             api_key = self.api_settings.get("genai_api_key")
             base_url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:streamGenerateContent?alt=sse&key={api_key}"
-            response = requests.post(base_url, json=payload, stream=True)
+            response = http_client.post(base_url, json=payload, stream=True)
         else:
             url_subdomain = "us-central1-aiplatform"
             location = "us-central1"
@@ -688,7 +686,7 @@ class GoogleTextApi(TextInterface):
                 max_tokens,
                 context,
             )
-            response = requests.post(
+            response = http_client.post(
                 url=url, headers=headers, json=payload, stream=True
             )
         if response.status_code != 200:
@@ -743,23 +741,14 @@ class GoogleTextApi(TextInterface):
                 model,
             )
 
-    def text__embeddings(
-        self, texts: List[str], model: str
+    def __embeddings_request(
+        self, texts: List[str], url: str, headers: Dict[str, str]
     ) -> ResponseType[EmbeddingsDataClass]:
-        model = model.split("__")
-        url_subdomain = "us-central1-aiplatform"
-        location = "us-central1"
-        token = get_access_token(self.location)
-        url = f"https://{url_subdomain}.googleapis.com/v1/projects/{self.project_id}/locations/{location}/publishers/google/models/{model[1]}:predict"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-        }
         instances = []
         for text in texts:
             instances.append({"content": text})
         payload = {"instances": instances}
-        response = requests.post(url=url, headers=headers, json=payload)
+        response = http_client.post(url=url, headers=headers, json=payload)
         try:
             original_response = response.json()
         except json.JSONDecodeError as exc:
@@ -783,6 +772,25 @@ class GoogleTextApi(TextInterface):
             standardized_response=standardized_response,
         )
 
+    def text__embeddings(
+        self, texts: List[str], model: str
+    ) -> ResponseType[EmbeddingsDataClass]:
+        model = model.split("__")
+        url_subdomain = "us-central1-aiplatform"
+        location = "us-central1"
+        token = get_access_token(self.location)
+        url = f"https://{url_subdomain}.googleapis.com/v1/projects/{self.project_id}/locations/{location}/publishers/google/models/{model[1]}:predict"
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {token}",
+        }
+        return batched_embeddings(
+            self.provider_name,
+            texts,
+            lambda batch: self.__embeddings_request(batch, url, headers),
+            model=model[1],
+        )
+
     def text__code_generation(
         self, instruction: str, temperature: float, max_tokens: int, prompt: str = ""
     ) -> ResponseType[CodeGenerationDataClass]:
@@ -805,7 +813,7 @@ class GoogleTextApi(TextInterface):
             ],
             "parameters": {"temperature": temperature, "maxOutputTokens": max_tokens},
         }
-        response = requests.post(url=url, headers=headers, json=payload)
+        response = http_client.post(url=url, headers=headers, json=payload)
         original_response = response.json()
         print("THe original response is\n\n", original_response)
         if "error" in original_response:
@@ -929,42 +937,34 @@ class GoogleTextApi(TextInterface):
             "cosine", "hamming", "manhattan", "euclidean"
         ] = "cosine",
         model: str = None,
+        top_k: Optional[int] = None,
     ) -> ResponseType[SearchDataClass]:
-        if len(texts) > 5:
-            raise ProviderException(
-                "Google does not support search in more than 5 items."
-            )
         if model is None:
             model = "768__textembedding-gecko"
-        # Import the function
-        function_score = METRICS[similarity_metric]
-
         # Embed the texts & query
-        texts_embed_response = GoogleTextApi.text__embeddings(
+        texts_embed_result = GoogleTextApi.text__embeddings(
             self, texts=texts, model=model
-        ).original_response
-        query_embed_response = GoogleTextApi.text__embeddings(
+        )
+        query_embed_result = GoogleTextApi.text__embeddings(
             self, texts=[query], model=model
-        ).original_response
+        )
+        texts_embed_response = texts_embed_result.original_response
+        query_embed_response = query_embed_result.original_response
 
         # Extracts embeddings from texts & query
-        texts_embed = [
-            item["embeddings"]["values"] for item in texts_embed_response["predictions"]
-        ]
-        query_embed = query_embed_response["predictions"][0]["embeddings"]["values"]
+        texts_embed = texts_embed_result.standardized_response.to_array()
+        query_embed = query_embed_result.standardized_response.to_array()[0]
 
-        items = []
-        # Calculate score for each text index
-        for index, text in enumerate(texts_embed):
-            score = function_score(query_embed, text)
-            items.append(
-                InfosSearchDataClass(
-                    object="search_result", document=index, score=score
-                )
+        # Score all texts at once and keep the best ones, sorted by descending score
+        indexes, scores = top_k_similarities(
+            query_embed, texts_embed, similarity_metric, top_k
+        )
+        sorted_items = [
+            InfosSearchDataClass(
+                object="search_result", document=int(index), score=float(score)
             )
-
-        # Sort items by score in descending order
-        sorted_items = sorted(items, key=lambda x: x.score, reverse=True)
+            for index, score in zip(indexes, scores)
+        ]
 
         # Build the original response
         original_response = {
@@ -2,10 +2,9 @@ import base64
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from time import sleep, time
+from time import time
 from typing import Any, Dict, List
 
-import requests
 from dateutil.parser import parse
 from google.cloud import videointelligence
 
@@ -75,6 +74,7 @@ from edenai_apis.utils.exception import (
     AsyncJobException,
     AsyncJobExceptionReason,
 )
+from edenai_apis.utils.poller import PollingPolicy, poll
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -82,6 +82,12 @@ from edenai_apis.utils.types import (
     AsyncResponseType,
     ResponseType,
 )
+from edenai_apis.utils.http import http_client
+
+
+FILE_PROCESSING_POLLING_POLICY = PollingPolicy(
+    initial_delay=2, max_delay=10, timeout=600
+)
 
 
 class GoogleVideoApi(VideoInterface):
@@ -114,7 +120,7 @@ class GoogleVideoApi(VideoInterface):
 
     def _check_file_status(self, file_uri: str, api_key: str) -> Dict[str, Any]:
         url = f"{file_uri}?key={api_key}"
-        response = requests.get(url)
+        response = http_client.get(url)
         if response.status_code != 200:
             raise ProviderException(message=response.text, code=response.status_code)
         try:
@@ -130,7 +136,7 @@ class GoogleVideoApi(VideoInterface):
 
         with open(file, "rb") as video_file:
             file = {"file": video_file}
-            response = requests.post(upload_url, files=file)
+            response = http_client.post(upload_url, files=file)
 
         if response.status_code != 200:
             raise ProviderException(message=response.text, code=response.status_code)
@@ -147,7 +153,7 @@ class GoogleVideoApi(VideoInterface):
         delete_url = (
             f"https://generativelanguage.googleapis.com/v1beta/{file}?key={api_key}"
         )
-        response = requests.delete(url=delete_url)
+        response = http_client.delete(url=delete_url)
         if response.status_code != 200:
             raise ProviderException(message=response.text, code=response.status_code)
 
@@ -777,7 +783,7 @@ class GoogleVideoApi(VideoInterface):
             ],
             "generationConfig": {"candidateCount": 1, "temperature": temperature},
         }
-        response = requests.post(url, json=payload)
+        response = http_client.post(url, json=payload)
         try:
             original_response = response.json()
         except json.JSONDecodeError as exc:
@@ -814,9 +820,14 @@ class GoogleVideoApi(VideoInterface):
             raise ProviderException(
                 message="The video file is too large (over 100 MB). Please use the asynchronous video question answering api instead.",
             )
-        while file_data["state"] == "PROCESSING":
-            sleep(5)
-            file_data = self._check_file_status(file_data["uri"], api_key)
+        if file_data["state"] == "PROCESSING":
+            file_uri = file_data["uri"]
+            file_data = poll(
+                lambda: self._check_file_status(file_uri, api_key),
+                is_done=lambda file_data: file_data["state"] != "PROCESSING",
+                policy=FILE_PROCESSING_POLLING_POLICY,
+                provider_name=self.provider_name,
+            )
 
         original_response, generated_text = self._request_question_answer(
             model=model,
@@ -865,7 +876,7 @@ class GoogleVideoApi(VideoInterface):
         inputs = json.loads(base64.b64decode(provider_job_id))
         process_file_id = inputs["process_file_id"]
         url = f"https://generativelanguage.googleapis.com/v1beta/files/{process_file_id}?key={api_key}"
-        response = requests.get(url=url)
+        response = http_client.get(url=url)
         if response.status_code == 403:
             raise AsyncJobException(
                 reason=AsyncJobExceptionReason.DEPRECATED_JOB_ID, code=403
@@ -8,6 +8,7 @@ from edenai_apis.features import ProviderInterface, TextInterface
 from edenai_apis.features.text.embeddings import EmbeddingsDataClass, EmbeddingDataClass
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.embeddings import batched_embeddings
 from edenai_apis.utils.types import ResponseType
 from edenai_apis.utils.exception import ProviderException
 
@@ -27,10 +28,9 @@ class JinaApi(ProviderInterface, TextInterface):
             {"Authorization": f"Bearer {self.api_key}", "Accept-Encoding": "identity"}
         )
 
-    def text__embeddings(
-        self, texts: List[str], model: Optional[str] = None
+    def __embeddings_request(
+        self, texts: List[str], model: str
     ) -> ResponseType[EmbeddingsDataClass]:
-        model = model or "jina-embeddings-v2-base-en"
         resp = self.session.post(  # type: ignore
             self.api_url, json={"input": texts, "model": model}
         )
@@ -55,3 +55,14 @@ class JinaApi(ProviderInterface, TextInterface):
             original_response=original_resp,
             standardized_response=standardized_response,
         )
+
+    def text__embeddings(
+        self, texts: List[str], model: Optional[str] = None
+    ) -> ResponseType[EmbeddingsDataClass]:
+        model = model or "jina-embeddings-v2-base-en"
+        return batched_embeddings(
+            self.provider_name,
+            texts,
+            lambda batch: self.__embeddings_request(batch, model),
+            model=model,
+        )
@@ -2,7 +2,6 @@ from io import BufferedReader
 from json import JSONDecodeError
 from typing import Dict
 
-import requests
 
 from edenai_apis.features import OcrInterface, ProviderInterface
 from edenai_apis.features.ocr.financial_parser.financial_parser_dataclass import (
@@ -24,6 +23,7 @@ from edenai_apis.apis.klippa.klippa_ocr_normalizer import (
     klippa_receipt_parser,
     klippa_resume_parser,
 )
+from edenai_apis.utils.http import http_client
 
 
 class KlippaApi(ProviderInterface, OcrInterface):
@@ -45,7 +45,7 @@ class KlippaApi(ProviderInterface, OcrInterface):
             "document": file,
         }
         data = {"pdf_text_extraction": "full"}
-        response = requests.post(
+        response = http_client.post(
             url=self.url + endpoint, headers=self.headers, files=files, data=data
         )
 
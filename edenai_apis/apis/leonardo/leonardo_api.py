@@ -14,6 +14,7 @@ from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.types import ResponseType
 from .config import get_model_id_image
 from edenai_apis.utils.parsing import extract
+from edenai_apis.utils.http import http_client
 
 class LeonardoApi(ProviderInterface, ImageInterface):
     provider_name = "leonardo"
@@ -45,7 +46,7 @@ class LeonardoApi(ProviderInterface, ImageInterface):
         # Launch job
 
         try:
-            launch_job_response = requests.post(url, headers=self.headers, json=payload)
+            launch_job_response = http_client.post(url, headers=self.headers, json=payload)
         except requests.exceptions.RequestException as e:
             raise ProviderException(e)
         
@@ -65,7 +66,7 @@ class LeonardoApi(ProviderInterface, ImageInterface):
         url_get_response = f"{self.base_url}/generations/{generation_id}"
 
         # Get job response
-        response = requests.get(url_get_response, headers=self.headers)
+        response = http_client.get(url_get_response, headers=self.headers)
 
         if response.status_code >= 500:
             raise ProviderException(
@@ -84,7 +85,7 @@ class LeonardoApi(ProviderInterface, ImageInterface):
         
         status = response_dict["generations_by_pk"]["status"]
         while status != "COMPLETE":
-            response = requests.get(url_get_response, headers=self.headers)
+            response = http_client.get(url_get_response, headers=self.headers)
             try:
                 response_dict = response.json()
             except requests.JSONDecodeError:
@@ -131,14 +132,14 @@ class LeonardoApi(ProviderInterface, ImageInterface):
             for image in image_url:
                 generated_images.append(
                     GeneratedImageDataClass(
-                        image=base64.b64encode(requests.get(image).content),
+                        image=base64.b64encode(http_client.get(image).content),
                         image_resource_url=image,
                     )
                 )
         else:
             generated_images.append(
                 GeneratedImageDataClass(
-                    image=base64.b64encode(requests.get(image_url).content),
+                    image=base64.b64encode(http_client.get(image_url).content),
                     image_resource_url=image_url,
                 )
             )
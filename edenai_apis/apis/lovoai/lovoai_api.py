@@ -3,7 +3,6 @@ import json
 from time import sleep
 from typing import Dict
 
-import requests
 
 from edenai_apis.features.audio import AudioInterface
 from edenai_apis.features.audio.text_to_speech.text_to_speech_dataclass import (
@@ -26,6 +25,7 @@ from edenai_apis.utils.types import (
     AsyncResponseType,
     AsyncPendingResponseType,
 )
+from edenai_apis.utils.http import http_client
 from .config import voice_ids
 
 
@@ -72,7 +72,7 @@ class LovoaiApi(ProviderInterface, AudioInterface):
             }
         )
 
-        response = requests.post(
+        response = http_client.post(
             f"{self.url}v1/tts/sync", headers=self.headers, data=payload
         )
 
@@ -90,7 +90,7 @@ class LovoaiApi(ProviderInterface, AudioInterface):
         if original_response.get("status") == "in_progress":
             while True:
                 sleep(1)
-                response_status = requests.get(
+                response_status = http_client.get(
                     f"{self.url}v1/tts/{original_response['id']}",
                     headers=self.headers,
                 )
@@ -113,7 +113,7 @@ class LovoaiApi(ProviderInterface, AudioInterface):
             raise ProviderException(error_message, error_code)
 
         audio_url = original_response["data"][0]["urls"][0]
-        audio_content = base64.b64encode(requests.get(audio_url).content)
+        audio_content = base64.b64encode(http_client.get(audio_url).content)
         audio_content_string = audio_content.decode("utf-8")
 
         return ResponseType[TextToSpeechDataClass](
@@ -144,7 +144,7 @@ class LovoaiApi(ProviderInterface, AudioInterface):
                 "speed": self.__adjust_speaking_rate(speaking_rate),
             }
         )
-        response = requests.post(
+        response = http_client.post(
             url,
             headers={
                 "X-API-KEY": self.api_settings["api_key_async"],
@@ -172,7 +172,7 @@ class LovoaiApi(ProviderInterface, AudioInterface):
         }
         url_status = f"https://api.genny.lovo.ai/api/v1/tts/{provider_job_id}"
 
-        response_status = requests.get(url=url_status, headers=headers)
+        response_status = http_client.get(url=url_status, headers=headers)
         original_response = response_status.json()
 
         if response_status.status_code == 422:
@@ -199,7 +199,7 @@ class LovoaiApi(ProviderInterface, AudioInterface):
             raise ProviderException(error_message, error_code)
 
         audio_url = original_response["data"][0]["urls"][0]
-        audio_content = base64.b64encode(requests.get(audio_url).content)
+        audio_content = base64.b64encode(http_client.get(audio_url).content)
         audio_content_string = audio_content.decode("utf-8")
 
         return AsyncResponseType[TextToSpeechAsyncDataClass](
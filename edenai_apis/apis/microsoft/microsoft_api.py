@@ -12,6 +12,7 @@ from edenai_apis.apis.microsoft.microsoft_translation_api import MicrosoftTransl
 from edenai_apis.features.provider.provider_interface import ProviderInterface
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.paginated import KEEP_ORIGINAL_RESPONSE
 
 
 class MicrosoftApi(
@@ -33,6 +34,7 @@ class MicrosoftApi(
         self.headers = get_microsoft_headers()
         self.url = get_microsoft_urls()
         self.user = user
+        self.keep_original_response = KEEP_ORIGINAL_RESPONSE
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         pass
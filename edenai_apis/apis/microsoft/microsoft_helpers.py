@@ -3,7 +3,7 @@ import datetime
 from collections import defaultdict
 from copy import deepcopy
 from math import floor
-from typing import Dict, List, Sequence, Optional, Any
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 
 from edenai_apis.features.image.face_detection.face_detection_dataclass import (
     FaceAccessories,
@@ -66,6 +66,7 @@ from edenai_apis.features.text import (
 from edenai_apis.features.text.moderation.category import CategoryType
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.bounding_box import Rect, SpatialIndex
 from edenai_apis.utils.conversion import (
     combine_date_with_time,
     convert_string_to_number,
@@ -558,25 +559,61 @@ def get_right_audio_support_and_sampling_rate(
 def microsoft_ocr_tables_standardize_response(
     original_response: dict,
 ) -> OcrTablesAsyncDataClass:
-    num_pages = len(original_response["pages"])
-    pages: List[Page] = [Page() for _ in range(num_pages)]
+    pages: List[Page] = list(microsoft_ocr_tables_pages(original_response))
+    return OcrTablesAsyncDataClass(pages=pages, num_pages=len(pages))
 
+
+def microsoft_ocr_tables_pages(original_response: dict) -> Iterator[Page]:
+    """Standardized pages of a layout analysis result, parsed one page at a time"""
+    # tables of each page
+    pages_tables: Dict[int, List[dict]] = {}
     for table in original_response.get("tables", []):
         page_index: int = table["boundingRegions"][0]["pageNumber"] - 1
-        std_table = _ocr_tables_standardize_table(table, original_response, page_index)
-        pages[page_index].tables.append(std_table)
+        pages_tables.setdefault(page_index, []).append(table)
+
+    for page_index, page in enumerate(original_response["pages"]):
+        tables = pages_tables.pop(page_index, [])
+        if not tables:
+            yield Page()
+            continue
+        # words of the page, indexed by position to be matched with table cells
+        words = page["words"]
+        words_index = SpatialIndex(
+            _polygon_corners_rect(word["polygon"]) for word in words
+        )
+        yield Page(
+            tables=[
+                _ocr_tables_standardize_table(
+                    table, original_response, words, words_index
+                )
+                for table in tables
+            ]
+        )
+
 
-    return OcrTablesAsyncDataClass(pages=pages, num_pages=num_pages)
+def _polygon_corners_rect(polygon: List[float]) -> Rect:
+    """Rect between the top left and bottom right corners of a polygon"""
+    return polygon[0], polygon[1], polygon[4], polygon[5]
 
 
 def _ocr_tables_standardize_table(
-    table: dict, original_response: dict, page_index: int
+    table: dict, original_response: dict, words: List[Dict], words_index: SpatialIndex
 ) -> Table:
     num_rows = table.get("rowCount", 0)
     rows = [Row() for _ in range(num_rows)]
 
-    for cell in table["cells"]:
-        std_cell = _ocr_tables_standardize_cell(cell, original_response, page_index)
+    # words within each cell's bounding box, found in one batch
+    cells_words = words_index.query_many(
+        _polygon_corners_rect(cell["boundingRegions"][0]["polygon"])
+        for cell in table["cells"]
+    )
+    for cell, cell_words in zip(table["cells"], cells_words):
+        cell_confidence = _calculate_cell_confidence(
+            [words[word_index] for word_index in cell_words]
+        )
+        std_cell = _ocr_tables_standardize_cell(
+            cell, original_response, cell_confidence
+        )
         row = rows[cell["rowIndex"]]
         row.cells.append(std_cell)
 
@@ -587,7 +624,7 @@ def _ocr_tables_standardize_table(
 
 
 def _ocr_tables_standardize_cell(
-    cell: dict, original_response: dict, page_index: int
+    cell: dict, original_response: dict, cell_confidence: float
 ) -> Cell:
     current_page_num = cell["boundingRegions"][0]["pageNumber"]
     width = original_response["pages"][current_page_num - 1]["width"]
@@ -595,10 +632,6 @@ def _ocr_tables_standardize_cell(
     is_header = cell.get("kind") in ["columnHeader", "rowHeader"]
     bounding_box = cell["boundingRegions"][0]["polygon"]
 
-    # Get the confidence of the words within the cell's bounding box
-    words = original_response["pages"][page_index]["words"]
-    cell_confidence = _calculate_cell_confidence(words, bounding_box)
-
     return Cell(
         text=cell["content"],
         col_index=cell["columnIndex"],
@@ -616,39 +649,13 @@ def _ocr_tables_standardize_cell(
     )
 
 
-def _calculate_cell_confidence(words: List[Dict], bounding_box: List[float]) -> float:
-    cell_words = [
-        word
-        for word in words
-        if _is_word_in_bounding_box(word["polygon"], bounding_box)
-    ]
+def _calculate_cell_confidence(cell_words: List[Dict]) -> float:
     if not cell_words:
         return 1.0
     confidences = [word["confidence"] for word in cell_words]
     return mean(confidences)
 
 
-def _is_word_in_bounding_box(word_box: List[float], cell_box: List[float]) -> bool:
-    word_left, word_top, word_right, word_bottom = (
-        word_box[0],
-        word_box[1],
-        word_box[4],
-        word_box[5],
-    )
-    cell_left, cell_top, cell_right, cell_bottom = (
-        cell_box[0],
-        cell_box[1],
-        cell_box[4],
-        cell_box[5],
-    )
-    return not (
-        word_right < cell_left
-        or word_left > cell_right
-        or word_bottom < cell_top
-        or word_top > cell_bottom
-    )
-
-
 def _create_ocr_async_bounding_box(polygon, height, width):
     return BoundingBox(
         height=(polygon[7] - polygon[3]) / height,
@@ -672,8 +679,15 @@ def microsoft_ocr_async_standardize_response(
     original_response: dict,
 ) -> OcrAsyncDataClass:
     raw_text = original_response.get("content", "")
-    pages = []
+    pages = list(microsoft_ocr_async_pages(original_response))
+    number_of_pages = len(pages)
+    return OcrAsyncDataClass(
+        raw_text=raw_text, pages=pages, number_of_pages=number_of_pages
+    )
+
 
+def microsoft_ocr_async_pages(original_response: dict) -> Iterator[OcrAsyncPage]:
+    """Standardized pages of a layout analysis result, parsed one page at a time"""
     for page in original_response.get("pages", []):
         lines = []
         height = page.get("height", 1)
@@ -696,11 +710,7 @@ def microsoft_ocr_async_standardize_response(
             lines.append(
                 Line(text=text, words=words, bounding_box=bounding_box, confidence=None)
             )
-        pages.append(OcrAsyncPage(lines=lines))
-    number_of_pages = len(pages)
-    return OcrAsyncDataClass(
-        raw_text=raw_text, pages=pages, number_of_pages=number_of_pages
-    )
+        yield OcrAsyncPage(lines=lines)
 
 
 def microsoft_parser_normalizer(original_response: Dict) -> List[Dict]:
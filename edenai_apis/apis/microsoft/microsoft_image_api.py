@@ -2,7 +2,6 @@ import base64
 import json
 from typing import List, Sequence, Optional, Any, Dict
 
-import requests
 from PIL import Image as Img
 
 from edenai_apis.apis.microsoft.microsoft_helpers import (
@@ -50,6 +49,7 @@ from edenai_apis.features.image.image_interface import ImageInterface
 from edenai_apis.utils.conversion import standardized_confidence_score
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.types import ResponseType
+from edenai_apis.utils.http import http_client
 
 
 class MicrosoftImageApi(ImageInterface):
@@ -58,7 +58,7 @@ class MicrosoftImageApi(ImageInterface):
     ) -> ResponseType[ExplicitContentDataClass]:
         with open(file, "rb") as file_:
             # Getting response of API
-            response = requests.post(
+            response = http_client.post(
                 f"{self.url['vision']}/analyze?visualFeatures=Adult",
                 headers=self.headers["vision"],
                 data=file_,
@@ -110,7 +110,7 @@ class MicrosoftImageApi(ImageInterface):
         self, file: str, model: str = None, file_url: str = ""
     ) -> ResponseType[ObjectDetectionDataClass]:
         with open(file, "rb") as file_:
-            response = requests.post(
+            response = http_client.post(
                 f"{self.url['vision']}/detect",
                 headers=self.headers["vision"],
                 data=file_,
@@ -176,7 +176,7 @@ class MicrosoftImageApi(ImageInterface):
                 ),
             }
             # Getting response of API
-            request = requests.post(
+            request = http_client.post(
                 f"{self.url['face']}/detect",
                 params=params,
                 headers=self.headers["face"],
@@ -205,7 +205,7 @@ class MicrosoftImageApi(ImageInterface):
         self, file: str, file_url: str = "", model: str = None
     ) -> ResponseType[LogoDetectionDataClass]:
         with open(file, "rb") as file_:
-            response = requests.post(
+            response = http_client.post(
                 f"{self.url['vision']}/analyze?visualFeatures=Brands",
                 headers=self.headers["vision"],
                 data=file_,
@@ -250,7 +250,7 @@ class MicrosoftImageApi(ImageInterface):
             file_content = file_.read()
 
         # Getting response of API
-        response = requests.post(
+        response = http_client.post(
             f"{self.url['vision']}analyze?details=Landmarks",
             headers=self.headers["vision"],
             data=file_content,
@@ -282,7 +282,7 @@ class MicrosoftImageApi(ImageInterface):
             "Content-Type": "application/json",
         }
         payload = {"name": collection_id, "recognitionModel": "recognition_04"}
-        response = requests.put(url=url, headers=headers, json=payload)
+        response = http_client.put(url=url, headers=headers, json=payload)
         if response.status_code != 200:
             raise ProviderException(
                 response.json()["error"]["message"], code=response.status_code
@@ -298,7 +298,7 @@ class MicrosoftImageApi(ImageInterface):
                 "Ocp-Apim-Subscription-Key"
             ],
         }
-        response = requests.get(url=url, headers=headers)
+        response = http_client.get(url=url, headers=headers)
         if response.status_code != 200:
             raise ProviderException(
                 response.json()["error"]["message"], code=response.status_code
@@ -321,7 +321,7 @@ class MicrosoftImageApi(ImageInterface):
                 "Ocp-Apim-Subscription-Key"
             ]
         }
-        response = requests.get(url=url, headers=headers)
+        response = http_client.get(url=url, headers=headers)
         if response.status_code != 200:
             raise ProviderException(
                 response.json()["error"]["message"], code=response.status_code
@@ -344,7 +344,7 @@ class MicrosoftImageApi(ImageInterface):
                 "Ocp-Apim-Subscription-Key"
             ]
         }
-        response = requests.delete(url=url, headers=headers)
+        response = http_client.delete(url=url, headers=headers)
         if response.status_code != 200:
             raise ProviderException(
                 response.json()["error"]["message"], code=response.status_code
@@ -362,7 +362,7 @@ class MicrosoftImageApi(ImageInterface):
         url = f"{self.url['face']}facelists/{collection_id}/persistedFaces?detectionModel=detection_03"
         headers = self.headers["face"]
         with open(file, "rb") as file_:
-            response = requests.post(url=url, headers=headers, data=file_)
+            response = http_client.post(url=url, headers=headers, data=file_)
         if response.status_code != 200:
             raise ProviderException(
                 response.json()["error"]["message"], code=response.status_code
@@ -384,7 +384,7 @@ class MicrosoftImageApi(ImageInterface):
                 "Ocp-Apim-Subscription-Key"
             ]
         }
-        response = requests.delete(url=url, headers=headers)
+        response = http_client.delete(url=url, headers=headers)
         if response.status_code != 200:
             raise ProviderException(
                 response.json()["error"]["message"], code=response.status_code
@@ -415,7 +415,7 @@ class MicrosoftImageApi(ImageInterface):
             "faceId": face_id,
             "faceListId": collection_id,
         }
-        response = requests.post(url=url, headers=headers, json=payload)
+        response = http_client.post(url=url, headers=headers, json=payload)
         if response.status_code != 200:
             raise ProviderException(
                 response.json()["error"]["message"], code=response.status_code
@@ -452,7 +452,7 @@ class MicrosoftImageApi(ImageInterface):
             endpoint = "imageanalysis:segment?api-version=2023-02-01-preview"
             url = base_url + endpoint + f"&mode={microsoft_params.mode}"
 
-            response = requests.post(
+            response = http_client.post(
                 url,
                 headers=self.headers["vision"],
                 data=f.read(),
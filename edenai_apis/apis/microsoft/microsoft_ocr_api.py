@@ -1,8 +1,7 @@
 import json
 from collections import defaultdict
-from typing import Sequence
+from typing import Iterator, Sequence
 
-import requests
 from PIL import Image as Img
 from azure.ai.formrecognizer import DocumentAnalysisClient
 from azure.core.credentials import AzureKeyCredential
@@ -14,6 +13,8 @@ from edenai_apis.apis.microsoft.microsoft_helpers import (
     get_microsoft_urls,
     microsoft_financial_parser_formatter,
     microsoft_ocr_async_standardize_response,
+    microsoft_ocr_async_pages,
+    microsoft_ocr_tables_pages,
 )
 from edenai_apis.features.ocr import (
     Bounding_box,
@@ -40,9 +41,13 @@ from edenai_apis.features.ocr.identity_parser.identity_parser_dataclass import (
     ItemIdentityParserDataClass,
     format_date,
 )
+from edenai_apis.features.ocr.ocr_async.ocr_async_dataclass import (
+    Page as OcrAsyncPage,
+)
 from edenai_apis.features.ocr.ocr_interface import OcrInterface
 from edenai_apis.features.ocr.ocr_tables_async.ocr_tables_async_dataclass import (
     OcrTablesAsyncDataClass,
+    Page as OcrTablesPage,
 )
 from edenai_apis.features.ocr.receipt_parser.receipt_parser_dataclass import (
     MerchantInformation,
@@ -60,6 +65,7 @@ from edenai_apis.utils.types import (
     AsyncResponseType,
     ResponseType,
 )
+from edenai_apis.utils.http import http_client
 
 
 class MicrosoftOcrApi(OcrInterface):
@@ -74,7 +80,7 @@ class MicrosoftOcrApi(OcrInterface):
 
         url = f"{self.api_settings['vision']['url']}/ocr?detectOrientation=true"
 
-        request = requests.post(
+        request = http_client.post(
             url=add_query_param_in_url(url, {"language": language}),
             headers=self.headers["vision"],
             data=file_content,
@@ -369,7 +375,7 @@ class MicrosoftOcrApi(OcrInterface):
         )
         url = add_query_param_in_url(url, {"locale": language})
 
-        response = requests.post(
+        response = http_client.post(
             url,
             headers={
                 "Content-Type": "application/octet-stream",
@@ -388,11 +394,9 @@ class MicrosoftOcrApi(OcrInterface):
             provider_job_id=response.headers.get("apim-request-id")
         )
 
-    def ocr__ocr_tables_async__get_job_result(
-        self, provider_job_id: str
-    ) -> AsyncBaseResponseType[OcrTablesAsyncDataClass]:
+    def _get_layout_analysis(self, provider_job_id: str) -> dict:
+        """Result of a `prebuilt-layout` analysis job, whatever its status"""
         headers = {
-            "Content-Type": "application/octet-stream",
             "Ocp-Apim-Subscription-Key": self.api_settings["documentintelligence"][
                 "subscription_key"
             ],
@@ -403,7 +407,7 @@ class MicrosoftOcrApi(OcrInterface):
             + f"documentintelligence/documentModels/prebuilt-layout/"
             f"analyzeResults/{provider_job_id}?api-version=2024-02-29-preview"
         )
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, headers=headers)
 
         if response.status_code >= 400:
             try:
@@ -422,13 +426,30 @@ class MicrosoftOcrApi(OcrInterface):
         data = response.json()
         if data.get("error"):
             raise ProviderException(data.get("error"), code=response.status_code)
+        return data
+
+    def _succeeded_layout_analysis(self, provider_job_id: str) -> dict:
+        """Result of a `prebuilt-layout` analysis job, raises if it did not
+        succeed yet"""
+        data = self._get_layout_analysis(provider_job_id)
+        if data["status"] != "succeeded":
+            raise ProviderException(
+                f"Microsoft job {provider_job_id} is not finished yet "
+                f"(status: {data['status']})"
+            )
+        return data["analyzeResult"]
+
+    def ocr__ocr_tables_async__get_job_result(
+        self, provider_job_id: str
+    ) -> AsyncBaseResponseType[OcrTablesAsyncDataClass]:
+        data = self._get_layout_analysis(provider_job_id)
         if data["status"] == "succeeded":
             original_result = data["analyzeResult"]
             standardized_response = microsoft_ocr_tables_standardize_response(
                 original_result
             )
             return AsyncResponseType[OcrTablesAsyncDataClass](
-                original_response=data,
+                original_response=data if self.keep_original_response else None,
                 standardized_response=standardized_response,
                 provider_job_id=provider_job_id,
             )
@@ -437,6 +458,14 @@ class MicrosoftOcrApi(OcrInterface):
             provider_job_id=provider_job_id
         )
 
+    def ocr__ocr_tables_async__get_job_pages(
+        self, provider_job_id: str
+    ) -> Iterator[OcrTablesPage]:
+        """Standardized pages of a succeeded job, parsed one at a time"""
+        return microsoft_ocr_tables_pages(
+            self._succeeded_layout_analysis(provider_job_id)
+        )
+
     def ocr__ocr_async__launch_job(
         self, file: str, file_url: str = ""
     ) -> AsyncLaunchJobResponseType:
@@ -447,7 +476,7 @@ class MicrosoftOcrApi(OcrInterface):
             f"{self.url['documentintelligence']}documentintelligence/documentModels/"
             f"prebuilt-layout:analyze?api-version=2024-02-29-preview"
         )
-        response = requests.post(
+        response = http_client.post(
             url,
             headers={
                 "Content-Type": "application/octet-stream",
@@ -467,38 +496,14 @@ class MicrosoftOcrApi(OcrInterface):
     def ocr__ocr_async__get_job_result(
         self, provider_job_id: str
     ) -> AsyncBaseResponseType[OcrDataClass]:
-        headers = {
-            "Ocp-Apim-Subscription-Key": self.api_settings["documentintelligence"][
-                "subscription_key"
-            ],
-        }
-
-        url = (
-            self.url["documentintelligence"]
-            + f"documentintelligence/documentModels/prebuilt-layout/"
-            f"analyzeResults/{provider_job_id}?api-version=2024-02-29-preview"
-        )
-        response = requests.get(url, headers=headers)
-
-        if response.status_code >= 400:
-            error = response.json()["error"]["message"]
-            if "Resource not found" in error:
-                raise AsyncJobException(
-                    reason=AsyncJobExceptionReason.DEPRECATED_JOB_ID,
-                    code=response.status_code,
-                )
-            raise ProviderException(error, code=response.status_code)
-
-        data = response.json()
-        if data.get("error"):
-            raise ProviderException(data.get("error"), code=response.status_code)
+        data = self._get_layout_analysis(provider_job_id)
         if data["status"] == "succeeded":
             original_result = data["analyzeResult"]
             standardized_response = microsoft_ocr_async_standardize_response(
                 original_result
             )
             return AsyncResponseType[OcrAsyncDataClass](
-                original_response=data,
+                original_response=data if self.keep_original_response else None,
                 standardized_response=standardized_response,
                 provider_job_id=provider_job_id,
             )
@@ -507,6 +512,14 @@ class MicrosoftOcrApi(OcrInterface):
             provider_job_id=provider_job_id
         )
 
+    def ocr__ocr_async__get_job_pages(
+        self, provider_job_id: str
+    ) -> Iterator[OcrAsyncPage]:
+        """Standardized pages of a succeeded job, parsed one at a time"""
+        return microsoft_ocr_async_pages(
+            self._succeeded_layout_analysis(provider_job_id)
+        )
+
     def ocr__financial_parser(
         self,
         file: str,
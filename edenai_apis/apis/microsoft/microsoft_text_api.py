@@ -4,7 +4,6 @@ from http import HTTPStatus
 from time import sleep
 from typing import Dict, Sequence
 
-import requests
 
 from edenai_apis.features.text import AnonymizationDataClass, ModerationDataClass
 from edenai_apis.features.text import (
@@ -26,6 +25,7 @@ from edenai_apis.features.text.spell_check import SpellCheckItem, SpellCheckData
 from edenai_apis.features.text.text_interface import TextInterface
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.types import ResponseType
+from edenai_apis.utils.http import http_client
 from .microsoft_helpers import microsoft_text_moderation_personal_infos
 
 
@@ -36,7 +36,7 @@ class MicrosoftTextApi(TextInterface):
         if not language:
             language = ""
         try:
-            response = requests.post(
+            response = http_client.post(
                 f"{self.url['text_moderation']}&language={language}",
                 headers=self.headers["text_moderation"],
                 json={"text": text},
@@ -71,7 +71,7 @@ class MicrosoftTextApi(TextInterface):
         the entities and their importances
         """
 
-        response = requests.post(
+        response = http_client.post(
             f"{self.url['text']}",
             headers=self.headers["text"],
             json={
@@ -129,7 +129,7 @@ class MicrosoftTextApi(TextInterface):
         :return:            String that contains output result
         """
 
-        response = requests.post(
+        response = http_client.post(
             self.url["summarization"],
             headers=self.headers["text"],
             json={
@@ -158,7 +158,7 @@ class MicrosoftTextApi(TextInterface):
         if get_url is None:
             raise ProviderException("Microsoft Azure couldn't create job")
 
-        get_response = requests.get(url=get_url, headers=self.headers["text"])
+        get_response = http_client.get(url=get_url, headers=self.headers["text"])
         if get_response.status_code != 200:
             err = get_response.json().get("error", {})
             error_msg = err.get("message", "Microsoft Azure couldn't fetch job")
@@ -181,7 +181,7 @@ class MicrosoftTextApi(TextInterface):
                 break
             sleep(6)
             wait_time += 6
-            get_response = requests.get(url=get_url, headers=self.headers["text"])
+            get_response = http_client.get(url=get_url, headers=self.headers["text"])
             data = get_response.json()
 
         standardized_response = SummarizeDataClass(result=summary)
@@ -194,7 +194,7 @@ class MicrosoftTextApi(TextInterface):
         self, text: str, language: str
     ) -> ResponseType[AnonymizationDataClass]:
         try:
-            response = requests.post(
+            response = http_client.post(
                 f"{self.url['text']}",
                 headers=self.headers["text"],
                 json={
@@ -267,7 +267,7 @@ class MicrosoftTextApi(TextInterface):
         :return:            TextSentimentAnalysis Object that contains sentiments and their rates
         """
         try:
-            response = requests.post(
+            response = http_client.post(
                 f"{self.url['text']}",
                 headers=self.headers["text"],
                 json={
@@ -359,7 +359,7 @@ class MicrosoftTextApi(TextInterface):
         """
 
         try:
-            response = requests.post(
+            response = http_client.post(
                 f"{self.url['text']}",
                 headers=self.headers["text"],
                 json={
@@ -404,7 +404,7 @@ class MicrosoftTextApi(TextInterface):
         data = {"text": text}
         params = {"mkt": language, "mode": "spell"}
 
-        response = requests.post(
+        response = http_client.post(
             self.url["spell_check"],
             headers=self.headers["spell_check"],
             data=data,
@@ -13,6 +13,7 @@ from edenai_apis.utils.conversion import add_query_param_in_url
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.languages import get_language_name_from_code
 from edenai_apis.utils.types import ResponseType
+from edenai_apis.utils.http import http_client
 
 
 class MicrosoftTranslationApi(TranslationInterface):
@@ -36,7 +37,7 @@ class MicrosoftTranslationApi(TranslationInterface):
     def translation__language_detection(
         self, text
     ) -> ResponseType[LanguageDetectionDataClass]:
-        response = requests.post(
+        response = http_client.post(
             url=f"{self.url['text']}",
             headers=self.headers["text"],
             json={
@@ -88,7 +89,7 @@ class MicrosoftTranslationApi(TranslationInterface):
             }
         ]
         # Getting response of API
-        response = requests.post(url, headers=self.headers["translator"], json=body)
+        response = http_client.post(url, headers=self.headers["translator"], json=body)
         self._raise_on_error(response)
         data = response.json()
 
@@ -18,8 +18,11 @@ from edenai_apis.features.text.generation.generation_dataclass import (
 )
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.embeddings import batched_embeddings
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.streaming import iter_sse_data
 from edenai_apis.utils.types import ResponseType
+from edenai_apis.utils.http import http_client
 
 
 class MistralApi(ProviderInterface, TextInterface):
@@ -42,17 +45,13 @@ class MistralApi(ProviderInterface, TextInterface):
         Yields:
             Generator: generator of messages
         """
-        for res in response.iter_lines():
-            chunk = res.decode().split("data: ")
-            if len(chunk) > 1:
-                if chunk[1] != "[DONE]":
-                    data = json.loads(chunk[1])
-                    yield ChatStreamResponse(
-                        text=data["choices"][0]["delta"]["content"],
-                        blocked=not data["choices"][0].get("finish_reason")
-                        in (None, "stop"),
-                        provider=self.provider_name,
-                    )
+        for chunk in iter_sse_data(response):
+            data = json.loads(chunk)
+            yield ChatStreamResponse(
+                text=data["choices"][0]["delta"]["content"],
+                blocked=not data["choices"][0].get("finish_reason") in (None, "stop"),
+                provider=self.provider_name,
+            )
 
     def text__generation(
         self, text: str, temperature: float, max_tokens: int, model: str
@@ -71,7 +70,7 @@ class MistralApi(ProviderInterface, TextInterface):
             "temperature": temperature,
             "max_tokens": max_tokens,
         }
-        response = requests.post(
+        response = http_client.post(
             self.url + "v1/chat/completions", json=payload, headers=self.headers
         )
         try:
@@ -165,7 +164,7 @@ class MistralApi(ProviderInterface, TextInterface):
             payload["tool_choice"] = "any" if tool_choice == "required" else tool_choice
 
         if not stream:
-            response = requests.post(
+            response = http_client.post(
                 self.url + "v1/chat/completions", json=payload, headers=self.headers
             )
             try:
@@ -214,7 +213,7 @@ class MistralApi(ProviderInterface, TextInterface):
             )
         else:
             payload["stream"] = True
-            response = requests.post(
+            response = http_client.post(
                 self.url + "v1/chat/completions",
                 json=payload,
                 headers=self.headers,
@@ -226,12 +225,11 @@ class MistralApi(ProviderInterface, TextInterface):
                 standardized_response=StreamChat(stream=response),
             )
 
-    def text__embeddings(
-        self, texts: List[str], model: Optional[str] = None
+    def __embeddings_request(
+        self, texts: List[str], model: str
     ) -> ResponseType[EmbeddingsDataClass]:
-        model = model.split("__")[1]
         payload = {"model": model, "input": texts}
-        response = requests.post(
+        response = http_client.post(
             url=self.url + "v1/embeddings", json=payload, headers=self.headers
         )
         try:
@@ -252,3 +250,14 @@ class MistralApi(ProviderInterface, TextInterface):
             original_response=original_response,
             standardized_response=EmbeddingsDataClass(items=items),
         )
+
+    def text__embeddings(
+        self, texts: List[str], model: Optional[str] = None
+    ) -> ResponseType[EmbeddingsDataClass]:
+        model = model.split("__")[1]
+        return batched_embeddings(
+            self.provider_name,
+            texts,
+            lambda batch: self.__embeddings_request(batch, model),
+            model=model,
+        )
@@ -52,6 +52,7 @@ from edenai_apis.utils.types import (
     AsyncResponseType,
     ResponseType,
 )
+from edenai_apis.utils.http import http_client
 
 
 def strip_nyckel_prefix(prefixed_id: str) -> str:
@@ -89,7 +90,7 @@ class NyckelApi(ProviderInterface, ImageInterface):
             "grant_type": "client_credentials",
         }
 
-        response = requests.post(url, data=data)
+        response = http_client.post(url, data=data)
         if not response.status_code == 200:
             self._raise_provider_exception(url, data, response)
 
@@ -160,7 +161,7 @@ class NyckelApi(ProviderInterface, ImageInterface):
 
         # The response 'data' key points to a url where we can fetch the image.
         try:
-            fetch_image_response = requests.get(response.json()[0]["data"])
+            fetch_image_response = http_client.get(response.json()[0]["data"])
             if fetch_image_response.status_code >= 400:
                 self._raise_provider_exception(url, {}, fetch_image_response)
         except IndexError:
@@ -2,7 +2,6 @@ import itertools
 import json
 import asyncio
 import os
-from time import sleep
 from typing import Dict, List, Literal, Optional, Sequence, Union
 from edenai_apis.features.text.chat.helpers import get_tool_call_from_history_by_id
 
@@ -65,9 +64,12 @@ from edenai_apis.utils.conversion import (
     find_all_occurrence,
     standardized_confidence_score,
 )
+from edenai_apis.utils.embeddings import batched_embeddings
 from edenai_apis.utils.exception import ProviderException
-from edenai_apis.utils.metrics import METRICS
+from edenai_apis.utils.metrics import top_k_similarities
+from edenai_apis.utils.poller import run_assistant
 from edenai_apis.utils.types import ResponseType
+from edenai_apis.utils.http import http_client
 from .helpers import (
     construct_anonymization_context,
     construct_classification_instruction,
@@ -117,14 +119,10 @@ class OllamaTextApi(TextInterface):
             ]
         )
 
-        run = self.client.beta.threads.runs.create_and_poll(
-            thread_id=thread.id,
-            assistant_id=assistant.id,
+        run = run_assistant(
+            self.client, thread.id, assistant.id, provider_name=self.provider_name
         )
 
-        while run.status != "completed":
-            sleep(1)
-
         messages = self.client.beta.threads.messages.list(thread_id=thread.id)
         usage = run.to_dict()["usage"]
         original_response = messages.to_dict()
@@ -156,7 +154,7 @@ class OllamaTextApi(TextInterface):
             "messages": messages,
         }
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = get_openapi_response(response)
 
         standardized_response = SummarizeDataClass(
@@ -173,7 +171,7 @@ class OllamaTextApi(TextInterface):
         self, text: str, language: str
     ) -> ResponseType[ModerationDataClass]:
         try:
-            response = requests.post(
+            response = http_client.post(
                 f"{self.url}/moderations", headers=self.headers, json={"input": text}
             )
         except Exception as exc:
@@ -216,41 +214,39 @@ class OllamaTextApi(TextInterface):
             "cosine", "hamming", "manhattan", "euclidean"
         ] = "cosine",
         model: str = None,
+        top_k: Optional[int] = None,
     ) -> ResponseType[SearchDataClass]:
         if model is None:
             model = "1536__text-embedding-ada-002"
 
-        # Import the function
-        function_score = METRICS[similarity_metric]
-
         # Embed the texts & query
-        texts_embed_response = OllamaTextApi.text__embeddings(
+        texts_embed_result = OllamaTextApi.text__embeddings(
             self, texts=texts, model=model
-        ).original_response
-        query_embed_response = OllamaTextApi.text__embeddings(
+        )
+        query_embed_result = OllamaTextApi.text__embeddings(
             self, texts=[query], model=model
-        ).original_response
+        )
+        texts_embed_response = texts_embed_result.original_response
+        query_embed_response = query_embed_result.original_response
 
         # Extract Tokens consumed
         texts_usage = texts_embed_response.get("usage").get("total_tokens")
         query_usage = query_embed_response.get("usage").get("total_tokens")
 
         # Extracts embeddings from texts & query
-        texts_embed = [item["embedding"] for item in texts_embed_response.get("data")]
-        query_embed = query_embed_response["data"][0]["embedding"]
-
-        items = []
-        # Calculate score for each text index
-        for index, text in enumerate(texts_embed):
-            score = function_score(query_embed, text)
-            items.append(
-                InfosSearchDataClass(
-                    object="search_result", document=index, score=score
-                )
-            )
+        texts_embed = texts_embed_result.standardized_response.to_array()
+        query_embed = query_embed_result.standardized_response.to_array()[0]
 
-        # Sort items by score in descending order
-        sorted_items = sorted(items, key=lambda x: x.score, reverse=True)
+        # Score all texts at once and keep the best ones, sorted by descending score
+        indexes, scores = top_k_similarities(
+            query_embed, texts_embed, similarity_metric, top_k
+        )
+        sorted_items = [
+            InfosSearchDataClass(
+                object="search_result", document=int(index), score=float(score)
+            )
+            for index, score in zip(indexes, scores)
+        ]
 
         # Build the original response
         original_response = {
@@ -300,7 +296,7 @@ class OllamaTextApi(TextInterface):
             "frequency_penalty": 0,
             "presence_penalty": 0,
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = get_openapi_response(response)
 
         answers = []
@@ -336,7 +332,7 @@ class OllamaTextApi(TextInterface):
             "messages": messages,
         }
         url = f"{self.url}/chat/completions"
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = get_openapi_response(response)
         pii_data = original_response["choices"][0]["message"]["content"]
         try:
@@ -456,7 +452,7 @@ class OllamaTextApi(TextInterface):
         }
 
         try:
-            response = requests.post(url, json=payload, headers=self.headers)
+            response = http_client.post(url, json=payload, headers=self.headers)
         except requests.exceptions.ChunkedEncodingError:
             raise ProviderException("Connection closed with provider", 400)
         original_response = get_openapi_response(response)
@@ -487,7 +483,7 @@ class OllamaTextApi(TextInterface):
         if max_tokens != 0:
             payload["max_tokens"] = max_tokens
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = get_openapi_response(response)
 
         standardized_response = GenerationDataClass(
@@ -584,19 +580,16 @@ class OllamaTextApi(TextInterface):
             original_response=original_response, standardized_response=result
         )
 
-    def text__embeddings(
+    def __embeddings_request(
         self, texts: List[str], model: str
     ) -> ResponseType[EmbeddingsDataClass]:
         url = "https://api.openai.com/v1/embeddings"
-        model = model.split("__")
-        if len(texts) == 1:
-            texts = texts[0]
         payload = {
-            "input": texts,
-            "model": model[1],
+            "input": texts[0] if len(texts) == 1 else texts,
+            "model": model,
         }
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = get_openapi_response(response)
 
         items: Sequence[EmbeddingsDataClass] = []
@@ -612,6 +605,17 @@ class OllamaTextApi(TextInterface):
             standardized_response=standardized_response,
         )
 
+    def text__embeddings(
+        self, texts: List[str], model: str
+    ) -> ResponseType[EmbeddingsDataClass]:
+        model = model.split("__")[1]
+        return batched_embeddings(
+            self.provider_name,
+            texts,
+            lambda batch: self.__embeddings_request(batch, model),
+            model=model,
+        )
+
     def text__chat(
         self,
         text: str,
@@ -760,10 +764,10 @@ class OllamaTextApi(TextInterface):
             "n": 3,
         }
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = get_openapi_response(response)
 
-        missing_information_call = requests.post(
+        missing_information_call = http_client.post(
             url,
             json={
                 "model": "gpt-4",
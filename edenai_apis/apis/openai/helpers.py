@@ -1,11 +1,19 @@
+import asyncio
+import hashlib
 import json
-import aiohttp
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
-from typing import List, Optional, Dict
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import aiohttp
 
 from requests import Response
 
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import get_retry_after
 from edenai_apis.utils.languages import get_language_name_from_code
 from .prompts_guidelines import (
     anthropic_prompt_guidelines,
@@ -143,7 +151,11 @@ def get_openapi_response(response: Response):
             raise ProviderException(message_error, code=response.status_code)
         return original_response
     except Exception:
-        raise ProviderException(response.text, code=response.status_code)
+        raise ProviderException(
+            response.text,
+            code=response.status_code,
+            retry_after=get_retry_after(response),
+        )
 
 
 # def construct_spell_check_instruction(text: str, language: str) -> str:
@@ -403,36 +415,223 @@ def convert_tool_results_to_openai_tool_calls(tools_results: List[dict]):
     return result
 
 
-async def moderate_content(headers, content: str) -> bool:
-    if not content:
+MODERATION_URL = "https://api.openai.com/v1/moderations"
+MODERATION_REJECTED_MESSAGE = (
+    "Content rejected due to violation of sexual content policies."
+)
+# max inputs sent in one /moderations request
+MODERATION_BATCH_SIZE = 32
+DEFAULT_MODERATION_CACHE_SIZE = 10_000
+DEFAULT_MODERATION_WORKERS = 16
+# moderate chat inputs while the completion is requested (see `ModeratedCompletion`)
+CONCURRENT_MODERATION = os.environ.get("EDENAI_OPENAI_CONCURRENT_MODERATION") is not None
+
+
+def is_rejected_by_moderation(result: Dict[str, Any]) -> bool:
+    """Only flagged sexual content is rejected"""
+    if not result.get("flagged"):
         return False
+    categories = result.get("categories") or {}
+    return bool(categories.get("sexual") or categories.get("sexual/minors"))
+
+
+class ModerationCache:
+    """Moderation verdicts (rejected or not) of already checked contents, by
+    content hash, so the history of a conversation is not moderated again on
+    every turn (least recently used verdicts are dropped first)
+
+    Args:
+        max_size (int): number of verdicts kept
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MODERATION_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._verdicts: "OrderedDict[str, bool]" = OrderedDict()
+
+    @staticmethod
+    def _key(content: str) -> str:
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def get(self, content: str) -> Optional[bool]:
+        key = self._key(content)
+        with self._lock:
+            rejected = self._verdicts.get(key)
+            if rejected is not None:
+                self._verdicts.move_to_end(key)
+            return rejected
+
+    def set(self, content: str, rejected: bool) -> None:
+        key = self._key(content)
+        with self._lock:
+            self._verdicts[key] = rejected
+            self._verdicts.move_to_end(key)
+            while len(self._verdicts) > self.max_size:
+                self._verdicts.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._verdicts.clear()
+
+
+MODERATION_CACHE = ModerationCache(
+    int(os.environ.get("EDENAI_MODERATION_CACHE_SIZE", DEFAULT_MODERATION_CACHE_SIZE))
+)
+
+
+def get_moderation_inputs(
+    text: Optional[str] = None,
+    chatbot_global_action: Optional[str] = None,
+    instruction: Optional[str] = None,
+    previous_history: Optional[List[Dict[str, Any]]] = None,
+    texts: Optional[List[str]] = None,
+    messages: Optional[List[Dict[str, Any]]] = None,
+) -> List[str]:
+    """Distinct non empty strings to moderate among the inputs of a call"""
+    contents: List[Any] = [text, chatbot_global_action, instruction]
+    contents.extend(
+        item.get("message") for item in previous_history or [] if isinstance(item, dict)
+    )
+    contents.extend(texts or [])
+    for message in messages or []:
+        if isinstance(message, dict) and "content" in message:
+            contents.extend(
+                content["content"].get("text")
+                for content in message["content"]
+                if isinstance(content, dict) and "content" in content
+            )
+    return list(
+        dict.fromkeys(
+            content for content in contents if content and isinstance(content, str)
+        )
+    )
+
+
+async def _moderate_batch(
+    session: aiohttp.ClientSession, headers: Dict[str, str], contents: List[str]
+) -> Optional[List[Dict[str, Any]]]:
+    async with session.post(
+        MODERATION_URL, headers=headers, json={"input": contents}
+    ) as response:
+        response_data = await get_openapi_response_async(response)
+    if response_data is None:
+        # rate limited: the contents are let through
+        return None
+    return response_data["results"]
+
 
+async def moderate_contents(
+    headers: Dict[str, str],
+    contents: Iterable[str],
+    cache: ModerationCache = MODERATION_CACHE,
+) -> None:
+    """Moderate all the contents at once (one `/moderations` request per
+    `MODERATION_BATCH_SIZE` contents not in the cache)
+
+    Raises:
+        ProviderException: if a content is rejected
+    """
+    to_moderate = []
+    for content in dict.fromkeys(contents):
+        rejected = cache.get(content)
+        if rejected:
+            raise ProviderException(message=MODERATION_REJECTED_MESSAGE, code=400)
+        if rejected is None:
+            to_moderate.append(content)
+    if not to_moderate:
+        return
+
+    batches = [
+        to_moderate[index : index + MODERATION_BATCH_SIZE]
+        for index in range(0, len(to_moderate), MODERATION_BATCH_SIZE)
+    ]
     async with aiohttp.ClientSession() as session:
-        async with session.post(
-            "https://api.openai.com/v1/moderations",
-            headers=headers,
-            json={"input": content},
-        ) as response:
-            response_data = await get_openapi_response_async(response)
+        batches_results = await asyncio.gather(
+            *(_moderate_batch(session, headers, batch) for batch in batches)
+        )
+
+    rejected_content = False
+    for batch, results in zip(batches, batches_results):
+        if results is None:
+            continue
+        for content, result in zip(batch, results):
+            rejected = is_rejected_by_moderation(result)
+            cache.set(content, rejected)
+            rejected_content = rejected_content or rejected
+    if rejected_content:
+        raise ProviderException(message=MODERATION_REJECTED_MESSAGE, code=400)
 
-            if response_data is None:
-                return False
 
-            flagged = response_data["results"][0]["flagged"]
+async def moderate_content(headers, content: str) -> bool:
+    if not content:
+        return False
 
-            if flagged:
-                categories = response_data["results"][0]["categories"]
-                if categories["sexual"] or categories["sexual/minors"]:
-                    message = "Content rejected due to violation of sexual content policies."
-                    raise ProviderException(message=message, code=400)
+    async with aiohttp.ClientSession() as session:
+        results = await _moderate_batch(session, headers, [content])
 
-                return False
-    return not flagged
+    if results is None:
+        return False
+    if is_rejected_by_moderation(results[0]):
+        raise ProviderException(message=MODERATION_REJECTED_MESSAGE, code=400)
+    return not results[0]["flagged"]
 
 
 async def moderate_if_exists(headers, value):
     if value and isinstance(value, str):
-        await moderate_content(headers, value)  # could be a problem
+        await moderate_contents(headers, [value])
+
+
+_moderation_executor: Optional[ThreadPoolExecutor] = None
+_moderation_executor_lock = threading.Lock()
+
+
+def get_moderation_executor() -> ThreadPoolExecutor:
+    """Threads running moderation concurrently with chat completions, separate
+    from `utils.concurrency` offload pool which may be running the completion"""
+    global _moderation_executor
+    if _moderation_executor is None:
+        with _moderation_executor_lock:
+            if _moderation_executor is None:
+                _moderation_executor = ThreadPoolExecutor(
+                    max_workers=int(
+                        os.environ.get(
+                            "EDENAI_MODERATION_WORKERS", DEFAULT_MODERATION_WORKERS
+                        )
+                    ),
+                    thread_name_prefix="edenai-moderation",
+                )
+    return _moderation_executor
+
+
+class ModeratedCompletion:
+    """Moderation of a chat completion inputs, running while the completion is
+    requested
+
+    Args:
+        moderation (Future): running moderation, raising `ProviderException` if
+            the content is rejected
+    """
+
+    def __init__(self, moderation: "Future[None]") -> None:
+        self.moderation = moderation
+
+    def check(self, response: Any = None) -> None:
+        """Wait for the moderation, the response is closed if it rejected the
+        content"""
+        try:
+            self.moderation.result()
+        except BaseException:
+            close = getattr(response, "close", None)
+            if close is not None:
+                close()
+            raise
+
+    def stream(self, response: Any) -> Iterator[Any]:
+        """Chunks of a streamed completion, released once the content passed
+        moderation (a rejected content closes the stream, which stops the
+        generation, before its first chunk)"""
+        self.check(response)
+        yield from response
 
 
 async def get_openapi_response_async(response: aiohttp.ClientResponse):
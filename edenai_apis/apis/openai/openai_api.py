@@ -1,7 +1,6 @@
 import random
+from concurrent.futures import Future
 from typing import Dict
-import asyncio
-import aiohttp
 
 import openai
 from openai import OpenAI
@@ -12,7 +11,13 @@ from edenai_apis.apis.openai.openai_image_api import OpenaiImageApi
 from edenai_apis.apis.openai.openai_text_api import OpenaiTextApi
 from edenai_apis.apis.openai.openai_translation_api import OpenaiTranslationApi
 from edenai_apis.apis.openai.openai_multimodal_api import OpenaiMultimodalApi
-from edenai_apis.apis.openai.helpers import moderate_if_exists
+from edenai_apis.apis.openai.helpers import (
+    CONCURRENT_MODERATION,
+    ModeratedCompletion,
+    get_moderation_executor,
+    get_moderation_inputs,
+    moderate_contents,
+)
 from edenai_apis.features.provider.provider_interface import ProviderInterface
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
@@ -59,41 +64,27 @@ class OpenaiApi(
         self.webhook_settings = load_provider(ProviderDataEnum.KEY, "webhooksite")
         self.webhook_token = self.webhook_settings["webhook_token"]
         self.moderation_flag = True
+        self.concurrent_moderation = CONCURRENT_MODERATION
 
     async def check_content_moderation_async(self, *args, **kwargs):
-        tasks = []
-
-        tasks.append(moderate_if_exists(self.headers, kwargs.get("text")))
-        tasks.append(
-            moderate_if_exists(self.headers, kwargs.get("chatbot_global_action"))
-        )
-        tasks.append(moderate_if_exists(self.headers, kwargs.get("instruction")))
-
-        if "previous_history" in kwargs:
-            tasks.extend(
-                moderate_if_exists(self.headers, item.get("message"))
-                for item in kwargs["previous_history"]
-                if isinstance(item, dict)
-            )
-
-        if "texts" in kwargs:
-            tasks.extend(
-                moderate_if_exists(self.headers, item) for item in kwargs["texts"]
-            )
-
-        if "messages" in kwargs:
-            for message in kwargs["messages"]:
-                if isinstance(message, dict) and "content" in message:
-                    for content in message["content"]:
-                        if isinstance(content, dict) and "content" in content:
-                            tasks.append(
-                                moderate_if_exists(
-                                    self.headers, content["content"].get("text")
-                                )
-                            )
-
-        async with aiohttp.ClientSession() as session:
-            await asyncio.gather(*tasks)
+        await moderate_contents(self.headers, get_moderation_inputs(**kwargs))
 
     def check_content_moderation(self, *args, **kwargs):
         async_to_sync(self.check_content_moderation_async)(*args, **kwargs)
+
+    def start_content_moderation(self, **kwargs) -> ModeratedCompletion:
+        """Moderation of the inputs of a chat completion, to `check` (or read the
+        completion `stream` through) before using the completion.
+
+        With `concurrent_moderation`, inputs are moderated while the completion is
+        requested, else the moderation is done (and raises) right away."""
+        if self.concurrent_moderation:
+            return ModeratedCompletion(
+                get_moderation_executor().submit(
+                    self.check_content_moderation, **kwargs
+                )
+            )
+        self.check_content_moderation(**kwargs)
+        moderation: "Future[None]" = Future()
+        moderation.set_result(None)
+        return ModeratedCompletion(moderation)
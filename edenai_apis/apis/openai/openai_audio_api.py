@@ -23,6 +23,7 @@ from edenai_apis.utils.types import (
 )
 
 from edenai_apis.utils.upload_gcs import BUCKET, upload_file_bytes_to_gcs
+from edenai_apis.utils.http import http_client
 
 from .helpers import convert_tts_audio_rate
 
@@ -50,7 +51,7 @@ class OpenaiAudioApi(AudioInterface):
         with open(file, "rb") as file_:
             files = {"file": file_}
             payload = {"model": "whisper-1", "language": language, **provider_params}
-            response = requests.post(url, data=payload, files=files, headers=headers)
+            response = http_client.post(url, data=payload, files=files, headers=headers)
             if response.status_code != 200:
                 raise ProviderException(response.text, response.status_code)
 
@@ -115,7 +116,7 @@ class OpenaiAudioApi(AudioInterface):
             "speed": speed,
             "response_format": audio_format,
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = response.content
         audio_content = BytesIO(response.content)
         audio = base64.b64encode(audio_content.read()).decode("utf-8")
@@ -1,7 +1,6 @@
 import json
 import os
 import fitz
-from time import sleep
 
 from edenai_apis.features.ocr import (
     FinancialParserDataClass,
@@ -12,6 +11,7 @@ from edenai_apis.features.ocr import (
 from edenai_apis.utils.types import ResponseType
 from edenai_apis.features import OcrInterface
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.poller import run_assistant
 
 
 def extract_text_from_pdf(pdf_path):
@@ -64,14 +64,10 @@ class OpenaiDocParsingApi(OcrInterface):
             ]
         )
 
-        run = self.client.beta.threads.runs.create_and_poll(
-            thread_id=thread.id,
-            assistant_id=assistant.id,
+        run = run_assistant(
+            self.client, thread.id, assistant.id, provider_name=self.provider_name
         )
 
-        while run.status != "completed":
-            sleep(1)
-
         messages = self.client.beta.threads.messages.list(thread_id=thread.id)
         usage = run.to_dict()["usage"]
         original_response = messages.to_dict()
@@ -5,12 +5,10 @@ import json
 from io import BytesIO
 from json import JSONDecodeError
 from typing import Sequence, Literal, Optional
-from time import sleep
 
 from openai import OpenAI, APIError
 
 
-import requests
 import mimetypes
 
 from edenai_apis.features import ImageInterface
@@ -31,6 +29,8 @@ from edenai_apis.features.image.variation import (
 )
 from edenai_apis.utils.types import ResponseType
 from edenai_apis.utils.upload_s3 import USER_PROCESS, upload_file_bytes_to_s3
+from edenai_apis.utils.http import http_client
+from edenai_apis.utils.poller import run_assistant
 from .tools import OpenAIFunctionTools
 from .helpers import get_openapi_response
 from ...features.image.question_answer import QuestionAnswerDataClass
@@ -55,7 +55,7 @@ class OpenaiImageApi(ImageInterface):
             "size": resolution,
             "response_format": "b64_json",
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = get_openapi_response(response)
 
         generations: Sequence[GeneratedImageDataClass] = []
@@ -113,7 +113,7 @@ class OpenaiImageApi(ImageInterface):
                 "temperature": temperature,
             }
 
-            response = requests.post(url, json=payload, headers=self.headers)
+            response = http_client.post(url, json=payload, headers=self.headers)
 
             if response.status_code >= 500:
                 raise ProviderException(
@@ -216,14 +216,10 @@ class OpenaiImageApi(ImageInterface):
             ]
         )
 
-        run = self.client.beta.threads.runs.create_and_poll(
-            thread_id=thread.id,
-            assistant_id=assistant.id,
+        run = run_assistant(
+            self.client, thread.id, assistant.id, provider_name=self.provider_name
         )
 
-        while run.status != "completed":
-            sleep(1)
-
         messages = self.client.beta.threads.messages.list(thread_id=thread.id)
         usage = run.to_dict()["usage"]
         original_response = messages.to_dict()
@@ -94,7 +94,7 @@ class OpenaiMultimodalApi(MultimodalInterface):
         response_format=None,
     ) -> ResponseType[Union[ChatDataClass, StreamChat]]:
 
-        self.check_content_moderation(
+        moderation = self.start_content_moderation(
             messages=messages, chatbot_global_action=chatbot_global_action
         )
 
@@ -129,6 +129,7 @@ class OpenaiMultimodalApi(MultimodalInterface):
             raise ProviderException(str(exc))
 
         if stream is False:
+            moderation.check()
             generated_text = response.choices[0].message.content
 
             standardized_response = ChatDataClass.generate_standardized_response(
@@ -147,7 +148,7 @@ class OpenaiMultimodalApi(MultimodalInterface):
                     in (None, "stop"),
                     provider="openai",
                 )
-                for chunk in response
+                for chunk in moderation.stream(response)
                 if chunk
             )
 
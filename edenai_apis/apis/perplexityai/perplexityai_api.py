@@ -2,9 +2,11 @@ from edenai_apis.features import ProviderInterface, TextInterface
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.streaming import iter_sse_data
 from edenai_apis.utils.types import ResponseType
 from edenai_apis.features.text import ChatDataClass, ChatMessageDataClass
 from edenai_apis.features.text.chat.chat_dataclass import StreamChat, ChatStreamResponse
+from edenai_apis.utils.http import http_client
 from typing import Dict, List, Literal, Optional, Union, Generator
 import requests
 import json
@@ -28,19 +30,9 @@ class PerplexityApi(ProviderInterface, TextInterface):
 
     @staticmethod
     def __text_to_json(
-        lst_data: List[str],
+        response: requests.Response,
     ) -> Generator[ChatStreamResponse, None, None]:
-        length = len(lst_data)
-        i = 0
-        while i < length:
-            if lst_data[i].startswith("data:"):
-                lst_data[i] = lst_data[i].replace("data: ", "")
-                lst_data[i] = lst_data[i].replace("\r", "")
-                i += 1
-            else:
-                lst_data.pop(i)
-            length = len(lst_data)
-        for token in lst_data:
+        for token in iter_sse_data(response):
             jsonres = json.loads(token)
             if error := jsonres.get("error"):
                 raise ProviderException(error.get("message"), error.get("code") or 400)
@@ -86,7 +78,9 @@ class PerplexityApi(ProviderInterface, TextInterface):
             "max_tokens": max_tokens,
             "stream": stream,
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(
+            url, json=payload, headers=self.headers, stream=stream
+        )
         if response.status_code != 200:
             raise ProviderException(response.text, response.status_code)
         else:
@@ -112,11 +106,9 @@ class PerplexityApi(ProviderInterface, TextInterface):
                     standardized_response=standardized_response,
                 )
             else:
-                data = response.text
-                lst_data = data.split("\n")
                 return ResponseType[StreamChat](
                     original_response=None,
                     standardized_response=StreamChat(
-                        stream=self.__text_to_json(lst_data)
+                        stream=self.__text_to_json(response)
                     ),
                 )
@@ -5,7 +5,6 @@ import uuid
 from io import BytesIO
 from typing import Dict, List
 
-import requests
 from apis.amazon.helpers import check_webhook_result
 
 from edenai_apis.features import OcrInterface, ProviderInterface, TextInterface
@@ -29,6 +28,7 @@ from edenai_apis.utils.types import (
     ResponseType,
 )
 from edenai_apis.utils.upload_s3 import USER_PROCESS, upload_file_bytes_to_s3
+from edenai_apis.utils.http import http_client
 
 
 class PrivateaiApi(ProviderInterface, OcrInterface, TextInterface):
@@ -65,7 +65,7 @@ class PrivateaiApi(ProviderInterface, OcrInterface, TextInterface):
                 "return_entity": True,
             },
         }
-        response = requests.post(
+        response = http_client.post(
             url=self.url + "v3/process/files/base64",
             data=json.dumps(data),
             headers=self.headers,
@@ -98,7 +98,7 @@ class PrivateaiApi(ProviderInterface, OcrInterface, TextInterface):
             "text": [text],
             "entity_detection": {"accuracy": "high", "return_entity": True},
         }
-        response = requests.post(
+        response = http_client.post(
             url=self.url + "v3/process/text", json=payload, headers=self.headers
         )
 
@@ -1,7 +1,6 @@
 from http import HTTPStatus
 from typing import Dict, Optional, Any, List
 
-import requests
 
 from edenai_apis.features.provider.provider_interface import ProviderInterface
 from edenai_apis.features.text.spell_check.spell_check_dataclass import (
@@ -14,6 +13,7 @@ from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.types import ResponseType
+from edenai_apis.utils.http import http_client
 
 
 class ProWritingAidApi(ProviderInterface, TextInterface):
@@ -46,7 +46,7 @@ class ProWritingAidApi(ProviderInterface, TextInterface):
             "documentType": 0,
         }
 
-        response = requests.post(
+        response = http_client.post(
             url=f"{self.api_url}/text", headers=self.headers, json=payload
         )
 
@@ -1,3 +1,5 @@
+from edenai_apis.utils.poller import PollingPolicy
+
 get_model_id = {
     "llama-2-70b" : "14ce4448d5e7e9ed0c37745ac46eca157aab09061f0c179ac2b323b5de56552b",
     "llama-2-70b-chat" :"58d078176e02c219e11eb4da5a02a7830a283b14cf8f94537af893ccff5ee781"
@@ -6,4 +8,7 @@ get_model_id_image = {
     "anime-style" : "09a5805203f4c12da649ec1923bb7729517ca25fcac790e640eaa9ed66573b65",
     "classic" : "c0259010b93e7a4102a4ba946d70e06d7d0c7dc007201af443cfc8f943ab1d3c",
     "vintedois-diffusion" : "28cea91bdfced0e2dc7fda466cc0a46501c0edc84905b2120ea02e0707b967fd",
-}
\ No newline at end of file
+}
+
+PREDICTION_FINAL_STATUSES = ("succeeded", "failed", "canceled")
+PREDICTION_POLLING_POLICY = PollingPolicy(initial_delay=0.5, max_delay=5, timeout=600)
@@ -18,8 +18,16 @@ from edenai_apis.features.text import (
 from edenai_apis.features.text.chat.chat_dataclass import StreamChat, ChatStreamResponse
 from edenai_apis.loaders.loaders import load_provider, ProviderDataEnum
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.poller import poll
+from edenai_apis.utils.streaming import iter_lines, iter_sse
 from edenai_apis.utils.types import ResponseType
-from .config import get_model_id, get_model_id_image
+from edenai_apis.utils.http import http_client
+from .config import (
+    PREDICTION_FINAL_STATUSES,
+    PREDICTION_POLLING_POLICY,
+    get_model_id,
+    get_model_id_image,
+)
 
 
 class ReplicateApi(ProviderInterface, ImageInterface, TextInterface):
@@ -63,28 +71,21 @@ class ReplicateApi(ProviderInterface, ImageInterface, TextInterface):
 
     def __get_stream_response(self, url: str) -> Generator:
         headers = {**self.headers, "Accept": "text/event-stream"}
-        response = requests.get(url, headers=headers, stream=True)
-        last_chunk = ""
-        for chunk in response.iter_lines():
-            if b"event: done" in chunk:
-                response.close()
-                break
-            elif last_chunk == b"event: error" and chunk.startswith(b"data: "):
-                yield ChatStreamResponse(
-                    text="[ERROR]", blocked=True, provider=self.provider_name
-                )
-            elif chunk.startswith(b"data: "):
-                if last_chunk == b"data: " and chunk == b"data: ":
+        response = http_client.get(url, headers=headers, stream=True)
+        try:
+            for event in iter_sse(iter_lines(response)):
+                if event.event == "done":
+                    break
+                if event.event == "error":
                     yield ChatStreamResponse(
-                        text="\n", blocked=False, provider=self.provider_name
+                        text="[ERROR]", blocked=True, provider=self.provider_name
                     )
-                else:
+                elif event.event == "output":
                     yield ChatStreamResponse(
-                        text=chunk.decode("utf-8").replace("data: ", ""),
-                        blocked=False,
-                        provider=self.provider_name,
+                        text=event.data, blocked=False, provider=self.provider_name
                     )
-            last_chunk = chunk
+        finally:
+            response.close()
 
     @overload
     def __get_response(
@@ -102,7 +103,7 @@ class ReplicateApi(ProviderInterface, ImageInterface, TextInterface):
         # Launch job
         if stream:
             payload["stream"] = True
-        launch_job_response = requests.post(url, headers=self.headers, json=payload)
+        launch_job_response = http_client.post(url, headers=self.headers, json=payload)
         try:
             launch_job_response_dict = launch_job_response.json()
         except requests.JSONDecodeError:
@@ -122,7 +123,7 @@ class ReplicateApi(ProviderInterface, ImageInterface, TextInterface):
         url_get_response = launch_job_response_dict["urls"]["get"]
 
         # Get job response
-        response = requests.get(url_get_response, headers=self.headers)
+        response = http_client.get(url_get_response, headers=self.headers)
 
         if response.status_code >= 500:
             raise ProviderException(
@@ -135,9 +136,8 @@ class ReplicateApi(ProviderInterface, ImageInterface, TextInterface):
                 response_dict.get("detail"), code=response.status_code
             )
 
-        status = response_dict["status"]
-        while status != "succeeded":
-            response = requests.get(url_get_response, headers=self.headers)
+        def get_prediction() -> dict:
+            response = http_client.get(url_get_response, headers=self.headers)
             try:
                 response_dict = response.json()
             except requests.JSONDecodeError:
@@ -147,8 +147,20 @@ class ReplicateApi(ProviderInterface, ImageInterface, TextInterface):
                 raise ProviderException(
                     response_dict.get("error", response_dict), code=response.status_code
                 )
-
-            status = response_dict["status"]
+            return response_dict
+
+        if response_dict["status"] not in PREDICTION_FINAL_STATUSES:
+            response_dict = poll(
+                get_prediction,
+                is_done=lambda prediction: prediction["status"]
+                in PREDICTION_FINAL_STATUSES,
+                policy=PREDICTION_POLLING_POLICY,
+                provider_name=self.provider_name,
+            )
+        if response_dict["status"] != "succeeded":
+            raise ProviderException(
+                response_dict.get("error") or f"Prediction {response_dict['status']}"
+            )
 
         self.__calculate_predict_time(response_dict)
         return response_dict
@@ -183,14 +195,14 @@ class ReplicateApi(ProviderInterface, ImageInterface, TextInterface):
             for image in image_url:
                 generated_images.append(
                     GeneratedImageDataClass(
-                        image=base64.b64encode(requests.get(image).content),
+                        image=base64.b64encode(http_client.get(image).content),
                         image_resource_url=image,
                     )
                 )
         else:
             generated_images.append(
                 GeneratedImageDataClass(
-                    image=base64.b64encode(requests.get(image_url).content),
+                    image=base64.b64encode(http_client.get(image_url).content),
                     image_resource_url=image_url,
                 )
             )
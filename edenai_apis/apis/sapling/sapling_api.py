@@ -25,6 +25,7 @@ from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.types import ResponseType
+from edenai_apis.utils.http import http_client
 
 
 class SaplingApi(ProviderInterface, TextInterface):
@@ -66,7 +67,7 @@ class SaplingApi(ProviderInterface, TextInterface):
         if language is not None:
             payload["lang"] = language
 
-        response = requests.post(f"{self.url}spellcheck", json=payload)
+        response = http_client.post(f"{self.url}spellcheck", json=payload)
         SaplingApi._check_error(response)
         original_response = response.json()
 
@@ -108,7 +109,7 @@ class SaplingApi(ProviderInterface, TextInterface):
         headers = {"Content-Type": "application/json"}
         payload = {"key": self.api_key, "text": text}
 
-        response = requests.post(f"{self.url}sentiment", json=payload, headers=headers)
+        response = http_client.post(f"{self.url}sentiment", json=payload, headers=headers)
 
         SaplingApi._check_error(response)
         response_json = response.json()
@@ -159,7 +160,7 @@ class SaplingApi(ProviderInterface, TextInterface):
         }
 
         try:
-            response = requests.post(f"{self.url}aidetect", json=payload)
+            response = http_client.post(f"{self.url}aidetect", json=payload)
         except Exception as excp:
             raise ProviderException(str(excp), code=500)
 
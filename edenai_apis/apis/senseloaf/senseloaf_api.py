@@ -13,6 +13,8 @@ from .remapping import ResumeMapper
 
 class SenseloafApi(ProviderInterface, OcrInterface):
     provider_name = "senseloaf"
+    # the client keeps the last response of each call
+    poolable = False
 
     def __init__(self, api_keys: Dict = {}):
         super().__init__()
@@ -4,7 +4,6 @@ from io import BytesIO
 from json import JSONDecodeError
 from typing import Dict, Literal, Optional, Any, List, Sequence
 
-import requests
 
 from edenai_apis.features import ProviderInterface, ImageInterface
 from edenai_apis.features.image import BackgroundRemovalDataClass
@@ -21,6 +20,7 @@ from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.types import ResponseType
 from edenai_apis.utils.upload_s3 import USER_PROCESS, upload_file_bytes_to_s3
+from edenai_apis.utils.http import http_client
 
 
 class StabilityAIApi(ProviderInterface, ImageInterface):
@@ -58,7 +58,7 @@ class StabilityAIApi(ProviderInterface, ImageInterface):
         }
 
         try:
-            response = requests.post(url, headers=self.headers, json=payload)
+            response = http_client.post(url, headers=self.headers, json=payload)
             original_response = response.json()
         except json.JSONDecodeError as exc:
             raise ProviderException("Internal Server Error", code=500) from exc
@@ -98,7 +98,7 @@ class StabilityAIApi(ProviderInterface, ImageInterface):
             files = {"image": f.read()}
             headers = {"Authorization": f"Bearer {self.api_key}", "accept": "image/*"}
 
-            response = requests.post(url, files=files, headers=headers)
+            response = http_client.post(url, files=files, headers=headers)
         try:
             original_response = response.json()
         except json.JSONDecodeError as exc:
@@ -144,7 +144,7 @@ class StabilityAIApi(ProviderInterface, ImageInterface):
             }
             files = {"init_image": img}
 
-            response = requests.post(url, headers=self.headers, data=data, files=files)
+            response = http_client.post(url, headers=self.headers, data=data, files=files)
 
         if response.status_code != 200:
             raise ProviderException(message=response.text, code=response.status_code)
@@ -1,6 +1,5 @@
 from typing import Dict, Sequence
 
-import requests
 
 from edenai_apis.features import ProviderInterface, TextInterface
 from edenai_apis.features.text import EmotionDetectionDataClass, EmotionItem, EmotionEnum
@@ -8,6 +7,7 @@ from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.types import ResponseType
+from edenai_apis.utils.http import http_client
 
 
 class VernaiApi(ProviderInterface, TextInterface):
@@ -23,7 +23,7 @@ class VernaiApi(ProviderInterface, TextInterface):
     def text__emotion_detection(
             self, text: str
     ) -> ResponseType[EmotionDetectionDataClass]:
-        response = requests.post(
+        response = http_client.post(
             url=self.url_emotion_detection,
             headers={"Authorization": f"{self.api_key}"},
             data={"text": text}
@@ -5,7 +5,6 @@ from http import HTTPStatus
 from typing import Dict, Literal
 
 import boto3
-import requests
 from requests.exceptions import JSONDecodeError
 
 from edenai_apis.apis.veryfi.veryfi_ocr_normalizer import (
@@ -29,6 +28,7 @@ from edenai_apis.features.provider.provider_interface import ProviderInterface
 from edenai_apis.loaders.data_loader import load_key
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.types import ResponseType
+from edenai_apis.utils.http import http_client
 
 
 class VeryfiApi(ProviderInterface, OcrInterface):
@@ -105,7 +105,7 @@ class VeryfiApi(ProviderInterface, OcrInterface):
             f"{self.partner_upload_folder}/{random_filename}",
         )
 
-        return requests.request(
+        return http_client.request(
             method="POST",
             url=f"{self.url}/{document_type}",
             headers=self.headers,
@@ -122,7 +122,7 @@ class VeryfiApi(ProviderInterface, OcrInterface):
 
             files = {"file": ("file", file_, mimetypes.guess_type(file_.name)[0])}
 
-            return requests.request(
+            return http_client.request(
                 method="POST",
                 url=f"{self.url}/{document_type}",
                 headers=self.headers,
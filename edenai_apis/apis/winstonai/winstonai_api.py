@@ -2,7 +2,6 @@ import json
 from http import HTTPStatus
 from typing import Dict, Sequence, Any, Optional
 from uuid import uuid4
-import requests
 from edenai_apis.apis.winstonai.config import WINSTON_AI_API_URL
 from edenai_apis.features import ProviderInterface, TextInterface, ImageInterface
 from edenai_apis.features.image.ai_detection.ai_detection_dataclass import (
@@ -22,6 +21,7 @@ from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.types import ResponseType
 from edenai_apis.utils.upload_s3 import upload_file_to_s3
+from edenai_apis.utils.http import http_client
 
 
 class WinstonaiApi(ProviderInterface, TextInterface, ImageInterface):
@@ -47,7 +47,7 @@ class WinstonaiApi(ProviderInterface, TextInterface, ImageInterface):
 
         payload = json.dumps({"url": file_url or upload_file_to_s3(file, file)})
 
-        response = requests.request(
+        response = http_client.request(
             "POST",
             f"{self.api_url}/image-detection",
             headers=self.headers,
@@ -88,7 +88,7 @@ class WinstonaiApi(ProviderInterface, TextInterface, ImageInterface):
             }
         )
 
-        response = requests.request(
+        response = http_client.request(
             "POST", f"{self.api_url}/predict", headers=self.headers, data=payload
         )
 
@@ -139,7 +139,7 @@ class WinstonaiApi(ProviderInterface, TextInterface, ImageInterface):
             }
         )
 
-        response = requests.request(
+        response = http_client.request(
             "POST", f"{self.api_url}/plagiarism", headers=self.headers, data=payload
         )
 
@@ -2,7 +2,6 @@ import itertools
 import json
 import asyncio
 import os
-from time import sleep
 from typing import Dict, List, Literal, Optional, Sequence, Union
 from edenai_apis.features.text.chat.helpers import get_tool_call_from_history_by_id
 
@@ -63,7 +62,9 @@ from edenai_apis.utils.conversion import (
 )
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.metrics import METRICS
+from edenai_apis.utils.poller import run_assistant
 from edenai_apis.utils.types import ResponseType
+from edenai_apis.utils.http import http_client
 from .helpers import (
     construct_anonymization_context,
     convert_tools_to_openai,
@@ -103,14 +104,10 @@ class XAiTextApi(TextInterface):
             ]
         )
 
-        run = self.client.beta.threads.runs.create_and_poll(
-            thread_id=thread.id,
-            assistant_id=assistant.id,
+        run = run_assistant(
+            self.client, thread.id, assistant.id, provider_name=self.provider_name
         )
 
-        while run.status != "completed":
-            sleep(1)
-
         messages = self.client.beta.threads.messages.list(thread_id=thread.id)
         usage = run.to_dict()["usage"]
         original_response = messages.to_dict()
@@ -142,7 +139,7 @@ class XAiTextApi(TextInterface):
             "messages": messages,
         }
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = get_openapi_response(response)
 
         standardized_response = SummarizeDataClass(
@@ -164,7 +161,7 @@ class XAiTextApi(TextInterface):
     #         "model": model[1],
     #     }
 
-    #     response = requests.post(url, json=payload, headers=self.headers)
+    #     response = http_client.post(url, json=payload, headers=self.headers)
     #     original_response = get_openapi_response(response)
 
     #     items: Sequence[EmbeddingsDataClass] = []
@@ -272,7 +269,7 @@ class XAiTextApi(TextInterface):
     #         "frequency_penalty": 0,
     #         "presence_penalty": 0,
     #     }
-    #     response = requests.post(url, json=payload, headers=self.headers)
+    #     response = http_client.post(url, json=payload, headers=self.headers)
     #     original_response = get_openapi_response(response)
 
     #     answers = []
@@ -308,7 +305,7 @@ class XAiTextApi(TextInterface):
             "messages": messages,
         }
         url = f"{self.url}/chat/completions"
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = get_openapi_response(response)
         pii_data = original_response["choices"][0]["message"]["content"]
         try:
@@ -428,7 +425,7 @@ class XAiTextApi(TextInterface):
         }
 
         try:
-            response = requests.post(url, json=payload, headers=self.headers)
+            response = http_client.post(url, json=payload, headers=self.headers)
         except requests.exceptions.ChunkedEncodingError:
             raise ProviderException("Connection closed with provider", 400)
         original_response = get_openapi_response(response)
@@ -458,7 +455,7 @@ class XAiTextApi(TextInterface):
         if max_tokens != 0:
             payload["max_tokens"] = max_tokens
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = get_openapi_response(response)
 
         standardized_response = GenerationDataClass(
@@ -697,10 +694,10 @@ class XAiTextApi(TextInterface):
             "n": 3,
         }
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = get_openapi_response(response)
 
-        missing_information_call = requests.post(
+        missing_information_call = http_client.post(
             url,
             json={
                 "model": "grok-base",
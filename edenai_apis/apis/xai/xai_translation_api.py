@@ -1,5 +1,4 @@
 
-import requests
 import json
 from edenai_apis.features import TranslationInterface
 from edenai_apis.features.translation.automatic_translation import (
@@ -10,6 +9,7 @@ from edenai_apis.features.translation.language_detection import (
 )
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.types import ResponseType
+from edenai_apis.utils.http import http_client
 from .helpers import (
     get_openapi_response,
     construct_language_detection_context,
@@ -39,7 +39,7 @@ class XAiTranslationApi(TranslationInterface):
             "model": "grok-beta",
             "messages": messages,
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = get_openapi_response(response)
         languages = original_response["choices"][0]["message"]["content"]
         try:
@@ -71,7 +71,7 @@ class XAiTranslationApi(TranslationInterface):
             "model": "grok-beta",
             "messages": messages,
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = get_openapi_response(response)
         translation = original_response["choices"][0]["message"]["content"]
 
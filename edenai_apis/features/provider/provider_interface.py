@@ -3,6 +3,9 @@ from abc import ABC
 
 class ProviderInterface(ABC):
     provider_name: str
+    # instances are shared between threads by `utils.provider_pool`, providers
+    # changing state on `self` during calls must set it to False
+    poolable: bool = True
 
     @classmethod
     def __init_subclass__(cls) -> None:
@@ -1,11 +1,26 @@
-from typing import Sequence
+from typing import Optional, Sequence
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer
+
+from edenai_apis.utils.compact_embeddings import (
+    CompactEmbeddingsModel,
+    embedding_to_list,
+)
 
 
 class EmbeddingDataClass(BaseModel):
     embedding: Sequence[float]
 
+    @field_serializer("embedding")
+    def serialize_embedding(self, embedding: Sequence[float]):
+        return embedding_to_list(embedding)
+
+
+class EmbeddingsDataClass(CompactEmbeddingsModel):
+    _item_class = EmbeddingDataClass
 
-class EmbeddingsDataClass(BaseModel):
     items: Sequence[EmbeddingDataClass] = Field(default_factory=list)
+    # embeddings cache statistics (see `edenai_apis.utils.embeddings_cache`),
+    # `None` when the cache is disabled. Not part of the serialized response
+    cache_hits: Optional[int] = Field(default=None, exclude=True)
+    cache_misses: Optional[int] = Field(default=None, exclude=True)
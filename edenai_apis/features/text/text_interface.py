@@ -127,6 +127,7 @@ class TextInterface:
             "cosine", "hamming", "manhattan", "euclidean"
         ] = "cosine",
         model: Optional[str] = None,
+        top_k: Optional[int] = None,
     ) -> ResponseType[SearchDataClass]:
         """
         Do sementic search over a set of texts
@@ -136,6 +137,7 @@ class TextInterface:
             query (str): your query
             distance_metric(str): what similarity metric to use
             model (str, optional): which openai model to use, Default to `None`.
+            top_k (int, optional): number of results to return, Default to `None` (all texts).
         """
         raise NotImplementedError
 
@@ -1,7 +1,9 @@
-from typing import Optional, Sequence
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from pydantic import BaseModel, Field, StrictStr
 
+from edenai_apis.utils.timeline import Detection, merge_detections
+
 
 class VideoLabelBoundingBox(BaseModel):
     top: Optional[float]
@@ -25,3 +27,52 @@ class VideoLabel(BaseModel):
 
 class LabelDetectionAsyncDataClass(BaseModel):
     labels: Sequence[VideoLabel] = Field(default_factory=list)
+
+    def compact_timeline(self, max_gap: float) -> "LabelDetectionAsyncDataClass":
+        """Labels merged by name and category, with a timestamp per segment of
+        detections less than `max_gap` seconds apart (see `utils.timeline`).
+        Bounding boxes of the first detection of each segment are kept."""
+        groups: Dict[Tuple[str, Tuple[str, ...]], List[VideoLabel]] = {}
+        for label in self.labels:
+            groups.setdefault((label.name, tuple(label.category)), []).append(label)
+
+        labels = []
+        for group in groups.values():
+            detections = [
+                Detection(
+                    start,
+                    timestamp.end if timestamp.end is not None else start,
+                    label.confidence,
+                    label,
+                )
+                for label in group
+                for timestamp in label.timestamp
+                for start in [
+                    timestamp.start if timestamp.start is not None else timestamp.end
+                ]
+                if start is not None
+            ]
+            segments = merge_detections(detections, max_gap)
+            if not segments:
+                labels.extend(group)
+                continue
+            labels.append(
+                VideoLabel(
+                    name=group[0].name,
+                    confidence=sum(
+                        segment.confidence * segment.detections for segment in segments
+                    )
+                    / len(detections),
+                    timestamp=[
+                        VideoLabelTimeStamp(start=segment.start, end=segment.end)
+                        for segment in segments
+                    ],
+                    category=group[0].category,
+                    bounding_box=[
+                        bounding_box
+                        for segment in segments
+                        for bounding_box in segment.first.bounding_box
+                    ],
+                )
+            )
+        return LabelDetectionAsyncDataClass(labels=labels)
@@ -1,7 +1,9 @@
-from typing import Optional, Sequence
+from typing import Dict, List, Optional, Sequence
 
 from pydantic import BaseModel, Field, StrictStr
 
+from edenai_apis.utils.timeline import Detection, merge_detections, segment_bounds
+
 
 class VideoLogoBoundingBox(BaseModel):
     top: Optional[float]
@@ -23,3 +25,27 @@ class LogoTrack(BaseModel):
 
 class LogoDetectionAsyncDataClass(BaseModel):
     logos: Sequence[LogoTrack] = Field(default_factory=list)
+
+    def compact_timeline(self, max_gap: float) -> "LogoDetectionAsyncDataClass":
+        """One track per logo, its frames merged into segments of frames less than
+        `max_gap` seconds apart, each one kept as its first and last frames with
+        the mean confidence of the segment (see `utils.timeline`)"""
+        detections: Dict[str, List[Detection]] = {}
+        for track in self.logos:
+            detections.setdefault(track.description, []).extend(
+                Detection(frame.timestamp, frame.timestamp, frame.confidence, frame)
+                for frame in track.tracking
+            )
+        return LogoDetectionAsyncDataClass(
+            logos=[
+                LogoTrack(
+                    description=description,
+                    tracking=[
+                        frame
+                        for segment in merge_detections(track_detections, max_gap)
+                        for frame in segment_bounds(segment)
+                    ],
+                )
+                for description, track_detections in detections.items()
+            ]
+        )
@@ -1,7 +1,9 @@
-from typing import Optional, Sequence
+from typing import Dict, List, Optional, Sequence
 
 from pydantic import BaseModel, Field, StrictStr
 
+from edenai_apis.utils.timeline import Detection, merge_detections, segment_bounds
+
 
 class VideoTextBoundingBox(BaseModel):
     top: Optional[float]
@@ -23,3 +25,27 @@ class VideoText(BaseModel):
 
 class TextDetectionAsyncDataClass(BaseModel):
     texts: Sequence[VideoText] = Field(default_factory=list)
+
+    def compact_timeline(self, max_gap: float) -> "TextDetectionAsyncDataClass":
+        """One track per text, its frames merged into segments of frames less than
+        `max_gap` seconds apart, each one kept as its first and last frames with
+        the mean confidence of the segment (see `utils.timeline`)"""
+        detections: Dict[str, List[Detection]] = {}
+        for track in self.texts:
+            detections.setdefault(track.text, []).extend(
+                Detection(frame.timestamp, frame.timestamp, frame.confidence, frame)
+                for frame in track.frames
+            )
+        return TextDetectionAsyncDataClass(
+            texts=[
+                VideoText(
+                    text=text,
+                    frames=[
+                        frame
+                        for segment in merge_detections(track_detections, max_gap)
+                        for frame in segment_bounds(segment)
+                    ],
+                )
+                for text, track_detections in detections.items()
+            ]
+        )
@@ -1,17 +1,65 @@
 # pylint: disable=locally-disabled, too-many-branches
+import asyncio
+import itertools
 import os
 import random
+import threading
 import time
-from typing import Any, Dict, List, Literal, Optional, Set, Tuple, Type, Union, overload
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
 from uuid import uuid4
 
 from edenai_apis import interface_v2
-from edenai_apis.features.provider.provider_interface import ProviderInterface
+from edenai_apis.features.text.chat.chat_dataclass import ChatStreamResponse
+from edenai_apis.loaders.capabilities import CapabilityIndex, get_capability_index
 from edenai_apis.loaders.data_loader import FeatureDataEnum, ProviderDataEnum
 from edenai_apis.loaders.loaders import load_feature, load_provider
+from edenai_apis.utils.batch import (
+    BATCH_METHOD_SUFFIX,
+    ConstraintsValidator,
+    get_native_batch_size,
+)
+from edenai_apis.utils.concurrency import (
+    ASYNC_METHOD_SUFFIX,
+    get_async_method,
+    get_offload_executor,
+    run_in_thread,
+)
 from edenai_apis.utils.constraints import validate_all_provider_constraints
 from edenai_apis.utils.exception import ProviderException, get_appropriate_error
+from edenai_apis.utils.latency import LATENCY_TRACKER
 from edenai_apis.utils.monitoring import insert_api_call, monitor_call
+from edenai_apis.utils.rate_limit import RATE_LIMITER, estimate_tokens
+from edenai_apis.utils.retry import (
+    DEFAULT_RETRY_POLICY,
+    NO_RETRY,
+    RetryPolicy,
+    args_rewinder,
+    retry_call,
+    retry_call_async,
+)
+from edenai_apis.utils.stream_metrics import instrument_stream
+from edenai_apis.utils.streaming import aiter_stream
+from edenai_apis.utils.timeline import TIMELINE_GAP, compact_timeline
 from edenai_apis.utils.types import AsyncLaunchJobResponseType
 from dotenv import load_dotenv
 
@@ -24,6 +72,21 @@ ProviderDict = Dict[
 FeatureSubfeatureProviderTuple = Union[Tuple[str, str, str], Tuple[str, str, str, str]]
 ProviderList = List[FeatureSubfeatureProviderTuple]
 
+# max number of jobs polled at the same time for one provider
+# by `get_async_job_results_many`
+DEFAULT_JOB_RESULTS_CONCURRENCY = int(
+    os.environ.get("EDENAI_JOB_RESULTS_CONCURRENCY", 8)
+)
+
+# max inputs (or native batches) computed at the same time by `compute_output_batch`
+DEFAULT_BATCH_CONCURRENCY = int(os.environ.get("EDENAI_BATCH_CONCURRENCY", 8))
+
+FanOutMode = Literal["all", "first_success", "hedged"]
+FAN_OUT_MODES = ("all", "first_success", "hedged")
+# seconds before starting a backup provider in `hedged` mode, when there are
+# not enough recent calls of the running provider to know its p95 latency
+DEFAULT_HEDGE_DELAY = float(os.environ.get("EDENAI_HEDGE_DELAY", 2))
+
 
 @overload
 def list_features(
@@ -97,54 +160,15 @@ def list_features(
         (list | dict): Return all possible provider/feature/subfeature or provider/feature/subfeature/phase as a list or dict
     """
 
-    method_set: Set[FeatureSubfeatureProviderTuple] = set()
-    ApiClasses: List[Type[ProviderInterface]] = load_provider(ProviderDataEnum.CLASS)
-    for cls in ApiClasses:
-        if (
-            not provider_name or cls.provider_name == provider_name
-        ):  # filter for provider_name if provided
-            # detect feature,subfeature,phase by looking at methods names
-            for method_name in filter(
-                lambda method_name: not method_name.startswith("_")
-                and "__" in method_name
-                and getattr(getattr(cls, method_name), "__isabstractmethod__", False)
-                is False,  # do not include method that are not implemented yet (interfaces abstract methods)
-                dir(cls),
-            ):
-                feature_i, subfeature_i, *others = method_name.split("__")
-                if not (feature or feature == feature_i) and not (
-                    subfeature or subfeature == subfeature_i
-                ):  # filter by subfeature if provided
-                    if len(others) > 0 and "async" not in subfeature_i:
-                        phase = others[0]
-                        method_set.add(
-                            (cls.provider_name, feature_i, subfeature_i, phase)
-                        )
-                    else:
-                        method_set.add((cls.provider_name, feature_i, subfeature_i))
-    method_list: ProviderList = list(method_set)
-    method_list.sort()
+    index = get_capability_index()
+    if provider_name or feature or subfeature:
+        index = CapabilityIndex(index.filter(provider_name, feature, subfeature))
+
     if not as_dict:
-        return method_list  # return a list
+        return list(index.entries)  # return a list
 
     # return resutls as dict
-    result = {}
-    for provider, feature_i, subfeature_i, *phase in method_list:
-        if provider not in result:
-            result[provider] = {}
-        if feature_i not in result[provider]:
-            result[provider][feature_i] = {}
-        have_phases = isinstance(result[provider][feature_i].get(subfeature_i), dict)
-        if result[provider][feature_i].get(subfeature_i) is None or have_phases:
-            if phase:
-                if not have_phases:
-                    result[provider][feature_i][subfeature_i] = {}
-                if not phase[0] in result[provider][feature_i][subfeature_i]:
-                    result[provider][feature_i][subfeature_i][phase[0]] = True
-            else:
-                result[provider][feature_i][subfeature_i] = True
-
-    return result
+    return index.to_dict()
 
 
 def list_providers(
@@ -160,18 +184,143 @@ def list_providers(
     Returns:
         List[str]: list of provider names
     """
-    # TO DO: keep the set as output, don't convert to list
-    providers_set = set()
-    for provider, feature_i, subfeature_i, *_phase in list_features():
-        if not feature or feature_i == feature:
-            if not subfeature or subfeature_i == subfeature:
-                providers_set.add(provider)
-    return list(providers_set)
+    return list(get_capability_index().providers(feature, subfeature))
 
 
 STATUS_SUCCESS = "success"
 
 
+def _is_async_subfeature(subfeature: str, phase: str = "") -> bool:
+    return ("_async" in phase) if phase else ("_async" in subfeature)
+
+
+def _subfeature_method(feature: str, subfeature: str, phase: str, suffix: str):
+    """`interface_v2` method (eg: `interface_v2.Text.chat`) for a subfeature"""
+    feature_class = getattr(interface_v2, feature.title())
+    subfeature_method_name = f'{subfeature}{f"__{phase}" if phase else ""}{suffix}'
+    return getattr(feature_class, subfeature_method_name)
+
+
+def _fake_output(
+    provider_name: str, feature: str, subfeature: str, phase: str, is_async: bool
+) -> Dict:
+    """Saved output of a provider subfeature (or a fake job id for async subfeatures)"""
+    if is_async:
+        return AsyncLaunchJobResponseType(provider_job_id=str(uuid4())).model_dump()
+    # TODO: refacto image search to save output with this phase
+    if phase in ["upload_image", "delete_image"]:
+        return {"status": STATUS_SUCCESS}
+    return load_provider(
+        ProviderDataEnum.OUTPUT,
+        provider_name=provider_name,
+        feature=feature,
+        subfeature=subfeature,
+        phase=phase,
+    )
+
+
+def _validate_fake_args(provider_name: str, feature: str, subfeature: str, phase: str):
+    sample_args = load_feature(
+        FeatureDataEnum.SAMPLES_ARGS,
+        feature=feature,
+        subfeature=subfeature,
+        phase=phase,
+        provider_name=provider_name,
+    )
+    # replace File Wrapper by file and file_url inputs and also transform input attributes as settings for tts
+    validate_all_provider_constraints(
+        provider_name, feature, subfeature, phase, sample_args
+    )
+
+
+def _final_result(
+    provider_name: str,
+    feature: str,
+    subfeature: str,
+    subfeature_result: Dict,
+    fake: bool,
+    user_email: Optional[str],
+) -> Dict:
+    final_result: Dict[str, Any] = {
+        "status": STATUS_SUCCESS,
+        "provider": provider_name,
+        **subfeature_result,
+    }
+
+    if os.environ.get("MONITORING", False) is True and user_email:
+        error = "Fake" if fake else None
+        insert_api_call(
+            provider=provider_name,
+            feature=feature,
+            subfeature=subfeature,
+            user_email=user_email,
+            error=error,
+        )
+
+    return final_result
+
+
+def _call_retry(
+    retry_policy: Optional[RetryPolicy], launch_job: bool, *args: Mapping[str, Any]
+) -> Tuple[RetryPolicy, Optional[Callable[[], None]]]:
+    """Retry policy of a provider call (with the `args` of each of its inputs),
+    and the function rewinding its arguments before a retry. Launching an async
+    job is not retried unless the caller gives a policy (the provider may have
+    started the job before failing), nor is a call with file objects that can't
+    be rewound."""
+    rewind = args_rewinder(*args)
+    if rewind is None:
+        return NO_RETRY, None
+    if retry_policy is not None:
+        return retry_policy, rewind
+    return (NO_RETRY if launch_job else DEFAULT_RETRY_POLICY), rewind
+
+
+def _with_attempts(subfeature_result: Dict, attempts: int) -> Dict:
+    """Record the number of attempts of retried calls in their result"""
+    if attempts > 1:
+        return {**subfeature_result, "attempts": attempts}
+    return subfeature_result
+
+
+def _with_compact_timeline(job_result: Any, timeline_gap: Optional[float]) -> Any:
+    """Job result with its video timeline compacted (see `utils.timeline`)"""
+    standardized_response = getattr(job_result, "standardized_response", None)
+    if timeline_gap is None or standardized_response is None:
+        return job_result
+    return job_result.model_copy(
+        update={
+            "standardized_response": compact_timeline(
+                standardized_response, timeline_gap
+            )
+        }
+    )
+
+
+def _instrument_response_stream(
+    provider_name: str,
+    feature: str,
+    subfeature: str,
+    response: Any,
+    args: Dict[str, Any],
+    started_at: float,
+) -> None:
+    """Measure the stream of streamed chat responses (`StreamChat`), see
+    `utils.stream_metrics`"""
+    standardized_response = getattr(response, "standardized_response", None)
+    stream = getattr(standardized_response, "stream", None)
+    if stream is None:
+        return
+    standardized_response.stream = instrument_stream(
+        stream,
+        provider_name,
+        feature,
+        subfeature,
+        model=args.get("model"),
+        started_at=started_at,
+    )
+
+
 @monitor_call(condition=IS_MONITORING)
 def compute_output(
     provider_name: str,
@@ -182,6 +331,7 @@ def compute_output(
     fake: bool = False,
     api_keys: Dict = {},
     user_email: Optional[str] = None,
+    retry_policy: Optional[RetryPolicy] = None,
 ) -> Dict:
     """
     Compute subfeature for provider and subfeature
@@ -195,12 +345,15 @@ def compute_output(
         fake (bool, optional): take result from sample. Defaults to `False`.
         api_keys (dict, optional): optional user's api_keys for each providers
         user_email (str, optional): optinal user email for monitoring (opted-out by default)
+        retry_policy (RetryPolicy, optional): retry of transient provider errors,
+            defaults to `utils.retry.DEFAULT_RETRY_POLICY`, or no retry when
+            launching an async job
 
     Returns:
-        dict: Result dict
+        dict: Result dict, with the number of `attempts` if the call was retried
     """
     # check if the function we're running is asyncronous
-    is_async = ("_async" in phase) if phase else ("_async" in subfeature)
+    is_async = _is_async_subfeature(subfeature, phase)
     # suffix is used for async
     suffix = "__launch_job" if is_async else ""
 
@@ -213,66 +366,129 @@ def compute_output(
         time.sleep(
             random.uniform(0.5, 1.5)
         )  # sleep to fake the response time from a provider
-        sample_args = load_feature(
-            FeatureDataEnum.SAMPLES_ARGS,
-            feature=feature,
-            subfeature=subfeature,
-            phase=phase,
-            provider_name=provider_name,
-        )
-        # replace File Wrapper by file and file_url inputs and also transform input attributes as settings for tts
-        sample_args = validate_all_provider_constraints(
-            provider_name, feature, subfeature, phase, sample_args
-        )
+        _validate_fake_args(provider_name, feature, subfeature, phase)
 
         # Return mocked results
-        if is_async:
-            subfeature_result: Any = AsyncLaunchJobResponseType(
-                provider_job_id=str(uuid4())
-            ).model_dump()
-        # TODO: refacto image search to save output with this phase
-        elif phase in ["upload_image", "delete_image"]:
-            subfeature_result = {"status": STATUS_SUCCESS}
-        else:
-            subfeature_result = load_provider(
-                ProviderDataEnum.OUTPUT,
-                provider_name=provider_name,
-                feature=feature,
-                subfeature=subfeature,
-                phase=phase,
-            )
+        subfeature_result = _fake_output(
+            provider_name, feature, subfeature, phase, is_async
+        )
 
     else:
         # Fake == False : Compute real output
+        subfeature_class = _subfeature_method(feature, subfeature, phase, suffix)
 
-        feature_class = getattr(interface_v2, feature.title())
-        subfeature_method_name = f'{subfeature}{f"__{phase}" if phase else ""}{suffix}'
-        subfeature_class = getattr(feature_class, subfeature_method_name)
+        def call_provider() -> Dict:
+            try:
+                with RATE_LIMITER.limit(
+                    provider_name, feature, subfeature, args, phase, api_keys
+                ):
+                    started_at = time.monotonic()
+                    subfeature_response = subfeature_class(provider_name, api_keys)(
+                        **args
+                    )
+                _instrument_response_stream(
+                    provider_name,
+                    feature,
+                    subfeature,
+                    subfeature_response,
+                    args,
+                    started_at,
+                )
+                return subfeature_response.model_dump()
+            except ProviderException as exc:
+                raise get_appropriate_error(provider_name, exc)
 
-        try:
-            subfeature_result = subfeature_class(provider_name, api_keys)(
-                **args
-            ).model_dump()
-        except ProviderException as exc:
-            raise get_appropriate_error(provider_name, exc)
+        policy, rewind = _call_retry(retry_policy, is_async, args)
+        subfeature_result, attempts = retry_call(
+            call_provider, policy, before_retry=rewind
+        )
+        subfeature_result = _with_attempts(subfeature_result, attempts)
 
-    final_result: Dict[str, Any] = {
-        "status": STATUS_SUCCESS,
-        "provider": provider_name,
-        **subfeature_result,
-    }
+    return _final_result(
+        provider_name, feature, subfeature, subfeature_result, fake, user_email
+    )
 
-    if os.environ.get("MONITORING", False) is True and user_email:
-        error = "Fake" if fake else None
-        insert_api_call(
-            provider=provider_name,
-            feature=feature,
-            subfeature=subfeature,
-            user_email=user_email,
-            error=error,
+
+@monitor_call(condition=IS_MONITORING)
+async def compute_output_async(
+    provider_name: str,
+    feature: str,
+    subfeature: str,
+    args: Dict[str, Any],
+    phase: str = "",
+    fake: bool = False,
+    api_keys: Dict = {},
+    user_email: Optional[str] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+) -> Dict:
+    """
+    Coroutine version of `compute_output`: providers implementing a native
+    coroutine for the subfeature are awaited, others run in a thread pool
+
+    Args:
+        provider_name (str): EdenAI provider name
+        feature (str): EdenAI feature name
+        subfeature (str): EdenAI subfeature name
+        phase (str): Eden AI phase name if give, Default to `Literal[""]`
+        args (Dict): inputs arguments for the feature call
+        fake (bool, optional): take result from sample. Defaults to `False`.
+        api_keys (dict, optional): optional user's api_keys for each providers
+        user_email (str, optional): optinal user email for monitoring (opted-out by default)
+        retry_policy (RetryPolicy, optional): retry of transient provider errors,
+            defaults to `utils.retry.DEFAULT_RETRY_POLICY`, or no retry when
+            launching an async job
+
+    Returns:
+        dict: Result dict, with the number of `attempts` if the call was retried
+    """
+    is_async = _is_async_subfeature(subfeature, phase)
+    suffix = "__launch_job" if is_async else ""
+
+    args = validate_all_provider_constraints(
+        provider_name, feature, subfeature, phase, args
+    )
+
+    if fake:
+        await asyncio.sleep(random.uniform(0.5, 1.5))
+        _validate_fake_args(provider_name, feature, subfeature, phase)
+        subfeature_result = _fake_output(
+            provider_name, feature, subfeature, phase, is_async
+        )
+    else:
+        subfeature_class = _subfeature_method(
+            feature, subfeature, phase, suffix + ASYNC_METHOD_SUFFIX
         )
 
-    return final_result
+        async def call_provider() -> Dict:
+            try:
+                async with RATE_LIMITER.alimit(
+                    provider_name, feature, subfeature, args, phase, api_keys
+                ):
+                    started_at = time.monotonic()
+                    subfeature_response = await subfeature_class(
+                        provider_name, api_keys
+                    )(**args)
+                _instrument_response_stream(
+                    provider_name,
+                    feature,
+                    subfeature,
+                    subfeature_response,
+                    args,
+                    started_at,
+                )
+                return subfeature_response.model_dump()
+            except ProviderException as exc:
+                raise get_appropriate_error(provider_name, exc)
+
+        policy, rewind = _call_retry(retry_policy, is_async, args)
+        subfeature_result, attempts = await retry_call_async(
+            call_provider, policy, before_retry=rewind
+        )
+        subfeature_result = _with_attempts(subfeature_result, attempts)
+
+    return _final_result(
+        provider_name, feature, subfeature, subfeature_result, fake, user_email
+    )
 
 
 # HACK: Why this function is the package provider instead of the backend ?
@@ -299,9 +515,7 @@ def check_provider_constraints(
         Tuple[bool, str]: Provider is ok, debug string
     """
 
-    # Refacto : use list_providers ?
-    subfeatures_providers = list_features(as_dict=True)
-    provider_info = subfeatures_providers.get(provider_name, None)
+    provider_info = get_capability_index().get(provider_name)
     if not provider_info:
         return False, f"Provider : '{provider_name}' unknown."
     if feature not in provider_info:
@@ -315,8 +529,8 @@ def check_provider_constraints(
             f"Provider : '{provider_name}' does not provide an API for '{feature} {subfeature}'",
         )
     if phase:
-        if not isinstance(provider_info[feature][subfeature], dict) or (
-            isinstance(provider_info[feature][subfeature], dict)
+        if not isinstance(provider_info[feature][subfeature], Mapping) or (
+            isinstance(provider_info[feature][subfeature], Mapping)
             and phase not in provider_info[feature][subfeature].keys()
         ):
             return (
@@ -345,6 +559,21 @@ def check_provider_constraints(
     return True, "All Good!"
 
 
+def _fake_job_result(
+    provider_name: str, feature: str, subfeature: str, async_job_id: str, phase: str
+) -> Dict:
+    # Load fake data from edenai_apis' saved output
+    fake_result = load_provider(
+        ProviderDataEnum.OUTPUT,
+        provider_name=provider_name,
+        feature=feature,
+        subfeature=subfeature,
+        phase=phase,
+    )
+    fake_result["provider_job_id"] = async_job_id
+    return fake_result
+
+
 @monitor_call(condition=IS_MONITORING)
 def get_async_job_result(
     provider_name: str,
@@ -355,6 +584,8 @@ def get_async_job_result(
     fake: bool = False,
     user_email=None,
     api_keys=dict(),
+    retry_policy: Optional[RetryPolicy] = None,
+    timeline_gap: Optional[float] = TIMELINE_GAP,
 ) -> Dict:
     """Get async result from job id
 
@@ -365,38 +596,1051 @@ def get_async_job_result(
         async_job_id (str): async job id to get result to
         phase (str): EdenAI phase. Default to empty string ("")
         fake (bool): Load fake results
+        retry_policy (RetryPolicy, optional): retry of transient provider errors,
+            defaults to `utils.retry.DEFAULT_RETRY_POLICY`
+        timeline_gap (float, optional): merge the video detections of a same
+            label/logo/text less than `timeline_gap` seconds apart into segments
+            (see `utils.timeline`), defaults to `EDENAI_VIDEO_TIMELINE_GAP`
+            (disabled if not set)
 
     Returns:
-        Dict: Result dict
+        Dict: Result dict, with the number of `attempts` if the call was retried
     """
 
     if fake is True:
         time.sleep(
             random.uniform(0.5, 1.5)
         )  # sleep to fake the response time from a provider
-        # Load fake data from edenai_apis' saved output
-        fake_result = load_provider(
-            ProviderDataEnum.OUTPUT,
-            provider_name=provider_name,
-            feature=feature,
-            subfeature=subfeature,
-            phase=phase,
+        return _fake_job_result(provider_name, feature, subfeature, async_job_id, phase)
+
+    subfeature_class = _subfeature_method(
+        feature, subfeature, phase, "__get_job_result"
+    )
+    return _job_result(
+        lambda job_id: subfeature_class(provider_name, api_keys)(job_id),
+        AsyncJobRequest(provider_name, feature, subfeature, async_job_id, phase),
+        api_keys,
+        retry_policy,
+        timeline_gap,
+    )
+
+
+@monitor_call(condition=IS_MONITORING)
+async def get_async_job_result_async(
+    provider_name: str,
+    feature: str,
+    subfeature: str,
+    async_job_id: AsyncLaunchJobResponseType,
+    phase: str = "",
+    fake: bool = False,
+    user_email=None,
+    api_keys=dict(),
+    retry_policy: Optional[RetryPolicy] = None,
+    timeline_gap: Optional[float] = TIMELINE_GAP,
+) -> Dict:
+    """Coroutine version of `get_async_job_result`
+
+    Args:
+        provider_name (str): EdenAI provider name
+        feature (str): EdenAI feature
+        subfeature (str): EdenAI subfeature
+        async_job_id (str): async job id to get result to
+        phase (str): EdenAI phase. Default to empty string ("")
+        fake (bool): Load fake results
+        retry_policy (RetryPolicy, optional): retry of transient provider errors,
+            defaults to `utils.retry.DEFAULT_RETRY_POLICY`
+        timeline_gap (float, optional): merge the video detections of a same
+            label/logo/text less than `timeline_gap` seconds apart into segments
+            (see `utils.timeline`), defaults to `EDENAI_VIDEO_TIMELINE_GAP`
+            (disabled if not set)
+
+    Returns:
+        Dict: Result dict, with the number of `attempts` if the call was retried
+    """
+    if fake is True:
+        await asyncio.sleep(random.uniform(0.5, 1.5))
+        return _fake_job_result(provider_name, feature, subfeature, async_job_id, phase)
+
+    subfeature_class = _subfeature_method(
+        feature, subfeature, phase, "__get_job_result" + ASYNC_METHOD_SUFFIX
+    )
+    return await _job_result_async(
+        lambda job_id: subfeature_class(provider_name, api_keys)(job_id),
+        AsyncJobRequest(provider_name, feature, subfeature, async_job_id, phase),
+        api_keys,
+        retry_policy,
+        timeline_gap,
+    )
+
+
+def iter_async_job_pages(
+    provider_name: str,
+    feature: str,
+    subfeature: str,
+    async_job_id: str,
+    api_keys: Dict = {},
+) -> Iterator[Dict]:
+    """Standardized pages of a succeeded async job, parsed one at a time
+
+    Unlike `get_async_job_result`, neither the whole standardized response nor the
+    provider original response are built: each page is parsed from the provider
+    response as it is fetched (eg: Amazon Textract `NextToken` pagination), so
+    memory does not grow with the number of pages of the document.
+    Supported by the providers implementing `<feature>__<subfeature>__get_job_pages`
+    (eg: `ocr__ocr_async__get_job_pages`).
+
+    Args:
+        provider_name (str): EdenAI provider name
+        feature (str): EdenAI feature name
+        subfeature (str): EdenAI subfeature name (eg: `ocr_async`)
+        async_job_id (str): async job id to get the pages of
+        api_keys (dict, optional): optional user's api_keys for each providers
+
+    Returns:
+        Iterator[Dict]: standardized pages (eg: `ocr_async` `Page`). The job is
+            fetched right away (errors, or a job not finished yet, are raised by
+            this function), the following pages when iterating.
+    """
+    provider_instance = interface_v2.get_provider_instance(provider_name, api_keys)
+    method = getattr(
+        provider_instance, f"{feature}__{subfeature}__get_job_pages", None
+    )
+    if method is None:
+        raise ValueError(
+            f"{provider_name} does not support getting the pages of "
+            f"{feature} {subfeature} jobs"
         )
-        fake_result["provider_job_id"] = async_job_id
+    try:
+        pages = method(async_job_id)
+    except ProviderException as exc:
+        raise get_appropriate_error(provider_name, exc)
+    return _dumped_pages(provider_name, pages)
 
-        return fake_result
 
-    feature_class = getattr(interface_v2, feature.title())
-    subfeature_method_name = (
-        f'{subfeature}{f"__{phase}" if phase else ""}__get_job_result'
+def _dumped_pages(provider_name: str, pages: Iterator[Any]) -> Iterator[Dict]:
+    try:
+        for page in pages:
+            yield page.model_dump()
+    except ProviderException as exc:
+        raise get_appropriate_error(provider_name, exc)
+
+
+class AsyncJobRequest(NamedTuple):
+    """Async job to get the result of, see `get_async_job_results_many`"""
+
+    provider_name: str
+    feature: str
+    subfeature: str
+    async_job_id: str
+    phase: str = ""
+
+
+class AsyncJobResult(NamedTuple):
+    """Result of an async job: `result` is the same dict as returned by
+    `get_async_job_result`, `error` is set instead if getting it failed"""
+
+    job: AsyncJobRequest
+    result: Optional[Dict] = None
+    error: Optional[Exception] = None
+
+
+def _group_jobs_by_provider(
+    jobs: Iterable[Union[AsyncJobRequest, Tuple[str, ...]]]
+) -> Dict[str, List[AsyncJobRequest]]:
+    groups: Dict[str, List[AsyncJobRequest]] = {}
+    for job in jobs:
+        job = AsyncJobRequest(*job)
+        groups.setdefault(job.provider_name, []).append(job)
+    return groups
+
+
+def _job_result_method_name(job: AsyncJobRequest) -> str:
+    phase = f"__{job.phase}" if job.phase else ""
+    return f"{job.feature}__{job.subfeature}{phase}__get_job_result"
+
+
+def _job_error(job: AsyncJobRequest, exc: Exception) -> AsyncJobResult:
+    if isinstance(exc, ProviderException):
+        exc = get_appropriate_error(job.provider_name, exc)
+    return AsyncJobResult(job, error=exc)
+
+
+def _fake_job_results(job: AsyncJobRequest) -> AsyncJobResult:
+    try:
+        result = _fake_job_result(
+            job.provider_name, job.feature, job.subfeature, job.async_job_id, job.phase
+        )
+    except Exception as exc:
+        return _job_error(job, exc)
+    return AsyncJobResult(job, result=result)
+
+
+def _shared_provider_instance(provider_name: str, api_keys: Dict) -> Optional[Any]:
+    """Instance of a provider shared by the jobs of a group, `None` if the provider
+    is not `poolable`: each job then gets its own instance"""
+    if not interface_v2.is_poolable(provider_name):
+        return None
+    return interface_v2.get_provider_instance(provider_name, api_keys)
+
+
+def _job_result(
+    get_job_result: Callable[[str], Any],
+    job: AsyncJobRequest,
+    api_keys: Dict,
+    retry_policy: Optional[RetryPolicy],
+    timeline_gap: Optional[float],
+) -> Dict:
+    """Result dict of an async job, fetched within the provider budget and
+    retried on transient errors (raised classified by `get_appropriate_error`)"""
+
+    def call_provider() -> Dict:
+        try:
+            with RATE_LIMITER.limit(
+                job.provider_name,
+                job.feature,
+                job.subfeature,
+                {},
+                job.phase,
+                api_keys,
+            ):
+                job_result = get_job_result(job.async_job_id)
+            return _with_compact_timeline(job_result, timeline_gap).model_dump()
+        except ProviderException as exc:
+            raise get_appropriate_error(job.provider_name, exc)
+
+    result, attempts = retry_call(call_provider, retry_policy or DEFAULT_RETRY_POLICY)
+    return _with_attempts(result, attempts)
+
+
+async def _job_result_async(
+    get_job_result: Callable[[str], Awaitable[Any]],
+    job: AsyncJobRequest,
+    api_keys: Dict,
+    retry_policy: Optional[RetryPolicy],
+    timeline_gap: Optional[float],
+) -> Dict:
+    """Coroutine version of `_job_result`"""
+
+    async def call_provider() -> Dict:
+        try:
+            async with RATE_LIMITER.alimit(
+                job.provider_name,
+                job.feature,
+                job.subfeature,
+                {},
+                job.phase,
+                api_keys,
+            ):
+                job_result = await get_job_result(job.async_job_id)
+            return _with_compact_timeline(job_result, timeline_gap).model_dump()
+        except ProviderException as exc:
+            raise get_appropriate_error(job.provider_name, exc)
+
+    result, attempts = await retry_call_async(
+        call_provider, retry_policy or DEFAULT_RETRY_POLICY
+    )
+    return _with_attempts(result, attempts)
+
+
+def _fetch_job_result(
+    provider_instance: Optional[Any],
+    job: AsyncJobRequest,
+    api_keys: Dict,
+    retry_policy: Optional[RetryPolicy],
+    timeline_gap: Optional[float],
+) -> AsyncJobResult:
+    if provider_instance is None:
+        try:
+            provider_instance = interface_v2.get_provider_instance(
+                job.provider_name, api_keys
+            )
+        except Exception as exc:
+            return _job_error(job, exc)
+    try:
+        method = getattr(provider_instance, _job_result_method_name(job))
+        result = _job_result(method, job, api_keys, retry_policy, timeline_gap)
+    except Exception as exc:
+        # already classified
+        return AsyncJobResult(job, error=exc)
+    return AsyncJobResult(job, result=result)
+
+
+def get_async_job_results_many(
+    jobs: Iterable[Union[AsyncJobRequest, Tuple[str, ...]]],
+    max_concurrency_per_provider: int = DEFAULT_JOB_RESULTS_CONCURRENCY,
+    fake: bool = False,
+    api_keys: Mapping[str, Dict] = {},
+    retry_policy: Optional[RetryPolicy] = None,
+    timeline_gap: Optional[float] = TIMELINE_GAP,
+) -> Iterator[AsyncJobResult]:
+    """Get the results of many async jobs, yielded as soon as they are fetched
+
+    Jobs are grouped by provider: one provider instance is used for all the jobs
+    of a provider (one per job for the providers which are not `poolable`, see
+    `utils.provider_pool`), and at most `max_concurrency_per_provider` of them are
+    fetched at the same time, within the provider budget (see `utils.rate_limit`).
+    Each result is the same as returned by `get_async_job_result`: retried on
+    transient errors (with the number of `attempts`), video timeline compacted.
+    A job failing doesn't stop the others, its error is set on its
+    `AsyncJobResult`.
+
+    Args:
+        jobs (Iterable): `AsyncJobRequest`s or tuples of
+            (provider_name, feature, subfeature, async_job_id[, phase])
+        max_concurrency_per_provider (int): max jobs fetched at once per provider
+        fake (bool): Load fake results
+        api_keys (Mapping[str, Dict]): api_keys to use for each provider name
+        retry_policy (RetryPolicy, optional): retry of transient provider errors
+            of each job, defaults to `utils.retry.DEFAULT_RETRY_POLICY`
+        timeline_gap (float, optional): video timelines compaction, see
+            `get_async_job_result`
+
+    Returns:
+        Iterator[AsyncJobResult]: job results, in the order they finished
+    """
+    groups = _group_jobs_by_provider(jobs)
+    if fake:
+        for group in groups.values():
+            yield from (_fake_job_results(job) for job in group)
+        return
+
+    queues: Dict[str, Deque[AsyncJobRequest]] = {}
+    instances: Dict[str, Optional[Any]] = {}
+    for provider_name, group in groups.items():
+        try:
+            instances[provider_name] = _shared_provider_instance(
+                provider_name, api_keys.get(provider_name, {})
+            )
+        except Exception as exc:
+            yield from (_job_error(job, exc) for job in group)
+            continue
+        queues[provider_name] = deque(group)
+
+    if not queues:
+        return
+
+    cap = max(1, max_concurrency_per_provider)
+    executor = ThreadPoolExecutor(
+        max_workers=sum(min(cap, len(queue)) for queue in queues.values()),
+        thread_name_prefix="edenai-job-results",
+    )
+    running: Dict[Future, str] = {}
+
+    def submit_next(provider_name: str) -> None:
+        job = queues[provider_name].popleft()
+        future = executor.submit(
+            _fetch_job_result,
+            instances[provider_name],
+            job,
+            api_keys.get(provider_name, {}),
+            retry_policy,
+            timeline_gap,
+        )
+        running[future] = provider_name
+
+    try:
+        for provider_name, queue in queues.items():
+            for _ in range(min(cap, len(queue))):
+                submit_next(provider_name)
+
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                provider_name = running.pop(future)
+                if queues[provider_name]:
+                    submit_next(provider_name)
+                yield future.result()
+    finally:
+        # the caller can stop iterating early
+        for future in running:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def get_async_job_results_many_async(
+    jobs: Iterable[Union[AsyncJobRequest, Tuple[str, ...]]],
+    max_concurrency_per_provider: int = DEFAULT_JOB_RESULTS_CONCURRENCY,
+    fake: bool = False,
+    api_keys: Mapping[str, Dict] = {},
+    retry_policy: Optional[RetryPolicy] = None,
+    timeline_gap: Optional[float] = TIMELINE_GAP,
+) -> AsyncIterator[AsyncJobResult]:
+    """Asyncio version of `get_async_job_results_many`, providers native
+    coroutines are used when implemented
+
+    Args:
+        jobs (Iterable): `AsyncJobRequest`s or tuples of
+            (provider_name, feature, subfeature, async_job_id[, phase])
+        max_concurrency_per_provider (int): max jobs fetched at once per provider
+        fake (bool): Load fake results
+        api_keys (Mapping[str, Dict]): api_keys to use for each provider name
+        retry_policy (RetryPolicy, optional): retry of transient provider errors
+            of each job, defaults to `utils.retry.DEFAULT_RETRY_POLICY`
+        timeline_gap (float, optional): video timelines compaction, see
+            `get_async_job_result`
+
+    Returns:
+        AsyncIterator[AsyncJobResult]: job results, in the order they finished
+    """
+    groups = _group_jobs_by_provider(jobs)
+    if fake:
+        for group in groups.values():
+            for job in group:
+                yield _fake_job_results(job)
+        return
+
+    async def fetch(
+        provider_instance: Optional[Any],
+        job: AsyncJobRequest,
+        semaphore: asyncio.Semaphore,
+    ) -> AsyncJobResult:
+        async with semaphore:
+            if provider_instance is None:
+                try:
+                    provider_instance = await run_in_thread(
+                        interface_v2.get_provider_instance,
+                        job.provider_name,
+                        api_keys.get(job.provider_name, {}),
+                    )
+                except Exception as exc:
+                    return _job_error(job, exc)
+            try:
+                method = get_async_method(
+                    provider_instance, _job_result_method_name(job)
+                )
+                result = await _job_result_async(
+                    method,
+                    job,
+                    api_keys.get(job.provider_name, {}),
+                    retry_policy,
+                    timeline_gap,
+                )
+            except Exception as exc:
+                # already classified
+                return AsyncJobResult(job, error=exc)
+            return AsyncJobResult(job, result=result)
+
+    tasks: List["asyncio.Task[AsyncJobResult]"] = []
+    for provider_name, group in groups.items():
+        try:
+            provider_instance = _shared_provider_instance(
+                provider_name, api_keys.get(provider_name, {})
+            )
+        except Exception as exc:
+            for job in group:
+                yield _job_error(job, exc)
+            continue
+        semaphore = asyncio.Semaphore(max(1, max_concurrency_per_provider))
+        tasks.extend(
+            asyncio.ensure_future(fetch(provider_instance, job, semaphore))
+            for job in group
+        )
+
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            yield await next_result
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+class ProviderRunResult(NamedTuple):
+    """Outcome of one provider in a fan-out: `result` is the same dict as returned
+    by `compute_output`, `error` is set instead if it failed. `elapsed` is the
+    duration of the call in seconds, `None` if it was cancelled (or never started)
+    because another provider succeeded first"""
+
+    provider_name: str
+    result: Optional[Dict] = None
+    error: Optional[Exception] = None
+    elapsed: Optional[float] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self.elapsed is None
+
+
+class _FanOut:
+    """Which providers to start and when to stop, shared by the thread
+    and asyncio versions of `compute_output_fan_out`"""
+
+    def __init__(
+        self,
+        providers: Sequence[str],
+        feature: str,
+        subfeature: str,
+        mode: str,
+        hedge_delay: Optional[float],
+    ) -> None:
+        if mode not in FAN_OUT_MODES:
+            raise ValueError(
+                f"Unknown fan-out mode '{mode}', use one of {FAN_OUT_MODES}"
+            )
+        self.providers = list(dict.fromkeys(providers))
+        if not self.providers:
+            raise ValueError("At least one provider is required")
+        self.feature = feature
+        self.subfeature = subfeature
+        self.mode = mode
+        self.hedge_delay = hedge_delay
+        self.waiting: Deque[str] = deque(self.providers)
+        self.results: Dict[str, ProviderRunResult] = {}
+        self.last_started: Optional[str] = None
+        self.last_started_at = 0.0
+        self.done = False
+
+    def start(self) -> List[str]:
+        """Providers to start right away"""
+        count = 1 if self.mode == "hedged" else len(self.waiting)
+        return self._next(count)
+
+    def _next(self, count: int = 1) -> List[str]:
+        count = min(count, len(self.waiting))
+        providers = [self.waiting.popleft() for _ in range(count)]
+        if providers:
+            self.last_started = providers[-1]
+            self.last_started_at = time.monotonic()
+        return providers
+
+    def wait_timeout(self) -> Optional[float]:
+        """Seconds to wait for a result before starting a backup provider"""
+        if self.mode != "hedged" or not self.waiting:
+            return None
+        delay = self.hedge_delay
+        if delay is None:
+            delay = LATENCY_TRACKER.percentile(
+                (self.last_started, self.feature, self.subfeature), 95
+            )
+        if delay is None:
+            delay = DEFAULT_HEDGE_DELAY
+        return max(self.last_started_at + delay - time.monotonic(), 0.0)
+
+    def on_timeout(self) -> List[str]:
+        """The running providers are slow: start a backup one"""
+        return self._next()
+
+    def on_result(self, run_result: ProviderRunResult) -> List[str]:
+        """Record a provider result, returns the providers to start next"""
+        self.results[run_result.provider_name] = run_result
+        if run_result.error is None and self.mode != "all":
+            self.done = True
+            return []
+        if run_result.error is not None and self.mode == "hedged":
+            # don't wait for the hedge delay to replace a failed provider
+            return self._next()
+        return []
+
+    def final_results(self) -> List[ProviderRunResult]:
+        return [
+            self.results.get(provider_name, ProviderRunResult(provider_name))
+            for provider_name in self.providers
+        ]
+
+
+def _record_latency(
+    provider_name: str, feature: str, subfeature: str, elapsed: float, fake: bool
+) -> None:
+    if not fake:
+        LATENCY_TRACKER.record((provider_name, feature, subfeature), elapsed)
+
+
+def compute_output_fan_out(
+    providers: Sequence[str],
+    feature: str,
+    subfeature: str,
+    args: Dict[str, Any],
+    mode: FanOutMode = "all",
+    phase: str = "",
+    fake: bool = False,
+    api_keys: Mapping[str, Dict] = {},
+    hedge_delay: Optional[float] = None,
+    user_email: Optional[str] = None,
+) -> List[ProviderRunResult]:
+    """
+    Compute the same subfeature with several providers concurrently (in threads)
+
+    Modes:
+        - `all`: wait for all the providers
+        - `first_success`: start all the providers, return as soon as one succeeds
+        - `hedged`: start the providers one after the other (in the given order of
+          preference), the next one is started when the running ones take longer
+          than `hedge_delay` (by default the p95 latency of the last started
+          provider) or fail. Return as soon as one succeeds
+
+    Args:
+        providers (Sequence[str]): EdenAI provider names
+        feature (str): EdenAI feature name
+        subfeature (str): EdenAI subfeature name
+        args (Dict): inputs arguments for the feature call
+        mode (str): `all`, `first_success` or `hedged`. Defaults to `all`
+        phase (str): Eden AI phase name if give, Default to `Literal[""]`
+        fake (bool, optional): take result from sample. Defaults to `False`.
+        api_keys (Mapping[str, Dict], optional): user's api_keys for each provider
+        hedge_delay (float, optional): seconds before starting a backup provider
+        user_email (str, optional): optinal user email for monitoring (opted-out by default)
+
+    Returns:
+        List[ProviderRunResult]: result, error and timing of each provider,
+            in the order of `providers`
+    """
+    fan_out = _FanOut(providers, feature, subfeature, mode, hedge_delay)
+
+    def run(provider_name: str) -> ProviderRunResult:
+        start = time.monotonic()
+        try:
+            result = compute_output(
+                provider_name,
+                feature,
+                subfeature,
+                dict(args),
+                phase=phase,
+                fake=fake,
+                api_keys=api_keys.get(provider_name, {}),
+                user_email=user_email,
+            )
+        except Exception as exc:
+            return ProviderRunResult(
+                provider_name, error=exc, elapsed=time.monotonic() - start
+            )
+        elapsed = time.monotonic() - start
+        _record_latency(provider_name, feature, subfeature, elapsed, fake)
+        return ProviderRunResult(provider_name, result=result, elapsed=elapsed)
+
+    # shared pool: calls still running once a provider succeeded are not awaited
+    executor = get_offload_executor()
+    running: Dict[Future, str] = {}
+
+    def submit(providers_to_start: List[str]) -> None:
+        for provider_name in providers_to_start:
+            running[executor.submit(run, provider_name)] = provider_name
+
+    submit(fan_out.start())
+    while running and not fan_out.done:
+        done, _ = wait(
+            running, timeout=fan_out.wait_timeout(), return_when=FIRST_COMPLETED
+        )
+        if not done:
+            submit(fan_out.on_timeout())
+        for future in done:
+            del running[future]
+            submit(fan_out.on_result(future.result()))
+
+    for future in running:
+        future.cancel()
+    return fan_out.final_results()
+
+
+async def compute_output_fan_out_async(
+    providers: Sequence[str],
+    feature: str,
+    subfeature: str,
+    args: Dict[str, Any],
+    mode: FanOutMode = "all",
+    phase: str = "",
+    fake: bool = False,
+    api_keys: Mapping[str, Dict] = {},
+    hedge_delay: Optional[float] = None,
+    user_email: Optional[str] = None,
+) -> List[ProviderRunResult]:
+    """Coroutine version of `compute_output_fan_out`, calls of the providers
+    still running once one succeeded are cancelled
+
+    Args:
+        providers (Sequence[str]): EdenAI provider names
+        feature (str): EdenAI feature name
+        subfeature (str): EdenAI subfeature name
+        args (Dict): inputs arguments for the feature call
+        mode (str): `all`, `first_success` or `hedged`. Defaults to `all`
+        phase (str): Eden AI phase name if give, Default to `Literal[""]`
+        fake (bool, optional): take result from sample. Defaults to `False`.
+        api_keys (Mapping[str, Dict], optional): user's api_keys for each provider
+        hedge_delay (float, optional): seconds before starting a backup provider
+        user_email (str, optional): optinal user email for monitoring (opted-out by default)
+
+    Returns:
+        List[ProviderRunResult]: result, error and timing of each provider,
+            in the order of `providers`
+    """
+    fan_out = _FanOut(providers, feature, subfeature, mode, hedge_delay)
+
+    async def run(provider_name: str) -> ProviderRunResult:
+        start = time.monotonic()
+        try:
+            result = await compute_output_async(
+                provider_name,
+                feature,
+                subfeature,
+                dict(args),
+                phase=phase,
+                fake=fake,
+                api_keys=api_keys.get(provider_name, {}),
+                user_email=user_email,
+            )
+        except Exception as exc:
+            return ProviderRunResult(
+                provider_name, error=exc, elapsed=time.monotonic() - start
+            )
+        elapsed = time.monotonic() - start
+        _record_latency(provider_name, feature, subfeature, elapsed, fake)
+        return ProviderRunResult(provider_name, result=result, elapsed=elapsed)
+
+    running: "Dict[asyncio.Task[ProviderRunResult], str]" = {}
+
+    def start(providers_to_start: List[str]) -> None:
+        for provider_name in providers_to_start:
+            running[asyncio.ensure_future(run(provider_name))] = provider_name
+
+    start(fan_out.start())
+    try:
+        while running and not fan_out.done:
+            done, _ = await asyncio.wait(
+                running, timeout=fan_out.wait_timeout(), return_when=FIRST_COMPLETED
+            )
+            if not done:
+                start(fan_out.on_timeout())
+            for task in done:
+                del running[task]
+                start(fan_out.on_result(task.result()))
+    finally:
+        for task in running:
+            task.cancel()
+    return fan_out.final_results()
+
+
+class BatchItemResult(NamedTuple):
+    """Result of the `index`-th input of `compute_output_batch`: `result` is the
+    same dict as returned by `compute_output`, `error` is set instead if it failed"""
+
+    index: int
+    result: Optional[Dict] = None
+    error: Optional[Exception] = None
+
+
+def compute_output_batch(
+    provider_name: str,
+    feature: str,
+    subfeature: str,
+    iterable_of_args: Iterable[Dict[str, Any]],
+    phase: str = "",
+    fake: bool = False,
+    api_keys: Dict = {},
+    max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    native_batch: bool = True,
+    user_email: Optional[str] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+) -> Iterator[BatchItemResult]:
+    """
+    Compute a subfeature for many inputs with one provider, results are yielded
+    in the order of the inputs as soon as they are available
+
+    Inputs are consumed lazily, at most `max_concurrency` of them are computed at
+    the same time by a single provider instance (one per worker thread for the
+    providers which are not `poolable`, see `utils.provider_pool`) and
+    constraints are validated once per distinct settings (see
+    `utils.batch.ConstraintsValidator`). When the provider implements a native
+    batch version of the subfeature (see `utils.batch`), inputs are sent by
+    batches of its `max_batch_size`.
+    Each call (or native batch, counted as one request) waits for the provider
+    budget (see `utils.rate_limit`) and is retried on transient errors like in
+    `compute_output` (a native batch is retried as a whole, async jobs launches
+    are not retried by default).
+    An input failing doesn't stop the others, its error is set on its result.
+
+    Args:
+        provider_name (str): EdenAI provider name
+        feature (str): EdenAI feature name
+        subfeature (str): EdenAI subfeature name
+        iterable_of_args (Iterable[Dict]): inputs arguments of each feature call
+        phase (str): Eden AI phase name if give, Default to `Literal[""]`
+        fake (bool, optional): take result from sample. Defaults to `False`.
+        api_keys (dict, optional): optional user's api_keys for the provider
+        max_concurrency (int): max inputs (or native batches) computed at once
+        native_batch (bool): use the provider native batch method if it has one
+        user_email (str, optional): optinal user email for monitoring (opted-out by default)
+        retry_policy (RetryPolicy, optional): retry of transient provider errors
+            of each call, see `compute_output`
+
+    Returns:
+        Iterator[BatchItemResult]: one result per input, in the inputs order, with
+            the number of `attempts` if the call was retried
+    """
+    is_async = _is_async_subfeature(subfeature, phase)
+    suffix = "__launch_job" if is_async else ""
+    validator = ConstraintsValidator(provider_name, feature, subfeature, phase)
+
+    phase_suffix = f"__{phase}" if phase else ""
+    method_name = f"{feature}__{subfeature}{phase_suffix}{suffix}"
+
+    def provider_methods() -> Tuple[Callable, Optional[Callable]]:
+        provider_instance = interface_v2.get_provider_instance(provider_name, api_keys)
+        batch_method = None
+        if native_batch and not is_async:
+            batch_method = getattr(
+                provider_instance, method_name + BATCH_METHOD_SUFFIX, None
+            )
+        return getattr(provider_instance, method_name), batch_method
+
+    method = batch_method = None
+    poolable = True
+    if fake:
+        _validate_fake_args(provider_name, feature, subfeature, phase)
+    else:
+        method, batch_method = provider_methods()
+        poolable = interface_v2.is_poolable(provider_name)
+
+    # providers keeping per-call state (not `poolable`) get one instance per worker
+    worker = threading.local()
+
+    def worker_methods() -> Tuple[Callable, Optional[Callable]]:
+        if poolable:
+            return method, batch_method
+        if not hasattr(worker, "methods"):
+            worker.methods = provider_methods()
+        return worker.methods
+
+    def item_error(index: int, exc: Exception) -> BatchItemResult:
+        if isinstance(exc, ProviderException):
+            exc = get_appropriate_error(provider_name, exc)
+        return BatchItemResult(index, error=exc)
+
+    def item_result(index: int, subfeature_result: Dict) -> BatchItemResult:
+        return BatchItemResult(
+            index,
+            result=_final_result(
+                provider_name, feature, subfeature, subfeature_result, fake, user_email
+            ),
+        )
+
+    def call_provider(
+        call: Callable[[], Any], args: Dict[str, Any], tokens: Optional[int] = None
+    ) -> Any:
+        try:
+            with RATE_LIMITER.limit(
+                provider_name,
+                feature,
+                subfeature,
+                args,
+                phase,
+                api_keys,
+                tokens=tokens,
+            ):
+                return call()
+        except ProviderException as exc:
+            raise get_appropriate_error(provider_name, exc)
+
+    def run_one(index: int, args: Dict[str, Any]) -> BatchItemResult:
+        try:
+            validated_args = validator.validate(args)
+        except Exception as exc:
+            return item_error(index, exc)
+        if fake:
+            subfeature_result = _fake_output(
+                provider_name, feature, subfeature, phase, is_async
+            )
+            return item_result(index, subfeature_result)
+        try:
+            item_method, _ = worker_methods()
+        except Exception as exc:
+            return item_error(index, exc)
+        policy, rewind = _call_retry(retry_policy, is_async, validated_args)
+        try:
+            response, attempts = retry_call(
+                lambda: call_provider(
+                    lambda: item_method(**validated_args), validated_args
+                ),
+                policy,
+                before_retry=rewind,
+            )
+        except Exception as exc:
+            # already classified
+            return BatchItemResult(index, error=exc)
+        return item_result(index, _with_attempts(response.model_dump(), attempts))
+
+    def run_native_batch(
+        chunk: List[Tuple[int, Dict[str, Any]]]
+    ) -> List[BatchItemResult]:
+        results: Dict[int, BatchItemResult] = {}
+        validated: List[Tuple[int, Dict[str, Any]]] = []
+        for index, args in chunk:
+            try:
+                validated.append((index, validator.validate(args)))
+            except Exception as exc:
+                results[index] = item_error(index, exc)
+        if validated:
+            batch_args = [args for _, args in validated]
+            policy, rewind = _call_retry(retry_policy, False, *batch_args)
+            try:
+                _, chunk_method = worker_methods()
+            except Exception as exc:
+                for index, _ in validated:
+                    results[index] = item_error(index, exc)
+                return [results[index] for index, _ in chunk]
+            try:
+                # one request, with the tokens of all the inputs
+                responses, attempts = retry_call(
+                    lambda: call_provider(
+                        lambda: chunk_method(batch_args),
+                        {},
+                        sum(estimate_tokens(args) for args in batch_args),
+                    ),
+                    policy,
+                    before_retry=rewind,
+                )
+                if len(responses) != len(validated):
+                    raise ProviderException(
+                        f"Expected {len(validated)} responses, got {len(responses)}"
+                    )
+            except Exception as exc:
+                # already classified
+                for index, _ in validated:
+                    results[index] = BatchItemResult(index, error=exc)
+            else:
+                for (index, _), response in zip(validated, responses):
+                    results[index] = item_result(
+                        index, _with_attempts(response.model_dump(), attempts)
+                    )
+        return [results[index] for index, _ in chunk]
+
+    def run_chunk(chunk: List[Tuple[int, Dict[str, Any]]]) -> List[BatchItemResult]:
+        if batch_method is not None:
+            return run_native_batch(chunk)
+        return [run_one(index, args) for index, args in chunk]
+
+    chunk_size = (
+        get_native_batch_size(provider_name, feature, subfeature, phase)
+        if batch_method is not None
+        else 1
+    )
+    inputs = enumerate(iterable_of_args)
+    chunks = iter(lambda: list(itertools.islice(inputs, chunk_size)), [])
+
+    max_concurrency = max(1, max_concurrency)
+    executor = ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="edenai-batch"
     )
-    subfeature_class = getattr(feature_class, subfeature_method_name)
+    # chunks submitted but not yielded yet, in inputs order. Twice the number of
+    # workers so they stay busy while waiting for a slow head of the queue
+    pending: Deque[Future] = deque()
+    try:
+        for chunk in itertools.islice(chunks, 2 * max_concurrency):
+            pending.append(executor.submit(run_chunk, chunk))
+        while pending:
+            yield from pending.popleft().result()
+            chunk = next(chunks, None)
+            if chunk is not None:
+                pending.append(executor.submit(run_chunk, chunk))
+    finally:
+        # the caller can stop iterating early
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def _standardized_stream(
+    provider_name: str,
+    feature: str,
+    subfeature: str,
+    standardized_response: Any,
+    model: Optional[str],
+    started_at: float,
+) -> Iterator[ChatStreamResponse]:
+    """Chunks of a chat response: the provider stream, or the whole answer in
+    a single chunk for providers that don't stream"""
+    stream = getattr(standardized_response, "stream", None)
+    if stream is None:
+        stream = iter(
+            [
+                ChatStreamResponse(
+                    text=standardized_response.generated_text or "",
+                    blocked=False,
+                    provider=provider_name,
+                )
+            ]
+        )
 
+    instrumented = instrument_stream(
+        stream, provider_name, feature, subfeature, model=model, started_at=started_at
+    )
     try:
-        subfeature_result = subfeature_class(provider_name, api_keys)(
-            async_job_id
-        ).model_dump()
+        yield from instrumented
     except ProviderException as exc:
         raise get_appropriate_error(provider_name, exc)
+    finally:
+        instrumented.close()
+        if hasattr(stream, "close"):
+            stream.close()
 
-    return subfeature_result
+
+def compute_output_stream(
+    provider_name: str,
+    feature: str,
+    subfeature: str,
+    args: Dict[str, Any],
+    api_keys: Dict = {},
+) -> Iterator[ChatStreamResponse]:
+    """
+    Stream a chat subfeature (`text` / `multimodal` `chat`) of any provider
+
+    Providers streaming natively are read as their response arrives, the answer of
+    the others is returned as a single chunk. The provider is called right away
+    (errors are raised by this function), the chunks are read when iterating.
+    Time to first token and inter-chunk latencies are sent to the sinks of
+    `utils.stream_metrics` (by default time to first token is recorded in
+    `utils.latency.LATENCY_TRACKER` under the `(provider_name, feature, subfeature,
+    "ttft")` key).
+
+    Args:
+        provider_name (str): EdenAI provider name
+        feature (str): EdenAI feature name
+        subfeature (str): EdenAI subfeature name
+        args (Dict): inputs arguments for the feature call, without `stream`
+        api_keys (dict, optional): optional user's api_keys for each providers
+
+    Returns:
+        Iterator[ChatStreamResponse]: chunks of the answer
+    """
+    args = validate_all_provider_constraints(
+        provider_name, feature, subfeature, "", {**args, "stream": True}
+    )
+    subfeature_class = _subfeature_method(feature, subfeature, "", "")
+    try:
+        with RATE_LIMITER.limit(provider_name, feature, subfeature, args, "", api_keys):
+            started_at = time.monotonic()
+            response = subfeature_class(provider_name, api_keys)(**args)
+    except ProviderException as exc:
+        raise get_appropriate_error(provider_name, exc)
+    return _standardized_stream(
+        provider_name,
+        feature,
+        subfeature,
+        response.standardized_response,
+        args.get("model"),
+        started_at,
+    )
+
+
+async def compute_output_stream_async(
+    provider_name: str,
+    feature: str,
+    subfeature: str,
+    args: Dict[str, Any],
+    api_keys: Dict = {},
+) -> AsyncIterator[ChatStreamResponse]:
+    """Async iterator version of `compute_output_stream`. Chunks are read from the
+    provider one at a time, only when the consumer asks for the next one
+
+    Args:
+        provider_name (str): EdenAI provider name
+        feature (str): EdenAI feature name
+        subfeature (str): EdenAI subfeature name
+        args (Dict): inputs arguments for the feature call, without `stream`
+        api_keys (dict, optional): optional user's api_keys for each providers
+
+    Returns:
+        AsyncIterator[ChatStreamResponse]: chunks of the answer
+    """
+    stream = await run_in_thread(
+        compute_output_stream, provider_name, feature, subfeature, args, api_keys
+    )
+    async for chunk in aiter_stream(stream):
+        yield chunk
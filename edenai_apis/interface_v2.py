@@ -9,9 +9,12 @@ Example:
     we can now use `3DModels` to make call to supported providers
     >>> 3d_from_img = 3DModels.create_3d_model_from_image('<provider_here>')
     >>> response = 3d_from_img(image=...)
+
+    Each method also has a coroutine version, suffixed with `_async`:
+    >>> response = await 3DModels.create_3d_model_from_image_async('<provider_here>')(image=...)
 """
 
-from typing import Callable, Dict, Type
+from typing import Any, Awaitable, Callable, Dict, Type
 
 from edenai_apis.features import (
     AudioInterface,
@@ -23,6 +26,33 @@ from edenai_apis.features import ProviderInterface
 from edenai_apis.features import TextInterface, TranslationInterface, VideoInterface
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.concurrency import ASYNC_METHOD_SUFFIX, get_async_method
+from edenai_apis.utils.provider_pool import PROVIDER_POOL
+
+
+def get_provider_instance(provider: str, api_keys: Dict = {}) -> ProviderInterface:
+    """Instance of a provider class, reused from the pool if one was already built
+    with the same api_keys (unless the provider class is not `poolable`)"""
+    # Get the provider's class.
+    # Example : GoogleAPI
+    ProviderClass = load_provider(ProviderDataEnum.CLASS, provider_name=provider)
+
+    # Instantiate the provider's class, or reuse a pooled instance
+    # built with the same api_keys.
+    # Example : google_api = GoogleAPI()
+    return PROVIDER_POOL.get_or_create(
+        provider,
+        api_keys,
+        lambda: ProviderClass(api_keys),
+        poolable=getattr(ProviderClass, "poolable", True),
+    )
+
+
+def is_poolable(provider: str) -> bool:
+    """Whether an instance of a provider class can be shared by concurrent calls
+    (see `utils.provider_pool`)"""
+    ProviderClass = load_provider(ProviderDataEnum.CLASS, provider_name=provider)
+    return getattr(ProviderClass, "poolable", True)
 
 
 def return_provider_method(func: Callable) -> Callable:
@@ -44,13 +74,7 @@ def return_provider_method(func: Callable) -> Callable:
         Returns:
             Callable: provider's function
         """
-        # Get the provider's class.
-        # Example : GoogleAPI
-        ProviderClass = load_provider(ProviderDataEnum.CLASS, provider_name=provider)
-
-        # Instantiate the provider's class.
-        # Example : google_api = GoogleAPI()
-        provider_instance = ProviderClass(api_keys)
+        provider_instance = get_provider_instance(provider, api_keys)
 
         # Get the right function.
         # Example : google_api.image__object_detection
@@ -61,6 +85,25 @@ def return_provider_method(func: Callable) -> Callable:
     return wrapped
 
 
+def return_provider_method_async(func: Callable) -> Callable:
+    """Coroutine version of `return_provider_method`
+
+    Args:
+        func (Callable): a ProviderApi method
+
+    Returns:
+        Callable: function take a provider_name and return a coroutine function
+            calling its class's method (natively if the provider implements
+            an `_async` version of the method, in a thread otherwise)
+    """
+
+    def wrapped(provider: str, api_keys: Dict = {}) -> Callable[..., Awaitable[Any]]:
+        provider_instance = get_provider_instance(provider, api_keys)
+        return get_async_method(provider_instance, func.__name__)
+
+    return wrapped
+
+
 def abstract(InterfaceClass: Type[ProviderInterface], method_prefix: str):
     """create an Abstracted Class and set all the methods of given InterfaceClass
     to it with modified names, methods have the same names as the subfeature
@@ -84,6 +127,12 @@ def abstract(InterfaceClass: Type[ProviderInterface], method_prefix: str):
             wrapped = return_provider_method(attr)
             # Overwriting the method
             setattr(NewAbstractedClass, method_name.replace(method_prefix, ""), wrapped)
+            # and its coroutine version
+            setattr(
+                NewAbstractedClass,
+                method_name.replace(method_prefix, "") + ASYNC_METHOD_SUFFIX,
+                return_provider_method_async(attr),
+            )
 
     return NewAbstractedClass
 
@@ -0,0 +1,250 @@
+"""
+Build-once index of every provider/feature/subfeature(/phase) implemented in
+`edenai_apis.apis`.
+
+Detecting what a provider implements requires introspecting every provider
+class (`dir(cls)` + abstract methods lookup), which is way too expensive to be
+done on each call. The index is built the first time it is requested and then
+shared by the whole process:
+    >>> index = get_capability_index()
+    >>> index.has("google", "text", "sentiment_analysis")
+    True
+    >>> index.providers(feature="text", subfeature="chat")
+    frozenset({'openai', 'mistral', ...})
+
+The index is read from `apis/capabilities.json` so that listing features does not
+import every provider (and all their SDKs). This manifest must be regenerated with
+`python edenai_apis/scripts/capabilities_manifest.py` when a provider adds or
+removes a (sub)feature.
+"""
+import inspect
+import json
+import os
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from edenai_apis.features.provider.provider_interface import ProviderInterface
+from edenai_apis.loaders.data_loader import load_class
+from edenai_apis.settings import apis_path
+from edenai_apis.utils.batch import BATCH_METHOD_SUFFIX
+
+CapabilityTuple = Union[Tuple[str, str, str], Tuple[str, str, str, str]]
+
+CAPABILITIES_MANIFEST_PATH = os.path.join(apis_path, "capabilities.json")
+
+
+def detect_capabilities(cls: Type[ProviderInterface]) -> List[CapabilityTuple]:
+    """List provider/feature/subfeature(/phase) implemented by a provider class
+    by looking at its methods names (eg: `ocr__ocr_tables_async__launch_job`)
+
+    Args:
+        cls (Type[ProviderInterface]): provider class
+
+    Returns:
+        List[CapabilityTuple]: one tuple per implemented (sub)feature
+    """
+    capabilities: List[CapabilityTuple] = []
+    for method_name in dir(cls):
+        if method_name.startswith("_") or "__" not in method_name:
+            continue
+        method = getattr(cls, method_name)
+        # do not include method that are not implemented yet (interfaces abstract methods)
+        if getattr(method, "__isabstractmethod__", False):
+            continue
+        # native coroutine versions (`<method>_async`) are not (sub)features
+        if inspect.iscoroutinefunction(method):
+            continue
+        # nor native batch versions (`<method>_batch`)
+        if method_name.endswith(BATCH_METHOD_SUFFIX):
+            continue
+        feature, subfeature, *others = method_name.split("__")
+        if len(others) > 0 and "async" not in subfeature:
+            capabilities.append((cls.provider_name, feature, subfeature, others[0]))
+        else:
+            capabilities.append((cls.provider_name, feature, subfeature))
+    return capabilities
+
+
+def _freeze(tree: Dict) -> Mapping:
+    return MappingProxyType(
+        {
+            key: _freeze(value) if isinstance(value, dict) else value
+            for key, value in tree.items()
+        }
+    )
+
+
+class CapabilityIndex:
+    """Immutable provider -> feature -> subfeature -> phase index
+
+    Args:
+        capabilities (Iterable[CapabilityTuple]): provider/feature/subfeature(/phase) tuples
+    """
+
+    __slots__ = ("_entries", "_tree", "_providers", "_entries_set")
+
+    def __init__(self, capabilities: Iterable[CapabilityTuple]) -> None:
+        entries_set = frozenset(capabilities)
+        entries: Tuple[CapabilityTuple, ...] = tuple(sorted(entries_set))
+
+        tree: Dict = {}
+        providers: Dict[Tuple[Optional[str], Optional[str]], set] = {}
+        for provider, feature, subfeature, *phase in entries:
+            subfeatures = tree.setdefault(provider, {}).setdefault(feature, {})
+            # a subfeature without phase (True) takes precedence over its phases
+            current = subfeatures.get(subfeature)
+            if current is None or isinstance(current, dict):
+                if phase:
+                    subfeatures.setdefault(subfeature, {})[phase[0]] = True
+                else:
+                    subfeatures[subfeature] = True
+
+            for key in (
+                (None, None),
+                (feature, None),
+                (None, subfeature),
+                (feature, subfeature),
+            ):
+                providers.setdefault(key, set()).add(provider)
+
+        self._entries = entries
+        self._entries_set = entries_set
+        self._tree = _freeze(tree)
+        self._providers: Mapping[
+            Tuple[Optional[str], Optional[str]], FrozenSet[str]
+        ] = MappingProxyType(
+            {key: frozenset(value) for key, value in providers.items()}
+        )
+
+    @classmethod
+    def from_classes(cls, classes: Iterable[Type[ProviderInterface]]) -> "CapabilityIndex":
+        capabilities: List[CapabilityTuple] = []
+        for provider_class in classes:
+            capabilities.extend(detect_capabilities(provider_class))
+        return cls(capabilities)
+
+    @property
+    def entries(self) -> Tuple[CapabilityTuple, ...]:
+        """All provider/feature/subfeature(/phase) tuples, sorted"""
+        return self._entries
+
+    @property
+    def tree(self) -> Mapping:
+        """Read-only provider -> feature -> subfeature (-> phase) mapping"""
+        return self._tree
+
+    def __contains__(self, capability: CapabilityTuple) -> bool:
+        return capability in self._entries_set
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def filter(
+        self,
+        provider_name: Optional[str] = None,
+        feature: Optional[str] = None,
+        subfeature: Optional[str] = None,
+    ) -> List[CapabilityTuple]:
+        """Sorted tuples matching the given provider/feature/subfeature"""
+        return [
+            entry
+            for entry in self._entries
+            if (not provider_name or entry[0] == provider_name)
+            and (not feature or entry[1] == feature)
+            and (not subfeature or entry[2] == subfeature)
+        ]
+
+    def providers(
+        self, feature: Optional[str] = None, subfeature: Optional[str] = None
+    ) -> FrozenSet[str]:
+        """Providers implementing the given feature/subfeature"""
+        return self._providers.get((feature or None, subfeature or None), frozenset())
+
+    def get(self, provider_name: str) -> Optional[Mapping]:
+        """Read-only feature -> subfeature (-> phase) mapping of a provider"""
+        return self._tree.get(provider_name)
+
+    def has(
+        self,
+        provider_name: str,
+        feature: Optional[str] = None,
+        subfeature: Optional[str] = None,
+        phase: Optional[str] = None,
+    ) -> bool:
+        """Check if a provider implements the given feature/subfeature/phase"""
+        node = self._tree.get(provider_name)
+        for key in (feature, subfeature):
+            if not key:
+                return node is not None
+            if not isinstance(node, Mapping) or key not in node:
+                return False
+            node = node[key]
+        if phase:
+            return isinstance(node, Mapping) and phase in node
+        return True
+
+    def to_dict(self) -> Dict:
+        """Mutable copy of `tree`"""
+
+        def _thaw(tree: Mapping) -> Dict:
+            return {
+                key: _thaw(value) if isinstance(value, Mapping) else value
+                for key, value in tree.items()
+            }
+
+        return _thaw(self._tree)
+
+
+def write_capability_manifest(
+    index: CapabilityIndex, path: str = CAPABILITIES_MANIFEST_PATH
+) -> None:
+    """Write `index` as a json manifest: {provider: [[feature, subfeature(, phase)], ...]}"""
+    manifest: Dict[str, List[List[str]]] = {}
+    for provider, *capability in index.entries:
+        manifest.setdefault(provider, []).append(capability)
+    # one capability per line, to keep the file readable and diffs small
+    providers = [
+        f"  {json.dumps(provider)}: [\n"
+        + ",\n".join(f"    {json.dumps(capability)}" for capability in capabilities)
+        + "\n  ]"
+        for provider, capabilities in manifest.items()
+    ]
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{\n" + ",\n".join(providers) + "\n}\n")
+
+
+def load_capability_manifest(
+    path: str = CAPABILITIES_MANIFEST_PATH,
+) -> Optional[CapabilityIndex]:
+    """Load a manifest written by `write_capability_manifest`, `None` if there is none"""
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        manifest: Dict[str, List[List[str]]] = json.load(f)
+    return CapabilityIndex(
+        (provider, *capability)  # type: ignore[misc]
+        for provider, capabilities in manifest.items()
+        for capability in capabilities
+    )
+
+
+@lru_cache(maxsize=1)
+def get_capability_index() -> CapabilityIndex:
+    """Process-wide capability index, built on first call from the manifest,
+    or by introspecting all provider classes if there is no manifest.
+    Use `get_capability_index.cache_clear()` to force a rebuild"""
+    index = load_capability_manifest()
+    if index is None:
+        index = CapabilityIndex.from_classes(load_class())
+    return index
@@ -6,9 +6,8 @@ from typing import Callable, Dict, List, Optional, Union, overload, Type
 from pydantic import BaseModel
 
 from edenai_apis.features.provider.provider_interface import ProviderInterface
-from edenai_apis.loaders.utils import load_json, check_messsing_keys
+from edenai_apis.loaders.utils import SETTINGS_STORE, load_json, check_messsing_keys
 from edenai_apis.settings import info_path, keys_path, outputs_path
-from edenai_apis.utils.compare import is_valid
 
 
 class FeatureDataEnum(Enum):
@@ -27,6 +26,7 @@ class ProviderDataEnum(Enum):
 
 def load_key(provider_name, location=False, api_keys: Dict = {}):
     """Get settings for a provider name of from passed apik_keys dict
+    Settings files are cached in memory by `SETTINGS_STORE`
 
     Args:
         provider_name (str): EdenAI provider name
@@ -36,7 +36,7 @@ def load_key(provider_name, location=False, api_keys: Dict = {}):
     """
 
     provider_settings_path = os.path.join(keys_path, provider_name + "_settings.json")
-    provider_settings_data = load_json(provider_settings_path)
+    provider_settings_data = SETTINGS_STORE.get(provider_settings_path)
     data = provider_settings_data
 
     if api_keys:
@@ -76,22 +76,20 @@ def load_class(
     """
     from edenai_apis import apis
 
-    api_class_list: List[Type[ProviderInterface]] = [
-        getattr(apis, api) for api in dir(apis) if is_valid(".*Api", api)
-    ]
-    api_class_list.sort(key=lambda api: api.provider_name)
     if provider_name:
-        # get first occurence of class with given provider_name, or None
-        api_class: Optional[Type[ProviderInterface]] = next(
-            filter(lambda cls: cls.provider_name == provider_name, api_class_list), None
-        )
-
-        if api_class is None:
+        # only import the requested provider
+        class_name = apis.PROVIDERS.get(provider_name)
+        if class_name is None:
             raise ValueError(
                 f"No ProviderInterface class implemented for provider: {provider_name}."
             )
 
-        return api_class
+        return getattr(apis, class_name)
+
+    api_class_list: List[Type[ProviderInterface]] = [
+        getattr(apis, class_name) for class_name in apis.PROVIDERS.values()
+    ]
+    api_class_list.sort(key=lambda api: api.provider_name)
     return api_class_list
 
 
@@ -142,10 +140,10 @@ def load_info_file(provider_name: str = "") -> Dict:
     if provider_name:
         return load_json(info_path(provider_name))
 
+    from edenai_apis.apis import PROVIDERS
+
     all_infos = {}
-    for provider_name_i in map(
-        lambda provider_class: provider_class.provider_name, load_class()
-    ):
+    for provider_name_i in sorted(PROVIDERS):
         provider_info = load_info_file(provider_name_i)
         for feature in provider_info:
             for subfeature in provider_info[feature]:
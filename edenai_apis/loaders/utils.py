@@ -1,9 +1,15 @@
+import copy
 import json
 import ntpath
-from typing import Dict
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
 
 from edenai_apis.utils.exception import ProviderException
 
+DEFAULT_SETTINGS_CHECK_INTERVAL = 5.0
+
 
 def load_json(path: str) -> dict:
     try:
@@ -20,3 +26,71 @@ def check_messsing_keys(owr_dict: Dict, own_dict: Dict):
     if len(different_keys) > 0:
         raise ProviderException(f"Setting keys missing: {', '.join(different_keys)}")
     return True
+
+
+class SettingsStore:
+    """Process-wide cache of json settings files.
+
+    Files are parsed once and reloaded only when their mtime changes. To avoid a
+    `stat` on every call, the mtime is checked at most once every `check_interval`
+    seconds (`0` checks on every call, a negative value never checks and files are
+    only reloaded with `reload`).
+
+    Args:
+        check_interval (float): min seconds between two mtime checks of a file
+        clock (Callable[[], float]): time function, mostly useful for tests
+    """
+
+    def __init__(
+        self,
+        check_interval: float = DEFAULT_SETTINGS_CHECK_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.check_interval = check_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        # path -> (mtime, last check time, data)
+        self._files: Dict[str, Tuple[float, float, dict]] = {}
+
+    def get(self, path: str) -> dict:
+        """Return a copy of the parsed json file, callers can mutate it safely"""
+        now = self._clock()
+        entry = self._files.get(path)
+        if entry is not None:
+            mtime, checked_at, data = entry
+            if self.check_interval < 0 or now - checked_at < self.check_interval:
+                return copy.deepcopy(data)
+            if self._mtime(path) == mtime:
+                with self._lock:
+                    self._files[path] = (mtime, now, data)
+                return copy.deepcopy(data)
+
+        mtime = self._mtime(path)
+        data = load_json(path)
+        with self._lock:
+            self._files[path] = (mtime, now, data)
+        return copy.deepcopy(data)
+
+    def reload(self, path: Optional[str] = None) -> None:
+        """Forget a cached file, or all of them, they will be read again on next `get`"""
+        with self._lock:
+            if path is None:
+                self._files.clear()
+            else:
+                self._files.pop(path, None)
+
+    @staticmethod
+    def _mtime(path: str) -> float:
+        try:
+            return os.stat(path).st_mtime
+        except FileNotFoundError:
+            return -1.0
+
+
+SETTINGS_STORE = SettingsStore(
+    check_interval=float(
+        os.environ.get(
+            "EDENAI_SETTINGS_CHECK_INTERVAL", DEFAULT_SETTINGS_CHECK_INTERVAL
+        )
+    )
+)
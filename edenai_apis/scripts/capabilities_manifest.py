@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+Generate `edenai_apis/apis/capabilities.json`, the list of provider/feature/subfeature(/phase)
+implemented by each provider class. It is used by `list_features` and `list_providers`
+to avoid importing every provider.
+"""
+from edenai_apis.loaders.capabilities import (
+    CAPABILITIES_MANIFEST_PATH,
+    CapabilityIndex,
+    write_capability_manifest,
+)
+from edenai_apis.loaders.data_loader import load_class
+
+
+def main():
+    """introspect all provider classes and write the manifest"""
+    print(f"=== Generating {CAPABILITIES_MANIFEST_PATH} ===")
+    write_capability_manifest(CapabilityIndex.from_classes(load_class()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Benchmark the startup cost of the package and check it for regressions.
+
+Each measure runs in a fresh python process (cold imports), and is repeated
+`--repeat` times to keep the median:
+    - `import edenai_apis`
+    - first `load_class(provider)` and `load_class()` calls
+    - first `compute_output(..., fake=True)` calls (saved outputs, no network)
+    - import cost of each provider module, read from `python -X importtime`
+
+Usage:
+    python edenai_apis/scripts/import_benchmark.py --output benchmark.json
+    python edenai_apis/scripts/import_benchmark.py --baseline benchmark.json --tolerance 0.2
+
+With `--baseline`, the script exits with status 1 if a measure is more than
+`--tolerance` slower than in the baseline file.
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+PACKAGE_PARENT_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..")
+)
+sys.path.insert(0, PACKAGE_PARENT_PATH)
+
+DEFAULT_CALLS = [
+    ("faker", "audio", "speech_to_text_async", ""),
+    ("google", "text", "sentiment_analysis", ""),
+    ("openai", "text", "chat", ""),
+]
+
+# `compute_output(fake=True)` sleeps to simulate the provider latency,
+# which is not what we want to measure
+_TIMER_CODE = """
+import json, sys, time
+from unittest import mock
+started = time.perf_counter()
+{setup}
+setup_time = time.perf_counter() - started
+with mock.patch("time.sleep"):
+    started = time.perf_counter()
+    {statement}
+    elapsed = time.perf_counter() - started
+print(json.dumps({{"setup": setup_time, "elapsed": elapsed}}))
+"""
+
+_IMPORTTIME_REGEX = re.compile(
+    r"import time:\s+(?P<self>\d+)\s+\|\s+(?P<cumulative>\d+)\s+\|(?P<indent>\s+)(?P<module>\S+)"
+)
+
+
+def _run_python(code: str, importtime: bool = False) -> subprocess.CompletedProcess:
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    return subprocess.run(
+        command + ["-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=PACKAGE_PARENT_PATH,
+        env={
+            **os.environ,
+            "PYTHONPATH": os.pathsep.join(
+                [PACKAGE_PARENT_PATH, os.environ.get("PYTHONPATH", "")]
+            ),
+        },
+    )
+
+
+def time_statement(statement: str, setup: str = "pass", repeat: int = 3) -> float:
+    """Median time (in seconds) of `statement` run in fresh processes after `setup`"""
+    code = _TIMER_CODE.format(setup=setup, statement=statement)
+    timings = [
+        json.loads(_run_python(code).stdout.strip().splitlines()[-1])["elapsed"]
+        for _ in range(repeat)
+    ]
+    return statistics.median(timings)
+
+
+def parse_importtime(stderr: str) -> Dict[str, Tuple[int, int]]:
+    """Parse `python -X importtime` output: {module: (self_us, cumulative_us)}"""
+    modules = {}
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_REGEX.match(line)
+        if match:
+            modules[match["module"]] = (int(match["self"]), int(match["cumulative"]))
+    return modules
+
+
+def provider_import_cost(provider_name: str, repeat: int = 3) -> float:
+    """Median cumulative import time (in seconds) of a provider package,
+    once `edenai_apis` is already imported"""
+    module = f"edenai_apis.apis.{provider_name}"
+    timings = []
+    for _ in range(repeat):
+        stderr = _run_python(
+            f"import edenai_apis; import {module}", importtime=True
+        ).stderr
+        timings.append(parse_importtime(stderr).get(module, (0, 0))[1] / 1e6)
+    return statistics.median(timings)
+
+
+def run_benchmark(
+    calls: List[Tuple[str, str, str, str]] = DEFAULT_CALLS,
+    providers: Optional[List[str]] = None,
+    repeat: int = 3,
+    top: int = 10,
+) -> Dict:
+    """Run all measures and return them as a json serializable dict"""
+    from edenai_apis.apis import PROVIDERS
+
+    results: Dict = {
+        "date": datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "metrics": {},
+    }
+    metrics = results["metrics"]
+
+    metrics["import_edenai_apis"] = time_statement("import edenai_apis", repeat=repeat)
+    metrics["first_load_class_faker"] = time_statement(
+        "load_class('faker')",
+        setup="from edenai_apis.loaders.data_loader import load_class",
+        repeat=repeat,
+    )
+    metrics["first_load_class_all"] = time_statement(
+        "load_class()",
+        setup="from edenai_apis.loaders.data_loader import load_class",
+        repeat=repeat,
+    )
+    metrics["first_list_features"] = time_statement(
+        "list_features()",
+        setup="from edenai_apis.interface import list_features",
+        repeat=repeat,
+    )
+    for provider_name, feature, subfeature, phase in calls:
+        metrics[f"first_compute_output_fake.{provider_name}.{feature}.{subfeature}"] = (
+            time_statement(
+                f"compute_output({provider_name!r}, {feature!r}, {subfeature!r}, {{}}, "
+                f"phase={phase!r}, fake=True)",
+                setup="from edenai_apis.interface import compute_output",
+                repeat=repeat,
+            )
+        )
+
+    providers_cost = {
+        provider_name: provider_import_cost(provider_name, repeat=repeat)
+        for provider_name in (providers or sorted(PROVIDERS))
+    }
+    for provider_name, cost in providers_cost.items():
+        metrics[f"provider_import.{provider_name}"] = cost
+    results["slowest_providers"] = sorted(
+        providers_cost.items(), key=lambda item: item[1], reverse=True
+    )[:top]
+    return results
+
+
+def find_regressions(
+    results: Dict, baseline: Dict, tolerance: float = 0.2, min_delta: float = 0.01
+) -> List[Tuple[str, float, float]]:
+    """Measures slower than `baseline` by more than `tolerance` (relative)
+    and `min_delta` seconds (absolute, to ignore noise on tiny measures)
+
+    Returns:
+        List[Tuple[str, float, float]]: (metric, baseline value, new value)
+    """
+    regressions = []
+    for metric, value in results["metrics"].items():
+        previous = baseline.get("metrics", {}).get(metric)
+        if previous is None:
+            continue
+        if value > previous * (1 + tolerance) and value - previous > min_delta:
+            regressions.append((metric, previous, value))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output", help="write results to this json file")
+    parser.add_argument("--baseline", help="json results to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10, help="nb of slowest providers")
+    parser.add_argument(
+        "--providers", nargs="*", help="providers to measure, all by default"
+    )
+    args = parser.parse_args()
+
+    results = run_benchmark(providers=args.providers, repeat=args.repeat, top=args.top)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    for metric, value in results["metrics"].items():
+        if not metric.startswith("provider_import."):
+            print(f"{metric:<70} {value * 1000:>10.1f} ms")
+    print(f"\n=== {args.top} slowest providers to import ===")
+    for provider_name, value in results["slowest_providers"]:
+        print(f"{provider_name:<70} {value * 1000:>10.1f} ms")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = find_regressions(results, baseline, tolerance=args.tolerance)
+        if regressions:
+            print(f"\n=== {len(regressions)} regression(s) ===")
+            for metric, previous, value in regressions:
+                print(f"{metric:<70} {previous * 1000:>8.1f} -> {value * 1000:.1f} ms")
+            sys.exit(1)
+        print("\nNo regression")
+
+
+if __name__ == "__main__":
+    main()
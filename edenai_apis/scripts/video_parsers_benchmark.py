@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Amazon Rekognition video parsers on synthetic job results.
+
+Long videos (eg: CCTV footage) produce tens of thousands of detections, spread
+over many `NextToken` pages. For each number of detections, synthetic pages of
+`--page-size` detections are generated and parsed `--repeat` times (the median
+is kept) by:
+    - `amazon_video_person_tracking_parser`
+    - `amazon_video_labels_parser`
+    - `amazon_video_text_parser`
+    - `amazon_video_face_parser`
+
+Usage:
+    python edenai_apis/scripts/video_parsers_benchmark.py
+    python edenai_apis/scripts/video_parsers_benchmark.py --detections 1000 50000
+
+The time per detection is reported for each size: it should stay about the same
+when the number of detections grows. With `--max-growth`, the script exits with
+status 1 if the time per detection of the largest size is more than
+`--max-growth` times the one of the smallest size.
+
+The synthetic pages are moved to the permanent generation (`gc.freeze()`)
+before being parsed, like the long-lived objects of an application would be,
+so the cyclic garbage collector only walks what the parsers allocate. Use
+`--no-gc-freeze` to measure the collection pressure of the pages themselves.
+"""
+import argparse
+import gc
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+PACKAGE_PARENT_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..")
+)
+sys.path.insert(0, PACKAGE_PARENT_PATH)
+
+from edenai_apis.apis.amazon.helpers import (  # noqa: E402
+    amazon_video_face_parser,
+    amazon_video_labels_parser,
+    amazon_video_person_tracking_parser,
+    amazon_video_text_parser,
+)
+
+DEFAULT_DETECTIONS = [1000, 10000, 50000]
+# max results of a Rekognition `Get*` call
+DEFAULT_PAGE_SIZE = 1000
+
+
+def _bounding_box(rng: random.Random) -> Dict:
+    return {
+        "Top": rng.random(),
+        "Left": rng.random(),
+        "Width": rng.random() / 4,
+        "Height": rng.random() / 4,
+    }
+
+
+def _face(rng: random.Random) -> Dict:
+    return {
+        "BoundingBox": _bounding_box(rng),
+        "Landmarks": [
+            {"Type": type_, "X": rng.random(), "Y": rng.random()}
+            for type_ in ("eyeLeft", "eyeRight", "nose", "mouthLeft", "mouthRight")
+        ],
+        "Pose": {"Roll": rng.uniform(-20, 20), "Yaw": 3.2, "Pitch": -1.5},
+        "Quality": {"Brightness": rng.uniform(0, 100), "Sharpness": 70.1},
+        "Confidence": rng.uniform(80, 100),
+    }
+
+
+# each person is detected in ~50 frames, each text in ~20 frames
+def person_detection(rng: random.Random, detections: int, timestamp: int) -> Dict:
+    person = {
+        "Index": rng.randrange(max(detections // 50, 1)),
+        "BoundingBox": _bounding_box(rng),
+    }
+    if rng.random() < 0.5:
+        person["Face"] = _face(rng)
+    return {"Timestamp": timestamp, "Person": person}
+
+
+def label_detection(rng: random.Random, detections: int, timestamp: int) -> Dict:
+    name = f"label-{rng.randrange(200)}"
+    return {
+        "Timestamp": timestamp,
+        "Label": {
+            "Name": name,
+            "Confidence": rng.uniform(50, 100),
+            "Instances": [{"BoundingBox": _bounding_box(rng)}],
+            "Parents": [{"Name": "Parent"}],
+        },
+    }
+
+
+def text_detection(rng: random.Random, detections: int, timestamp: int) -> Dict:
+    return {
+        "Timestamp": timestamp,
+        "TextDetection": {
+            "DetectedText": f"text-{rng.randrange(max(detections // 20, 1))}",
+            "Confidence": rng.uniform(50, 100),
+            "Geometry": {"BoundingBox": _bounding_box(rng)},
+        },
+    }
+
+
+def face_detection(rng: random.Random, detections: int, timestamp: int) -> Dict:
+    return {"Timestamp": timestamp, "Face": _face(rng)}
+
+
+PARSERS = {
+    "person_tracking": (
+        amazon_video_person_tracking_parser,
+        "Persons",
+        person_detection,
+    ),
+    "labels": (amazon_video_labels_parser, "Labels", label_detection),
+    "text": (amazon_video_text_parser, "TextDetections", text_detection),
+    "face": (amazon_video_face_parser, "Faces", face_detection),
+}
+
+
+def synthetic_pages(
+    key: str, make_detection: Callable, detections: int, page_size: int
+) -> List[Dict]:
+    """Rekognition job result of `detections` detections, one every 40ms,
+    paginated by `page_size`"""
+    rng = random.Random(detections)
+    items = [
+        make_detection(rng, detections, index * 40) for index in range(detections)
+    ]
+    return [
+        {"JobStatus": "SUCCEEDED", key: items[start : start + page_size]}
+        for start in range(0, detections, page_size)
+    ]
+
+
+def time_parser(
+    parser: Callable, pages: List[Dict], repeat: int, gc_freeze: bool = True
+) -> float:
+    if gc_freeze:
+        gc.collect()
+        gc.freeze()
+    timings = []
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            parser(iter(pages))
+            timings.append(time.perf_counter() - started)
+    finally:
+        if gc_freeze:
+            gc.unfreeze()
+    return statistics.median(timings)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--detections", type=int, nargs="+", default=DEFAULT_DETECTIONS
+    )
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--parsers", nargs="+", choices=list(PARSERS), default=list(PARSERS)
+    )
+    parser.add_argument("--max-growth", type=float, default=None)
+    parser.add_argument("--no-gc-freeze", dest="gc_freeze", action="store_false")
+    args = parser.parse_args(argv)
+
+    failed = False
+    sizes = sorted(args.detections)
+    for name in args.parsers:
+        parse, key, make_detection = PARSERS[name]
+        per_detection = []
+        for size in sizes:
+            pages = synthetic_pages(key, make_detection, size, args.page_size)
+            elapsed = time_parser(parse, pages, args.repeat, args.gc_freeze)
+            per_detection.append(elapsed / size)
+            print(
+                f"{name:<16} {size:>8} detections {elapsed:>9.3f}s "
+                f"{per_detection[-1] * 1e6:>8.1f}us/detection"
+            )
+        growth = per_detection[-1] / per_detection[0]
+        print(f"{name:<16} time per detection growth: x{growth:.2f}")
+        if args.max_growth is not None and growth > args.max_growth:
+            print(f"{name} does not scale linearly (> x{args.max_growth})")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
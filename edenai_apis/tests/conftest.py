@@ -2,7 +2,8 @@ from typing import Callable, Any
 
 import pytest
 
-from edenai_apis.interface import list_features, list_providers
+from edenai_apis.interface import list_providers
+from edenai_apis.loaders.capabilities import get_capability_index
 
 only_async = lambda p, f, s, ph: "_async" not in s and "_async" not in ph
 only_async_without_phase = lambda p, f, s, ph: "_async" not in s
@@ -20,7 +21,7 @@ def global_features(
     Returns:
          list [] providers   : [([provider1, provider2], feature, subfeature)]
     """
-    method_list = list_features()
+    method_list = get_capability_index().entries
     detailed_providers_list = []
     params_dict = {}
 
@@ -93,7 +94,7 @@ def pytest_addoption(parser):
 
 
 def pytest_configure(config):
-    method_list = list_features()
+    method_list = get_capability_index().entries
     # params_list = []
     pytest.PROVIDER = "google"
     pytest.FEATURE = "translation"
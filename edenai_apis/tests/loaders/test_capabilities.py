@@ -0,0 +1,94 @@
+import pytest
+
+from edenai_apis.features import ProviderInterface, TextInterface
+from edenai_apis.interface import list_features, list_providers
+from edenai_apis.loaders.capabilities import (
+    CapabilityIndex,
+    detect_capabilities,
+    get_capability_index,
+    load_capability_manifest,
+    write_capability_manifest,
+)
+from edenai_apis.loaders.data_loader import load_class
+
+
+class FakeApi(ProviderInterface, TextInterface):
+    provider_name = "fake"
+
+    def __init__(self, api_keys={}):
+        pass
+
+    def text__sentiment_analysis(self, language, text, **kwargs):
+        pass
+
+    async def text__sentiment_analysis_async(self, language, text, **kwargs):
+        pass
+
+    def text__sentiment_analysis_batch(self, items):
+        pass
+
+    def text__search__launch(self, **kwargs):
+        pass
+
+    def text__chat_async__launch_job(self, **kwargs):
+        pass
+
+
+class TestCapabilityIndex:
+    def test_detect_capabilities(self):
+        capabilities = set(detect_capabilities(FakeApi))
+        assert capabilities == {
+            ("fake", "text", "sentiment_analysis"),
+            ("fake", "text", "search", "launch"),
+            ("fake", "text", "chat_async"),
+        }
+
+    def test_index_lookups(self):
+        index = CapabilityIndex.from_classes([FakeApi])
+        assert ("fake", "text", "sentiment_analysis") in index
+        assert index.has("fake")
+        assert index.has("fake", "text", "sentiment_analysis")
+        assert index.has("fake", "text", "search", "launch")
+        assert not index.has("fake", "text", "search", "unknown")
+        assert not index.has("fake", "text", "sentiment_analysis", "launch")
+        assert not index.has("fake", "image")
+        assert not index.has("unknown")
+        assert index.providers("text", "search") == frozenset({"fake"})
+        assert index.providers("image") == frozenset()
+
+    def test_index_is_read_only(self):
+        index = CapabilityIndex.from_classes([FakeApi])
+        with pytest.raises(TypeError):
+            index.tree["fake"]["text"]["new"] = True  # type: ignore[index]
+        copy = index.to_dict()
+        copy["fake"]["text"]["new"] = True
+        assert not index.has("fake", "text", "new")
+
+    def test_index_is_built_once(self):
+        assert get_capability_index() is get_capability_index()
+
+
+def test_list_features_filters():
+    for provider, feature, subfeature, *_ in list_features(
+        feature="text", subfeature="chat"
+    ):
+        assert (feature, subfeature) == ("text", "chat")
+    assert sorted(
+        {entry[0] for entry in list_features(feature="text", subfeature="chat")}
+    ) == sorted(list_providers("text", "chat"))
+
+
+def test_capability_manifest_is_up_to_date():
+    """`apis/capabilities.json` must be regenerated with `scripts/capabilities_manifest.py`
+    when a provider implements a new (sub)feature"""
+    manifest = load_capability_manifest()
+    assert manifest is not None, "capabilities manifest is missing"
+    assert manifest.entries == CapabilityIndex.from_classes(load_class()).entries
+
+
+def test_capability_manifest_roundtrip(tmp_path):
+    path = str(tmp_path / "capabilities.json")
+    index = CapabilityIndex.from_classes([FakeApi])
+    write_capability_manifest(index, path)
+    assert load_capability_manifest(path).entries == index.entries
+    assert load_capability_manifest(str(tmp_path / "missing.json")) is None
@@ -1,4 +1,6 @@
 import os
+import subprocess
+import sys
 from typing import Optional
 
 import pytest
@@ -75,6 +77,28 @@ class TestLoadClass:
         nb_providers = len(list_providers())
         assert len_klass == nb_providers
 
+    @pytest.mark.parametrize(("provider"), sorted(global_providers()))
+    def test_load_class_provider_name(self, provider: str):
+        assert load_class(provider).provider_name == provider
+
+    def test_load_class_only_imports_given_provider(self):
+        code = (
+            "import sys\n"
+            "from edenai_apis.interface import list_features\n"
+            "from edenai_apis.loaders.data_loader import load_class\n"
+            "list_features()\n"
+            "load_class('faker')\n"
+            "print(sorted({m.split('.')[2] for m in sys.modules if m.startswith('edenai_apis.apis.')}))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        ).stdout
+        assert output.strip().splitlines()[-1] == "['faker']"
+
 
 class TestLoadDataclass:
     @pytest.mark.parametrize(
@@ -0,0 +1,68 @@
+import json
+import os
+
+import pytest
+
+from edenai_apis.loaders import utils as loaders_utils
+from edenai_apis.loaders.utils import SettingsStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def settings_file(tmp_path):
+    path = tmp_path / "provider_settings.json"
+    path.write_text(json.dumps({"api_key": "first"}))
+    return str(path)
+
+
+def _rewrite(path, data, mtime):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.utime(path, (mtime, mtime))
+
+
+def test_file_is_parsed_once(mocker, settings_file):
+    store = SettingsStore(check_interval=-1)
+    load_json = mocker.spy(loaders_utils, "load_json")
+    assert store.get(settings_file) == {"api_key": "first"}
+    assert store.get(settings_file) == {"api_key": "first"}
+    assert load_json.call_count == 1
+
+
+def test_returns_copies(settings_file):
+    store = SettingsStore()
+    store.get(settings_file)["api_key"] = "mutated"
+    assert store.get(settings_file) == {"api_key": "first"}
+
+
+def test_reload_on_mtime_change(settings_file):
+    clock = FakeClock()
+    store = SettingsStore(check_interval=10, clock=clock)
+    assert store.get(settings_file) == {"api_key": "first"}
+
+    _rewrite(settings_file, {"api_key": "second"}, mtime=1)
+    clock.now = 5
+    assert store.get(settings_file) == {"api_key": "first"}  # not checked yet
+    clock.now = 10
+    assert store.get(settings_file) == {"api_key": "second"}
+
+
+def test_explicit_reload(settings_file):
+    store = SettingsStore(check_interval=-1)
+    assert store.get(settings_file) == {"api_key": "first"}
+    _rewrite(settings_file, {"api_key": "second"}, mtime=1)
+    assert store.get(settings_file) == {"api_key": "first"}
+    store.reload(settings_file)
+    assert store.get(settings_file) == {"api_key": "second"}
+
+
+def test_missing_file(tmp_path):
+    with pytest.raises(Exception):
+        SettingsStore().get(str(tmp_path / "missing_settings.json"))
@@ -1,20 +1,68 @@
 """
     Test interface functions :
     - compute_output
+    - compute_output_async
+    - get_async_job_result
+    - get_async_job_result_async
+    - get_async_job_results_many
+    - get_async_job_results_many_async
+    - iter_async_job_pages
+    - compute_output_fan_out
+    - compute_output_fan_out_async
+    - compute_output_batch
+    - compute_output_stream
+    - compute_output_stream_async
     - list_features
     - list_providers
     - check_provider_constraints
 """
 
+import asyncio
+import contextlib
+import threading
+import time
+from io import BytesIO
+from types import SimpleNamespace
+from typing import List
+
 import pytest
 from pytest_mock import MockerFixture
 
+from edenai_apis import interface
 from edenai_apis.interface import (
+    AsyncJobRequest,
     check_provider_constraints,
     compute_output,
+    compute_output_async,
+    compute_output_batch,
+    compute_output_fan_out,
+    compute_output_fan_out_async,
+    compute_output_stream,
+    compute_output_stream_async,
+    get_async_job_result,
+    get_async_job_result_async,
+    get_async_job_results_many,
+    get_async_job_results_many_async,
+    iter_async_job_pages,
     list_features,
     list_providers,
 )
+from edenai_apis.features.text.chat import ChatDataClass
+from edenai_apis.features.text.chat.chat_dataclass import (
+    ChatStreamResponse,
+    StreamChat,
+)
+from edenai_apis.features.video.text_detection_async.text_detection_async_dataclass import (
+    TextDetectionAsyncDataClass,
+)
+from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.retry import NO_RETRY
+from edenai_apis.utils.stream_metrics import (
+    CallbackSink,
+    add_stream_metrics_sink,
+    remove_stream_metrics_sink,
+)
+from edenai_apis.utils.types import AsyncResponseType, ResponseType
 from edenai_apis.tests.conftest import global_features, only_async
 
 VALID_PROVIDER = "amazon"
@@ -60,6 +108,782 @@ class TestGetAsyncJobResult:
         assert final_result["status"] == "success"
 
 
+class TestComputeOutputAsync:
+    def test_output_fake(self, mocker: MockerFixture):
+        mocker.patch("edenai_apis.interface.asyncio.sleep", return_value=None)
+        final_result = asyncio.run(
+            compute_output_async("google", "text", "sentiment_analysis", {}, fake=True)
+        )
+        assert final_result["provider"] == "google"
+        assert final_result["status"] == "success"
+        assert final_result == compute_output(
+            "google", "text", "sentiment_analysis", {}, fake=True
+        )
+
+    def test_job_result_fake(self, mocker: MockerFixture):
+        mocker.patch("edenai_apis.interface.asyncio.sleep", return_value=None)
+        result = asyncio.run(
+            get_async_job_result_async(
+                "amazon", "audio", "speech_to_text_async", "job-id", fake=True
+            )
+        )
+        assert result["provider_job_id"] == "job-id"
+
+    def test_sync_provider_method(self, mocker: MockerFixture):
+        provider = mocker.Mock(spec=["text__sentiment_analysis"])
+        provider.text__sentiment_analysis.return_value.model_dump.return_value = {
+            "items": []
+        }
+        mocker.patch(
+            "edenai_apis.interface_v2.get_provider_instance", return_value=provider
+        )
+        final_result = asyncio.run(
+            compute_output_async(
+                "google", "text", "sentiment_analysis", {"text": "hi", "language": "en"}
+            )
+        )
+        assert final_result == {"status": "success", "provider": "google", "items": []}
+        provider.text__sentiment_analysis.assert_called_once_with(
+            text="hi", language="en"
+        )
+
+    def test_native_provider_coroutine(self, mocker: MockerFixture):
+        provider = mocker.Mock(
+            spec=["text__sentiment_analysis", "text__sentiment_analysis_async"]
+        )
+        provider.text__sentiment_analysis_async = mocker.AsyncMock(
+            side_effect=ProviderException("Rate limit exceeded", code=429)
+        )
+        mocker.patch(
+            "edenai_apis.interface_v2.get_provider_instance", return_value=provider
+        )
+        with pytest.raises(ProviderException):
+            asyncio.run(
+                compute_output_async(
+                    "google",
+                    "text",
+                    "sentiment_analysis",
+                    {"text": "hi"},
+                    retry_policy=NO_RETRY,
+                )
+            )
+        provider.text__sentiment_analysis_async.assert_awaited_once_with(text="hi")
+        provider.text__sentiment_analysis.assert_not_called()
+
+    def test_transient_errors_retried(self, mocker: MockerFixture):
+        mocker.patch("edenai_apis.utils.retry.asyncio.sleep", return_value=None)
+        provider = mocker.Mock(spec=["text__sentiment_analysis_async"])
+        provider.text__sentiment_analysis_async = mocker.AsyncMock(
+            side_effect=[
+                ProviderException("Rate limit exceeded", code=429),
+                SimpleNamespace(model_dump=lambda: {"items": []}),
+            ]
+        )
+        mocker.patch(
+            "edenai_apis.interface_v2.get_provider_instance", return_value=provider
+        )
+        final_result = asyncio.run(
+            compute_output_async(
+                "google", "text", "sentiment_analysis", {"text": "hi"}
+            )
+        )
+        assert final_result == {
+            "status": "success",
+            "provider": "google",
+            "items": [],
+            "attempts": 2,
+        }
+
+    def test_launch_job_not_retried(self, mocker: MockerFixture):
+        mocker.patch(
+            "edenai_apis.interface.validate_all_provider_constraints",
+            side_effect=lambda *args: args[-1],
+        )
+        provider = mocker.Mock(spec=["audio__speech_to_text_async__launch_job_async"])
+        provider.audio__speech_to_text_async__launch_job_async = mocker.AsyncMock(
+            side_effect=ProviderException("Service unavailable", code=503)
+        )
+        mocker.patch(
+            "edenai_apis.interface_v2.get_provider_instance", return_value=provider
+        )
+        with pytest.raises(ProviderException):
+            asyncio.run(
+                compute_output_async(
+                    "amazon", "audio", "speech_to_text_async", {"file": "a.mp3"}
+                )
+            )
+        provider.audio__speech_to_text_async__launch_job_async.assert_awaited_once()
+
+    def test_file_arguments_rewound(self, mocker: MockerFixture):
+        mocker.patch("edenai_apis.utils.retry.asyncio.sleep", return_value=None)
+        read = []
+
+        async def sentiment_analysis(text, file):
+            read.append(file.read())
+            if len(read) == 1:
+                raise ProviderException("Service unavailable", code=503)
+            return SimpleNamespace(model_dump=lambda: {"items": []})
+
+        provider = SimpleNamespace(text__sentiment_analysis_async=sentiment_analysis)
+        mocker.patch(
+            "edenai_apis.interface_v2.get_provider_instance", return_value=provider
+        )
+        asyncio.run(
+            compute_output_async(
+                "google",
+                "text",
+                "sentiment_analysis",
+                {"text": "hi", "file": BytesIO(b"content")},
+            )
+        )
+        assert read == [b"content", b"content"]
+
+
+def record_rate_limits(mocker: MockerFixture) -> List:
+    """Record the (args, kwargs) of the calls waiting for the provider budget"""
+    limited = []
+
+    def limit(*args, **kwargs):
+        limited.append((args, kwargs))
+        return contextlib.nullcontext()
+
+    mocker.patch.object(interface.RATE_LIMITER, "limit", side_effect=limit)
+    return limited
+
+
+class FakeJobProvider:
+    """Provider getting job results slowly, recording its max concurrency"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def audio__speech_to_text_async__get_job_result(self, job_id):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.01)
+        with self.lock:
+            self.running -= 1
+        if job_id == "failed":
+            raise ProviderException("Job not found", code=404)
+        return SimpleNamespace(model_dump=lambda: {"provider_job_id": job_id})
+
+
+class TestGetAsyncJobResultsMany:
+    JOBS = [("amazon", "audio", "speech_to_text_async", str(i)) for i in range(10)]
+
+    def test_rate_limited(self, mocker: MockerFixture):
+        limited = record_rate_limits(mocker)
+        mocker.patch(
+            "edenai_apis.interface_v2.get_provider_instance",
+            return_value=FakeJobProvider(),
+        )
+        list(get_async_job_results_many(self.JOBS))
+        assert len(limited) == len(self.JOBS)
+        assert limited[0][0][:3] == ("amazon", "audio", "speech_to_text_async")
+
+    def test_provider_instance_reused(self, mocker: MockerFixture):
+        provider = FakeJobProvider()
+        get_provider_instance = mocker.patch(
+            "edenai_apis.interface_v2.get_provider_instance", return_value=provider
+        )
+        results = list(
+            get_async_job_results_many(self.JOBS, max_concurrency_per_provider=3)
+        )
+        assert sorted(result.job.async_job_id for result in results) == sorted(
+            job[3] for job in self.JOBS
+        )
+        assert all(result.error is None for result in results)
+        assert results[0].result["provider_job_id"] == results[0].job.async_job_id
+        get_provider_instance.assert_called_once_with("amazon", {})
+        assert provider.max_running == 3
+
+    def test_errors_dont_stop_other_jobs(self, mocker: MockerFixture):
+        def get_provider_instance(provider, api_keys):
+            if provider != "amazon":
+                raise ProviderException("Invalid api key", code=401)
+            return FakeJobProvider()
+
+        mocker.patch(
+            "edenai_apis.interface_v2.get_provider_instance",
+            side_effect=get_provider_instance,
+        )
+        jobs = [
+            AsyncJobRequest("amazon", "audio", "speech_to_text_async", "failed"),
+            AsyncJobRequest("amazon", "audio", "speech_to_text_async", "ok"),
+            AsyncJobRequest("amazon", "audio", "unknown_async", "ok"),
+            AsyncJobRequest("google", "audio", "speech_to_text_async", "ok"),
+        ]
+        results = {
+            result.job: result for result in get_async_job_results_many(jobs)
+        }
+        assert len(results) == len(jobs)
+        assert isinstance(results[jobs[0]].error, ProviderException)
+        assert results[jobs[1]].result == {"provider_job_id": "ok"}
+        assert isinstance(results[jobs[2]].error, AttributeError)
+        assert results[jobs[3]].error.status_code == 401
+
+    def test_transient_errors_retried(self, mocker: MockerFixture):
+        mocker.patch("edenai_apis.utils.retry.time.sleep", return_value=None)
+        provider = mocker.Mock(spec=["audio__speech_to_text_async__get_job_result"])
+        provider.audio__speech_to_text_async__get_job_result.side_effect = [
+            ProviderException("Service unavailable", code=503),
+            SimpleNamespace(model_dump=lambda: {"provider_job_id": "0"}),
+        ]
+        mocker.patch(
+            "edenai_apis.interface_v2.get_provider_instance", return_value=provider
+        )
+        (result,) = get_async_job_results_many(self.JOBS[:1])
+        assert result.result == {"provider_job_id": "0", "attempts": 2}
+
+    def test_fake(self):
+        results = list(get_async_job_results_many(self.JOBS[:2], fake=True))
+        assert [result.result["provider_job_id"] for result in results] == ["0", "1"]
+
+        # a job without fake result doesn't stop the others
+        jobs = [("amazon", "audio", "unknown_async", "0")] + self.JOBS[:1]
+        failed, result = get_async_job_results_many(jobs, fake=True)
+        assert failed.error is not None
+        assert result.result["provider_job_id"] == "0"
+
+    def test_not_poolable_provider_instance_per_job(self, mocker: MockerFixture):
+        instances = []
+
+        def get_provider_instance(provider, api_keys):
+            instances.append(FakeJobProvider())
+            return instances[-1]
+
+        mocker.patch(
+            "edenai_apis.interface_v2.get_provider_instance",
+            side_effect=get_provider_instance,
+        )
+        mocker.patch("edenai_apis.interface_v2.is_poolable", return_value=False)
+        results = list(get_async_job_results_many(self.JOBS))
+        assert all(result.error is None for result in results)
+        assert len(instances) == len(self.JOBS)
+        assert all(instance.max_running == 1 for instance in instances)
+
+        instances.clear()
+
+        async def collect():
+            return [
+                result
+                async for result in get_async_job_results_many_async(self.JOBS)
+            ]
+
+        assert all(result.error is None for result in asyncio.run(collect()))
+        assert len(instances) == len(self.JOBS)
+
+    def test_async(self, mocker: MockerFixture):
+        provider = FakeJobProvider()
+        mocker.patch(
+            "edenai_apis.interface_v2.get_provider_instance", return_value=provider
+        )
+
+        async def collect():
+            return [
+                result
+                async for result in get_async_job_results_many_async(
+                    self.JOBS, max_concurrency_per_provider=2
+                )
+            ]
+
+        results = asyncio.run(collect())
+        assert len(results) == len(self.JOBS)
+        assert all(result.error is None for result in results)
+        assert provider.max_running <= 2
+
+
+class TestIterAsyncJobPages:
+    def test_pages(self, mocker: MockerFixture):
+        read = []
+
+        def get_job_pages(job_id):
+            for index in range(3):
+                read.append(index)
+                yield SimpleNamespace(model_dump=lambda index=index: {"page": index})
+
+        provider = SimpleNamespace(ocr__ocr_async__get_job_pages=get_job_pages)
+        mocker.patch(
+            "edenai_apis.interface_v2.get_provider_instance", return_value=provider
+        )
+        pages = iter_async_job_pages("amazon", "ocr", "ocr_async", "job-id")
+        assert next(pages) == {"page": 0}
+        assert read == [0]
+        assert list(pages) == [{"page": 1}, {"page": 2}]
+
+    def test_errors(self, mocker: MockerFixture):
+        def get_job_pages(job_id):
+            raise ProviderException("Rate exceeded", code=429)
+
+        provider = SimpleNamespace(ocr__ocr_async__get_job_pages=get_job_pages)
+        mocker.patch(
+            "edenai_apis.interface_v2.get_provider_instance", return_value=provider
+        )
+        with pytest.raises(ProviderException) as exc:
+            iter_async_job_pages("amazon", "ocr", "ocr_async", "job-id")
+        assert exc.value.status_code == 429
+        with pytest.raises(ValueError):
+            iter_async_job_pages("amazon", "ocr", "ocr_tables_async", "job-id")
+
+
+class TestGetAsyncJobResultTimeline:
+    @staticmethod
+    def job_result(job_id):
+        box = {"top": 0, "left": 0, "width": 1, "height": 1}
+        frames = [
+            {"confidence": 0.9, "timestamp": timestamp, "bounding_box": box}
+            for timestamp in (0.0, 0.5, 1.0, 5.0)
+        ]
+        return AsyncResponseType(
+            original_response={},
+            standardized_response=TextDetectionAsyncDataClass(
+                texts=[{"text": "EXIT", "frames": frames}]
+            ),
+            provider_job_id=job_id,
+        )
+
+    def test_timeline_gap(self, mocker: MockerFixture):
+        provider = SimpleNamespace(
+            video__text_detection_async__get_job_result=self.job_result
+        )
+        mocker.patch(
+            "edenai_apis.interface_v2.get_provider_instance", return_value=provider
+        )
+
+        def timestamps(**kwargs):
+            result = get_async_job_result(
+                "amazon", "video", "text_detection_async", "job-id", **kwargs
+            )
+            frames = result["standardized_response"]["texts"][0]["frames"]
+            return [frame["timestamp"] for frame in frames]
+
+        assert timestamps(timeline_gap=None) == [0.0, 0.5, 1.0, 5.0]
+        assert timestamps(timeline_gap=1.0) == [0.0, 1.0, 5.0]
+
+    def test_many_timeline_gap(self, mocker: MockerFixture):
+        provider = SimpleNamespace(
+            video__text_detection_async__get_job_result=self.job_result
+        )
+        mocker.patch(
+            "edenai_apis.interface_v2.get_provider_instance", return_value=provider
+        )
+        jobs = [("amazon", "video", "text_detection_async", "job-id")]
+        (job_result,) = get_async_job_results_many(jobs, timeline_gap=1.0)
+        frames = job_result.result["standardized_response"]["texts"][0]["frames"]
+        assert [frame["timestamp"] for frame in frames] == [0.0, 1.0, 5.0]
+
+
+def fake_provider_calls(delays, failing=()):
+    """compute_output side effect: each provider answers after its delay"""
+    calls = []
+
+    def compute_output(provider_name, feature, subfeature, args, **kwargs):
+        calls.append(provider_name)
+        time.sleep(delays[provider_name])
+        if provider_name in failing:
+            raise ProviderException("Provider error", code=500)
+        return {"status": "success", "provider": provider_name}
+
+    return compute_output, calls
+
+
+class TestComputeOutputFanOut:
+    def test_all(self, mocker: MockerFixture):
+        side_effect, calls = fake_provider_calls(
+            {"google": 0.05, "amazon": 0, "microsoft": 0}, failing=["microsoft"]
+        )
+        mocker.patch("edenai_apis.interface.compute_output", side_effect=side_effect)
+        results = compute_output_fan_out(
+            ["google", "amazon", "microsoft"], "text", "sentiment_analysis", {}
+        )
+        assert [result.provider_name for result in results] == [
+            "google",
+            "amazon",
+            "microsoft",
+        ]
+        assert results[0].result == {"status": "success", "provider": "google"}
+        assert results[0].elapsed >= 0.05
+        assert isinstance(results[2].error, ProviderException)
+        assert not any(result.cancelled for result in results)
+
+    def test_first_success(self, mocker: MockerFixture):
+        side_effect, _ = fake_provider_calls(
+            {"google": 0.5, "amazon": 0.01, "microsoft": 0}, failing=["microsoft"]
+        )
+        mocker.patch("edenai_apis.interface.compute_output", side_effect=side_effect)
+        start = time.monotonic()
+        google, amazon, microsoft = compute_output_fan_out(
+            ["google", "amazon", "microsoft"],
+            "text",
+            "sentiment_analysis",
+            {},
+            mode="first_success",
+        )
+        assert time.monotonic() - start < 0.5
+        assert google.cancelled
+        assert amazon.result["provider"] == "amazon"
+        assert microsoft.error is not None
+
+    def test_hedged(self, mocker: MockerFixture):
+        side_effect, calls = fake_provider_calls({"google": 0.5, "amazon": 0})
+        mocker.patch("edenai_apis.interface.compute_output", side_effect=side_effect)
+        google, amazon = compute_output_fan_out(
+            ["google", "amazon"],
+            "text",
+            "sentiment_analysis",
+            {},
+            mode="hedged",
+            hedge_delay=0.05,
+        )
+        assert calls == ["google", "amazon"]
+        assert google.cancelled
+        assert amazon.result["provider"] == "amazon"
+
+        # the backup provider is not needed if the first one is fast enough
+        side_effect, calls = fake_provider_calls({"google": 0, "amazon": 0})
+        mocker.patch("edenai_apis.interface.compute_output", side_effect=side_effect)
+        compute_output_fan_out(
+            ["google", "amazon"],
+            "text",
+            "sentiment_analysis",
+            {},
+            mode="hedged",
+            hedge_delay=1,
+        )
+        assert calls == ["google"]
+
+    def test_hedged_replaces_failed_provider(self, mocker: MockerFixture):
+        side_effect, calls = fake_provider_calls(
+            {"google": 0, "amazon": 0}, failing=["google"]
+        )
+        mocker.patch("edenai_apis.interface.compute_output", side_effect=side_effect)
+        start = time.monotonic()
+        google, amazon = compute_output_fan_out(
+            ["google", "amazon"],
+            "text",
+            "sentiment_analysis",
+            {},
+            mode="hedged",
+            hedge_delay=10,
+        )
+        assert time.monotonic() - start < 10
+        assert google.error is not None
+        assert amazon.result is not None
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            compute_output_fan_out(["google"], "text", "sentiment_analysis", {}, "any")
+
+    def test_async_first_success(self, mocker: MockerFixture):
+        cancelled = []
+
+        async def compute_output_async(provider_name, *args, **kwargs):
+            try:
+                await asyncio.sleep(1 if provider_name == "google" else 0)
+            except asyncio.CancelledError:
+                cancelled.append(provider_name)
+                raise
+            return {"status": "success", "provider": provider_name}
+
+        mocker.patch(
+            "edenai_apis.interface.compute_output_async",
+            side_effect=compute_output_async,
+        )
+        google, amazon = asyncio.run(
+            compute_output_fan_out_async(
+                ["google", "amazon"],
+                "text",
+                "sentiment_analysis",
+                {},
+                mode="first_success",
+            )
+        )
+        assert google.cancelled
+        assert amazon.result["provider"] == "amazon"
+        assert cancelled == ["google"]
+
+
+
+class FakeModerationProvider:
+    def __init__(self):
+        self.batches = []
+
+    def text__moderation(self, text, language):
+        time.sleep(0.01 * (len(text) % 3))
+        if text == "error":
+            raise ProviderException("Invalid text", code=400)
+        return SimpleNamespace(model_dump=lambda: {"text": text})
+
+
+class FakeBatchModerationProvider(FakeModerationProvider):
+    def text__moderation_batch(self, items):
+        self.batches.append([item["text"] for item in items])
+        return [self.text__moderation(**item) for item in items]
+
+
+class TestComputeOutputBatch:
+    @pytest.fixture(autouse=True)
+    def validation(self, mocker: MockerFixture):
+        return mocker.patch(
+            "edenai_apis.utils.batch.validate_all_provider_constraints",
+            side_effect=lambda provider, feature, subfeature, phase, args: args,
+        )
+
+    def test_order_and_errors(self, mocker: MockerFixture, validation):
+        provider = FakeModerationProvider()
+        get_provider_instance = mocker.patch(
+            "edenai_apis.interface_v2.get_provider_instance", return_value=provider
+        )
+        texts = ["a", "bb", "error", "ccc", "d"] * 4
+        results = list(
+            compute_output_batch(
+                "openai",
+                "text",
+                "moderation",
+                ({"text": text, "language": "en"} for text in texts),
+                max_concurrency=3,
+            )
+        )
+        assert [result.index for result in results] == list(range(len(texts)))
+        for text, result in zip(texts, results):
+            if text == "error":
+                assert isinstance(result.error, ProviderException)
+            else:
+                assert result.result == {
+                    "status": "success",
+                    "provider": "openai",
+                    "text": text,
+                }
+        get_provider_instance.assert_called_once()
+        # same settings for all the inputs
+        assert validation.call_count == 1
+
+    def test_native_batch(self, mocker: MockerFixture):
+        provider = FakeBatchModerationProvider()
+        mocker.patch(
+            "edenai_apis.interface_v2.get_provider_instance", return_value=provider
+        )
+        texts = [str(index) for index in range(40)] + ["error"]
+        results = list(
+            compute_output_batch(
+                "openai",
+                "text",
+                "moderation",
+                [{"text": text, "language": "en"} for text in texts],
+            )
+        )
+        # openai moderation max_batch_size is 32, batches run concurrently
+        assert sorted(len(batch) for batch in provider.batches) == [9, 32]
+        assert [result.result["text"] for result in results[:32]] == texts[:32]
+        # a failing native batch fails all its inputs
+        assert all(result.error is not None for result in results[32:])
+
+        provider.batches.clear()
+        list(
+            compute_output_batch(
+                "openai",
+                "text",
+                "moderation",
+                [{"text": "a", "language": "en"}],
+                native_batch=False,
+            )
+        )
+        assert provider.batches == []
+
+    def test_transient_errors_retried(self, mocker: MockerFixture):
+        mocker.patch("edenai_apis.utils.retry.time.sleep", return_value=None)
+        provider = FakeBatchModerationProvider()
+        calls = []
+
+        def text__moderation(text, language):
+            calls.append(text)
+            if len(calls) == 1:
+                raise ProviderException("Rate limit exceeded", code=429)
+            return SimpleNamespace(model_dump=lambda: {"text": text})
+
+        provider.text__moderation = text__moderation
+        mocker.patch(
+            "edenai_apis.interface_v2.get_provider_instance", return_value=provider
+        )
+        inputs = [{"text": "a", "language": "en"}]
+        (result,) = compute_output_batch(
+            "openai", "text", "moderation", inputs, native_batch=False
+        )
+        assert result.result["attempts"] == 2
+
+        # a native batch is retried as a whole
+        calls.clear()
+        (result,) = compute_output_batch("openai", "text", "moderation", inputs)
+        assert calls == ["a", "a"]
+        assert result.result["attempts"] == 2
+
+    def test_not_poolable_provider_instance_per_worker(self, mocker: MockerFixture):
+        instances = []
+
+        class StatefulModerationProvider:
+            """Keeps the last response on the instance, like affinda or senseloaf"""
+
+            def __init__(self):
+                instances.append(self)
+
+            def text__moderation(self, text, language):
+                self.last_response = {"text": text}
+                time.sleep(0.005)
+                return SimpleNamespace(model_dump=lambda: self.last_response)
+
+        mocker.patch(
+            "edenai_apis.interface_v2.get_provider_instance",
+            side_effect=lambda *args: StatefulModerationProvider(),
+        )
+        mocker.patch("edenai_apis.interface_v2.is_poolable", return_value=False)
+        texts = [str(index) for index in range(40)]
+        results = compute_output_batch(
+            "openai",
+            "text",
+            "moderation",
+            [{"text": text, "language": "en"} for text in texts],
+            max_concurrency=4,
+            native_batch=False,
+        )
+        assert [result.result["text"] for result in results] == texts
+        # the first instance, then one per worker
+        assert 2 <= len(instances) <= 5
+
+    def test_inputs_consumed_lazily(self, mocker: MockerFixture):
+        mocker.patch(
+            "edenai_apis.interface_v2.get_provider_instance",
+            return_value=FakeModerationProvider(),
+        )
+        consumed = []
+
+        def inputs():
+            for index in range(1000):
+                consumed.append(index)
+                yield {"text": "a", "language": "en"}
+
+        results = compute_output_batch(
+            "openai", "text", "moderation", inputs(), max_concurrency=2
+        )
+        assert next(results).index == 0
+        results.close()
+        assert len(consumed) <= 6
+
+    def test_fake(self):
+        results = list(
+            compute_output_batch(
+                "google", "text", "sentiment_analysis", [{}, {}], fake=True
+            )
+        )
+        assert [result.result["provider"] for result in results] == [
+            "google",
+            "google",
+        ]
+
+    def test_rate_limited(self, mocker: MockerFixture):
+        limited = record_rate_limits(mocker)
+        provider = FakeBatchModerationProvider()
+        mocker.patch(
+            "edenai_apis.interface_v2.get_provider_instance", return_value=provider
+        )
+        inputs = [{"text": "a" * 40, "language": "en"} for _ in range(40)]
+        list(compute_output_batch("openai", "text", "moderation", inputs))
+        # one request per native batch, with the tokens of its inputs
+        assert sorted(kwargs["tokens"] for _, kwargs in limited) == [80, 320]
+
+        limited.clear()
+        list(
+            compute_output_batch(
+                "openai", "text", "moderation", inputs[:3], native_batch=False
+            )
+        )
+        assert [args[3] for args, _ in limited] == [inputs[0]] * 3
+
+
+class TestComputeOutputStream:
+    ARGS = {"text": "Hello", "model": "model"}
+
+    @pytest.fixture(autouse=True)
+    def validation(self, mocker: MockerFixture):
+        mocker.patch(
+            "edenai_apis.interface.validate_all_provider_constraints",
+            side_effect=lambda provider, feature, subfeature, phase, args: args,
+        )
+
+    @staticmethod
+    def mock_provider(mocker: MockerFixture, standardized_response):
+        provider = mocker.Mock(spec=["text__chat"])
+        provider.text__chat.return_value = ResponseType(
+            original_response=None, standardized_response=standardized_response
+        )
+        mocker.patch(
+            "edenai_apis.interface_v2.get_provider_instance", return_value=provider
+        )
+        return provider
+
+    @staticmethod
+    def chunks(texts):
+        for text in texts:
+            yield ChatStreamResponse(text=text, blocked=False, provider="mistral")
+
+    def test_native_stream(self, mocker: MockerFixture):
+        provider = self.mock_provider(
+            mocker, StreamChat(stream=self.chunks(["Hel", "lo"]))
+        )
+        stream = compute_output_stream("mistral", "text", "chat", self.ARGS)
+        provider.text__chat.assert_called_once_with(
+            text="Hello", model="model", stream=True
+        )
+        assert [chunk.text for chunk in stream] == ["Hel", "lo"]
+
+    def test_buffered_answer_single_chunk(self, mocker: MockerFixture):
+        self.mock_provider(mocker, ChatDataClass(generated_text="Hello", message=[]))
+        chunks = list(compute_output_stream("cohere", "text", "chat", self.ARGS))
+        assert chunks == [
+            ChatStreamResponse(text="Hello", blocked=False, provider="cohere")
+        ]
+
+    def test_errors_raised_on_call(self, mocker: MockerFixture):
+        provider = self.mock_provider(mocker, None)
+        provider.text__chat.side_effect = ProviderException("Invalid model", code=400)
+        with pytest.raises(ProviderException):
+            compute_output_stream("mistral", "text", "chat", self.ARGS)
+
+    def test_async(self, mocker: MockerFixture):
+        self.mock_provider(mocker, StreamChat(stream=self.chunks(["a", "b", "c"])))
+
+        async def collect():
+            return [
+                chunk.text
+                async for chunk in compute_output_stream_async(
+                    "mistral", "text", "chat", self.ARGS
+                )
+            ]
+
+        assert asyncio.run(collect()) == ["a", "b", "c"]
+
+    def test_stream_metrics(self, mocker: MockerFixture):
+        self.mock_provider(mocker, StreamChat(stream=self.chunks(["a", "b"])))
+        recorded = []
+        sink = CallbackSink(recorded.append)
+        add_stream_metrics_sink(sink)
+        try:
+            list(compute_output_stream("mistral", "text", "chat", self.ARGS))
+        finally:
+            remove_stream_metrics_sink(sink)
+        assert len(recorded) == 1
+        assert recorded[0].labels == {
+            "provider": "mistral",
+            "feature": "text",
+            "subfeature": "chat",
+            "model": "model",
+        }
+        assert recorded[0].chunks == 2
+        assert recorded[0].completed
+
+
 def test_list_features():
     # with a list as return
     method_list = list_features()
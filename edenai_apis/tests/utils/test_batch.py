@@ -0,0 +1,112 @@
+"""
+    Test constraints validation of batched inputs
+"""
+import copy
+
+from edenai_apis.loaders.data_loader import FeatureDataEnum
+from edenai_apis.loaders.loaders import load_feature
+from edenai_apis.tests.conftest import global_features
+from edenai_apis.utils import batch
+from edenai_apis.utils.batch import (
+    CONTENT_ARGS,
+    ConstraintsValidator,
+    get_native_batch_size,
+)
+from edenai_apis.utils.constraints import validate_all_provider_constraints
+
+
+def test_validate_once_per_settings(mocker):
+    validate = mocker.patch.object(
+        batch,
+        "validate_all_provider_constraints",
+        side_effect=lambda provider, feature, subfeature, phase, args: {
+            **args,
+            "language": "en-US",
+        },
+    )
+    validator = ConstraintsValidator("google", "text", "sentiment_analysis")
+    assert validator.validate({"text": "a", "language": "en"}) == {
+        "text": "a",
+        "language": "en-US",
+    }
+    assert validator.validate({"text": "b", "language": "en"}) == {
+        "text": "b",
+        "language": "en-US",
+    }
+    assert validate.call_count == 1
+    # content is not sent to the validation
+    assert validate.call_args.args[-1] == {"language": "en"}
+
+    validator.validate({"text": "c", "language": "fr"})
+    assert validate.call_count == 2
+
+
+def test_unhashable_settings_are_always_validated(mocker):
+    validate = mocker.patch.object(
+        batch,
+        "validate_all_provider_constraints",
+        side_effect=lambda provider, feature, subfeature, phase, args: args,
+    )
+    validator = ConstraintsValidator("amazon", "ocr", "ocr")
+    file = object()
+    validator.validate({"file": file})
+    validator.validate({"file": file})
+    assert validate.call_count == 2
+
+
+def test_native_batch_size():
+    assert get_native_batch_size("openai", "text", "moderation") == 32
+    assert (
+        get_native_batch_size("google", "text", "sentiment_analysis")
+        == batch.DEFAULT_NATIVE_BATCH_SIZE
+    )
+
+
+def _content_samples():
+    """Sample arguments of the subfeatures taking content arguments"""
+    samples = {}
+    for param in global_features(return_phase=True)["ungrouped_providers"]:
+        provider, feature, subfeature, phase = param.values
+        key = (feature, subfeature, phase)
+        if key not in samples:
+            try:
+                samples[key] = load_feature(
+                    FeatureDataEnum.SAMPLES_ARGS,
+                    feature=feature,
+                    subfeature=subfeature,
+                    phase=phase,
+                )
+            except Exception:
+                samples[key] = None
+        args = samples[key]
+        if args and "file" not in args and any(name in args for name in CONTENT_ARGS):
+            yield provider, feature, subfeature, phase, args
+
+
+def _validated(validate, args):
+    try:
+        return validate(copy.deepcopy(args))
+    except Exception as exc:
+        return type(exc)
+
+
+def test_content_args_not_read_by_constraints():
+    """`ConstraintsValidator` validates the settings without `CONTENT_ARGS` and
+    reuses the result for any content: `validate_all_provider_constraints` must
+    give the same result (or error) with and without them"""
+    checked = 0
+    for provider, feature, subfeature, phase, args in _content_samples():
+        expected = _validated(
+            lambda args: validate_all_provider_constraints(
+                provider, feature, subfeature, phase, args
+            ),
+            args,
+        )
+        validator = ConstraintsValidator(provider, feature, subfeature, phase)
+        assert _validated(validator.validate, args) == expected, (
+            provider,
+            feature,
+            subfeature,
+        )
+        checked += 1
+    assert checked
@@ -0,0 +1,57 @@
+"""
+    Test spatial index of bounding boxes
+"""
+import random
+
+from edenai_apis.utils.bounding_box import (
+    SpatialIndex,
+    polygon_to_rect,
+    rects_intersect,
+)
+
+
+def test_polygon_to_rect():
+    assert polygon_to_rect([1, 2, 5, 2, 5, 4, 1, 4]) == (1, 2, 5, 4)
+
+
+def test_query():
+    words = [(0, 0, 1, 1), (2, 0, 3, 1), (0, 5, 1, 6), (10, 10, 12, 11)]
+    index = SpatialIndex(words)
+    assert index.query((0, 0, 2.5, 1)) == [0, 1]
+    # touching boxes intersect
+    assert index.query((1, 1, 1.5, 1.5)) == [0]
+    assert index.query((4, 4, 5, 5)) == []
+    assert index.query_many([(-100, -100, 100, 100), (11, 10.5, 11, 10.5)]) == [
+        [0, 1, 2, 3],
+        [3],
+    ]
+
+
+def test_empty_index():
+    index = SpatialIndex([])
+    assert len(index) == 0
+    assert index.query((0, 0, 1, 1)) == []
+
+
+def test_same_as_full_scan():
+    rng = random.Random(0)
+
+    def random_rect(max_size):
+        left, top = rng.uniform(-50, 1000), rng.uniform(-50, 1000)
+        # some inverted rects, as found in rotated OCR polygons
+        return (
+            left,
+            top,
+            left + rng.uniform(-2, max_size),
+            top + rng.uniform(-2, max_size),
+        )
+
+    words = [random_rect(20) for _ in range(2000)]
+    cells = [random_rect(200) for _ in range(300)]
+    index = SpatialIndex(words)
+    for cell, found in zip(cells, index.query_many(cells)):
+        assert found == [
+            position
+            for position, word in enumerate(words)
+            if rects_intersect(word, cell)
+        ]
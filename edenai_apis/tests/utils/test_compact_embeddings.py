@@ -0,0 +1,130 @@
+"""
+    Test float32 array backed embeddings responses
+"""
+import json
+
+import numpy as np
+import pytest
+
+from edenai_apis.apis.openai.openai_text_api import OpenaiTextApi
+from edenai_apis.features.image.embeddings import (
+    EmbeddingsDataClass as ImageEmbeddingsDataClass,
+)
+from edenai_apis.features.text.embeddings import (
+    EmbeddingDataClass,
+    EmbeddingsDataClass,
+)
+from edenai_apis.utils import compact_embeddings
+from edenai_apis.utils.compact_embeddings import compact_response
+from edenai_apis.utils.embeddings import batched_embeddings
+from edenai_apis.utils.metrics import METRICS
+from edenai_apis.utils.types import ResponseType
+
+
+@pytest.mark.parametrize("dataclass", [EmbeddingsDataClass, ImageEmbeddingsDataClass])
+def test_from_array_serialization(dataclass):
+    vectors = np.arange(6, dtype=np.float32).reshape(2, 3)
+    response = dataclass.from_array(vectors)
+    assert response.is_compact
+    assert isinstance(response.items[0].embedding, np.ndarray)
+    expected = {"items": [{"embedding": [0.0, 1.0, 2.0]}, {"embedding": [3.0, 4.0, 5.0]}]}
+    assert response.model_dump() == expected
+    assert json.loads(response.model_dump_json()) == expected
+
+
+def test_to_array_is_zero_copy():
+    vectors = np.arange(6, dtype=np.float32).reshape(2, 3)
+    response = EmbeddingsDataClass.from_array(vectors)
+    assert response.to_array() is vectors
+    assert np.shares_memory(vectors, response.items[1].embedding)
+    # other dtypes are converted
+    assert response.to_array(np.float64).dtype == np.float64
+
+
+def test_to_array_keeps_precision_when_not_compact():
+    embedding = [0.1234567890123, 2.0]
+    response = EmbeddingsDataClass(items=[EmbeddingDataClass(embedding=embedding)])
+    assert response.to_array().dtype == np.float64
+    assert response.to_array()[0].tolist() == embedding
+
+
+def test_compact_keeps_fields():
+    response = EmbeddingsDataClass(
+        items=[EmbeddingDataClass(embedding=[1.0, 2.0])], cache_hits=1
+    )
+    assert not response.is_compact
+    compact = response.compact()
+    assert compact.is_compact
+    assert compact.cache_hits == 1
+    assert compact.model_dump() == response.model_dump()
+    assert compact.compact() is compact
+
+
+def test_compact_skips_ragged_vectors():
+    response = EmbeddingsDataClass(
+        items=[
+            EmbeddingDataClass(embedding=[1.0, 2.0]),
+            EmbeddingDataClass(embedding=[1.0]),
+        ]
+    )
+    assert response.compact() is response
+    assert EmbeddingsDataClass().compact().items == []
+
+
+def test_compact_response_is_opt_in(mocker):
+    response = ResponseType[EmbeddingsDataClass](
+        original_response={},
+        standardized_response=EmbeddingsDataClass(
+            items=[EmbeddingDataClass(embedding=[1.0, 2.0])]
+        ),
+    )
+    assert not compact_response(response).standardized_response.is_compact
+    mocker.patch.object(compact_embeddings, "COMPACT_EMBEDDINGS", True)
+    assert compact_response(response).standardized_response.is_compact
+
+
+def test_batched_embeddings_compact_mode(mocker):
+    mocker.patch.object(compact_embeddings, "COMPACT_EMBEDDINGS", True)
+
+    def embed(texts):
+        return ResponseType[EmbeddingsDataClass](
+            original_response={},
+            standardized_response=EmbeddingsDataClass(
+                items=[EmbeddingDataClass(embedding=[float(text)]) for text in texts]
+            ),
+        )
+
+    response = batched_embeddings("faker", ["1", "2"], embed)
+    assert response.standardized_response.to_array().tolist() == [[1.0], [2.0]]
+
+
+def test_search_scores_unchanged_when_not_compact(mocker):
+    """Search scores are the pairwise `METRICS` of the provider floats"""
+    rng = np.random.default_rng(7)
+    vectors = rng.normal(size=(20, 64)).tolist()
+    query = rng.normal(size=64).tolist()
+
+    def text__embeddings(self, texts, model):
+        items = vectors if len(texts) > 1 else [query]
+        return ResponseType[EmbeddingsDataClass](
+            original_response={"usage": {"total_tokens": 1}},
+            standardized_response=EmbeddingsDataClass(
+                items=[EmbeddingDataClass(embedding=item) for item in items]
+            ),
+        )
+
+    mocker.patch.object(OpenaiTextApi, "text__embeddings", text__embeddings)
+    texts = [str(index) for index in range(len(vectors))]
+    for metric in sorted(METRICS):
+        response = OpenaiTextApi.text__search(None, texts, "query", metric)
+        scores = {
+            item.document: item.score for item in response.standardized_response.items
+        }
+        # batched float64 sums may differ in the last bit, float32 from the 7th digit
+        assert scores == pytest.approx(
+            {
+                index: METRICS[metric](query, vector)
+                for index, vector in enumerate(vectors)
+            },
+            rel=1e-12,
+        )
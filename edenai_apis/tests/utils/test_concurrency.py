@@ -0,0 +1,47 @@
+"""
+    Test helpers calling providers from asyncio
+"""
+import asyncio
+import contextvars
+import threading
+
+from edenai_apis.utils.concurrency import get_async_method, run_in_thread
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+class SyncProvider:
+    def text__moderation(self, text):
+        return text, threading.get_ident(), request_id.get()
+
+
+class NativeProvider(SyncProvider):
+    async def text__moderation_async(self, text):
+        return "native", threading.get_ident()
+
+
+def test_run_in_thread_keeps_context():
+    async def main():
+        request_id.set("abc")
+        return await run_in_thread(SyncProvider().text__moderation, "text")
+
+    text, thread_id, current_request_id = asyncio.run(main())
+    assert text == "text"
+    assert thread_id != threading.get_ident()
+    assert current_request_id == "abc"
+
+
+def test_sync_methods_are_offloaded():
+    method = get_async_method(SyncProvider(), "text__moderation")
+    assert asyncio.iscoroutinefunction(method)
+    assert method.__name__ == "text__moderation"
+    text, thread_id, _ = asyncio.run(method(text="text"))
+    assert text == "text"
+    assert thread_id != threading.get_ident()
+
+
+def test_native_coroutines_are_preferred():
+    method = get_async_method(NativeProvider(), "text__moderation")
+    result, thread_id = asyncio.run(method("text"))
+    assert result == "native"
+    assert thread_id == threading.get_ident()
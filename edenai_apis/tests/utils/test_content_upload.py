@@ -0,0 +1,230 @@
+"""
+    Test content-addressed uploads with local S3 and GCS stand-ins
+"""
+import threading
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from botocore.exceptions import ClientError
+
+from edenai_apis.apis.amazon import helpers as amazon_helpers
+from edenai_apis.utils import content_upload, upload_gcs, upload_s3
+from edenai_apis.utils.content_upload import UploadIndex, content_key
+
+
+class LocalS3Client:
+    """S3 client stand-in storing objects in memory"""
+
+    def __init__(self):
+        self.objects = {}
+        self.uploads = 0
+        self.signed = 0
+
+    def head_object(self, Bucket, Key):
+        if (Bucket, Key) not in self.objects:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        return {}
+
+    def upload_file(self, Filename, Bucket, Key, Config=None):
+        with open(Filename, "rb") as file:
+            self.upload_fileobj(file, Bucket, Key, Config)
+
+    def upload_fileobj(self, Fileobj, Bucket, Key, Config=None):
+        self.uploads += 1
+        self.objects[(Bucket, Key)] = Fileobj.read()
+
+    def generate_presigned_url(self, method, Params, ExpiresIn):
+        self.signed += 1
+        return f"https://s3/{Params['Bucket']}/{Params['Key']}?n={self.signed}"
+
+
+class LocalBlob:
+    def __init__(self, bucket, name):
+        self.bucket = bucket
+        self.name = name
+
+    def exists(self):
+        return self.name in self.bucket.objects
+
+    def upload_from_string(self, data, content_type=None):
+        self.bucket.uploads.append(self.name)
+        self.bucket.objects[self.name] = data
+
+    def upload_from_filename(self, filename):
+        with open(filename, "rb") as file:
+            self.upload_from_string(file.read())
+
+    def compose(self, sources):
+        self.bucket.objects[self.name] = b"".join(
+            self.bucket.objects[source.name] for source in sources
+        )
+
+    def delete(self):
+        del self.bucket.objects[self.name]
+
+    def generate_signed_url(self, expiration, version):
+        return f"https://gcs/{self.bucket.name}/{self.name}"
+
+
+class LocalBucket:
+    """GCS bucket stand-in storing objects in memory"""
+
+    def __init__(self, name):
+        self.name = name
+        self.objects = {}
+        self.uploads = []
+
+    def blob(self, name):
+        return LocalBlob(self, name)
+
+
+@pytest.fixture(autouse=True)
+def upload_index(monkeypatch):
+    index = UploadIndex()
+    monkeypatch.setattr(content_upload, "UPLOAD_INDEX", index)
+    monkeypatch.setattr(content_upload, "DEDUPLICATE_UPLOADS", True)
+    return index
+
+
+@pytest.fixture
+def s3_client(monkeypatch):
+    client = LocalS3Client()
+    monkeypatch.setattr(upload_s3, "s3_client_load", lambda: client)
+    monkeypatch.setattr(upload_s3, "BUCKET", "providers")
+    return client
+
+
+def test_content_key():
+    file = BytesIO(b"video content")
+    file.seek(6)
+    key = content_key(file, "/tmp/video.mp4")
+    assert file.tell() == 6
+    assert key.endswith("_video.mp4")
+    # hashed from the position of the file object
+    assert content_key(BytesIO(b"content"), "other.mp4") == key.replace(
+        "video.mp4", "other.mp4"
+    )
+    assert content_key(BytesIO(b"other content"), "video.mp4") != key
+
+
+def test_s3_uploaded_once(s3_client, upload_index, tmp_path):
+    path = tmp_path / "document.pdf"
+    path.write_bytes(b"%PDF document")
+
+    url = upload_s3.upload_file_to_s3(str(path), "document.pdf")
+    assert upload_s3.upload_file_to_s3(str(path), "document.pdf") == url
+    assert upload_s3.upload_file_bytes_to_s3(
+        BytesIO(b"%PDF document"), "document.pdf"
+    ) == url
+    assert s3_client.uploads == 1
+    assert s3_client.signed == 1
+    assert list(s3_client.objects.values()) == [b"%PDF document"]
+
+    # another process: the object is found in the bucket
+    upload_index.clear()
+    upload_s3.upload_file_to_s3(str(path), "document.pdf")
+    assert s3_client.uploads == 1
+
+    upload_s3.upload_file_bytes_to_s3(BytesIO(b"%PDF other"), "document.pdf")
+    assert s3_client.uploads == 2
+
+
+def test_deduplication_disabled(s3_client, monkeypatch):
+    monkeypatch.setattr(content_upload, "DEDUPLICATE_UPLOADS", False)
+    for _ in range(2):
+        upload_s3.upload_file_bytes_to_s3(BytesIO(b"image"), ".png")
+    assert s3_client.uploads == 2
+    assert s3_client.signed == 2
+
+
+def test_concurrent_uploads(s3_client):
+    threads = [
+        threading.Thread(
+            target=upload_s3.upload_file_bytes_to_s3,
+            args=(BytesIO(b"audio"), "audio.wav"),
+        )
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert s3_client.uploads == 1
+
+
+def test_index_expiration(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(content_upload.time, "monotonic", lambda: now[0])
+    index = UploadIndex(ttl=60)
+    uploads = []
+
+    def upload_once():
+        return index.upload_once(
+            "bucket", "key", lambda: False, lambda: uploads.append(1)
+        )
+
+    def sign(key, period):
+        return f"url-{now[0]}"
+
+    assert upload_once() is True
+    assert upload_once() is False
+    assert index.signed_url("bucket", "key", 100, sign) == "url-0.0"
+
+    now[0] = 49.0
+    assert index.signed_url("bucket", "key", 100, sign) == "url-0.0"
+    now[0] = 51.0
+    # less than half of the period left
+    assert index.signed_url("bucket", "key", 100, sign) == "url-51.0"
+    now[0] = 61.0
+    # checked in the bucket again
+    assert upload_once() is True
+    assert len(uploads) == 2
+
+
+def test_gcs_large_file_by_chunks(monkeypatch, tmp_path):
+    monkeypatch.setattr(upload_gcs, "UPLOAD_CHUNK_SIZE", 4)
+    bucket = LocalBucket("providers")
+    path = tmp_path / "video.mp4"
+    path.write_bytes(b"0123456789")
+
+    key = upload_gcs.upload_to_gcs_bucket(bucket, str(path), "video.mp4")
+    assert bucket.objects == {key: b"0123456789"}
+    assert sorted(bucket.uploads) == [f"{key}.part-{index}" for index in range(3)]
+
+    bucket.uploads.clear()
+    assert upload_gcs.upload_to_gcs_bucket(bucket, str(path), "video.mp4") == key
+    assert bucket.uploads == []
+
+
+def test_gcs_bytes_uploaded_once(monkeypatch):
+    bucket = LocalBucket("audios")
+    client = type("LocalClient", (), {"bucket": lambda self, name: bucket})()
+    monkeypatch.setattr(upload_gcs, "gcs_client_load", lambda: client)
+
+    urls = [
+        upload_gcs.upload_file_bytes_to_gcs(BytesIO(b"audio"), "audio.wav", "audios")
+        for _ in range(2)
+    ]
+    assert urls[0] == urls[1]
+    assert len(bucket.uploads) == 1
+
+
+def test_amazon_video_uploaded_once(monkeypatch, tmp_path, s3_client):
+    resource = type("Resource", (), {})()
+    resource.meta = type("Meta", (), {"client": s3_client})()
+    monkeypatch.setattr(
+        amazon_helpers, "storage_clients", lambda api_settings: {"video": resource}
+    )
+    path = tmp_path / "movie.mp4"
+    path.write_bytes(b"frames")
+
+    names = [
+        amazon_helpers._upload_video_file_to_amazon_server(
+            str(path), Path(path), {"bucket_video": "videos"}
+        )
+        for _ in range(2)
+    ]
+    assert names[0] == names[1]
+    assert names[0].endswith("_movie_video_.mp4")
+    assert s3_client.uploads == 1
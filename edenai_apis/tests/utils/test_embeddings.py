@@ -0,0 +1,140 @@
+"""
+    Test text__embeddings batching
+"""
+import threading
+import time
+
+import pytest
+
+from edenai_apis.features.text.embeddings import (
+    EmbeddingDataClass,
+    EmbeddingsDataClass,
+)
+from edenai_apis.utils import embeddings
+from edenai_apis.utils.embeddings import (
+    batched_embeddings,
+    get_embeddings_limits,
+    merge_usage,
+    split_batches,
+)
+from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.types import ResponseType
+
+
+def fake_embed(texts):
+    return ResponseType[EmbeddingsDataClass](
+        original_response={"usage": {"total_tokens": len(texts)}, "texts": texts},
+        standardized_response=EmbeddingsDataClass(
+            items=[EmbeddingDataClass(embedding=[float(text)]) for text in texts]
+        ),
+    )
+
+
+@pytest.fixture
+def limits(mocker):
+    def _set(**values):
+        mocker.patch.object(
+            embeddings,
+            "get_embeddings_limits",
+            return_value={"max_batch_size": None, "max_batch_tokens": None, **values},
+        )
+
+    return _set
+
+
+def test_split_batches_by_size():
+    assert split_batches(list("abcdefg"), max_batch_size=3) == [
+        ["a", "b", "c"],
+        ["d", "e", "f"],
+        ["g"],
+    ]
+    assert split_batches(list("abc")) == [["a", "b", "c"]]
+    assert split_batches([], max_batch_size=3) == []
+
+
+def test_split_batches_by_tokens():
+    texts = ["aa", "aaa", "a", "aaaaaa", "a"]
+    batches = split_batches(texts, max_batch_tokens=4, count_tokens=len)
+    # a text bigger than the limit is sent alone
+    assert batches == [["aa"], ["aaa", "a"], ["aaaaaa"], ["a"]]
+    assert split_batches(
+        texts, max_batch_size=1, max_batch_tokens=100, count_tokens=len
+    ) == [[text] for text in texts]
+
+
+def test_merge_usage():
+    assert merge_usage(
+        [
+            {"total_tokens": 1, "details": {"cached": 1}, "model": "a"},
+            None,
+            {"total_tokens": 2, "details": {"cached": 3}},
+        ]
+    ) == {"total_tokens": 3, "details": {"cached": 4}}
+
+
+def test_get_embeddings_limits_from_info():
+    assert get_embeddings_limits("cohere")["max_batch_size"] == 96
+    assert get_embeddings_limits("google")["max_batch_size"] == 5
+
+
+def test_single_batch_response_is_unchanged(limits):
+    limits(max_batch_size=10)
+    response = batched_embeddings("provider", ["1", "2"], fake_embed)
+    assert response.original_response == {
+        "usage": {"total_tokens": 2},
+        "texts": ["1", "2"],
+    }
+
+
+def test_batches_are_merged_in_input_order(limits):
+    limits(max_batch_size=2)
+    texts = [str(i) for i in range(7)]
+
+    def slow_first_batches(batch):
+        # first batches answer last
+        time.sleep(0.01 * (7 - int(batch[0])))
+        return fake_embed(batch)
+
+    response = batched_embeddings("provider", texts, slow_first_batches, max_workers=4)
+    assert [item.embedding[0] for item in response.standardized_response.items] == [
+        float(text) for text in texts
+    ]
+    assert len(response.original_response["batches"]) == 4
+    assert response.original_response["usage"] == {"total_tokens": 7}
+
+
+def test_concurrency_is_bounded(limits):
+    limits(max_batch_size=1)
+    lock = threading.Lock()
+    running = []
+    max_running = []
+
+    def embed(batch):
+        with lock:
+            running.append(batch)
+            max_running.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(batch)
+        return fake_embed(batch)
+
+    batched_embeddings("provider", [str(i) for i in range(10)], embed, max_workers=3)
+    assert max(max_running) <= 3
+
+
+def test_batch_error_is_raised(limits):
+    limits(max_batch_size=1)
+
+    def embed(batch):
+        if batch == ["2"]:
+            raise ProviderException("Too many requests", code=429)
+        return fake_embed(batch)
+
+    with pytest.raises(ProviderException, match="Too many requests"):
+        batched_embeddings("provider", ["1", "2", "3"], embed)
+
+
+def test_missing_embeddings_raise(limits):
+    limits(max_batch_size=2)
+    with pytest.raises(ProviderException):
+        batched_embeddings("provider", ["1", "2", "3"], lambda batch: fake_embed(["1"]))
@@ -0,0 +1,135 @@
+"""
+    Test embeddings cache backends and their use by text__embeddings batching
+"""
+import numpy as np
+import pytest
+
+from edenai_apis.features.text.embeddings import (
+    EmbeddingDataClass,
+    EmbeddingsDataClass,
+)
+from edenai_apis.utils import embeddings_cache
+from edenai_apis.utils.embeddings import batched_embeddings
+from edenai_apis.utils.embeddings_cache import (
+    MemoryEmbeddingsCache,
+    MmapEmbeddingsCache,
+    SqliteEmbeddingsCache,
+    embedding_cache_key,
+    embeddings_cache_from_config,
+)
+from edenai_apis.utils.types import ResponseType
+
+
+@pytest.fixture(params=["memory", "sqlite", "mmap"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        backend = MemoryEmbeddingsCache()
+    elif request.param == "sqlite":
+        backend = SqliteEmbeddingsCache(str(tmp_path / "cache.db"))
+    else:
+        backend = MmapEmbeddingsCache(str(tmp_path / "cache"))
+    yield backend
+    backend.close()
+
+
+def test_cache_key():
+    key = embedding_cache_key("openai", "text-embedding-ada-002", "hello")
+    assert key.startswith("openai:text-embedding-ada-002:")
+    assert "hello" not in key
+    assert key != embedding_cache_key("openai", "other-model", "hello")
+    assert key != embedding_cache_key("cohere", "text-embedding-ada-002", "hello")
+
+
+def test_backends_get_set(cache):
+    assert cache.get_many(["a"]) == {}
+    cache.set_many({"a": [0.5, 1.0], "b": np.array([2.0, 3.0, 4.0])})
+    found = cache.get_many(["a", "b", "c"])
+    assert set(found) == {"a", "b"}
+    assert found["a"].dtype == np.float32
+    assert found["a"].tolist() == [0.5, 1.0]
+    assert found["b"].tolist() == [2.0, 3.0, 4.0]
+    cache.set_many({"c": [5.0, 6.0]})
+    assert cache.get_many(["c"])["c"].tolist() == [5.0, 6.0]
+
+
+@pytest.mark.parametrize(
+    "backend_class, filename",
+    [(SqliteEmbeddingsCache, "cache.db"), (MmapEmbeddingsCache, "cache")],
+)
+def test_disk_backends_persist(tmp_path, backend_class, filename):
+    path = str(tmp_path / filename)
+    cache = backend_class(path)
+    cache.set_many({"a": [1.0, 2.0], "b": [3.0, 4.0]})
+    cache.set_many({"c": [5.0, 6.0, 7.0]})
+    cache.close()
+
+    reopened = backend_class(path)
+    found = reopened.get_many(["a", "b", "c"])
+    assert {key: vector.tolist() for key, vector in found.items()} == {
+        "a": [1.0, 2.0],
+        "b": [3.0, 4.0],
+        "c": [5.0, 6.0, 7.0],
+    }
+    reopened.close()
+
+
+def test_memory_backend_lru():
+    cache = MemoryEmbeddingsCache(maxsize=2)
+    cache.set_many({"a": [1.0], "b": [2.0]})
+    cache.get_many(["a"])
+    cache.set_many({"c": [3.0]})
+    assert set(cache.get_many(["a", "b", "c"])) == {"a", "c"}
+
+
+def test_cache_from_config(tmp_path):
+    assert embeddings_cache_from_config("") is None
+    assert isinstance(embeddings_cache_from_config("memory"), MemoryEmbeddingsCache)
+    assert isinstance(
+        embeddings_cache_from_config(f"sqlite:{tmp_path / 'cache.db'}"),
+        SqliteEmbeddingsCache,
+    )
+    assert isinstance(
+        embeddings_cache_from_config(f"mmap:{tmp_path / 'cache'}"),
+        MmapEmbeddingsCache,
+    )
+    with pytest.raises(ValueError):
+        embeddings_cache_from_config("redis")
+
+
+def test_only_misses_are_sent(mocker, cache):
+    mocker.patch.object(embeddings_cache, "EMBEDDINGS_CACHE", cache)
+    sent = []
+
+    def embed(texts):
+        sent.append(texts)
+        return ResponseType[EmbeddingsDataClass](
+            original_response={"usage": {"total_tokens": len(texts)}},
+            standardized_response=EmbeddingsDataClass(
+                items=[EmbeddingDataClass(embedding=[float(text)]) for text in texts]
+            ),
+        )
+
+    first = batched_embeddings("faker", ["1", "2", "1"], embed, model="model")
+    assert sent == [["1", "2"]]
+    assert first.standardized_response.cache_hits == 0
+    assert first.standardized_response.cache_misses == 3
+    assert first.original_response["usage"] == {"total_tokens": 2}
+
+    second = batched_embeddings("faker", ["2", "3", "1"], embed, model="model")
+    assert sent[1:] == [["3"]]
+    assert [item.embedding for item in second.standardized_response.items] == [
+        [2.0],
+        [3.0],
+        [1.0],
+    ]
+    assert second.standardized_response.cache_hits == 2
+    assert second.original_response["cache"] == {"hits": 2, "misses": 1}
+    # stats are not part of the serialized response
+    assert "cache_hits" not in second.standardized_response.model_dump()
+
+    third = batched_embeddings("faker", ["3"], embed, model="model")
+    assert len(sent) == 2
+    assert third.original_response["usage"] == {"total_tokens": 0}
+
+    batched_embeddings("faker", ["3"], embed, model="other-model")
+    assert sent[2:] == [["3"]]
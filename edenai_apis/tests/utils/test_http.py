@@ -0,0 +1,70 @@
+"""
+    Test shared http client
+"""
+import responses
+
+from edenai_apis.utils.http import HTTPClient, PooledSession
+
+URL = "https://api.example.com/v1/test"
+
+
+def test_session_is_reused():
+    client = HTTPClient()
+    assert client.session is client.session
+
+
+def test_new_session_after_fork(mocker):
+    client = HTTPClient()
+    session = client.session
+    mocker.patch("edenai_apis.utils.http.os.getpid", return_value=-1)
+    assert client.session is not session
+
+
+def test_close():
+    client = HTTPClient()
+    session = client.session
+    client.close()
+    assert client.session is not session
+
+
+@responses.activate
+def test_default_timeout(mocker):
+    responses.add(responses.POST, URL, json={"ok": True})
+    session = PooledSession(timeout=(1.0, 2.0))
+    send = mocker.spy(session, "send")
+
+    session.post(URL, json={})
+    assert send.call_args.kwargs["timeout"] == (1.0, 2.0)
+
+    session.post(URL, json={}, timeout=5)
+    assert send.call_args.kwargs["timeout"] == 5
+
+
+@responses.activate
+def test_cookies_are_not_kept():
+    responses.add(
+        responses.GET, URL, json={}, headers={"Set-Cookie": "session=secret; Path=/"}
+    )
+    client = HTTPClient()
+    response = client.get(URL)
+    assert response.status_code == 200
+    assert len(client.session.cookies) == 0
+
+
+@responses.activate
+def test_requests_like_api():
+    for method in (
+        responses.GET,
+        responses.POST,
+        responses.PUT,
+        responses.PATCH,
+        responses.DELETE,
+    ):
+        responses.add(method, URL, json={"method": method})
+    client = HTTPClient()
+    assert client.get(URL).json() == {"method": "GET"}
+    assert client.post(URL, json={}).json() == {"method": "POST"}
+    assert client.put(URL).json() == {"method": "PUT"}
+    assert client.patch(URL).json() == {"method": "PATCH"}
+    assert client.delete(URL).json() == {"method": "DELETE"}
+    assert client.request(method="POST", url=URL).json() == {"method": "POST"}
@@ -0,0 +1,26 @@
+"""
+    Test rolling latencies of provider calls
+"""
+from edenai_apis.utils.latency import LatencyTracker
+
+
+def test_percentile():
+    tracker = LatencyTracker(window=100)
+    key = ("google", "text", "sentiment_analysis")
+    assert tracker.percentile(key, 95) is None
+    for seconds in range(1, 101):
+        tracker.record(key, seconds / 100)
+    assert tracker.percentile(key, 95) == 0.95
+    assert tracker.percentile(key, 50) == 0.5
+    assert tracker.percentile(("amazon", "text", "sentiment_analysis"), 95) is None
+
+
+def test_window_and_min_samples():
+    tracker = LatencyTracker(window=3)
+    for seconds in [10, 1, 2, 3]:
+        tracker.record("key", seconds)
+    # the oldest duration left the window
+    assert tracker.percentile("key", 100, min_samples=3) == 3
+    assert tracker.percentile("key", 100, min_samples=4) is None
+    tracker.clear()
+    assert tracker.percentile("key", 100, min_samples=0) is None
@@ -0,0 +1,60 @@
+"""
+    Test similarity metrics used by text search
+"""
+import numpy as np
+import pytest
+
+from edenai_apis.utils.metrics import BATCH_METRICS, METRICS, top_k_similarities
+
+RNG = np.random.default_rng(42)
+EMBEDDINGS = RNG.normal(size=(50, 16)).tolist()
+QUERY = RNG.normal(size=16).tolist()
+
+
+@pytest.mark.parametrize("metric", sorted(METRICS))
+def test_batch_metrics_match_pairwise_metrics(metric):
+    expected = [METRICS[metric](QUERY, embedding) for embedding in EMBEDDINGS]
+    scores = BATCH_METRICS[metric](
+        np.asarray(QUERY, dtype=np.float64), np.asarray(EMBEDDINGS, dtype=np.float64)
+    )
+    assert np.allclose(scores, expected)
+
+
+@pytest.mark.parametrize("metric", sorted(METRICS))
+def test_top_k_similarities_sorted(metric):
+    expected = sorted(
+        range(len(EMBEDDINGS)),
+        key=lambda index: METRICS[metric](QUERY, EMBEDDINGS[index]),
+        reverse=True,
+    )
+    indexes, scores = top_k_similarities(QUERY, EMBEDDINGS, metric)
+    assert list(indexes) == expected
+    assert list(scores) == sorted(scores, reverse=True)
+
+    top_indexes, top_scores = top_k_similarities(QUERY, EMBEDDINGS, metric, top_k=5)
+    assert list(top_indexes) == expected[:5]
+    assert np.allclose(top_scores, scores[:5])
+
+
+def test_top_k_similarities_float32():
+    _, scores = top_k_similarities(QUERY, EMBEDDINGS, "cosine")
+    assert scores.dtype == np.float64
+    _, scores32 = top_k_similarities(QUERY, EMBEDDINGS, "cosine", dtype=np.float32)
+    assert scores32.dtype == np.float32
+    assert np.allclose(sorted(scores32), sorted(scores), atol=1e-3)
+
+
+def test_top_k_similarities_edge_cases():
+    indexes, scores = top_k_similarities(QUERY, [], "cosine")
+    assert len(indexes) == len(scores) == 0
+    assert len(top_k_similarities(QUERY, EMBEDDINGS, "cosine", top_k=0)[0]) == 0
+    assert len(top_k_similarities(QUERY, EMBEDDINGS, "cosine", top_k=100)[0]) == 50
+
+
+def test_cosine_with_null_vector():
+    _, scores = top_k_similarities([1.0, 0.0], [[0.0, 0.0], [1.0, 0.0]], "cosine")
+    assert list(scores) == [100.0, 0.0]
+
+
+def test_hamming_similarity():
+    assert METRICS["hamming"]([1, -1, 1, -1], [1, 1, 1, 1]) == 50.0
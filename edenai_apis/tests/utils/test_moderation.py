@@ -0,0 +1,120 @@
+"""
+    Test moderation of OpenAI chat inputs
+"""
+import asyncio
+from concurrent.futures import Future
+
+import pytest
+from pytest_mock import MockerFixture
+
+from edenai_apis.apis.openai.helpers import (
+    ModeratedCompletion,
+    ModerationCache,
+    get_moderation_inputs,
+    moderate_contents,
+)
+from edenai_apis.utils.exception import ProviderException
+
+SEXUAL = {"flagged": True, "categories": {"sexual": True, "sexual/minors": False}}
+VIOLENCE = {"flagged": True, "categories": {"sexual": False, "violence": True}}
+SAFE = {"flagged": False, "categories": {}}
+
+
+def test_get_moderation_inputs():
+    assert get_moderation_inputs(
+        text="Hello",
+        chatbot_global_action="Be nice",
+        previous_history=[
+            {"role": "user", "message": "Hello"},
+            {"role": "assistant", "message": "Hi"},
+            {"role": "assistant", "message": None},
+        ],
+        messages=[
+            {"role": "user", "content": [{"type": "text", "content": {"text": "Hey"}}]}
+        ],
+    ) == ["Hello", "Be nice", "Hi", "Hey"]
+
+
+def test_moderation_cache_lru():
+    cache = ModerationCache(max_size=2)
+    cache.set("a", False)
+    cache.set("b", True)
+    assert cache.get("a") is False
+    cache.set("c", False)
+    # "b" is the least recently used
+    assert cache.get("b") is None
+    assert cache.get("a") is False
+    assert cache.get("c") is False
+
+
+class TestModerateContents:
+    @staticmethod
+    def mock_batch(mocker: MockerFixture, verdicts):
+        async def moderate_batch(session, headers, contents):
+            return [verdicts[content] for content in contents]
+
+        return mocker.patch(
+            "edenai_apis.apis.openai.helpers._moderate_batch",
+            side_effect=moderate_batch,
+        )
+
+    def test_single_request_and_cache(self, mocker: MockerFixture):
+        moderate_batch = self.mock_batch(mocker, {"a": SAFE, "b": VIOLENCE, "c": SAFE})
+        cache = ModerationCache()
+        asyncio.run(moderate_contents({}, ["a", "b", "a"], cache=cache))
+        assert moderate_batch.call_count == 1
+        assert moderate_batch.call_args.args[2] == ["a", "b"]
+
+        # next turn: only the new message is moderated
+        asyncio.run(moderate_contents({}, ["a", "b", "c"], cache=cache))
+        assert moderate_batch.call_count == 2
+        assert moderate_batch.call_args.args[2] == ["c"]
+
+    def test_rejected(self, mocker: MockerFixture):
+        moderate_batch = self.mock_batch(mocker, {"a": SAFE, "b": SEXUAL})
+        cache = ModerationCache()
+        with pytest.raises(ProviderException) as exc:
+            asyncio.run(moderate_contents({}, ["a", "b"], cache=cache))
+        assert exc.value.status_code == 400
+        # rejected without any request
+        with pytest.raises(ProviderException):
+            asyncio.run(moderate_contents({}, ["b"], cache=cache))
+        assert moderate_batch.call_count == 1
+
+    def test_rate_limited_not_cached(self, mocker: MockerFixture):
+        moderate_batch = mocker.patch(
+            "edenai_apis.apis.openai.helpers._moderate_batch", return_value=None
+        )
+        cache = ModerationCache()
+        asyncio.run(moderate_contents({}, ["a"], cache=cache))
+        assert cache.get("a") is None
+        assert moderate_batch.call_count == 1
+
+
+class TestModeratedCompletion:
+    class FakeStream:
+        def __init__(self, chunks):
+            self.chunks = chunks
+            self.closed = False
+
+        def __iter__(self):
+            return iter(self.chunks)
+
+        def close(self):
+            self.closed = True
+
+    def test_stream_released_after_moderation(self):
+        moderation = Future()
+        response = self.FakeStream(["a", "b"])
+        stream = ModeratedCompletion(moderation).stream(response)
+        moderation.set_result(None)
+        assert list(stream) == ["a", "b"]
+        assert not response.closed
+
+    def test_rejected_stream_closed(self):
+        moderation = Future()
+        moderation.set_exception(ProviderException("rejected", code=400))
+        response = self.FakeStream(["a", "b"])
+        with pytest.raises(ProviderException):
+            list(ModeratedCompletion(moderation).stream(response))
+        assert response.closed
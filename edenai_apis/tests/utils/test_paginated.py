@@ -0,0 +1,144 @@
+"""
+    Test page by page assembly of paginated async results
+"""
+import json
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from edenai_apis.apis.amazon.amazon_api import AmazonApi
+from edenai_apis.apis.amazon.helpers import (
+    amazon_ocr_async_formatter,
+    amazon_ocr_async_pages,
+    amazon_ocr_tables_pages,
+    amazon_ocr_tables_parser,
+    textract_page_blocks,
+)
+from edenai_apis.apis.microsoft.microsoft_helpers import (
+    microsoft_ocr_async_pages,
+    microsoft_ocr_async_standardize_response,
+)
+from edenai_apis.settings import outputs_path
+from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.paginated import follow_pagination, keep_items
+
+
+def load_original_response(provider: str, subfeature: str):
+    path = os.path.join(outputs_path(provider), "ocr", f"{subfeature}_output.json")
+    with open(path) as file:
+        return json.load(file)["original_response"]
+
+
+def test_follow_pagination_is_lazy():
+    fetched = []
+
+    def fetch_next(token):
+        fetched.append(token)
+        return {"page": token, "NextToken": "3" if token == "2" else None}
+
+    responses = follow_pagination({"page": "1", "NextToken": "2"}, fetch_next)
+    assert next(responses) == {"page": "1", "NextToken": "2"}
+    assert fetched == []
+    assert [response["page"] for response in responses] == ["2", "3"]
+    assert fetched == ["2", "3"]
+
+
+def test_keep_items():
+    kept = []
+    assert list(keep_items(iter([1, 2]), kept)) == [1, 2]
+    assert kept == [1, 2]
+    assert list(keep_items(iter([1, 2]), None)) == [1, 2]
+
+
+def test_textract_page_blocks_over_responses():
+    def blocks(*blocks):
+        return {"Blocks": [{"BlockType": type_, "Id": id_} for type_, id_ in blocks]}
+
+    responses = [
+        blocks(("PAGE", "p1"), ("LINE", "a")),
+        blocks(("WORD", "b"), ("PAGE", "p2")),
+        blocks(("LINE", "c")),
+    ]
+    pages = [
+        [block["Id"] for block in page] for page in textract_page_blocks(responses)
+    ]
+    assert pages == [["p1", "a", "b"], ["p2", "c"]]
+
+
+def test_amazon_pages_same_as_formatters():
+    responses = load_original_response("amazon", "ocr_async")
+    assert len(responses) > 1
+    pages = list(amazon_ocr_async_pages(iter(responses)))
+    assert pages == amazon_ocr_async_formatter(responses).pages
+
+    responses = load_original_response("amazon", "ocr_tables_async")
+    pages = list(amazon_ocr_tables_pages(iter(responses)))
+    assert pages == amazon_ocr_tables_parser(responses).pages
+
+
+def test_microsoft_pages_same_as_standardizer():
+    original_response = load_original_response("microsoft", "ocr_async")
+    analyze_result = original_response.get("analyzeResult", original_response)
+    assert (
+        list(microsoft_ocr_async_pages(analyze_result))
+        == microsoft_ocr_async_standardize_response(analyze_result).pages
+    )
+
+
+@pytest.fixture
+def amazon_api(mocker):
+    mocker.patch("edenai_apis.apis.amazon.amazon_api.load_provider")
+    mocker.patch("edenai_apis.apis.amazon.amazon_api.clients")
+    mocker.patch("edenai_apis.apis.amazon.amazon_api.storage_clients")
+    api = AmazonApi()
+    responses = load_original_response("amazon", "ocr_async")
+    # response of each pagination token
+    tokens = [None] + [str(index) for index in range(1, len(responses))]
+    next_tokens = tokens[1:] + [None]
+
+    def get_document_text_detection(JobId, NextToken=None):
+        index = tokens.index(NextToken)
+        return {
+            **responses[index],
+            "JobStatus": "SUCCEEDED",
+            "NextToken": next_tokens[index],
+        }
+
+    api.clients = {"textract": MagicMock()}
+    api.clients["textract"].get_document_text_detection = MagicMock(
+        side_effect=get_document_text_detection
+    )
+    return api, responses
+
+
+def test_amazon_ocr_async_job_pages(amazon_api):
+    api, responses = amazon_api
+    get_result = api.clients["textract"].get_document_text_detection
+
+    result = api.ocr__ocr_async__get_job_result("job")
+    assert len(result.original_response) == len(responses)
+    assert get_result.call_count == len(responses)
+
+    api.keep_original_response = False
+    result_without_original = api.ocr__ocr_async__get_job_result("job")
+    assert result_without_original.original_response is None
+    assert (
+        result_without_original.standardized_response == result.standardized_response
+    )
+
+    get_result.reset_mock()
+    pages = api.ocr__ocr_async__get_job_pages("job")
+    assert get_result.call_count == 1
+    assert next(pages) == result.standardized_response.pages[0]
+    assert list(pages) == result.standardized_response.pages[1:]
+    assert get_result.call_count == len(responses)
+
+
+def test_amazon_job_pages_not_finished(amazon_api):
+    api, _ = amazon_api
+    api.clients["textract"].get_document_text_detection = MagicMock(
+        return_value={"JobStatus": "IN_PROGRESS"}
+    )
+    with pytest.raises(ProviderException, match="not finished"):
+        api.ocr__ocr_async__get_job_pages("job")
@@ -0,0 +1,196 @@
+"""
+    Test the shared async job poller
+"""
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from edenai_apis.utils import poller
+from edenai_apis.utils.async_to_sync import fibonacci_waiting_call
+from edenai_apis.utils.exception import ProviderException, ProviderTimeoutError
+from edenai_apis.utils.poller import (
+    PollingCancelledError,
+    PollingPolicy,
+    ProviderPollGate,
+    poll,
+    poll_async,
+    run_assistant,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(mocker):
+    fake_clock = FakeClock()
+    mocker.patch.object(poller.time, "sleep", side_effect=fake_clock.sleep)
+    mocker.patch.object(poller.time, "monotonic", side_effect=fake_clock)
+    return fake_clock
+
+
+def statuses(*values):
+    responses = iter(values)
+    return lambda: next(responses)
+
+
+def test_policy_delay():
+    policy = PollingPolicy(initial_delay=1, max_delay=5, multiplier=2, jitter=0)
+    assert [policy.delay(attempt) for attempt in range(5)] == [1, 2, 4, 5, 5]
+
+    policy = PollingPolicy(initial_delay=10, max_delay=10, jitter=0.1)
+    for _ in range(50):
+        assert 9 <= policy.delay(3) <= 11
+
+
+def test_poll_until_done(clock):
+    check = statuses("running", "running", "done")
+    result = poll(
+        check,
+        is_done=lambda status: status == "done",
+        policy=PollingPolicy(initial_delay=1, jitter=0),
+        clock=clock,
+    )
+    assert result == "done"
+    assert clock.now == 3  # 1 + 2
+
+
+def test_poll_timeout(clock):
+    policy = PollingPolicy(initial_delay=1, jitter=0, timeout=5)
+    with pytest.raises(ProviderTimeoutError):
+        poll(lambda: "running", lambda status: False, policy=policy, clock=clock)
+    assert clock.now == 5
+
+    clock.now = 0
+    result = poll(
+        lambda: "running",
+        lambda status: False,
+        policy=policy,
+        raise_on_timeout=False,
+        clock=clock,
+    )
+    assert result == "running"
+
+
+def test_poll_retries_rate_limited_checks(clock):
+    calls = []
+
+    def check():
+        calls.append(clock.now)
+        if len(calls) == 1:
+            raise ProviderException("Too many requests", code=429)
+        return "done"
+
+    policy = PollingPolicy(initial_delay=1, jitter=0)
+    assert poll(check, lambda status: True, policy=policy, clock=clock) == "done"
+    # the rate limited check waits longer than the initial delay
+    assert calls == [0, 2]
+
+
+def test_poll_raises_provider_errors(clock):
+    def check():
+        raise ProviderException("Job failed", code=400)
+
+    with pytest.raises(ProviderException):
+        poll(check, lambda status: True, clock=clock)
+
+
+def test_poll_cancel():
+    cancel_event = threading.Event()
+    cancel_event.set()
+    with pytest.raises(PollingCancelledError):
+        poll(lambda: "running", lambda status: False, cancel_event=cancel_event)
+
+    cancel_event = threading.Event()
+    timer = threading.Timer(0.05, cancel_event.set)
+    timer.start()
+    with pytest.raises(PollingCancelledError):
+        poll(
+            lambda: "running",
+            lambda status: False,
+            policy=PollingPolicy(initial_delay=60),
+            cancel_event=cancel_event,
+        )
+
+
+def test_gate_spaces_provider_checks():
+    clock = FakeClock()
+    gate = ProviderPollGate(clock=clock)
+    assert gate.reserve("amazon", 1) == 0
+    assert gate.reserve("amazon", 1) == 1
+    assert gate.reserve("amazon", 1) == 2
+    assert gate.reserve("google", 1) == 0
+    assert gate.reserve("amazon", 0) == 0
+    clock.now = 10
+    assert gate.reserve("amazon", 1) == 0
+
+
+def test_poll_async():
+    policy = PollingPolicy(initial_delay=0.001, jitter=0)
+
+    async def async_check(responses=iter(["running", "done"])):
+        return next(responses)
+
+    assert (
+        asyncio.run(poll_async(async_check, lambda status: status == "done", policy))
+        == "done"
+    )
+    sync_check = statuses("running", "done")
+    assert (
+        asyncio.run(poll_async(sync_check, lambda status: status == "done", policy))
+        == "done"
+    )
+
+    with pytest.raises(ProviderTimeoutError):
+        asyncio.run(
+            poll_async(
+                lambda: "running",
+                lambda status: False,
+                PollingPolicy(initial_delay=0.001, timeout=0.01),
+            )
+        )
+
+
+def test_fibonacci_waiting_call(clock):
+    check = statuses(
+        {"JobStatus": "IN_PROGRESS"}, {"JobStatus": "IN_PROGRESS"}, {"JobStatus": "OK"}
+    )
+    response = fibonacci_waiting_call(
+        max_time=60, status="IN_PROGRESS", func=check, status_positif=False
+    )
+    assert response == {"JobStatus": "OK"}
+
+    # last response is returned when max_time is reached
+    response = fibonacci_waiting_call(
+        max_time=10, status="SUCCEEDED", func=lambda: {"JobStatus": "IN_PROGRESS"}
+    )
+    assert response == {"JobStatus": "IN_PROGRESS"}
+
+
+def test_run_assistant(clock, mocker):
+    runs = mocker.Mock()
+    runs.create.return_value = SimpleNamespace(id="run", status="queued")
+    runs.retrieve.side_effect = [
+        SimpleNamespace(id="run", status="in_progress"),
+        SimpleNamespace(id="run", status="completed"),
+    ]
+    client = SimpleNamespace(beta=SimpleNamespace(threads=SimpleNamespace(runs=runs)))
+    run = run_assistant(client, "thread", "assistant", "xai")
+    assert run.status == "completed"
+    runs.retrieve.assert_called_with(thread_id="thread", run_id="run")
+
+    runs.create.return_value = SimpleNamespace(
+        id="run", status="failed", last_error=SimpleNamespace(message="Invalid file")
+    )
+    with pytest.raises(ProviderException, match="Invalid file"):
+        run_assistant(client, "thread", "assistant", "xai")
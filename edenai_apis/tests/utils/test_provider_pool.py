@@ -0,0 +1,99 @@
+"""
+    Test provider instances pool
+"""
+import threading
+
+from edenai_apis.loaders.data_loader import ProviderDataEnum
+from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.provider_pool import ProviderInstancePool, hash_api_keys
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_hash_api_keys():
+    assert hash_api_keys({}) == hash_api_keys(None) == ""
+    assert hash_api_keys({"a": 1, "b": 2}) == hash_api_keys({"b": 2, "a": 1})
+    assert "secret" not in hash_api_keys({"api_key": "secret"})
+
+
+def test_pool_reuses_instances_by_keys():
+    pool = ProviderInstancePool(maxsize=10, ttl=60)
+    first = pool.get_or_create("openai", {}, object)
+    assert pool.get_or_create("openai", {}, object) is first
+    assert pool.get_or_create("openai", {"api_key": "key"}, object) is not first
+    assert pool.get_or_create("google", {}, object) is not first
+    assert len(pool) == 3
+
+
+def test_pool_lru_eviction():
+    pool = ProviderInstancePool(maxsize=2, ttl=60)
+    first = pool.get_or_create("a", {}, object)
+    pool.get_or_create("b", {}, object)
+    pool.get_or_create("a", {}, object)  # a is now the most recently used
+    pool.get_or_create("c", {}, object)
+    assert len(pool) == 2
+    assert pool.get_or_create("a", {}, object) is first
+
+
+def test_pool_ttl_eviction():
+    clock = FakeClock()
+    pool = ProviderInstancePool(maxsize=10, ttl=60, clock=clock)
+    first = pool.get_or_create("a", {}, object)
+    clock.now = 59
+    assert pool.get_or_create("a", {}, object) is first
+    clock.now = 60
+    assert pool.get_or_create("a", {}, object) is not first
+
+
+def test_pool_disabled():
+    pool = ProviderInstancePool(maxsize=0)
+    assert pool.get_or_create("a", {}, object) is not pool.get_or_create(
+        "a", {}, object
+    )
+    assert len(pool) == 0
+
+
+def test_pool_not_poolable():
+    pool = ProviderInstancePool()
+    first = pool.get_or_create("affinda", {}, object, poolable=False)
+    assert pool.get_or_create("affinda", {}, object, poolable=False) is not first
+    assert len(pool) == 0
+
+
+def test_stateful_providers_not_poolable():
+    for provider_name in ("affinda", "senseloaf", "rossum", "symbl"):
+        provider_class = load_provider(ProviderDataEnum.CLASS, provider_name)
+        assert provider_class.poolable is False
+
+
+def test_pool_invalidate():
+    pool = ProviderInstancePool()
+    pool.get_or_create("a", {}, object)
+    pool.get_or_create("b", {}, object)
+    pool.invalidate("a")
+    assert len(pool) == 1
+    pool.invalidate()
+    assert len(pool) == 0
+
+
+def test_pool_thread_safety():
+    pool = ProviderInstancePool(maxsize=4)
+    instances = []
+
+    def worker():
+        for index in range(50):
+            instances.append(pool.get_or_create(str(index % 4), {}, object))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(pool) == 4
+    assert len({id(instance) for instance in instances}) >= 4
@@ -0,0 +1,180 @@
+"""
+    Test proactive rate limiting of provider calls
+"""
+import asyncio
+import threading
+
+import pytest
+from pytest_mock import MockerFixture
+
+from edenai_apis.utils.exception import ProviderLimitationError
+from edenai_apis.utils.rate_limit import (
+    MemoryRateLimiterBackend,
+    RateLimit,
+    RateLimiter,
+    estimate_tokens,
+    get_api_key_id,
+    rate_limiter_backend_from_config,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_memory_token_bucket():
+    clock = FakeClock()
+    backend = MemoryRateLimiterBackend(clock=clock)
+    # 2 tokens per second, up to 2
+    assert backend.reserve("key", 2, 2, 1, max_wait=1) == 0
+    assert backend.reserve("key", 2, 2, 1, max_wait=1) == 0
+    assert backend.reserve("key", 2, 2, 1, max_wait=1) == 0.5
+    assert backend.reserve("key", 2, 2, 1, max_wait=1) == 1
+    # too long: nothing taken
+    assert backend.reserve("key", 2, 2, 1, max_wait=1) is None
+    clock.now = 1.0
+    assert backend.reserve("key", 2, 2, 1, max_wait=1) == 0.5
+    # refill never exceeds the capacity
+    clock.now = 100.0
+    assert backend.reserve("other", 2, 2, 3, max_wait=1) == 0.5
+
+
+def test_rate_limit_from_config():
+    assert RateLimit.from_config(None) is None
+    assert RateLimit.from_config({"burst": 3}) is None
+    rate_limit = RateLimit.from_config({"requests_per_second": 0.5})
+    assert rate_limit.requests_capacity == 1
+    assert RateLimit(requests_per_second=5, burst=10).requests_capacity == 10
+
+
+def test_estimate_tokens():
+    assert estimate_tokens({"text": "a" * 40, "max_tokens": 100}) == 110
+    assert estimate_tokens({"language": "en"}) == 0
+
+
+def test_api_key_id():
+    assert get_api_key_id({}) == "default"
+    assert get_api_key_id({"api_key": "a"}) != get_api_key_id({"api_key": "b"})
+    assert get_api_key_id({"api_key": "a"}) == get_api_key_id(
+        {"api_key": "a", "rate_limit": {"requests_per_second": 1}}
+    )
+
+
+def test_invalid_backend_config():
+    with pytest.raises(ValueError):
+        rate_limiter_backend_from_config("memcached")
+
+
+class TestRateLimiter:
+    @pytest.fixture
+    def sleep(self, mocker: MockerFixture):
+        return mocker.patch("edenai_apis.utils.rate_limit.time.sleep")
+
+    @staticmethod
+    def limiter(mocker: MockerFixture, config, max_wait=1.0):
+        mocker.patch(
+            "edenai_apis.utils.rate_limit.load_provider",
+            return_value={"constraints": {"rate_limit": config}},
+        )
+        mocker.patch(
+            "edenai_apis.utils.rate_limit.package_settings", return_value={}
+        )
+        return RateLimiter(MemoryRateLimiterBackend(clock=FakeClock()), max_wait)
+
+    def test_calls_wait_for_budget(self, mocker: MockerFixture, sleep):
+        limiter = self.limiter(mocker, {"requests_per_second": 1})
+        for _ in range(2):
+            with limiter.limit("openai", "text", "chat", {}):
+                pass
+        sleep.assert_called_once_with(1.0)
+        with pytest.raises(ProviderLimitationError) as exc:
+            with limiter.limit("openai", "text", "chat", {}):
+                pass
+        assert exc.value.status_code == 429
+
+    def test_budget_per_api_key(self, mocker: MockerFixture, sleep):
+        limiter = self.limiter(mocker, {"requests_per_second": 1})
+        with limiter.limit("openai", "text", "chat", {}, api_keys={"api_key": "a"}):
+            pass
+        with limiter.limit("openai", "text", "chat", {}, api_keys={"api_key": "b"}):
+            pass
+        sleep.assert_not_called()
+
+    def test_settings_override_info(self, mocker: MockerFixture, sleep):
+        limiter = self.limiter(mocker, None)
+        api_keys = {"api_key": "a", "rate_limit": {"requests_per_second": 1}}
+        assert limiter.get_rate_limit("openai", "text", "chat") is None
+        assert limiter.get_rate_limit(
+            "openai", "text", "chat", api_keys=api_keys
+        ) == RateLimit(requests_per_second=1)
+
+    def test_package_settings_override_info(self, mocker: MockerFixture, sleep):
+        limiter = self.limiter(mocker, {"requests_per_second": 5})
+        mocker.patch(
+            "edenai_apis.utils.rate_limit.package_settings",
+            return_value={"api_key": "a", "rate_limit": {"requests_per_second": 1}},
+        )
+        assert limiter.get_rate_limit("openai", "text", "chat") == RateLimit(
+            requests_per_second=1
+        )
+        # user's api keys replace the package settings
+        assert limiter.get_rate_limit(
+            "openai", "text", "chat", api_keys={"api_key": "b"}
+        ) == RateLimit(requests_per_second=5)
+
+    def test_tokens_override(self, mocker: MockerFixture, sleep):
+        limiter = self.limiter(mocker, {"tokens_per_minute": 60})
+        # the estimation of the args (0 tokens) is not used
+        with pytest.raises(ProviderLimitationError):
+            with limiter.limit("openai", "text", "moderation", {}, tokens=200):
+                pass
+
+    def test_tokens_budget_gives_back_requests(self, mocker: MockerFixture, sleep):
+        limiter = self.limiter(
+            mocker, {"requests_per_second": 1, "tokens_per_minute": 60}
+        )
+        # 100 tokens need 40 seconds of budget
+        with pytest.raises(ProviderLimitationError):
+            with limiter.limit("openai", "text", "chat", {"max_tokens": 100}):
+                pass
+        # the request taken before failing on tokens was given back
+        with limiter.limit("openai", "text", "chat", {"max_tokens": 10}):
+            pass
+        sleep.assert_not_called()
+
+    def test_max_concurrency(self, mocker: MockerFixture, sleep):
+        limiter = self.limiter(mocker, {"max_concurrency": 1}, max_wait=0.05)
+        entered, release = threading.Event(), threading.Event()
+
+        def hold():
+            with limiter.limit("openai", "text", "chat", {}):
+                entered.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=hold)
+        thread.start()
+        entered.wait(5)
+        with pytest.raises(ProviderLimitationError):
+            with limiter.limit("openai", "text", "chat", {}):
+                pass
+
+        async def concurrent_call():
+            async with limiter.alimit("openai", "text", "chat", {}):
+                pass
+
+        with pytest.raises(ProviderLimitationError):
+            asyncio.run(concurrent_call())
+        release.set()
+        thread.join()
+        asyncio.run(concurrent_call())
+
+    def test_unlimited(self, mocker: MockerFixture, sleep):
+        limiter = self.limiter(mocker, None)
+        for _ in range(100):
+            with limiter.limit("openai", "text", "chat", {}):
+                pass
+        sleep.assert_not_called()
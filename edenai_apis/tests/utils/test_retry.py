@@ -0,0 +1,165 @@
+"""
+    Test retry of transient provider errors
+"""
+import asyncio
+from io import BytesIO
+from types import SimpleNamespace
+
+import pytest
+import responses
+from pytest_mock import MockerFixture
+
+from edenai_apis.apis.symbl.symbl_api import SymblApi
+from edenai_apis.utils.exception import (
+    ProviderException,
+    ProviderInternalServerError,
+    ProviderInvalidInputError,
+    ProviderLimitationError,
+    ProviderTimeoutError,
+)
+from edenai_apis.utils.retry import (
+    RetryPolicy,
+    args_rewinder,
+    retry_call,
+    retry_call_async,
+)
+
+POLICY = RetryPolicy(max_attempts=3, initial_delay=1, multiplier=2, jitter=0)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def sleep(mocker: MockerFixture):
+    return mocker.patch("edenai_apis.utils.retry.time.sleep")
+
+
+def failing(*errors, result="ok"):
+    errors = list(errors)
+
+    def call():
+        if errors:
+            raise errors.pop(0)
+        return result
+
+    return call
+
+
+def test_retry_transient_errors(sleep):
+    call = failing(ProviderInternalServerError("down"), ProviderException("busy", 503))
+    assert retry_call(call, POLICY) == ("ok", 3)
+    assert [args.args[0] for args in sleep.call_args_list] == [1, 2]
+
+
+def test_not_retryable(sleep):
+    with pytest.raises(ProviderInvalidInputError) as exc:
+        retry_call(failing(ProviderInvalidInputError("bad", 500)), POLICY)
+    assert exc.value.attempts == 1
+    with pytest.raises(ProviderException):
+        retry_call(failing(ProviderException("bad request", 400)), POLICY)
+    sleep.assert_not_called()
+
+
+def test_timeouts_retried_on_opt_in(sleep):
+    for error in (ProviderTimeoutError("timeout"), ProviderException("timeout", 504)):
+        with pytest.raises(ProviderException):
+            retry_call(failing(error), POLICY)
+        policy = RetryPolicy(max_attempts=2, jitter=0, retry_timeouts=True)
+        assert retry_call(failing(error), policy) == ("ok", 2)
+
+
+def test_args_rewinder(sleep):
+    file = BytesIO(b"content")
+    file.read(2)
+    read = []
+
+    def call():
+        read.append(file.read())
+        if len(read) == 1:
+            raise ProviderInternalServerError("down")
+        return "ok"
+
+    rewind = args_rewinder({"file": file, "text": "hi"})
+    assert retry_call(call, POLICY, before_retry=rewind) == ("ok", 2)
+    assert read == [b"ntent", b"ntent"]
+
+    stream = SimpleNamespace(read=lambda: b"", seekable=lambda: False)
+    assert args_rewinder({"file": stream}) is None
+
+
+def test_max_attempts(sleep):
+    errors = [ProviderLimitationError("slow down", 429) for _ in range(3)]
+    with pytest.raises(ProviderLimitationError) as exc:
+        retry_call(failing(*errors), POLICY)
+    assert exc.value.attempts == 3
+
+
+def test_retry_after(sleep):
+    call = failing(ProviderException("slow down", 429, retry_after=5))
+    assert retry_call(call, POLICY) == ("ok", 2)
+    sleep.assert_called_once_with(5)
+
+    # too long to wait for
+    call = failing(ProviderException("slow down", 429, retry_after=3600))
+    with pytest.raises(ProviderException):
+        retry_call(call, POLICY)
+
+
+@responses.activate
+def test_provider_retry_after_from_http_response(sleep):
+    """The `Retry-After` of any provider response extends the backoff"""
+    responses.add(
+        responses.GET,
+        "https://api.symbl.ai/v1/job/job",
+        json={"message": "Too many requests"},
+        status=429,
+        headers={"Retry-After": "7"},
+    )
+    responses.add(
+        responses.GET,
+        "https://api.symbl.ai/v1/job/job",
+        json={"status": "in_progress"},
+    )
+    provider = SymblApi.__new__(SymblApi)
+    provider.access_token = "token"
+    result, attempts = retry_call(
+        lambda: provider.audio__speech_to_text_async__get_job_result(
+            "jobEdenAIconversation"
+        ),
+        POLICY,
+    )
+    assert attempts == 2
+    assert result.status == "pending"
+    sleep.assert_called_once_with(7)
+
+
+def test_deadline(sleep):
+    clock = FakeClock()
+    sleep.side_effect = lambda seconds: setattr(clock, "now", clock.now + seconds)
+    policy = RetryPolicy(max_attempts=5, initial_delay=1, jitter=0, deadline=10)
+
+    def call():
+        clock.now += 4
+        raise ProviderInternalServerError("down")
+
+    with pytest.raises(ProviderInternalServerError) as exc:
+        retry_call(call, policy, clock=clock)
+    # 4s + 1s wait + 4s: a 2s wait would end after the deadline
+    assert exc.value.attempts == 2
+
+
+def test_retry_async(mocker: MockerFixture):
+    sleep = mocker.patch("edenai_apis.utils.retry.asyncio.sleep")
+    call = failing(ProviderInternalServerError("down"))
+
+    async def async_call():
+        return call()
+
+    assert asyncio.run(retry_call_async(async_call, POLICY)) == ("ok", 2)
+    sleep.assert_called_once_with(1)
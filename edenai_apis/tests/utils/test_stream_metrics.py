@@ -0,0 +1,115 @@
+"""
+    Test metrics of streamed chat responses
+"""
+import pytest
+
+from edenai_apis.utils.latency import LatencyTracker
+from edenai_apis.utils.stream_metrics import (
+    CallbackSink,
+    LatencyTrackerSink,
+    MetricsRegistrySink,
+    StreamMetrics,
+    instrument_stream,
+)
+
+
+class FakeClock:
+    def __init__(self, times):
+        self.times = iter(times)
+
+    def __call__(self):
+        return next(self.times)
+
+
+def test_instrument_stream():
+    recorded = []
+    # started at 0, chunks at 1, 1.5 and 3.5, ends at 4
+    clock = FakeClock([1, 1.5, 3.5, 4])
+    stream = instrument_stream(
+        iter("abc"),
+        "mistral",
+        "text",
+        "chat",
+        model="small",
+        started_at=0,
+        sinks=[CallbackSink(recorded.append)],
+        clock=clock,
+    )
+    assert list(stream) == ["a", "b", "c"]
+    (metrics,) = recorded
+    assert metrics.ttft == 1
+    assert metrics.inter_chunk_latencies == [0.5, 2]
+    assert metrics.max_gap == 2
+    assert metrics.chunks == 3
+    assert metrics.chunks_per_second == 2 / 2.5
+    assert metrics.total_time == 4
+    assert metrics.completed and metrics.error is None
+
+
+def test_instrument_stream_error_and_early_close():
+    recorded = []
+    sinks = [CallbackSink(recorded.append)]
+
+    def failing():
+        yield "a"
+        raise ValueError("connection lost")
+
+    with pytest.raises(ValueError):
+        list(instrument_stream(failing(), "mistral", "text", "chat", sinks=sinks))
+    assert recorded[-1].error == "ValueError"
+    assert recorded[-1].chunks == 1
+
+    stream = instrument_stream(iter("abc"), "mistral", "text", "chat", sinks=sinks)
+    next(stream)
+    stream.close()
+    assert not recorded[-1].completed
+    assert recorded[-1].error is None
+
+
+def test_failing_sink_does_not_break_stream():
+    def callback(metrics):
+        raise RuntimeError()
+
+    stream = instrument_stream(
+        iter("ab"), "mistral", "text", "chat", sinks=[CallbackSink(callback)]
+    )
+    assert list(stream) == ["a", "b"]
+
+
+def test_latency_tracker_sink(mocker):
+    tracker = LatencyTracker()
+    mocker.patch("edenai_apis.utils.stream_metrics.LATENCY_TRACKER", tracker)
+    LatencyTrackerSink().record(StreamMetrics("mistral", "text", "chat", ttft=0.3))
+    assert (
+        tracker.percentile(("mistral", "text", "chat", "ttft"), 50, min_samples=1)
+        == 0.3
+    )
+
+
+def test_metrics_registry_render():
+    registry = MetricsRegistrySink(buckets=(0.1, 1))
+    registry.record(
+        StreamMetrics(
+            "mistral",
+            "text",
+            "chat",
+            model="small",
+            ttft=0.5,
+            total_time=2,
+            chunks=3,
+            inter_chunk_latencies=[0.05, 1.5],
+        )
+    )
+    rendered = registry.render()
+    labels = 'feature="text",model="small",provider="mistral",subfeature="chat"'
+    assert f'edenai_stream_ttft_seconds_bucket{{{labels},le="0.1"}} 0' in rendered
+    assert f'edenai_stream_ttft_seconds_bucket{{{labels},le="1"}} 1' in rendered
+    assert (
+        f'edenai_stream_inter_chunk_seconds_bucket{{{labels},le="0.1"}} 1' in rendered
+    )
+    assert (
+        f'edenai_stream_inter_chunk_seconds_bucket{{{labels},le="+Inf"}} 2' in rendered
+    )
+    assert f"edenai_stream_chunks_total{{{labels}}} 3" in rendered
+    assert f"edenai_streams_total{{{labels}}} 1" in rendered
+    assert "# TYPE edenai_stream_ttft_seconds histogram" in rendered
@@ -0,0 +1,90 @@
+"""
+    Test incremental parsing of streamed responses
+"""
+import asyncio
+
+from edenai_apis.utils.streaming import (
+    ServerSentEvent,
+    aiter_stream,
+    iter_json_lines,
+    iter_sse,
+    iter_sse_data,
+)
+
+
+class FakeStreamedResponse:
+    def __init__(self, lines):
+        self.lines = lines
+        self.read = 0
+        self.closed = False
+
+    def iter_lines(self, chunk_size=512):
+        assert chunk_size is None
+        for line in self.lines:
+            self.read += 1
+            yield line
+
+    def close(self):
+        self.closed = True
+
+
+def test_iter_sse():
+    lines = [
+        b": keep-alive",
+        b"event: output",
+        b"data: Hello",
+        b"",
+        b"event: output",
+        b"data: multi",
+        b"data:line\r",
+        b"",
+        b"id: 3",
+        b"data: {}",
+        b"",
+        "data: no blank line at the end",
+    ]
+    assert list(iter_sse(lines)) == [
+        ServerSentEvent("output", "Hello"),
+        ServerSentEvent("output", "multi\nline"),
+        ServerSentEvent("message", "{}", "3"),
+        ServerSentEvent("message", "no blank line at the end", "3"),
+    ]
+
+
+def test_iter_sse_data_is_incremental():
+    response = FakeStreamedResponse(
+        [b'data: {"a": 1}', b"", b'data: {"a": 2}', b"", b"data: [DONE]", b"", b"x"]
+    )
+    stream = iter_sse_data(response)
+    assert next(stream) == '{"a": 1}'
+    # only the lines of the first event were read
+    assert response.read == 2
+    assert list(stream) == ['{"a": 2}']
+    assert response.read == 6
+    assert response.closed
+
+
+def test_iter_json_lines():
+    response = FakeStreamedResponse([b'{"a": 1}', b"", b'{"a": 2}'])
+    assert list(iter_json_lines(response)) == [{"a": 1}, {"a": 2}]
+    assert response.closed
+
+
+def test_aiter_stream():
+    consumed = []
+
+    def stream():
+        for index in range(3):
+            consumed.append(index)
+            yield index
+
+    async def first_two():
+        items = []
+        async for item in aiter_stream(stream()):
+            items.append(item)
+            if len(items) == 2:
+                break
+        return items
+
+    assert asyncio.run(first_two()) == [0, 1]
+    assert consumed == [0, 1]
@@ -0,0 +1,123 @@
+"""
+    Test timeline compaction of video detection results
+"""
+import json
+import os
+
+import pytest
+
+from edenai_apis.features.video.label_detection_async.label_detection_async_dataclass import (
+    LabelDetectionAsyncDataClass,
+)
+from edenai_apis.features.video.logo_detection_async.logo_detection_async_dataclass import (
+    LogoDetectionAsyncDataClass,
+)
+from edenai_apis.features.video.text_detection_async.text_detection_async_dataclass import (
+    TextDetectionAsyncDataClass,
+    VideoText,
+    VideoTextFrames,
+)
+from edenai_apis.settings import outputs_path
+from edenai_apis.utils.timeline import Detection, compact_timeline, merge_detections
+
+
+def load_standardized_response(provider: str, subfeature: str):
+    path = os.path.join(outputs_path(provider), "video", f"{subfeature}_output.json")
+    with open(path) as file:
+        return json.load(file)["standardized_response"]
+
+
+def timeline_length(result) -> int:
+    """Number of timestamps/frames of a video result"""
+    if isinstance(result, LabelDetectionAsyncDataClass):
+        return sum(len(label.timestamp) for label in result.labels)
+    if isinstance(result, LogoDetectionAsyncDataClass):
+        return sum(len(logo.tracking) for logo in result.logos)
+    return sum(len(text.frames) for text in result.texts)
+
+
+def frame(timestamp, confidence=0.9):
+    return VideoTextFrames(
+        confidence=confidence,
+        timestamp=timestamp,
+        bounding_box={"top": 0, "left": 0, "width": 1, "height": 1},
+        polygon=None,
+    )
+
+
+def test_merge_detections():
+    detections = [
+        Detection(2.0, 2.5, 0.5, "c"),
+        Detection(0.0, 1.0, 0.8, "a"),
+        Detection(1.2, 1.5, None, "b"),
+        Detection(5.0, 5.0, 0.6, "d"),
+    ]
+    segments = merge_detections(detections, max_gap=0.5)
+    assert [(segment.start, segment.end) for segment in segments] == [
+        (0.0, 2.5),
+        (5.0, 5.0),
+    ]
+    assert segments[0].confidence == pytest.approx(0.65)
+    assert (segments[0].first, segments[0].last) == ("a", "c")
+    assert segments[0].detections == 3
+    assert merge_detections([Detection(0.0, 0.0, None, "a")], 1.0)[0].confidence is None
+    assert merge_detections([], 1.0) == []
+
+
+def test_text_frames_compacted():
+    result = TextDetectionAsyncDataClass(
+        texts=[
+            VideoText(text="EXIT", frames=[frame(0.0, 0.8), frame(0.5, 1.0)]),
+            VideoText(text="OPEN", frames=[frame(0.0)]),
+            VideoText(text="EXIT", frames=[frame(1.0, 0.9), frame(10.0, 0.7)]),
+        ]
+    )
+    compacted = result.compact_timeline(max_gap=1.0)
+    assert [text.text for text in compacted.texts] == ["EXIT", "OPEN"]
+    exit_frames = compacted.texts[0].frames
+    assert [frame.timestamp for frame in exit_frames] == [0.0, 1.0, 10.0]
+    assert [frame.confidence for frame in exit_frames] == pytest.approx(
+        [0.9, 0.9, 0.7]
+    )
+    assert compacted.texts[1].frames == result.texts[1].frames
+
+
+@pytest.mark.parametrize(
+    ("provider", "subfeature", "dataclass"),
+    [
+        ("amazon", "label_detection_async", LabelDetectionAsyncDataClass),
+        ("google", "label_detection_async", LabelDetectionAsyncDataClass),
+        ("google", "logo_detection_async", LogoDetectionAsyncDataClass),
+        ("amazon", "text_detection_async", TextDetectionAsyncDataClass),
+        ("google", "text_detection_async", TextDetectionAsyncDataClass),
+    ],
+)
+def test_compact_timeline_of_samples(provider, subfeature, dataclass):
+    result = dataclass(**load_standardized_response(provider, subfeature))
+    assert compact_timeline(result, None) is result
+
+    compacted = compact_timeline(result, max_gap=1.0)
+    assert isinstance(compacted, dataclass)
+    assert timeline_length(compacted) <= timeline_length(result)
+
+
+def test_labels_merged_into_segments():
+    labels = [
+        {
+            "name": "Car",
+            "confidence": confidence,
+            "timestamp": [{"start": start, "end": None}],
+            "category": ["Vehicle"],
+            "bounding_box": [],
+        }
+        for start, confidence in [(0.0, 0.8), (0.5, 0.6), (4.0, 0.7)]
+    ]
+    result = LabelDetectionAsyncDataClass(labels=labels)
+    compacted = result.compact_timeline(max_gap=1.0)
+    assert len(compacted.labels) == 1
+    label = compacted.labels[0]
+    assert [(timestamp.start, timestamp.end) for timestamp in label.timestamp] == [
+        (0.0, 0.5),
+        (4.0, 4.0),
+    ]
+    assert label.confidence == pytest.approx(0.7)
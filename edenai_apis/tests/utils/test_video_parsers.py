@@ -0,0 +1,76 @@
+"""
+    Test Amazon Rekognition video parsers
+"""
+from edenai_apis.apis.amazon.helpers import (
+    amazon_video_labels_parser,
+    amazon_video_person_tracking_parser,
+    amazon_video_text_parser,
+)
+
+BOX = {"Top": 0.1, "Left": 0.2, "Width": 0.3, "Height": 0.4}
+
+
+def person(index, timestamp, bounding_box=BOX):
+    return {
+        "Timestamp": timestamp,
+        "Person": {"Index": index, "BoundingBox": bounding_box},
+    }
+
+
+def text(value, timestamp):
+    return {
+        "Timestamp": timestamp,
+        "TextDetection": {
+            "DetectedText": value,
+            "Confidence": 91.234,
+            "Geometry": {"BoundingBox": BOX},
+        },
+    }
+
+
+def test_persons_grouped_over_pages():
+    pages = [
+        {"Persons": [person(1, 0), person(0, 40), person(1, 80)]},
+        {"Persons": [person(0, 120), person(2, 160, bounding_box=None)]},
+    ]
+    result = amazon_video_person_tracking_parser(iter(pages))
+    assert [
+        [tracking.offset for tracking in tracked_person.tracked]
+        for tracked_person in result.persons
+    ] == [[0.04, 0.12], [0.0, 0.08]]
+    tracking = result.persons[0].tracked[0]
+    assert tracking.bounding_box.width == 0.3
+    assert tracking.poses.pitch is None
+    assert tracking.landmarks.eye_left == []
+
+
+def test_texts_grouped_over_pages():
+    pages = [
+        {"TextDetections": [text("EXIT", 0), text("B-12", 40)]},
+        {"TextDetections": [text("EXIT", 80)]},
+    ]
+    result = amazon_video_text_parser(iter(pages))
+    assert [video_text.text for video_text in result.texts] == ["EXIT", "B-12"]
+    assert [frame.timestamp for frame in result.texts[0].frames] == [0.0, 0.08]
+    assert result.texts[0].frames[0].confidence == 0.91
+
+
+def test_labels_single_response():
+    response = {
+        "Labels": [
+            {
+                "Timestamp": 1500,
+                "Label": {
+                    "Name": "Car",
+                    "Confidence": 87.0,
+                    "Instances": [{"BoundingBox": BOX}],
+                    "Parents": [{"Name": "Vehicle"}, {"Name": ""}],
+                },
+            }
+        ]
+    }
+    (label,) = amazon_video_labels_parser(response).labels
+    assert label.name == "Car"
+    assert label.category == ["Vehicle"]
+    assert label.timestamp[0].start == 1.5
+    assert label.bounding_box[0].top == 0.1
@@ -1,6 +1,7 @@
-from time import sleep
 from typing import Callable
 
+from edenai_apis.utils.poller import PollingPolicy, poll
+
 
 def fibonacci_waiting_call(
     max_time: int,
@@ -10,7 +11,8 @@ def fibonacci_waiting_call(
     provider_handel_call: Callable = None,
     **func_args,
 ):
-    """Check response call if succeeded synchronously form an async endpoint
+    """Check response call if succeeded synchronously form an async endpoint.
+    Kept for backward compatibility, use `edenai_apis.utils.poller.poll` instead
 
     Args:
         max_time (int): Max time to wait
@@ -20,29 +22,23 @@ def fibonacci_waiting_call(
         provider_handel_call (Callable): The function wrapper for the provider call
         to handle errors
     """
-    first_occurence, second_occurence = (
-        1,
-        2,
-    )  # waiting exponentially using fibonacci
-    wait_time = first_occurence + second_occurence
-    total_wait_time = wait_time
-    get_response = (
-        func(**func_args)
-        if not provider_handel_call
-        else provider_handel_call(func, **func_args)
-    )
-    while total_wait_time < max_time:  # Wait for the answer from provider
-        if (status_positif and get_response["JobStatus"] == status) or (
-            not status_positif and get_response["JobStatus"] != status
-        ):
-            break
-        sleep(wait_time)
-        first_occurence = second_occurence
-        second_occurence = wait_time
-        wait_time = first_occurence + second_occurence
-        total_wait_time += wait_time
+
+    def check():
         if provider_handel_call:
-            get_response = provider_handel_call(func, **func_args)
-        else:
-            get_response = func(**func_args)
-    return get_response
+            return provider_handel_call(func, **func_args)
+        return func(**func_args)
+
+    def is_done(response) -> bool:
+        if status_positif:
+            return response["JobStatus"] == status
+        return response["JobStatus"] != status
+
+    # waiting exponentially, close to the fibonacci sequence (3, 5, 8, 13...)
+    return poll(
+        check,
+        is_done,
+        policy=PollingPolicy(
+            initial_delay=3, multiplier=1.618, max_delay=max_time, timeout=max_time
+        ),
+        raise_on_timeout=False,
+    )
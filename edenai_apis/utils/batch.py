@@ -0,0 +1,103 @@
+"""
+Helpers for `interface.compute_output_batch`.
+
+Providers can implement a native batch version of a subfeature method, named
+like the method with a `_batch` suffix. It takes the (validated) arguments of
+several calls and returns one response per call, in the same order:
+
+    >>> def text__moderation_batch(
+    ...     self, items: List[Dict[str, Any]]
+    ... ) -> List[ResponseType[ModerationDataClass]]:
+
+The number of calls sent at once is the `max_batch_size` declared in the
+subfeature constraints of the provider `info.json`.
+
+Inputs of a batch usually share the same settings (language, model...) and only
+differ by their content (`text`...), so `ConstraintsValidator` only validates
+each distinct settings once.
+"""
+import json
+import threading
+from typing import Any, Dict, Optional
+
+from edenai_apis.loaders.data_loader import ProviderDataEnum
+from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.constraints import validate_all_provider_constraints
+
+BATCH_METHOD_SUFFIX = "_batch"
+DEFAULT_NATIVE_BATCH_SIZE = 32
+
+# arguments carrying the content to process, never read by constraints validation
+CONTENT_ARGS = ("text", "texts", "query")
+
+# max distinct settings validated per batch
+MAX_VALIDATED_SETTINGS = 1024
+
+
+def get_native_batch_size(
+    provider_name: str, feature: str, subfeature: str, phase: str = ""
+) -> int:
+    """`max_batch_size` declared in the provider info.json for a subfeature"""
+    constraints = (
+        load_provider(
+            ProviderDataEnum.PROVIDER_INFO,
+            provider_name=provider_name,
+            feature=feature,
+            subfeature=subfeature,
+            phase=phase,
+        ).get("constraints")
+        or {}
+    )
+    return constraints.get("max_batch_size") or DEFAULT_NATIVE_BATCH_SIZE
+
+
+class ConstraintsValidator:
+    """`validate_all_provider_constraints` of a subfeature, run once per distinct
+    settings (arguments other than `CONTENT_ARGS`)
+
+    Args:
+        provider_name (str): provider name
+        feature (str): feature name
+        subfeature (str): subfeature name
+        phase (str): phase name
+    """
+
+    def __init__(
+        self, provider_name: str, feature: str, subfeature: str, phase: str = ""
+    ) -> None:
+        self.provider_name = provider_name
+        self.feature = feature
+        self.subfeature = subfeature
+        self.phase = phase
+        self._lock = threading.Lock()
+        self._validated: Dict[str, Dict[str, Any]] = {}
+
+    def _validate(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        return validate_all_provider_constraints(
+            self.provider_name, self.feature, self.subfeature, self.phase, args
+        )
+
+    @staticmethod
+    def _settings_key(settings: Dict[str, Any]) -> Optional[str]:
+        try:
+            return json.dumps(settings, sort_keys=True)
+        except (TypeError, ValueError):
+            # files and other objects are validated each time
+            return None
+
+    def validate(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        content = {name: args[name] for name in CONTENT_ARGS if name in args}
+        settings = {name: value for name, value in args.items() if name not in content}
+        key = self._settings_key(settings)
+        if key is None:
+            return self._validate(args)
+
+        with self._lock:
+            validated = self._validated.get(key)
+        if validated is None:
+            validated = self._validate(settings)
+            with self._lock:
+                if len(self._validated) >= MAX_VALIDATED_SETTINGS:
+                    self._validated.clear()
+                self._validated[key] = validated
+        return {**validated, **content}
@@ -1,5 +1,6 @@
+import math
 from enum import IntEnum
-from typing import Callable, Dict, List, Sequence
+from typing import Callable, Dict, Iterable, List, Sequence, Set, Tuple
 
 from pydantic import BaseModel, Field, field_validator
 from typing_extensions import overload
@@ -192,3 +193,103 @@ class BoundingBox(BaseModel):
         }
 
         return cls.from_json(boxes)
+
+
+# (left, top, right, bottom)
+Rect = Tuple[float, float, float, float]
+
+
+def polygon_to_rect(polygon: Sequence[float]) -> Rect:
+    """Rect enclosing a flat polygon `[x0, y0, x1, y1, ...]`"""
+    xs = polygon[0::2]
+    ys = polygon[1::2]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def rects_intersect(first: Rect, second: Rect) -> bool:
+    """Whether two rects overlap or touch"""
+    return not (
+        first[2] < second[0]
+        or first[0] > second[2]
+        or first[3] < second[1]
+        or first[1] > second[3]
+    )
+
+
+class SpatialIndex:
+    """Grid index of rects (eg: the words of an OCR page), to find the rects
+    intersecting a box (eg: a table cell) without scanning all of them
+
+    Each rect is stored in the buckets of the uniform grid it covers, a query only
+    checks the rects of the buckets covered by the box. The default bucket size is
+    twice the average rect size, so a word is usually in 1 to 4 buckets.
+
+    Args:
+        rects (Iterable[Rect]): indexed `(left, top, right, bottom)` rects, any
+            coordinates system (pixels, inches, normalized...)
+        bucket_size (float, optional): width and height of a grid bucket
+
+    Example:
+        >>> index = SpatialIndex(polygon_to_rect(word["polygon"]) for word in words)
+        >>> index.query_many([polygon_to_rect(cell["polygon"]) for cell in cells])
+        [[0, 1], [2], []]
+    """
+
+    def __init__(self, rects: Iterable[Rect], bucket_size: float = 0.0) -> None:
+        self.rects: List[Rect] = list(rects)
+        if bucket_size <= 0:
+            bucket_size = self._default_bucket_size(self.rects)
+        self.bucket_size = bucket_size
+        self._buckets: Dict[Tuple[int, int], List[int]] = {}
+        for index, rect in enumerate(self.rects):
+            for bucket in self._covered_buckets(rect):
+                self._buckets.setdefault(bucket, []).append(index)
+
+    def __len__(self) -> int:
+        return len(self.rects)
+
+    @staticmethod
+    def _default_bucket_size(rects: Sequence[Rect]) -> float:
+        sizes = [
+            max(abs(right - left), abs(bottom - top))
+            for left, top, right, bottom in rects
+        ]
+        average_size = sum(sizes) / len(sizes) if sizes else 0.0
+        return 2 * average_size if average_size > 0 else 1.0
+
+    def _bucket_range(self, rect: Rect) -> Tuple[int, int, int, int]:
+        """First and last buckets `(min_x, max_x, min_y, max_y)` covered by a rect,
+        inverted rects (right < left...) cover their whole span"""
+        left, top, right, bottom = rect
+        return (
+            math.floor(min(left, right) / self.bucket_size),
+            math.floor(max(left, right) / self.bucket_size),
+            math.floor(min(top, bottom) / self.bucket_size),
+            math.floor(max(top, bottom) / self.bucket_size),
+        )
+
+    def _covered_buckets(self, rect: Rect) -> Iterable[Tuple[int, int]]:
+        min_x, max_x, min_y, max_y = self._bucket_range(rect)
+        for x in range(min_x, max_x + 1):
+            for y in range(min_y, max_y + 1):
+                yield x, y
+
+    def query(self, rect: Rect) -> List[int]:
+        """Indexes (in insertion order) of the rects intersecting `rect`"""
+        candidates: Set[int] = set()
+        min_x, max_x, min_y, max_y = self._bucket_range(rect)
+        if (max_x - min_x + 1) * (max_y - min_y + 1) > len(self._buckets):
+            # box larger than the indexed area: check the filled buckets only
+            for (x, y), indexes in self._buckets.items():
+                if min_x <= x <= max_x and min_y <= y <= max_y:
+                    candidates.update(indexes)
+        else:
+            for bucket in self._covered_buckets(rect):
+                candidates.update(self._buckets.get(bucket, ()))
+        return sorted(
+            index for index in candidates if rects_intersect(self.rects[index], rect)
+        )
+
+    def query_many(self, rects: Iterable[Rect]) -> List[List[int]]:
+        """`query` of each rect"""
+        return [self.query(rect) for rect in rects]
@@ -0,0 +1,101 @@
+"""
+Compact representation of embeddings responses.
+
+By default each `EmbeddingDataClass.embedding` is a python list of floats, which
+costs ~32 bytes per dimension. In compact mode an `EmbeddingsDataClass` is backed
+by a single contiguous `numpy.float32` array (4 bytes per dimension): each item
+embedding is a row view of this array, converted to a list only when
+the response is serialized (`model_dump`, `model_dump_json`).
+
+    >>> response = EmbeddingsDataClass.from_array(vectors)
+    >>> response.to_array()  # no copy
+    >>> response.model_dump()  # {"items": [{"embedding": [...]}, ...]}
+
+The compact mode is enabled for `text__embeddings` with the environment variable
+`EDENAI_COMPACT_EMBEDDINGS=1`.
+"""
+import os
+from typing import Any, ClassVar, Optional, Sequence, Type, TypeVar, Union
+
+import numpy as np
+from pydantic import BaseModel, PrivateAttr
+
+from edenai_apis.utils.types import ResponseType
+
+COMPACT_EMBEDDINGS = os.environ.get("EDENAI_COMPACT_EMBEDDINGS", "").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+Vectors = Union[np.ndarray, Sequence[Sequence[float]]]
+
+T = TypeVar("T", bound="CompactEmbeddingsModel")
+
+
+def embedding_to_list(embedding: Any) -> Any:
+    """Serializer of embeddings fields, numpy rows are materialized as lists"""
+    if isinstance(embedding, np.ndarray):
+        return embedding.tolist()
+    return embedding
+
+
+class CompactEmbeddingsModel(BaseModel):
+    """Base of embeddings responses (a list of `items` with an `embedding` field)
+    that can be backed by one float32 array"""
+
+    _item_class: ClassVar[Type[BaseModel]]
+    _array: Optional[np.ndarray] = PrivateAttr(default=None)
+
+    @classmethod
+    def from_array(cls: Type[T], vectors: Vectors, **fields: Any) -> T:
+        """Build a response backed by `vectors` (one row per item) without copying
+        them if they already are a contiguous float32 array"""
+        array = np.ascontiguousarray(vectors, dtype=np.float32)
+        if array.ndim != 2:
+            raise ValueError(f"Expected a 2d array of vectors, got {array.ndim}d")
+        # no validation: items keep their numpy row view
+        items = [cls._item_class.model_construct(embedding=row) for row in array]
+        instance = cls.model_construct(items=items, **fields)
+        instance._array = array
+        return instance
+
+    def to_array(self, dtype: Optional[type] = None) -> np.ndarray:
+        """Embeddings as a 2d array of `dtype`. By default the float32 array of a
+        compact response (no copy), float64 otherwise (the precision of the
+        python floats of the items)"""
+        if self._array is not None and dtype in (None, self._array.dtype):
+            return self._array
+        return np.asarray(
+            [item.embedding for item in self.items], dtype=dtype or np.float64
+        )
+
+    @property
+    def is_compact(self) -> bool:
+        return self._array is not None
+
+    def compact(self: T) -> T:
+        """Compact copy of this response, or itself if it can't be compacted
+        (already compact, no items or vectors of different sizes)"""
+        if self.is_compact or not self.items:
+            return self
+        dimensions = {len(item.embedding) for item in self.items}
+        if len(dimensions) != 1 or 0 in dimensions:
+            return self
+        fields = {
+            name: getattr(self, name)
+            for name in type(self).model_fields
+            if name != "items"
+        }
+        return type(self).from_array(self.to_array(np.float32), **fields)
+
+
+def compact_response(response: ResponseType) -> ResponseType:
+    """Compact the standardized response of `response` if the compact mode is enabled"""
+    standardized_response = response.standardized_response
+    if not COMPACT_EMBEDDINGS or not isinstance(
+        standardized_response, CompactEmbeddingsModel
+    ):
+        return response
+    response.standardized_response = standardized_response.compact()
+    return response
@@ -0,0 +1,69 @@
+"""
+Helpers to call synchronous provider code from asyncio.
+
+Providers are synchronous unless they implement a native coroutine version of a
+subfeature method, named like the method with an `_async` suffix
+(eg: `async def text__moderation_async(...)` next to `def text__moderation(...)`).
+Sync methods are offloaded to a bounded thread pool so they don't block the
+event loop.
+
+The number of threads can be configured with the environment variable
+`EDENAI_ASYNC_OFFLOAD_WORKERS`.
+"""
+import asyncio
+import contextvars
+import functools
+import inspect
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+DEFAULT_OFFLOAD_WORKERS = 64
+ASYNC_METHOD_SUFFIX = "_async"
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_offload_executor() -> ThreadPoolExecutor:
+    """Thread pool used to run sync provider calls from coroutines"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=int(
+                        os.environ.get(
+                            "EDENAI_ASYNC_OFFLOAD_WORKERS", DEFAULT_OFFLOAD_WORKERS
+                        )
+                    ),
+                    thread_name_prefix="edenai-offload",
+                )
+    return _executor
+
+
+async def run_in_thread(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a sync function in the offload thread pool, keeping the context vars"""
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_offload_executor(), call)
+
+
+def get_async_method(instance: Any, method_name: str) -> Callable[..., Awaitable[Any]]:
+    """Coroutine function for `instance.<method_name>`: its native `_async`
+    version if the provider implements one, else the sync method run in a thread"""
+    native_method = getattr(instance, f"{method_name}{ASYNC_METHOD_SUFFIX}", None)
+    if native_method is not None and inspect.iscoroutinefunction(native_method):
+        return native_method
+
+    sync_method = getattr(instance, method_name)
+
+    @functools.wraps(sync_method)
+    async def offloaded(*args: Any, **kwargs: Any) -> Any:
+        return await run_in_thread(sync_method, *args, **kwargs)
+
+    return offloaded
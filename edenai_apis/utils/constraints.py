@@ -335,6 +335,11 @@ def transform_file_args(args: dict) -> dict:
     return args
 
 
+# `utils.batch.ConstraintsValidator` runs this validation once per distinct
+# settings, without the content arguments (`utils.batch.CONTENT_ARGS`: text,
+# texts, query), and reuses the result for every input of a batch: a constraint
+# reading (or rewriting) one of them must be handled there as well.
+# `tests/utils/test_batch.py` checks the results are the same for all providers.
 def validate_all_provider_constraints(
     provider: str, feature: str, subfeature: str, phase: str, args: dict
 ) -> dict:
@@ -0,0 +1,206 @@
+"""
+Content-addressed uploads to the provider staging buckets.
+
+Files sent to providers by url (videos, documents, audios...) are uploaded to a
+bucket first (`utils.upload_s3`, `utils.upload_gcs`, Amazon video bucket). The
+key of an uploaded file is the sha256 of its content, so the same file
+submitted again, to another feature or provider, is uploaded once:
+    - the upload is skipped if the file is in the local index of the files
+      recently uploaded by this process, or already in the bucket (existence
+      check)
+    - the signed url of a file is reused while it is still valid for at least
+      half of its period
+
+Files larger than one chunk are uploaded by chunks in parallel (S3 multipart
+upload, GCS composite upload).
+
+Environment variables:
+    - `EDENAI_DEDUPLICATE_UPLOADS`: set to `0` to upload every file under a new
+      unique key instead
+    - `EDENAI_UPLOAD_CHUNK_SIZE`: chunk size in bytes (default 16MB)
+    - `EDENAI_UPLOAD_CONCURRENCY`: max chunks uploaded in parallel (default 8)
+    - `EDENAI_UPLOAD_INDEX_SIZE`: max files kept in the local index
+    - `EDENAI_UPLOAD_INDEX_TTL`: seconds after which a file of the local index
+      is checked in its bucket again (eg: deleted by a lifecycle rule)
+"""
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import IO, Callable, Tuple, Union
+from uuid import uuid4
+
+DEDUPLICATE_UPLOADS = os.getenv("EDENAI_DEDUPLICATE_UPLOADS", "1") != "0"
+UPLOAD_CHUNK_SIZE = int(os.getenv("EDENAI_UPLOAD_CHUNK_SIZE", str(16 * 1024 * 1024)))
+UPLOAD_CONCURRENCY = int(os.getenv("EDENAI_UPLOAD_CONCURRENCY", "8"))
+DEFAULT_UPLOAD_INDEX_SIZE = 10_000
+DEFAULT_UPLOAD_INDEX_TTL = 3600
+
+_HASH_BLOCK_SIZE = 1024 * 1024
+_KEY_LOCKS = 64
+
+UploadedFile = Union[str, IO[bytes]]
+
+
+def content_sha256(file: UploadedFile) -> str:
+    """sha256 hex digest of a file path or of a file object from its current
+    position (the position is restored)"""
+    digest = hashlib.sha256()
+    if isinstance(file, str):
+        with open(file, "rb") as stream:
+            for block in iter(lambda: stream.read(_HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+        return digest.hexdigest()
+    position = file.tell()
+    try:
+        for block in iter(lambda: file.read(_HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    finally:
+        file.seek(position)
+    return digest.hexdigest()
+
+
+def content_key(file: UploadedFile, file_name: str) -> str:
+    """Key of a file in a bucket: sha256 of its content, followed by its name
+    (kept for its extension)"""
+    return f"{content_sha256(file)}_{os.path.basename(str(file_name))}"
+
+
+class UploadIndex:
+    """Thread-safe LRU index of the files uploaded by this process, and of
+    their signed urls
+
+    Args:
+        maxsize (int): max number of files (and of urls) kept
+        ttl (float): seconds during which an uploaded file is assumed to still
+            be in its bucket
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_UPLOAD_INDEX_SIZE,
+        ttl: float = DEFAULT_UPLOAD_INDEX_TTL,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # the same key is uploaded by one thread at a time
+        self._key_locks = [threading.Lock() for _ in range(_KEY_LOCKS)]
+        # (bucket, key) -> time of the upload or existence check
+        self._uploaded: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self._urls: "OrderedDict[Tuple[str, str, int], Tuple[str, float]]" = (
+            OrderedDict()
+        )
+
+    def _remember(self, entries: OrderedDict, entry_key, value) -> None:
+        with self._lock:
+            entries[entry_key] = value
+            entries.move_to_end(entry_key)
+            while len(entries) > self.maxsize:
+                entries.popitem(last=False)
+
+    def is_uploaded(self, bucket: str, key: str) -> bool:
+        """Whether a file was uploaded (or found in its bucket) less than `ttl`
+        seconds ago"""
+        with self._lock:
+            checked_at = self._uploaded.get((bucket, key))
+            if checked_at is None or time.monotonic() - checked_at > self.ttl:
+                return False
+            self._uploaded.move_to_end((bucket, key))
+            return True
+
+    def upload_once(
+        self,
+        bucket: str,
+        key: str,
+        exists: Callable[[], bool],
+        upload: Callable[[], None],
+    ) -> bool:
+        """Call `upload` unless the file was already uploaded by this process or
+        `exists` in the bucket
+
+        Returns:
+            bool: whether the file was uploaded
+        """
+        with self._key_locks[hash((bucket, key)) % _KEY_LOCKS]:
+            if self.is_uploaded(bucket, key):
+                return False
+            uploaded = not exists()
+            if uploaded:
+                upload()
+            self._remember(self._uploaded, (bucket, key), time.monotonic())
+            return uploaded
+
+    def forget(self, bucket: str, key: str) -> None:
+        """Remove a file (eg: deleted from its bucket) and its urls from the index"""
+        with self._lock:
+            self._uploaded.pop((bucket, key), None)
+            for url_key in list(self._urls):
+                if url_key[:2] == (bucket, key):
+                    del self._urls[url_key]
+
+    def signed_url(
+        self, bucket: str, key: str, period: int, sign: Callable[[str, int], str]
+    ) -> str:
+        """Url of a file signed for `period` seconds by `sign(key, period)`,
+        the previous one is reused while valid for at least half of `period`"""
+        url_key = (bucket, key, period)
+        now = time.monotonic()
+        with self._lock:
+            cached = self._urls.get(url_key)
+        if cached is not None and cached[1] - now >= period / 2:
+            return cached[0]
+        url = sign(key, period)
+        self._remember(self._urls, url_key, (url, now + period))
+        return url
+
+    def clear(self) -> None:
+        with self._lock:
+            self._uploaded.clear()
+            self._urls.clear()
+
+
+UPLOAD_INDEX = UploadIndex(
+    int(os.getenv("EDENAI_UPLOAD_INDEX_SIZE", str(DEFAULT_UPLOAD_INDEX_SIZE))),
+    float(os.getenv("EDENAI_UPLOAD_INDEX_TTL", str(DEFAULT_UPLOAD_INDEX_TTL))),
+)
+
+
+def deduplicated_upload(
+    file: UploadedFile,
+    file_name: str,
+    bucket: str,
+    exists: Callable[[str], bool],
+    upload: Callable[[str], None],
+) -> str:
+    """Upload a file to a bucket under its content key, unless it is already
+    there (under a new unique key if `DEDUPLICATE_UPLOADS` is disabled)
+
+    Args:
+        file (str | IO[bytes]): file path or file object
+        file_name (str): file name, kept at the end of the key
+        bucket (str): bucket name
+        exists (Callable[[str], bool]): whether a key is in the bucket
+        upload (Callable[[str], None]): upload the file under a key
+
+    Returns:
+        str: key of the file in the bucket
+    """
+    if not DEDUPLICATE_UPLOADS:
+        key = f"{uuid4()}_{file_name}"
+        upload(key)
+        return key
+    key = content_key(file, file_name)
+    UPLOAD_INDEX.upload_once(bucket, key, lambda: exists(key), lambda: upload(key))
+    return key
+
+
+def deduplicated_url(
+    bucket: str, key: str, period: int, sign: Callable[[str, int], str]
+) -> str:
+    """Signed url of an uploaded file, reused while still valid
+    (see `UploadIndex.signed_url`)"""
+    if not DEDUPLICATE_UPLOADS:
+        return sign(key, period)
+    return UPLOAD_INDEX.signed_url(bucket, key, period, sign)
@@ -0,0 +1,247 @@
+"""
+Batching layer for `text__embeddings`.
+
+Providers limit the number of texts (and tokens) accepted by a single embeddings
+request. `batched_embeddings` splits the texts following the limits declared in
+the `text.embeddings` constraints of the provider `info.json`:
+    - `max_batch_size`: max number of texts per request
+    - `max_batch_tokens`: max number of (estimated) tokens per request
+sends the batches concurrently and merges the responses back in input order:
+    >>> batched_embeddings(
+    ...     "cohere",
+    ...     texts,
+    ...     lambda batch: self.__embeddings_request(batch, model),
+    ...     model=model,
+    ... )
+
+When an embeddings cache is enabled (see `edenai_apis.utils.embeddings_cache`),
+only the texts missing from the cache are sent to the provider. Responses are
+backed by a single float32 array in compact mode
+(see `edenai_apis.utils.compact_embeddings`).
+
+The number of concurrent requests of a single call can be configured with the
+environment variable `EDENAI_EMBEDDINGS_MAX_WORKERS`.
+"""
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from edenai_apis.features.text.embeddings import (
+    EmbeddingDataClass,
+    EmbeddingsDataClass,
+)
+from edenai_apis.loaders.data_loader import ProviderDataEnum
+from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils import compact_embeddings, embeddings_cache
+from edenai_apis.utils.compact_embeddings import compact_response
+from edenai_apis.utils.embeddings_cache import embedding_cache_key
+from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.types import ResponseType
+
+DEFAULT_MAX_WORKERS = 4
+
+EmbedFunction = Callable[[List[str]], ResponseType[EmbeddingsDataClass]]
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough upper bound of the number of tokens of a text.
+    Tokenizers average ~4 bytes per token on english, 3 leaves some margin"""
+    return max(1, math.ceil(len(text.encode("utf-8")) / 3))
+
+
+def split_batches(
+    texts: List[str],
+    max_batch_size: Optional[int] = None,
+    max_batch_tokens: Optional[int] = None,
+    count_tokens: Callable[[str], int] = estimate_tokens,
+) -> List[List[str]]:
+    """Split `texts` in consecutive batches respecting both limits.
+    A text bigger than `max_batch_tokens` is sent alone, the provider will decide
+    if it can be truncated or not
+
+    Args:
+        texts (List[str]): texts to embed
+        max_batch_size (int, optional): max number of texts per batch
+        max_batch_tokens (int, optional): max number of tokens per batch
+        count_tokens (Callable[[str], int]): tokens counter. Default to `estimate_tokens`
+
+    Returns:
+        List[List[str]]: batches, in input order
+    """
+    batches: List[List[str]] = []
+    batch: List[str] = []
+    batch_tokens = 0
+    for text in texts:
+        tokens = count_tokens(text) if max_batch_tokens else 0
+        if batch and (
+            (max_batch_size and len(batch) >= max_batch_size)
+            or (max_batch_tokens and batch_tokens + tokens > max_batch_tokens)
+        ):
+            batches.append(batch)
+            batch, batch_tokens = [], 0
+        batch.append(text)
+        batch_tokens += tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def merge_usage(usages: Iterable[Optional[Dict]]) -> Dict:
+    """Sum the numeric values of several `usage` dicts (nested dicts included)"""
+    merged: Dict[str, Any] = {}
+    for usage in usages:
+        for key, value in (usage or {}).items():
+            if isinstance(value, dict):
+                merged[key] = merge_usage([merged.get(key), value])
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                merged[key] = merged.get(key, 0) + value
+    return merged
+
+
+def merge_embeddings_responses(
+    responses: List[ResponseType[EmbeddingsDataClass]],
+) -> ResponseType[EmbeddingsDataClass]:
+    """Concatenate batches responses, the original response keeps every batch
+    response under `batches` and their summed `usage`"""
+    if len(responses) == 1:
+        return responses[0]
+    items: List[EmbeddingDataClass] = []
+    for response in responses:
+        items.extend(response.standardized_response.items)
+    original_response: Dict[str, Any] = {
+        "batches": [response.original_response for response in responses]
+    }
+    usage = merge_usage(
+        response.original_response.get("usage")
+        for response in responses
+        if isinstance(response.original_response, dict)
+    )
+    if usage:
+        original_response["usage"] = usage
+    return ResponseType[EmbeddingsDataClass](
+        original_response=original_response,
+        standardized_response=EmbeddingsDataClass(items=items),
+    )
+
+
+def get_embeddings_limits(provider_name: str) -> Dict[str, Optional[int]]:
+    """`max_batch_size` & `max_batch_tokens` declared in the provider info.json"""
+    constraints = (
+        load_provider(ProviderDataEnum.PROVIDER_INFO, provider_name, "text", "embeddings")
+        .get("constraints")
+        or {}
+    )
+    return {
+        "max_batch_size": constraints.get("max_batch_size"),
+        "max_batch_tokens": constraints.get("max_batch_tokens"),
+    }
+
+
+def _send_batches(
+    provider_name: str,
+    texts: List[str],
+    embed: EmbedFunction,
+    max_workers: Optional[int] = None,
+) -> ResponseType[EmbeddingsDataClass]:
+    batches = split_batches(texts, **get_embeddings_limits(provider_name))
+    if len(batches) <= 1:
+        return embed(texts)
+
+    if max_workers is None:
+        max_workers = int(
+            os.environ.get("EDENAI_EMBEDDINGS_MAX_WORKERS", DEFAULT_MAX_WORKERS)
+        )
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches)))) as pool:
+        responses = list(pool.map(embed, batches))
+
+    for batch, response in zip(batches, responses):
+        if len(response.standardized_response.items) != len(batch):
+            raise ProviderException(
+                f"Expected {len(batch)} embeddings, got "
+                f"{len(response.standardized_response.items)}"
+            )
+    return merge_embeddings_responses(responses)
+
+
+def _cached_embeddings(
+    cache: embeddings_cache.EmbeddingsCache,
+    provider_name: str,
+    model: Optional[str],
+    texts: List[str],
+    embed: EmbedFunction,
+    max_workers: Optional[int] = None,
+) -> ResponseType[EmbeddingsDataClass]:
+    keys = [embedding_cache_key(provider_name, model, text) for text in texts]
+    vectors = cache.get_many(set(keys))
+    hits = sum(1 for key in keys if key in vectors)
+
+    # each missing text is only sent once, even if it appears several times
+    missing = {key: text for key, text in zip(keys, texts) if key not in vectors}
+    response = None
+    if missing:
+        response = _send_batches(
+            provider_name, list(missing.values()), embed, max_workers
+        )
+        items = response.standardized_response.items
+        if len(items) != len(missing):
+            raise ProviderException(
+                f"Expected {len(missing)} embeddings, got {len(items)}"
+            )
+        new_vectors = {
+            key: np.asarray(item.embedding, dtype=np.float32)
+            for key, item in zip(missing, items)
+        }
+        cache.set_many(new_vectors)
+        vectors.update(new_vectors)
+
+    usage = {"total_tokens": 0}
+    if response is not None and isinstance(response.original_response, dict):
+        usage = merge_usage([response.original_response.get("usage")])
+    stats = {"cache_hits": hits, "cache_misses": len(texts) - hits}
+    if compact_embeddings.COMPACT_EMBEDDINGS:
+        standardized_response = EmbeddingsDataClass.from_array(
+            np.stack([vectors[key] for key in keys]), **stats
+        )
+    else:
+        standardized_response = EmbeddingsDataClass(
+            items=[EmbeddingDataClass(embedding=vectors[key].tolist()) for key in keys],
+            **stats,
+        )
+    return ResponseType[EmbeddingsDataClass](
+        original_response={
+            "cache": {"hits": hits, "misses": len(texts) - hits},
+            "usage": usage,
+            "response": response.original_response if response else None,
+        },
+        standardized_response=standardized_response,
+    )
+
+
+def batched_embeddings(
+    provider_name: str,
+    texts: List[str],
+    embed: EmbedFunction,
+    model: Optional[str] = None,
+    max_workers: Optional[int] = None,
+) -> ResponseType[EmbeddingsDataClass]:
+    """Embed `texts` with as many `embed` calls as needed by the provider limits,
+    reusing cached embeddings if the embeddings cache is enabled
+
+    Args:
+        provider_name (str): provider whose info.json declares the limits
+        texts (List[str]): texts to embed
+        embed (EmbedFunction): sends one request for a batch of texts
+        model (str, optional): model used by `embed`, part of the cache key
+        max_workers (int, optional): max concurrent requests.
+            Default to `EDENAI_EMBEDDINGS_MAX_WORKERS` (4)
+
+    Returns:
+        ResponseType[EmbeddingsDataClass]: one embedding per text, in input order
+    """
+    cache = embeddings_cache.EMBEDDINGS_CACHE
+    if cache is None or not texts:
+        return compact_response(_send_batches(provider_name, texts, embed, max_workers))
+    return _cached_embeddings(cache, provider_name, model, texts, embed, max_workers)
@@ -0,0 +1,250 @@
+"""
+Content-addressed cache of text embeddings.
+
+Embeddings are cached by (provider, model, sha256(text)), so the same documents
+embedded again (eg: a `text__search` corpus) are not sent to the provider, only
+the cache misses are. Vectors are stored as float32.
+
+The cache is disabled by default and enabled with environment variables:
+    - `EDENAI_EMBEDDINGS_CACHE`: backend to use:
+        - `memory`: in-memory LRU (`EDENAI_EMBEDDINGS_CACHE_SIZE` vectors)
+        - `sqlite:<path>`: sqlite database file
+        - `mmap:<directory>`: memory-mapped float32 arrays (one file per dimension)
+    - `EDENAI_EMBEDDINGS_CACHE_SIZE`: max number of vectors of the memory backend
+
+or by setting `EMBEDDINGS_CACHE` to any `EmbeddingsCache` instance.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_MEMORY_CACHE_SIZE = 100_000
+
+
+def embedding_cache_key(provider_name: str, model: Optional[str], text: str) -> str:
+    """Cache key of a text embedded by a provider model"""
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return f"{provider_name}:{model or ''}:{digest}"
+
+
+class EmbeddingsCache(ABC):
+    """Embeddings cache backend, must be thread-safe"""
+
+    @abstractmethod
+    def get_many(self, keys: Iterable[str]) -> Dict[str, np.ndarray]:
+        """Cached vectors of `keys`, missing keys are not in the returned dict"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_many(self, vectors: Dict[str, np.ndarray]) -> None:
+        """Store vectors by key"""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release the backend resources"""
+
+
+class MemoryEmbeddingsCache(EmbeddingsCache):
+    """In-memory LRU cache
+
+    Args:
+        maxsize (int): max number of vectors kept
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MEMORY_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._vectors: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._vectors)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, np.ndarray]:
+        found = {}
+        with self._lock:
+            for key in keys:
+                vector = self._vectors.get(key)
+                if vector is not None:
+                    self._vectors.move_to_end(key)
+                    found[key] = vector
+        return found
+
+    def set_many(self, vectors: Dict[str, np.ndarray]) -> None:
+        with self._lock:
+            for key, vector in vectors.items():
+                self._vectors[key] = np.asarray(vector, dtype=np.float32)
+                self._vectors.move_to_end(key)
+            while len(self._vectors) > self.maxsize:
+                self._vectors.popitem(last=False)
+
+
+class SqliteEmbeddingsCache(EmbeddingsCache):
+    """On-disk cache in a sqlite database, vectors are stored as float32 blobs
+
+    Args:
+        path (str): database file, created if needed
+    """
+
+    # sqlite default limit of variables in a statement is 999
+    _CHUNK_SIZE = 500
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB)"
+            )
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, np.ndarray]:
+        keys = list(keys)
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), self._CHUNK_SIZE):
+                chunk = keys[start : start + self._CHUNK_SIZE]
+                rows = self._connection.execute(
+                    "SELECT key, vector FROM embeddings WHERE key IN "
+                    f"({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for key, vector in rows:
+                    found[key] = np.frombuffer(vector, dtype=np.float32)
+        return found
+
+    def set_many(self, vectors: Dict[str, np.ndarray]) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                [
+                    (key, np.asarray(vector, dtype=np.float32).tobytes())
+                    for key, vector in vectors.items()
+                ],
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class MmapEmbeddingsCache(EmbeddingsCache):
+    """On-disk cache of memory-mapped float32 arrays.
+
+    Vectors are appended to one `vectors_<dimension>.f32` file per dimension and
+    read back through `numpy.memmap`, `index.tsv` maps keys to their row.
+    Only one process should write in a directory.
+
+    Args:
+        directory (str): cache directory, created if needed
+    """
+
+    _INDEX_FILE = "index.tsv"
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self._rows: Dict[int, int] = {}
+        self._maps: Dict[int, np.memmap] = {}
+        index_path = os.path.join(directory, self._INDEX_FILE)
+        if os.path.exists(index_path):
+            with open(index_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    key, dimension, row = line.rstrip("\n").split("\t")
+                    self._index[key] = (int(dimension), int(row))
+        for dimension in {dimension for dimension, _ in self._index.values()}:
+            size = os.path.getsize(self._vectors_path(dimension))
+            self._rows[dimension] = size // (dimension * 4)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._index)
+
+    def _vectors_path(self, dimension: int) -> str:
+        return os.path.join(self.directory, f"vectors_{dimension}.f32")
+
+    def _map(self, dimension: int) -> np.memmap:
+        vectors = self._maps.get(dimension)
+        if vectors is None or len(vectors) < self._rows[dimension]:
+            vectors = np.memmap(
+                self._vectors_path(dimension),
+                dtype=np.float32,
+                mode="r",
+                shape=(self._rows[dimension], dimension),
+            )
+            self._maps[dimension] = vectors
+        return vectors
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, np.ndarray]:
+        found = {}
+        with self._lock:
+            for key in keys:
+                position = self._index.get(key)
+                if position is not None:
+                    dimension, row = position
+                    found[key] = np.array(self._map(dimension)[row])
+        return found
+
+    def set_many(self, vectors: Dict[str, np.ndarray]) -> None:
+        by_dimension: Dict[int, List[Tuple[str, np.ndarray]]] = {}
+        for key, vector in vectors.items():
+            vector = np.asarray(vector, dtype=np.float32)
+            by_dimension.setdefault(len(vector), []).append((key, vector))
+
+        with self._lock:
+            index_lines = []
+            for dimension, items in by_dimension.items():
+                items = [(key, vector) for key, vector in items if key not in self._index]
+                if not items:
+                    continue
+                with open(self._vectors_path(dimension), "ab") as f:
+                    f.write(np.stack([vector for _, vector in items]).tobytes())
+                first_row = self._rows.get(dimension, 0)
+                for offset, (key, _) in enumerate(items):
+                    self._index[key] = (dimension, first_row + offset)
+                    index_lines.append(f"{key}\t{dimension}\t{first_row + offset}\n")
+                self._rows[dimension] = first_row + len(items)
+            if index_lines:
+                index_path = os.path.join(self.directory, self._INDEX_FILE)
+                with open(index_path, "a", encoding="utf-8") as f:
+                    f.writelines(index_lines)
+
+    def close(self) -> None:
+        with self._lock:
+            self._maps.clear()
+
+
+def embeddings_cache_from_config(
+    config: Optional[str], maxsize: int = DEFAULT_MEMORY_CACHE_SIZE
+) -> Optional[EmbeddingsCache]:
+    """Build a backend from a `memory`, `sqlite:<path>` or `mmap:<directory>` string,
+    `None` (no cache) for an empty config"""
+    if not config:
+        return None
+    backend, _, location = config.partition(":")
+    if backend == "memory":
+        return MemoryEmbeddingsCache(maxsize=maxsize)
+    if backend == "sqlite" and location:
+        return SqliteEmbeddingsCache(location)
+    if backend == "mmap" and location:
+        return MmapEmbeddingsCache(location)
+    raise ValueError(
+        f"Invalid embeddings cache `{config}`, "
+        "use `memory`, `sqlite:<path>` or `mmap:<directory>`"
+    )
+
+
+EMBEDDINGS_CACHE: Optional[EmbeddingsCache] = embeddings_cache_from_config(
+    os.environ.get("EDENAI_EMBEDDINGS_CACHE"),
+    maxsize=int(
+        os.environ.get("EDENAI_EMBEDDINGS_CACHE_SIZE", DEFAULT_MEMORY_CACHE_SIZE)
+    ),
+)
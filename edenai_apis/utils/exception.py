@@ -3,6 +3,8 @@ import re
 from enum import Enum
 from typing import Dict, List, Optional, Type
 
+from edenai_apis.utils.http import last_retry_after
+
 
 class AsyncJobExceptionReason(Enum):
     DEPRECATED_JOB_ID = (
@@ -12,12 +14,27 @@ class AsyncJobExceptionReason(Enum):
 
 
 class ProviderException(Exception):
-    """Handle error returned by providers"""
+    """Handle error returned by providers
+
+    `retry_after` is the number of seconds the provider asked to wait before
+    retrying (`Retry-After` header), if any. When not given, it is taken from the
+    last response received by `utils.http.http_client` with the same status code."""
 
-    def __init__(self, message: Optional[str] = None, code=None):
+    retry_after: Optional[float] = None
+
+    def __init__(
+        self,
+        message: Optional[str] = None,
+        code=None,
+        retry_after: Optional[float] = None,
+    ):
         super().__init__(message)
         if code:
             self.code = code
+            if retry_after is None:
+                retry_after = last_retry_after(code)
+        if retry_after is not None:
+            self.retry_after = retry_after
     
     @property
     def status_code(self):
@@ -152,6 +169,8 @@ def get_appropriate_error(
 
     for exception_type, error_list in error_dict.items():
         if any([re.search(error_pattern, error_msg) for error_pattern in error_list]):
-            return exception_type(error_msg, error_code)
+            error = exception_type(error_msg, error_code)
+            error.retry_after = exception.retry_after
+            return error
 
     return exception
@@ -1,4 +1,44 @@
+"""
+Shared HTTP layer used by providers instead of module level `requests` calls.
+
+`requests.post`/`requests.get`... open a new connection (and TLS handshake) for
+every call, `http_client` keeps a pool of keep-alive connections per host:
+    >>> from edenai_apis.utils.http import http_client
+    >>> response = http_client.post("https://api.openai.com/v1/...", json=payload)
+
+The pool can be configured with the environment variables:
+    - `EDENAI_HTTP_POOL_CONNECTIONS`: number of hosts to keep a pool for
+    - `EDENAI_HTTP_POOL_MAXSIZE`: max number of connections kept per host
+    - `EDENAI_HTTP_CONNECT_TIMEOUT`: default connect timeout in seconds
+    - `EDENAI_HTTP_READ_TIMEOUT`: default read timeout in seconds
+
+The `Retry-After` header of the last response received in the current context
+(thread or asyncio task) is kept: a `ProviderException` raised for this response
+status code (eg: 429, 503) gets it as `retry_after`, for any provider.
+"""
+import os
+import threading
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from enum import Enum
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_CONNECTIONS = 32
+DEFAULT_POOL_MAXSIZE = 32
+DEFAULT_CONNECT_TIMEOUT = 30.0
+DEFAULT_READ_TIMEOUT = 600.0
+
+Timeout = Union[None, float, Tuple[Optional[float], Optional[float]]]
+
+# (status code, Retry-After seconds) of the last response of the context
+_last_retry_after: ContextVar[Optional[Tuple[int, float]]] = ContextVar(
+    "edenai_last_retry_after", default=None
+)
 
 
 class HTTPMethod(Enum):
@@ -7,3 +47,149 @@ class HTTPMethod(Enum):
     PUT = "PUT"
     PATCH = "PATCH"
     DELETE = "DELETE"
+
+
+class _NoCookiesPolicy(DefaultCookiePolicy):
+    """The session is shared between users, it must never keep cookies"""
+
+    def set_ok(self, cookie, request):
+        return False
+
+
+class PooledSession(requests.Session):
+    """`requests.Session` with a connection pool per host, a default timeout
+    and without cookies persistence"""
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        timeout: Timeout = (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT),
+    ) -> None:
+        super().__init__()
+        self.timeout = timeout
+        self.cookies.set_policy(_NoCookiesPolicy())
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=0,
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def request(self, method, url, *args, **kwargs) -> requests.Response:
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        response = super().request(method, url, *args, **kwargs)
+        retry_after = get_retry_after(response)
+        _last_retry_after.set(
+            None if retry_after is None else (response.status_code, retry_after)
+        )
+        return response
+
+
+class HTTPClient:
+    """Drop-in replacement for the `requests` module functions
+    (`request`, `get`, `post`, `put`, `patch`, `delete`) backed by a `PooledSession`.
+
+    A new session is created in each process, connections must not be shared
+    between forked workers.
+
+    Args:
+        pool_connections (int): number of hosts to keep a pool for
+        pool_maxsize (int): max number of connections kept per host
+        timeout (Timeout): default timeout when none is given to a request
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        timeout: Timeout = (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT),
+    ) -> None:
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._session: Optional[PooledSession] = None
+        self._pid: Optional[int] = None
+
+    @property
+    def session(self) -> PooledSession:
+        pid = os.getpid()
+        if self._session is None or self._pid != pid:
+            with self._lock:
+                if self._session is None or self._pid != pid:
+                    self._session = PooledSession(
+                        pool_connections=self.pool_connections,
+                        pool_maxsize=self.pool_maxsize,
+                        timeout=self.timeout,
+                    )
+                    self._pid = pid
+        return self._session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        return self.session.request(method=method, url=url, **kwargs)
+
+    def get(self, url: str, params=None, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, params=params, **kwargs)
+
+    def post(self, url: str, data=None, json=None, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, data=data, json=json, **kwargs)
+
+    def put(self, url: str, data=None, **kwargs: Any) -> requests.Response:
+        return self.request("PUT", url, data=data, **kwargs)
+
+    def patch(self, url: str, data=None, **kwargs: Any) -> requests.Response:
+        return self.request("PATCH", url, data=data, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        """Close all pooled connections"""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+            self._session = None
+            self._pid = None
+
+
+http_client = HTTPClient(
+    pool_connections=int(
+        os.environ.get("EDENAI_HTTP_POOL_CONNECTIONS", DEFAULT_POOL_CONNECTIONS)
+    ),
+    pool_maxsize=int(os.environ.get("EDENAI_HTTP_POOL_MAXSIZE", DEFAULT_POOL_MAXSIZE)),
+    timeout=(
+        float(os.environ.get("EDENAI_HTTP_CONNECT_TIMEOUT", DEFAULT_CONNECT_TIMEOUT)),
+        float(os.environ.get("EDENAI_HTTP_READ_TIMEOUT", DEFAULT_READ_TIMEOUT)),
+    ),
+)
+
+
+def get_retry_after(response: requests.Response) -> Optional[float]:
+    """Seconds to wait before retrying, from the `Retry-After` header of a response
+    (in seconds or as an HTTP date), `None` if absent or invalid"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def last_retry_after(status_code: Any) -> Optional[float]:
+    """`Retry-After` seconds of the last response received in the current context,
+    `None` if it had no such header or another status code than `status_code`"""
+    last = _last_retry_after.get()
+    if last is None or str(last[0]) != str(status_code):
+        return None
+    return last[1]
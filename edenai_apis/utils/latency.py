@@ -0,0 +1,61 @@
+"""
+Rolling latencies of provider calls.
+
+Keeps the last `window` durations (in seconds) of each key, usually
+`(provider_name, feature, subfeature)`, to get percentiles of recent calls:
+
+    >>> LATENCY_TRACKER.record(("google", "text", "sentiment_analysis"), 0.42)
+    >>> LATENCY_TRACKER.percentile(("google", "text", "sentiment_analysis"), 95)
+
+The window size can be configured with the environment variable
+`EDENAI_LATENCY_WINDOW`.
+"""
+import math
+import os
+import threading
+from collections import deque
+from typing import Deque, Dict, Hashable, Optional
+
+DEFAULT_LATENCY_WINDOW = 100
+DEFAULT_MIN_SAMPLES = 5
+
+
+class LatencyTracker:
+    """Thread-safe rolling window of durations per key
+
+    Args:
+        window (int): number of durations kept per key
+    """
+
+    def __init__(self, window: int = DEFAULT_LATENCY_WINDOW) -> None:
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples: Dict[Hashable, Deque[float]] = {}
+
+    def record(self, key: Hashable, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(
+        self, key: Hashable, q: float, min_samples: int = DEFAULT_MIN_SAMPLES
+    ) -> Optional[float]:
+        """`q`-th percentile (nearest rank) of the recorded durations of `key`,
+        `None` if less than `min_samples` were recorded"""
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if not samples or len(samples) < min_samples:
+            return None
+        rank = max(math.ceil(q / 100 * len(samples)), 1)
+        return samples[rank - 1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+
+LATENCY_TRACKER = LatencyTracker(
+    window=int(os.environ.get("EDENAI_LATENCY_WINDOW", DEFAULT_LATENCY_WINDOW))
+)
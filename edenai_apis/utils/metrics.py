@@ -1,4 +1,4 @@
-from typing import List
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
@@ -27,14 +27,103 @@ def squared_euclidean_similarity(embedding1: List[float], embedding2: List[float
     # numpy arrays
     point1 = np.array(embedding1)
     point2 = np.array(embedding2)
-    
+
     # calculating Euclidean distance
     dist = np.linalg.norm(point1 - point2)
     return  (1 - dist) * SCORE_MULTIPLIER
 
+def hamming_similarity(embedding1: List[float], embedding2: List[float]):
+    """
+    Computes the hamming similarity between the binarized (sign) vectors.
+    """
+    bits1 = np.asarray(embedding1) > 0
+    bits2 = np.asarray(embedding2) > 0
+    return (1 - np.count_nonzero(bits1 != bits2) / len(bits1)) * SCORE_MULTIPLIER
+
 
 METRICS = {
     "cosine" : cosine_similarity,
     "manhattan" : manhattan_similarity,
     "euclidean" : squared_euclidean_similarity,
+    "hamming" : hamming_similarity,
 }
+
+
+# Batched versions of the metrics above: score one query against all the rows
+# of an embeddings matrix at once
+
+Embeddings = Union[np.ndarray, Sequence[Sequence[float]]]
+
+
+def batch_cosine_similarity(query: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    products = matrix @ query
+    similarities = np.divide(
+        products, norms, out=np.zeros_like(products), where=norms != 0
+    )
+    return similarities * SCORE_MULTIPLIER
+
+
+def batch_manhattan_similarity(query: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    return SCORE_MULTIPLIER - np.abs(matrix - query).sum(axis=1)
+
+
+def batch_euclidean_similarity(query: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    return (1 - np.linalg.norm(matrix - query, axis=1)) * SCORE_MULTIPLIER
+
+
+def batch_hamming_similarity(query: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    distances = np.count_nonzero((matrix > 0) != (query > 0), axis=1)
+    return (1 - distances / matrix.shape[1]) * SCORE_MULTIPLIER
+
+
+BATCH_METRICS: Dict[str, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {
+    "cosine": batch_cosine_similarity,
+    "manhattan": batch_manhattan_similarity,
+    "euclidean": batch_euclidean_similarity,
+    "hamming": batch_hamming_similarity,
+}
+
+
+def top_k_similarities(
+    query_embedding: Sequence[float],
+    embeddings: Embeddings,
+    similarity_metric: str = "cosine",
+    top_k: Optional[int] = None,
+    dtype: type = np.float64,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Scores all `embeddings` against `query_embedding` and returns the `top_k` best ones.
+
+    Args:
+        query_embedding (Sequence[float]): embedding of the query
+        embeddings (Embeddings): one embedding per document (list of lists or 2d array)
+        similarity_metric (str): one of `BATCH_METRICS` keys. Default to `"cosine"`
+        top_k (int, optional): number of results to keep, all documents if `None`
+        dtype (type): float type used for computations. Default to `np.float64`
+            (same scores as `METRICS`), `np.float32` halves the memory of large
+            corpora but scores may differ in the last digits and reorder near ties
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: documents indexes and their scores,
+            sorted by descending score (ties keep the documents order)
+    """
+    matrix = np.asarray(embeddings, dtype=dtype)
+    if matrix.size == 0:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=dtype)
+    query = np.asarray(query_embedding, dtype=dtype)
+    scores = BATCH_METRICS[similarity_metric](query, matrix)
+
+    if top_k is None or top_k >= len(scores):
+        indexes = np.argsort(-scores, kind="stable")
+    elif top_k <= 0:
+        indexes = np.empty(0, dtype=np.intp)
+    else:
+        # only sort the k best candidates, ties at the k-th score are broken
+        # by document order like a full stable sort would
+        threshold = -np.partition(-scores, top_k - 1)[top_k - 1]
+        better = np.flatnonzero(scores > threshold)
+        ties = np.flatnonzero(scores == threshold)[: top_k - len(better)]
+        candidates = np.sort(np.concatenate([better, ties]))
+        indexes = candidates[np.argsort(-scores[candidates], kind="stable")]
+    return indexes, scores[indexes]
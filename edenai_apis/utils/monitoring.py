@@ -25,17 +25,19 @@ CREATE TABLE IF NOT EXISTS history (
 """
 
 import getpass
+import inspect
 import os
 import socket
 from datetime import datetime
 from typing import Optional
 
 import psycopg2
-from loaders.data_loader import ProviderDataEnum
-from loaders.loaders import load_provider
 from psycopg2 import errors
 from psycopg2.extensions import AsIs
 
+from edenai_apis.loaders.data_loader import ProviderDataEnum
+from edenai_apis.loaders.loaders import load_provider
+from .concurrency import run_in_thread
 from .upload_s3 import get_providers_json_from_s3
 
 global INFOS_FROM_S3
@@ -46,6 +48,33 @@ def monitor_call(condition=False):
     """decorator for compute output functions to add monitoring features"""
 
     def decorator_monitor_call(compute_func):
+        if inspect.iscoroutinefunction(compute_func):
+
+            async def async_wrapper(provider_name, feature, subfeature, *args, **kwargs):
+                fake = kwargs.get("fake", False)
+                error = "Fake" if fake else None
+                user_email = kwargs.get("user_email")
+                try:
+                    return await compute_func(
+                        provider_name, feature, subfeature, *args, **kwargs
+                    )
+                except Exception as exc:
+                    error = str(exc)
+                    raise
+                finally:
+                    if condition:
+                        # the db insert is blocking, keep it out of the event loop
+                        await run_in_thread(
+                            insert_api_call,
+                            provider=provider_name,
+                            feature=feature,
+                            subfeature=subfeature,
+                            user_email=user_email,
+                            error=error,
+                        )
+
+            return async_wrapper
+
         def wrapper(
             provider_name,
             feature,
@@ -0,0 +1,58 @@
+"""
+Page by page assembly of paginated provider results.
+
+Async jobs on long documents are returned by some providers in many responses
+(eg: Amazon Textract `NextToken` pagination). Rather than collecting all of them
+before standardizing the result, `follow_pagination` fetches them lazily so each
+response can be parsed, and released, as soon as it arrives:
+
+    >>> responses = follow_pagination(first_response, get_next_response)
+    >>> pages = (standardize_page(page) for page in group_pages(responses))
+
+The `original_response` of such results is the list of all provider responses.
+Keeping it can be disabled with the environment variable
+`EDENAI_KEEP_ORIGINAL_RESPONSE=0`, `original_response` is then `None` and only
+the standardized pages are kept in memory.
+"""
+import os
+from typing import Callable, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+KEEP_ORIGINAL_RESPONSE = os.environ.get(
+    "EDENAI_KEEP_ORIGINAL_RESPONSE", "1"
+).lower() in ("1", "true", "yes")
+
+
+def follow_pagination(
+    first_response: dict,
+    fetch_next: Callable[[str], dict],
+    token_key: str = "NextToken",
+) -> Iterator[dict]:
+    """Yield `first_response` then the next responses, fetched one at a time
+
+    Args:
+        first_response (dict): already fetched first response
+        fetch_next (Callable[[str], dict]): fetch the response of a pagination token
+        token_key (str): key of the next pagination token in the responses
+
+    Returns:
+        Iterator[dict]: the responses, a response is fetched only when the
+            previous one was consumed
+    """
+    response = first_response
+    while True:
+        next_token = response.get(token_key)
+        yield response
+        if not next_token:
+            return
+        response = fetch_next(next_token)
+
+
+def keep_items(items: Iterable[T], kept: Optional[List[T]]) -> Iterator[T]:
+    """Yield `items`, also appending them to `kept` unless it is `None`"""
+    for item in items:
+        if kept is not None:
+            kept.append(item)
+        yield item
+
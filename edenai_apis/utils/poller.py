@@ -0,0 +1,254 @@
+"""
+Poll a provider until an async job (or any long running resource) is done.
+
+    >>> response = poll(
+    ...     lambda: http_client.get(job_url, headers=headers).json(),
+    ...     is_done=lambda response: response["status"] in ("succeeded", "failed"),
+    ...     policy=PollingPolicy(initial_delay=0.5, max_delay=5, timeout=600),
+    ...     provider_name="replicate",
+    ... )
+
+Waits between two checks grow exponentially (with jitter) up to `max_delay`,
+checks stop when `timeout` is reached (`ProviderTimeoutError`) or when the
+`cancel_event` is set (`PollingCancelledError`). A check failing with a 429
+(rate limited) is retried with a longer wait instead of failing the whole job.
+
+`min_interval` spaces the checks of a provider made by all the pollers of the
+process, so thousands of jobs polled at the same time don't burn the provider
+quota. `poll_async` is the asyncio version, cancelled like any other task.
+`run_assistant` polls the runs of OpenAI-compatible assistants APIs.
+"""
+import asyncio
+import inspect
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional, TypeVar, Union
+
+from edenai_apis.utils.concurrency import run_in_thread
+from edenai_apis.utils.exception import ProviderException, ProviderTimeoutError
+
+T = TypeVar("T")
+
+RATE_LIMITED_STATUS_CODE = 429
+
+
+class PollingCancelledError(Exception):
+    """Polling was cancelled before the job was done"""
+
+
+@dataclass(frozen=True)
+class PollingPolicy:
+    """How often and for how long to poll
+
+    Args:
+        initial_delay (float): seconds to wait after the first check
+        max_delay (float): max seconds between two checks
+        multiplier (float): growth factor of the delay after each check
+        jitter (float): random +/- ratio applied to each delay
+        timeout (float, optional): max seconds to poll, forever if `None`
+        min_interval (float): min seconds between two checks of the same provider,
+            across all the pollers of the process
+    """
+
+    initial_delay: float = 1.0
+    max_delay: float = 30.0
+    multiplier: float = 2.0
+    jitter: float = 0.1
+    timeout: Optional[float] = None
+    min_interval: float = 0.0
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait after the `attempt`-th check (starting at 0)"""
+        delay = min(self.initial_delay * self.multiplier**attempt, self.max_delay)
+        if self.jitter:
+            delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        return max(delay, 0.0)
+
+
+DEFAULT_POLICY = PollingPolicy()
+
+
+class ProviderPollGate:
+    """Process-wide spacing of checks per provider"""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
+
+    def reserve(self, provider_name: Optional[str], min_interval: float) -> float:
+        """Reserve the next check slot of a provider, returns seconds to wait for it"""
+        if not provider_name or min_interval <= 0:
+            return 0.0
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next_slot.get(provider_name, now))
+            self._next_slot[provider_name] = slot + min_interval
+        return slot - now
+
+
+POLL_GATE = ProviderPollGate()
+
+
+def _is_rate_limited(exc: ProviderException) -> bool:
+    return exc.status_code == RATE_LIMITED_STATUS_CODE
+
+
+def _timeout_error(provider_name: Optional[str], timeout: Optional[float]):
+    return ProviderTimeoutError(
+        f"{provider_name or 'Provider'} job not done after {timeout} seconds",
+        code=504,
+    )
+
+
+def poll(
+    check: Callable[[], T],
+    is_done: Callable[[T], bool],
+    policy: PollingPolicy = DEFAULT_POLICY,
+    provider_name: Optional[str] = None,
+    cancel_event: Optional[threading.Event] = None,
+    raise_on_timeout: bool = True,
+    clock: Optional[Callable[[], float]] = None,
+) -> T:
+    """Call `check` until `is_done(result)`, waiting between calls following `policy`
+
+    Args:
+        check (Callable[[], T]): get the job status from the provider
+        is_done (Callable[[T], bool]): whether the job is finished (succeeded or failed)
+        policy (PollingPolicy): delays and timeout
+        provider_name (str, optional): provider polled, for `min_interval` spacing
+        cancel_event (threading.Event, optional): stops polling when set
+        raise_on_timeout (bool): raise `ProviderTimeoutError` on timeout,
+            else return the last result
+        clock (Callable[[], float], optional): time function (`time.monotonic`
+            by default), mostly useful for tests
+
+    Returns:
+        T: last `check` result
+    """
+    clock = clock or time.monotonic
+    deadline = None if policy.timeout is None else clock() + policy.timeout
+    attempt = 0
+    result: Optional[T] = None
+    has_result = False
+    while True:
+        if cancel_event is not None and cancel_event.is_set():
+            raise PollingCancelledError()
+
+        gate_wait = POLL_GATE.reserve(provider_name, policy.min_interval)
+        if gate_wait:
+            time.sleep(gate_wait)
+
+        try:
+            result, has_result = check(), True
+            if is_done(result):
+                return result
+        except ProviderException as exc:
+            if not _is_rate_limited(exc):
+                raise
+            # rate limited: wait longer before the next check
+            attempt += 1
+
+        delay = policy.delay(attempt)
+        attempt += 1
+        if deadline is not None:
+            remaining = deadline - clock()
+            if remaining <= 0:
+                if raise_on_timeout or not has_result:
+                    raise _timeout_error(provider_name, policy.timeout)
+                return result  # type: ignore[return-value]
+            delay = min(delay, remaining)
+
+        if cancel_event is not None:
+            if cancel_event.wait(delay):
+                raise PollingCancelledError()
+        else:
+            time.sleep(delay)
+
+
+async def poll_async(
+    check: Callable[[], Union[T, Awaitable[T]]],
+    is_done: Callable[[T], bool],
+    policy: PollingPolicy = DEFAULT_POLICY,
+    provider_name: Optional[str] = None,
+    raise_on_timeout: bool = True,
+    clock: Optional[Callable[[], float]] = None,
+) -> T:
+    """Asyncio version of `poll`, `check` can be a coroutine function or a sync
+    function (run in a thread). Cancel the awaiting task to stop polling"""
+    is_coroutine = inspect.iscoroutinefunction(check)
+    clock = clock or time.monotonic
+    deadline = None if policy.timeout is None else clock() + policy.timeout
+    attempt = 0
+    result: Optional[T] = None
+    has_result = False
+    while True:
+        gate_wait = POLL_GATE.reserve(provider_name, policy.min_interval)
+        if gate_wait:
+            await asyncio.sleep(gate_wait)
+
+        try:
+            if is_coroutine:
+                result = await check()  # type: ignore[misc]
+            else:
+                result = await run_in_thread(check)  # type: ignore[arg-type]
+            has_result = True
+            if is_done(result):  # type: ignore[arg-type]
+                return result  # type: ignore[return-value]
+        except ProviderException as exc:
+            if not _is_rate_limited(exc):
+                raise
+            attempt += 1
+
+        delay = policy.delay(attempt)
+        attempt += 1
+        if deadline is not None:
+            remaining = deadline - clock()
+            if remaining <= 0:
+                if raise_on_timeout or not has_result:
+                    raise _timeout_error(provider_name, policy.timeout)
+                return result  # type: ignore[return-value]
+            delay = min(delay, remaining)
+        await asyncio.sleep(delay)
+
+
+ASSISTANT_RUN_FINAL_STATUSES = (
+    "completed",
+    "failed",
+    "cancelled",
+    "expired",
+    "incomplete",
+    "requires_action",
+)
+ASSISTANT_RUN_POLLING_POLICY = PollingPolicy(
+    initial_delay=0.5, max_delay=5, timeout=600
+)
+
+
+def run_assistant(client, thread_id: str, assistant_id: str, provider_name: str):
+    """Start an assistant run on a thread and poll it until it is finished, with
+    an OpenAI-compatible client (OpenAI, xAI, Ollama...)
+
+    Raises:
+        ProviderException: if the run did not complete
+    """
+    run = client.beta.threads.runs.create(
+        thread_id=thread_id, assistant_id=assistant_id
+    )
+    if run.status not in ASSISTANT_RUN_FINAL_STATUSES:
+        run = poll(
+            lambda: client.beta.threads.runs.retrieve(
+                thread_id=thread_id, run_id=run.id
+            ),
+            is_done=lambda run: run.status in ASSISTANT_RUN_FINAL_STATUSES,
+            policy=ASSISTANT_RUN_POLLING_POLICY,
+            provider_name=provider_name,
+        )
+    if run.status != "completed":
+        error = getattr(run, "last_error", None)
+        raise ProviderException(
+            getattr(error, "message", None) or f"Assistant run {run.status}"
+        )
+    return run
@@ -0,0 +1,129 @@
+"""
+Pool of provider instances reused across calls.
+
+Instantiating a provider class is expensive for a lot of providers
+(gRPC clients for google, boto3 clients for amazon, http clients for openai...),
+so instances are kept in a bounded LRU pool keyed by provider name and a hash of
+the api_keys used to build them. Entries expire after `ttl` seconds so rotated
+credentials and stale connections don't live forever.
+
+A pooled instance is shared by all the threads calling its provider (fan-out,
+batch, bulk job results...), so pooled providers must be thread-safe: they must
+not change state on `self` while handling a call (clients switched to another
+workspace, tokens refreshed on `self`, last response kept on a client...).
+Providers which do set the `poolable = False` class attribute (see
+`ProviderInterface`) and are built for each call instead.
+
+The pool can be configured with the environment variables:
+    - `EDENAI_PROVIDER_POOL_SIZE`: max number of instances (0 disables the pool)
+    - `EDENAI_PROVIDER_POOL_TTL`: time to live of an instance in seconds
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+DEFAULT_POOL_SIZE = 128
+DEFAULT_POOL_TTL = 15 * 60
+
+PoolKey = Tuple[str, str]
+
+
+def hash_api_keys(api_keys: Optional[Dict]) -> str:
+    """Stable hash of an api_keys dict, raw keys are never stored in the pool"""
+    if not api_keys:
+        return ""
+    serialized = json.dumps(api_keys, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class ProviderInstancePool:
+    """Thread-safe LRU pool of provider instances with TTL eviction
+
+    Args:
+        maxsize (int): maximum number of instances kept, `0` disables the pool
+        ttl (float): seconds after which an instance is rebuilt
+        clock (Callable[[], float]): time function, mostly useful for tests
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_POOL_SIZE,
+        ttl: float = DEFAULT_POOL_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._instances: "OrderedDict[PoolKey, Tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._instances)
+
+    def get_or_create(
+        self,
+        provider_name: str,
+        api_keys: Optional[Dict],
+        factory: Callable[[], Any],
+        poolable: bool = True,
+    ) -> Any:
+        """Return the pooled instance for (provider_name, api_keys)
+        or build one with `factory` and pool it (a new instance is built for
+        each call if not `poolable`)"""
+        if self.maxsize <= 0 or not poolable:
+            return factory()
+
+        key: PoolKey = (provider_name, hash_api_keys(api_keys))
+        now = self._clock()
+        with self._lock:
+            entry = self._instances.get(key)
+            if entry is not None:
+                created_at, instance = entry
+                if now - created_at < self.ttl:
+                    self._instances.move_to_end(key)
+                    return instance
+                del self._instances[key]
+
+        # build outside of the lock, provider constructors can be slow
+        instance = factory()
+
+        with self._lock:
+            entry = self._instances.get(key)
+            if entry is not None and now - entry[0] < self.ttl:
+                # another thread was faster, keep a single instance
+                self._instances.move_to_end(key)
+                return entry[1]
+            self._instances[key] = (now, instance)
+            self._evict()
+        return instance
+
+    def _evict(self) -> None:
+        now = self._clock()
+        for key in [
+            key
+            for key, (created_at, _) in self._instances.items()
+            if now - created_at >= self.ttl
+        ]:
+            del self._instances[key]
+        while len(self._instances) > self.maxsize:
+            self._instances.popitem(last=False)
+
+    def invalidate(self, provider_name: Optional[str] = None) -> None:
+        """Drop pooled instances of a provider, or all of them if no provider given"""
+        with self._lock:
+            if provider_name is None:
+                self._instances.clear()
+                return
+            for key in [key for key in self._instances if key[0] == provider_name]:
+                del self._instances[key]
+
+
+PROVIDER_POOL = ProviderInstancePool(
+    maxsize=int(os.environ.get("EDENAI_PROVIDER_POOL_SIZE", DEFAULT_POOL_SIZE)),
+    ttl=float(os.environ.get("EDENAI_PROVIDER_POOL_TTL", DEFAULT_POOL_TTL)),
+)
@@ -0,0 +1,466 @@
+"""
+Proactive rate limiting of provider calls.
+
+Calls are limited per (provider, api key, feature/subfeature) with token buckets,
+so they wait (at most `EDENAI_RATE_LIMIT_MAX_WAIT` seconds) for the provider budget
+instead of failing with a rate limit error. Budgets are declared in the subfeature
+constraints of the provider `info.json`, or in the provider settings (user's
+`api_keys`, else the package `<provider>_settings.json`), which take precedence:
+
+    "rate_limit": {
+        "requests_per_second": 5,
+        "burst": 10,
+        "tokens_per_minute": 90000,
+        "max_concurrency": 4
+    }
+
+Every field is optional, subfeatures without `rate_limit` are not limited.
+`tokens_per_minute` counts an estimation of the tokens of each call (input
+characters / 4 + `max_tokens`). A native batch call counts as one request, with
+the tokens of all its inputs.
+
+Buckets are kept by a backend, configured with the environment variable
+`EDENAI_RATE_LIMITER`:
+    - `memory` (default): process-wide, in memory
+    - `redis://...` / `rediss://...`: shared by every process using the same redis
+      (needs the `redis` package)
+
+`max_concurrency` is enforced per process.
+"""
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from edenai_apis.loaders.data_loader import ProviderDataEnum, load_key
+from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.settings import keys_path
+from edenai_apis.utils.exception import ProviderLimitationError
+
+DEFAULT_MAX_WAIT = 10.0
+RATE_LIMITED_STATUS_CODE = 429
+# seconds between two checks of a free concurrency slot by coroutines
+CONCURRENCY_CHECK_INTERVAL = 0.01
+
+# arguments counted by `estimate_tokens`
+TOKEN_ARGS = (
+    "text",
+    "texts",
+    "query",
+    "instruction",
+    "chatbot_global_action",
+    "previous_history",
+    "messages",
+)
+CHARACTERS_PER_TOKEN = 4
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Budget of a provider subfeature, per api key
+
+    Args:
+        requests_per_second (float, optional): sustained requests rate
+        burst (float, optional): requests allowed at once, defaults to
+            `requests_per_second` (at least 1)
+        tokens_per_minute (float, optional): estimated tokens per minute
+        max_concurrency (int, optional): calls running at the same time
+    """
+
+    requests_per_second: Optional[float] = None
+    burst: Optional[float] = None
+    tokens_per_minute: Optional[float] = None
+    max_concurrency: Optional[int] = None
+
+    @classmethod
+    def from_config(cls, config: Optional[Mapping[str, Any]]) -> Optional["RateLimit"]:
+        """`RateLimit` of a `rate_limit` config, `None` if it doesn't limit anything"""
+        if not config:
+            return None
+        rate_limit = cls(
+            requests_per_second=config.get("requests_per_second"),
+            burst=config.get("burst"),
+            tokens_per_minute=config.get("tokens_per_minute"),
+            max_concurrency=config.get("max_concurrency"),
+        )
+        if (
+            not rate_limit.requests_per_second
+            and not rate_limit.tokens_per_minute
+            and not rate_limit.max_concurrency
+        ):
+            return None
+        return rate_limit
+
+    @property
+    def requests_capacity(self) -> float:
+        return self.burst or max(self.requests_per_second or 0, 1)
+
+
+class RateLimiterBackend(ABC):
+    """Token buckets storage, must be thread-safe"""
+
+    @abstractmethod
+    def reserve(
+        self, key: str, rate: float, capacity: float, cost: float, max_wait: float
+    ) -> Optional[float]:
+        """Take `cost` tokens from the `key` bucket (refilled with `rate` tokens
+        per second, up to `capacity`), a negative `cost` gives tokens back
+
+        Returns:
+            Optional[float]: seconds to wait before using the tokens, `None` (and
+                nothing is taken) if it is more than `max_wait`
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release the backend resources"""
+
+
+class MemoryRateLimiterBackend(RateLimiterBackend):
+    """Buckets of the current process
+
+    Args:
+        clock (Callable[[], float]): time function, mostly useful for tests
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+
+    def reserve(
+        self, key: str, rate: float, capacity: float, cost: float, max_wait: float
+    ) -> Optional[float]:
+        with self._lock:
+            now = self._clock()
+            tokens, updated_at = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated_at) * rate) - cost
+            wait = max(-tokens / rate, 0.0)
+            if cost > 0 and wait > max_wait:
+                return None
+            self._buckets[key] = (min(tokens, capacity), now)
+        return wait
+
+
+class RedisRateLimiterBackend(RateLimiterBackend):
+    """Buckets shared through redis, updated atomically by a lua script (using the
+    redis server clock, so nodes don't need synchronized clocks)
+
+    Args:
+        url (str): redis url (`redis://host:port/db`)
+        prefix (str): prefix of the redis keys
+    """
+
+    _SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local max_wait = tonumber(ARGV[4])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(bucket[1]) or capacity
+local updated_at = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + (now - updated_at) * rate) - cost
+local wait = math.max(-tokens / rate, 0)
+if cost > 0 and wait > max_wait then
+    return nil
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(math.min(tokens, capacity)),
+    'updated_at', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil((capacity / rate + wait) * 1000) + 1000)
+return tostring(wait)
+"""
+
+    def __init__(self, url: str, prefix: str = "edenai:rate_limit:") -> None:
+        try:
+            import redis
+        except ImportError as exc:
+            raise ImportError(
+                "RedisRateLimiterBackend requires `redis`: pip install redis"
+            ) from exc
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url)
+        self._script = self._client.register_script(self._SCRIPT)
+
+    def reserve(
+        self, key: str, rate: float, capacity: float, cost: float, max_wait: float
+    ) -> Optional[float]:
+        wait = self._script(
+            keys=[f"{self.prefix}{key}"], args=[rate, capacity, cost, max_wait]
+        )
+        return None if wait is None else float(wait)
+
+    def close(self) -> None:
+        self._client.close()
+
+
+def rate_limiter_backend_from_config(config: Optional[str]) -> RateLimiterBackend:
+    """Build a backend from a `memory` or `redis://...` string (`memory` if empty)"""
+    if not config or config == "memory":
+        return MemoryRateLimiterBackend()
+    if config.startswith(("redis://", "rediss://", "unix://")):
+        return RedisRateLimiterBackend(config)
+    raise ValueError(
+        f"Invalid rate limiter `{config}`, use `memory` or `redis://<host>:<port>`"
+    )
+
+
+def estimate_tokens(args: Mapping[str, Any]) -> int:
+    """Rough token count of a call: its text inputs and the tokens it may generate"""
+    characters = 0
+    for name in TOKEN_ARGS:
+        value = args.get(name)
+        if isinstance(value, str):
+            characters += len(value)
+        elif value:
+            characters += len(json.dumps(value, default=str))
+    return characters // CHARACTERS_PER_TOKEN + (args.get("max_tokens") or 0)
+
+
+def package_settings(provider_name: str) -> Mapping[str, Any]:
+    """Package settings of a provider, empty if it has no settings file"""
+    if not os.path.isfile(os.path.join(keys_path, f"{provider_name}_settings.json")):
+        return {}
+    return load_key(provider_name)
+
+
+def get_api_key_id(api_keys: Optional[Mapping[str, Any]]) -> str:
+    """Non reversible id of user's api keys (`default` for the package settings)"""
+    if not api_keys:
+        return "default"
+    settings = {key: value for key, value in api_keys.items() if key != "rate_limit"}
+    return hashlib.sha256(
+        json.dumps(settings, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()[:16]
+
+
+class RateLimiter:
+    """Waits for the budget of provider calls
+
+    Args:
+        backend (RateLimiterBackend): token buckets storage
+        max_wait (float): max seconds a call waits before raising
+            `ProviderLimitationError`
+    """
+
+    def __init__(
+        self,
+        backend: Optional[RateLimiterBackend] = None,
+        max_wait: float = DEFAULT_MAX_WAIT,
+    ) -> None:
+        self.backend = backend or MemoryRateLimiterBackend()
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        self._semaphores: Dict[Tuple[str, int], threading.BoundedSemaphore] = {}
+        self._rate_limits: Dict[Tuple[str, str, str, str], Optional[RateLimit]] = {}
+
+    def get_rate_limit(
+        self,
+        provider_name: str,
+        feature: str,
+        subfeature: str,
+        phase: str = "",
+        api_keys: Optional[Mapping[str, Any]] = None,
+    ) -> Optional[RateLimit]:
+        """Budget from the provider settings (`api_keys`, else the package
+        settings), else from its info.json"""
+        settings = api_keys or package_settings(provider_name)
+        if settings.get("rate_limit"):
+            return RateLimit.from_config(settings["rate_limit"])
+        info_key = (provider_name, feature, subfeature, phase)
+        if info_key not in self._rate_limits:
+            constraints = (
+                load_provider(
+                    ProviderDataEnum.PROVIDER_INFO,
+                    provider_name=provider_name,
+                    feature=feature,
+                    subfeature=subfeature,
+                    phase=phase,
+                ).get("constraints")
+                or {}
+            )
+            self._rate_limits[info_key] = RateLimit.from_config(
+                constraints.get("rate_limit")
+            )
+        return self._rate_limits[info_key]
+
+    def _reserve(
+        self, key: str, rate_limit: RateLimit, tokens: int, provider_name: str
+    ) -> float:
+        """Take a request and `tokens` from the buckets, seconds to wait for them"""
+        reserved = []
+        waits = [0.0]
+        buckets = []
+        if rate_limit.requests_per_second:
+            buckets.append(
+                (
+                    f"{key}:requests",
+                    rate_limit.requests_per_second,
+                    rate_limit.requests_capacity,
+                    1,
+                )
+            )
+        if rate_limit.tokens_per_minute and tokens:
+            buckets.append(
+                (
+                    f"{key}:tokens",
+                    rate_limit.tokens_per_minute / 60,
+                    rate_limit.tokens_per_minute,
+                    tokens,
+                )
+            )
+        for bucket_key, rate, capacity, cost in buckets:
+            wait = self.backend.reserve(bucket_key, rate, capacity, cost, self.max_wait)
+            if wait is None:
+                # give back what was taken from the other buckets
+                for bucket in reserved:
+                    self.backend.reserve(*bucket[:3], -bucket[3], self.max_wait)
+                raise ProviderLimitationError(
+                    f"{provider_name} rate limit reached, "
+                    f"retry in more than {self.max_wait} seconds",
+                    code=RATE_LIMITED_STATUS_CODE,
+                )
+            reserved.append((bucket_key, rate, capacity, cost))
+            waits.append(wait)
+        return max(waits)
+
+    def _semaphore(self, key: str, max_concurrency: int) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._semaphores.get((key, max_concurrency))
+            if semaphore is None:
+                semaphore = self._semaphores[(key, max_concurrency)] = (
+                    threading.BoundedSemaphore(max_concurrency)
+                )
+            return semaphore
+
+    def _concurrency_error(self, provider_name: str) -> ProviderLimitationError:
+        return ProviderLimitationError(
+            f"{provider_name} max concurrent calls reached "
+            f"for more than {self.max_wait} seconds",
+            code=RATE_LIMITED_STATUS_CODE,
+        )
+
+    def _prepare(
+        self,
+        provider_name: str,
+        feature: str,
+        subfeature: str,
+        args: Mapping[str, Any],
+        phase: str,
+        api_keys: Optional[Mapping[str, Any]],
+        tokens: Optional[int],
+    ) -> Optional[Tuple[float, Optional[threading.BoundedSemaphore]]]:
+        rate_limit = self.get_rate_limit(
+            provider_name, feature, subfeature, phase, api_keys
+        )
+        if rate_limit is None:
+            return None
+        key = f"{provider_name}:{get_api_key_id(api_keys)}:{feature}__{subfeature}"
+        if not rate_limit.tokens_per_minute:
+            tokens = 0
+        elif tokens is None:
+            tokens = estimate_tokens(args)
+        wait = self._reserve(key, rate_limit, tokens, provider_name)
+        semaphore = (
+            self._semaphore(key, rate_limit.max_concurrency)
+            if rate_limit.max_concurrency
+            else None
+        )
+        return wait, semaphore
+
+    @contextmanager
+    def limit(
+        self,
+        provider_name: str,
+        feature: str,
+        subfeature: str,
+        args: Mapping[str, Any],
+        phase: str = "",
+        api_keys: Optional[Mapping[str, Any]] = None,
+        tokens: Optional[int] = None,
+    ) -> Iterator[None]:
+        """Wait for the budget of a call, run the call inside the context.
+        `tokens` overrides the estimation of the tokens of the call (eg: sum of
+        the inputs of a native batch)
+
+        Raises:
+            ProviderLimitationError: if the budget is not available within `max_wait`
+        """
+        prepared = self._prepare(
+            provider_name, feature, subfeature, args, phase, api_keys, tokens
+        )
+        if prepared is None:
+            yield
+            return
+        wait, semaphore = prepared
+        started_at = time.monotonic()
+        if wait:
+            time.sleep(wait)
+        if semaphore is None:
+            yield
+            return
+        timeout = max(self.max_wait - (time.monotonic() - started_at), 0)
+        if not semaphore.acquire(timeout=timeout):
+            raise self._concurrency_error(provider_name)
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+    @asynccontextmanager
+    async def alimit(
+        self,
+        provider_name: str,
+        feature: str,
+        subfeature: str,
+        args: Mapping[str, Any],
+        phase: str = "",
+        api_keys: Optional[Mapping[str, Any]] = None,
+        tokens: Optional[int] = None,
+    ) -> AsyncIterator[None]:
+        """Coroutine version of `limit`"""
+        prepared = self._prepare(
+            provider_name, feature, subfeature, args, phase, api_keys, tokens
+        )
+        if prepared is None:
+            yield
+            return
+        wait, semaphore = prepared
+        started_at = time.monotonic()
+        if wait:
+            await asyncio.sleep(wait)
+        if semaphore is None:
+            yield
+            return
+        # the event loop thread never blocks on the semaphore
+        deadline = started_at + self.max_wait
+        while not semaphore.acquire(blocking=False):
+            if time.monotonic() >= deadline:
+                raise self._concurrency_error(provider_name)
+            await asyncio.sleep(CONCURRENCY_CHECK_INTERVAL)
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+
+RATE_LIMITER = RateLimiter(
+    backend=rate_limiter_backend_from_config(os.environ.get("EDENAI_RATE_LIMITER")),
+    max_wait=float(os.environ.get("EDENAI_RATE_LIMIT_MAX_WAIT", DEFAULT_MAX_WAIT)),
+)
@@ -0,0 +1,211 @@
+"""
+Retry transient provider errors.
+
+Errors are classified by `utils.exception.get_appropriate_error`, only transient
+ones are retried (`ProviderLimitationError`, `ProviderInternalServerError`, and
+unclassified errors with a 429/5xx status):
+
+    >>> result, attempts = retry_call(call_provider, RetryPolicy(max_attempts=3))
+
+Timeouts (`ProviderTimeoutError`, 408/504 statuses) are only retried by policies
+with `retry_timeouts`: the provider may have processed (and billed) the request
+before timing out. For the same reason, calls launching async jobs are not
+retried by default (see `interface.compute_output`), and the file objects of
+the arguments of a call are rewound before retrying it (`args_rewinder`).
+
+Waits between attempts grow exponentially (with jitter), a provider `Retry-After`
+hint (`ProviderException.retry_after`) is waited for when it is longer. No attempt
+starts if it would wait past the policy `deadline`.
+
+The default policy can be configured with the environment variables:
+    - `EDENAI_RETRY_MAX_ATTEMPTS`: calls made at most (1 disables retries)
+    - `EDENAI_RETRY_DEADLINE`: max seconds since the first attempt to retry
+    - `EDENAI_RETRY_TIMEOUTS`: set to `1` to retry timeouts too
+"""
+import asyncio
+import os
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Mapping, Optional, Tuple, Type, TypeVar
+
+from edenai_apis.utils.exception import (
+    ProviderException,
+    ProviderInternalServerError,
+    ProviderLimitationError,
+    ProviderTimeoutError,
+)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_DEADLINE = 60.0
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Which errors to retry, how many times and how long to wait
+
+    Args:
+        max_attempts (int): calls made at most, including the first one
+        initial_delay (float): seconds to wait before the first retry
+        max_delay (float): max seconds between two attempts
+        multiplier (float): growth factor of the delay after each attempt
+        jitter (float): random +/- ratio applied to each delay
+        deadline (float, optional): max seconds since the first attempt to start
+            another one
+        max_retry_after (float): provider `Retry-After` hints longer than this are
+            not waited for, the error is raised
+        retryable_errors (Tuple[Type[ProviderException], ...]): error classes to retry
+        retryable_status_codes (Tuple[int, ...]): status codes of unclassified
+            errors to retry
+        retry_timeouts (bool): also retry timeouts (`timeout_errors`,
+            `timeout_status_codes`), only safe for idempotent calls
+    """
+
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    initial_delay: float = 0.5
+    max_delay: float = 8.0
+    multiplier: float = 2.0
+    jitter: float = 0.1
+    deadline: Optional[float] = DEFAULT_DEADLINE
+    max_retry_after: float = 30.0
+    retryable_errors: Tuple[Type[ProviderException], ...] = (
+        ProviderLimitationError,
+        ProviderInternalServerError,
+    )
+    retryable_status_codes: Tuple[int, ...] = (429, 500, 502, 503)
+    retry_timeouts: bool = False
+    timeout_errors: Tuple[Type[ProviderException], ...] = (ProviderTimeoutError,)
+    timeout_status_codes: Tuple[int, ...] = (408, 504)
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        if isinstance(exc, self.timeout_errors):
+            return self.retry_timeouts
+        if isinstance(exc, self.retryable_errors):
+            return True
+        # subclasses are classified errors (invalid input, authorization...)
+        if type(exc) is not ProviderException:
+            return False
+        if exc.status_code in self.timeout_status_codes:
+            return self.retry_timeouts
+        return exc.status_code in self.retryable_status_codes
+
+    def delay(self, attempt: int, exc: ProviderException) -> Optional[float]:
+        """Seconds to wait after the `attempt`-th failed call (starting at 1),
+        `None` if the error must not be retried"""
+        if attempt >= self.max_attempts or not self.is_retryable(exc):
+            return None
+        delay = min(self.initial_delay * self.multiplier ** (attempt - 1), self.max_delay)
+        if self.jitter:
+            delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        retry_after = getattr(exc, "retry_after", None)
+        if retry_after is not None:
+            if retry_after > self.max_retry_after:
+                return None
+            delay = max(delay, retry_after)
+        return max(delay, 0.0)
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+DEFAULT_RETRY_POLICY = RetryPolicy(
+    max_attempts=int(os.environ.get("EDENAI_RETRY_MAX_ATTEMPTS", DEFAULT_MAX_ATTEMPTS)),
+    deadline=float(os.environ.get("EDENAI_RETRY_DEADLINE", DEFAULT_DEADLINE)),
+    retry_timeouts=os.environ.get("EDENAI_RETRY_TIMEOUTS", "0") == "1",
+)
+
+
+def args_rewinder(*args: Mapping[str, Any]) -> Optional[Callable[[], None]]:
+    """Function seeking the file objects of the `args` of a call (or of each
+    input of a batch call) back to their current position before a retry, `None`
+    if one of them can't be rewound (the call must not be retried: the first
+    attempt may have read it)"""
+    positions = []
+    for value in (value for call_args in args for value in call_args.values()):
+        if not hasattr(value, "read"):
+            continue
+        seekable = getattr(value, "seekable", None)
+        if seekable is None or not seekable():
+            return None
+        positions.append((value, value.tell()))
+
+    def rewind() -> None:
+        for file, position in positions:
+            file.seek(position)
+
+    return rewind
+
+
+def _next_delay(
+    policy: RetryPolicy, attempt: int, exc: ProviderException, elapsed: float
+) -> Optional[float]:
+    delay = policy.delay(attempt, exc)
+    if delay is None:
+        return None
+    if policy.deadline is not None and elapsed + delay > policy.deadline:
+        return None
+    return delay
+
+
+def retry_call(
+    call: Callable[[], T],
+    policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    clock: Optional[Callable[[], float]] = None,
+    before_retry: Optional[Callable[[], None]] = None,
+) -> Tuple[T, int]:
+    """Call `call` until it succeeds or fails with an error not to retry
+
+    Args:
+        call (Callable[[], T]): provider call, raising classified `ProviderException`
+        policy (RetryPolicy): retried errors, delays and deadline
+        clock (Callable[[], float], optional): time function (`time.monotonic`
+            by default), mostly useful for tests
+        before_retry (Callable[[], None], optional): called before each retry
+            (eg: `args_rewinder(args)`)
+
+    Returns:
+        Tuple[T, int]: result of the call and number of attempts made
+
+    Raises:
+        ProviderException: last error, with its `attempts` count
+    """
+    clock = clock or time.monotonic
+    started_at = clock()
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            return call(), attempt
+        except ProviderException as exc:
+            delay = _next_delay(policy, attempt, exc, clock() - started_at)
+            if delay is None:
+                exc.attempts = attempt
+                raise
+        time.sleep(delay)
+        if before_retry is not None:
+            before_retry()
+
+
+async def retry_call_async(
+    call: Callable[[], Awaitable[T]],
+    policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    clock: Optional[Callable[[], float]] = None,
+    before_retry: Optional[Callable[[], None]] = None,
+) -> Tuple[T, int]:
+    """Coroutine version of `retry_call`"""
+    clock = clock or time.monotonic
+    started_at = clock()
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            return await call(), attempt
+        except ProviderException as exc:
+            delay = _next_delay(policy, attempt, exc, clock() - started_at)
+            if delay is None:
+                exc.attempts = attempt
+                raise
+        await asyncio.sleep(delay)
+        if before_retry is not None:
+            before_retry()
@@ -0,0 +1,398 @@
+"""
+Performance metrics of streamed chat responses.
+
+`instrument_stream` wraps a `StreamChat.stream` generator and measures, without
+changing the chunks:
+    - `ttft`: seconds between the call and the first chunk (time to first token)
+    - `inter_chunk_latencies`: seconds between two consecutive chunks
+    - `chunks`: number of chunks received, `chunks_per_second` after the first one
+    - `max_gap`: longest wait between two chunks (stall)
+
+Once the stream is consumed (or closed), a `StreamMetrics` is sent to every
+registered sink:
+
+    >>> add_stream_metrics_sink(CallbackSink(lambda metrics: print(metrics.ttft)))
+    >>> add_stream_metrics_sink(registry := MetricsRegistrySink())
+    >>> registry.render()  # Prometheus text exposition format
+
+`PrometheusSink` and `OpenTelemetrySink` forward the metrics to
+`prometheus_client` / `opentelemetry` when these (optional) packages are installed.
+"""
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from edenai_apis.utils.latency import LATENCY_TRACKER
+
+T = TypeVar("T")
+
+# seconds, from fast local models to slow reasoning models
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+@dataclass
+class StreamMetrics:
+    provider: str
+    feature: str
+    subfeature: str
+    model: Optional[str] = None
+    ttft: Optional[float] = None
+    total_time: float = 0.0
+    chunks: int = 0
+    inter_chunk_latencies: List[float] = field(default_factory=list)
+    completed: bool = False
+    error: Optional[str] = None
+
+    @property
+    def max_gap(self) -> Optional[float]:
+        return max(self.inter_chunk_latencies, default=None)
+
+    @property
+    def chunks_per_second(self) -> Optional[float]:
+        """Chunks received per second after the first one"""
+        streaming_time = sum(self.inter_chunk_latencies)
+        if not streaming_time:
+            return None
+        return len(self.inter_chunk_latencies) / streaming_time
+
+    @property
+    def labels(self) -> Dict[str, str]:
+        return {
+            "provider": self.provider,
+            "feature": self.feature,
+            "subfeature": self.subfeature,
+            "model": self.model or "",
+        }
+
+
+class StreamMetricsSink(ABC):
+    """Destination of the metrics of streamed responses"""
+
+    @abstractmethod
+    def record(self, metrics: StreamMetrics) -> None:
+        pass
+
+
+class CallbackSink(StreamMetricsSink):
+    """Call a function with the metrics of each stream"""
+
+    def __init__(self, callback: Callable[[StreamMetrics], Any]) -> None:
+        self.callback = callback
+
+    def record(self, metrics: StreamMetrics) -> None:
+        self.callback(metrics)
+
+
+class LatencyTrackerSink(StreamMetricsSink):
+    """Keep recent time to first token in `utils.latency.LATENCY_TRACKER` under
+    the `(provider, feature, subfeature, "ttft")` key, eg: to route traffic to the
+    provider currently answering the fastest"""
+
+    def record(self, metrics: StreamMetrics) -> None:
+        if metrics.ttft is not None:
+            LATENCY_TRACKER.record(
+                (metrics.provider, metrics.feature, metrics.subfeature, "ttft"),
+                metrics.ttft,
+            )
+
+
+class Histogram:
+    """Cumulative buckets histogram, Prometheus style"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self) -> List[Tuple[str, int]]:
+        counts, total = [], 0
+        for bound, count in zip(
+            [str(bucket) for bucket in self.buckets] + ["+Inf"], self.counts
+        ):
+            total += count
+            counts.append((bound, total))
+        return counts
+
+
+LabelsKey = Tuple[Tuple[str, str], ...]
+
+
+class MetricsRegistrySink(StreamMetricsSink):
+    """In process registry of streaming metrics (histograms and counters per
+    provider/feature/subfeature/model), rendered in the Prometheus text format"""
+
+    HISTOGRAMS = {
+        "edenai_stream_ttft_seconds": "Time to first chunk of streamed responses",
+        "edenai_stream_inter_chunk_seconds": "Time between two chunks",
+        "edenai_stream_duration_seconds": "Total duration of streamed responses",
+    }
+    COUNTERS = {
+        "edenai_stream_chunks_total": "Chunks received",
+        "edenai_streams_total": "Streamed responses",
+        "edenai_stream_errors_total": "Streamed responses interrupted by an error",
+    }
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self.histograms: Dict[str, Dict[LabelsKey, Histogram]] = {
+            name: {} for name in self.HISTOGRAMS
+        }
+        self.counters: Dict[str, Dict[LabelsKey, float]] = {
+            name: {} for name in self.COUNTERS
+        }
+
+    def _observe(self, name: str, labels: LabelsKey, values: Iterable[float]) -> None:
+        histograms = self.histograms[name]
+        if labels not in histograms:
+            histograms[labels] = Histogram(self.buckets)
+        for value in values:
+            histograms[labels].observe(value)
+
+    def _inc(self, name: str, labels: LabelsKey, value: float = 1) -> None:
+        self.counters[name][labels] = self.counters[name].get(labels, 0) + value
+
+    def record(self, metrics: StreamMetrics) -> None:
+        labels: LabelsKey = tuple(sorted(metrics.labels.items()))
+        with self._lock:
+            if metrics.ttft is not None:
+                self._observe("edenai_stream_ttft_seconds", labels, [metrics.ttft])
+            self._observe(
+                "edenai_stream_inter_chunk_seconds",
+                labels,
+                metrics.inter_chunk_latencies,
+            )
+            self._observe(
+                "edenai_stream_duration_seconds", labels, [metrics.total_time]
+            )
+            self._inc("edenai_stream_chunks_total", labels, metrics.chunks)
+            self._inc("edenai_streams_total", labels)
+            if metrics.error is not None:
+                self._inc("edenai_stream_errors_total", labels)
+
+    @staticmethod
+    def _format_labels(labels: LabelsKey, **extra: str) -> str:
+        items = list(labels) + list(extra.items())
+        return ",".join(f'{name}="{value}"' for name, value in items)
+
+    def render(self) -> str:
+        """Metrics in the Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            for name, description in self.HISTOGRAMS.items():
+                lines += [f"# HELP {name} {description}", f"# TYPE {name} histogram"]
+                for labels, histogram in self.histograms[name].items():
+                    for bound, count in histogram.cumulative_counts():
+                        lines.append(
+                            f"{name}_bucket{{{self._format_labels(labels, le=bound)}}}"
+                            f" {count}"
+                        )
+                    formatted = self._format_labels(labels)
+                    lines.append(f"{name}_sum{{{formatted}}} {histogram.sum}")
+                    lines.append(f"{name}_count{{{formatted}}} {histogram.count}")
+            for name, description in self.COUNTERS.items():
+                lines += [f"# HELP {name} {description}", f"# TYPE {name} counter"]
+                for labels, value in self.counters[name].items():
+                    lines.append(f"{name}{{{self._format_labels(labels)}}} {value}")
+        return "\n".join(lines) + "\n"
+
+
+class PrometheusSink(StreamMetricsSink):
+    """Export the metrics with `prometheus_client` (optional dependency)"""
+
+    def __init__(self, registry: Any = None, namespace: str = "edenai") -> None:
+        try:
+            from prometheus_client import REGISTRY, Counter, Histogram as _Histogram
+        except ImportError as exc:
+            raise ImportError(
+                "PrometheusSink requires `prometheus_client`: "
+                "pip install prometheus-client"
+            ) from exc
+        registry = registry or REGISTRY
+        labels = ["provider", "feature", "subfeature", "model"]
+        self.ttft = _Histogram(
+            "stream_ttft_seconds",
+            "Time to first chunk of streamed responses",
+            labels,
+            namespace=namespace,
+            buckets=DEFAULT_LATENCY_BUCKETS,
+            registry=registry,
+        )
+        self.inter_chunk = _Histogram(
+            "stream_inter_chunk_seconds",
+            "Time between two chunks",
+            labels,
+            namespace=namespace,
+            buckets=DEFAULT_LATENCY_BUCKETS,
+            registry=registry,
+        )
+        self.chunks = Counter(
+            "stream_chunks",
+            "Chunks received",
+            labels,
+            namespace=namespace,
+            registry=registry,
+        )
+        self.errors = Counter(
+            "stream_errors",
+            "Streamed responses interrupted by an error",
+            labels,
+            namespace=namespace,
+            registry=registry,
+        )
+
+    def record(self, metrics: StreamMetrics) -> None:
+        labels = metrics.labels
+        if metrics.ttft is not None:
+            self.ttft.labels(**labels).observe(metrics.ttft)
+        inter_chunk = self.inter_chunk.labels(**labels)
+        for latency in metrics.inter_chunk_latencies:
+            inter_chunk.observe(latency)
+        self.chunks.labels(**labels).inc(metrics.chunks)
+        if metrics.error is not None:
+            self.errors.labels(**labels).inc()
+
+
+class OpenTelemetrySink(StreamMetricsSink):
+    """Record each stream as an OpenTelemetry span (optional dependency),
+    with the metrics as attributes"""
+
+    def __init__(self, tracer: Any = None) -> None:
+        try:
+            from opentelemetry import trace
+        except ImportError as exc:
+            raise ImportError(
+                "OpenTelemetrySink requires `opentelemetry-api`: "
+                "pip install opentelemetry-api"
+            ) from exc
+        self.tracer = tracer or trace.get_tracer("edenai_apis")
+
+    def record(self, metrics: StreamMetrics) -> None:
+        end_time = time.time_ns()
+        start_time = end_time - int(metrics.total_time * 1e9)
+        span = self.tracer.start_span(
+            f"{metrics.feature}__{metrics.subfeature} stream", start_time=start_time
+        )
+        attributes: Dict[str, Any] = {
+            f"edenai.{name}": value for name, value in metrics.labels.items()
+        }
+        attributes["edenai.stream.chunks"] = metrics.chunks
+        attributes["edenai.stream.completed"] = metrics.completed
+        if metrics.ttft is not None:
+            attributes["edenai.stream.ttft"] = metrics.ttft
+        if metrics.max_gap is not None:
+            attributes["edenai.stream.max_gap"] = metrics.max_gap
+        if metrics.chunks_per_second is not None:
+            attributes["edenai.stream.chunks_per_second"] = metrics.chunks_per_second
+        if metrics.error is not None:
+            attributes["edenai.stream.error"] = metrics.error
+        span.set_attributes(attributes)
+        span.end(end_time=end_time)
+
+
+_sinks_lock = threading.Lock()
+STREAM_METRICS_SINKS: List[StreamMetricsSink] = [LatencyTrackerSink()]
+
+
+def add_stream_metrics_sink(sink: StreamMetricsSink) -> None:
+    with _sinks_lock:
+        STREAM_METRICS_SINKS.append(sink)
+
+
+def remove_stream_metrics_sink(sink: StreamMetricsSink) -> None:
+    with _sinks_lock:
+        if sink in STREAM_METRICS_SINKS:
+            STREAM_METRICS_SINKS.remove(sink)
+
+
+def _publish(metrics: StreamMetrics, sinks: Optional[Sequence[StreamMetricsSink]]):
+    if sinks is None:
+        with _sinks_lock:
+            sinks = list(STREAM_METRICS_SINKS)
+    for sink in sinks:
+        try:
+            sink.record(metrics)
+        except Exception:
+            # metrics must never break the stream of the user
+            pass
+
+
+def instrument_stream(
+    stream: Iterator[T],
+    provider: str,
+    feature: str,
+    subfeature: str,
+    model: Optional[str] = None,
+    started_at: Optional[float] = None,
+    sinks: Optional[Sequence[StreamMetricsSink]] = None,
+    clock: Callable[[], float] = time.monotonic,
+) -> Generator[T, None, None]:
+    """Yield the chunks of `stream` and publish its `StreamMetrics` to the sinks
+    once it is consumed, closed or failed
+
+    Args:
+        stream (Iterator): chunks of a streamed response
+        provider (str): provider name
+        feature (str): feature name
+        subfeature (str): subfeature name
+        model (str, optional): model used
+        started_at (float, optional): `clock()` when the provider was called,
+            defaults to the creation of the stream
+        sinks (Sequence[StreamMetricsSink], optional): defaults to the registered
+            sinks (`add_stream_metrics_sink`)
+        clock (Callable[[], float]): time function, mostly useful for tests
+    """
+    metrics = StreamMetrics(provider, feature, subfeature, model)
+    started_at = clock() if started_at is None else started_at
+    last_chunk_at: Optional[float] = None
+    try:
+        for chunk in stream:
+            now = clock()
+            if last_chunk_at is None:
+                metrics.ttft = now - started_at
+            else:
+                metrics.inter_chunk_latencies.append(now - last_chunk_at)
+            last_chunk_at = now
+            metrics.chunks += 1
+            yield chunk
+        metrics.completed = True
+    except Exception as exc:
+        metrics.error = type(exc).__name__
+        raise
+    finally:
+        metrics.total_time = clock() - started_at
+        _publish(metrics, sinks)
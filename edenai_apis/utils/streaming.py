@@ -0,0 +1,126 @@
+"""
+Incremental parsing of streamed provider responses.
+
+Streamed chat completions are read as they arrive, line by line, so the first
+tokens can be forwarded before the provider finished generating the answer.
+Never read `response.text` (or `response.json()`) of a streamed response: it waits
+for and buffers the whole body.
+
+    >>> response = http_client.post(url, json=payload, stream=True)
+    >>> for data in iter_sse_data(response):  # Server-Sent Events
+    ...     chunk = json.loads(data)
+    >>> for chunk in iter_json_lines(response):  # newline delimited JSON
+    ...     ...
+
+`aiter_stream` consumes such a (sync) generator from asyncio, one item at a time.
+"""
+import json
+from typing import (
+    Any,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+import requests
+
+from edenai_apis.utils.concurrency import run_in_thread
+
+T = TypeVar("T")
+
+SSE_DONE = "[DONE]"
+
+_EXHAUSTED = object()
+
+
+class ServerSentEvent(NamedTuple):
+    event: str = "message"
+    data: str = ""
+    id: Optional[str] = None
+
+
+def iter_lines(response: requests.Response) -> Iterator[bytes]:
+    """Lines of a streamed response, each one as soon as it is received
+    (the default `iter_lines` waits for 512 bytes blocks)"""
+    return response.iter_lines(chunk_size=None)
+
+
+def iter_sse(lines: Iterable[Union[bytes, str]]) -> Iterator[ServerSentEvent]:
+    """Parse Server-Sent Events from lines, multiline `data` fields are joined
+    with new lines (https://html.spec.whatwg.org/multipage/server-sent-events.html)"""
+    event: Optional[str] = None
+    data_lines = []
+    last_id: Optional[str] = None
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        line = line.rstrip("\r")
+        if not line:
+            # blank line: dispatch the event
+            if data_lines:
+                yield ServerSentEvent(event or "message", "\n".join(data_lines), last_id)
+            event, data_lines = None, []
+            continue
+        if line.startswith(":"):
+            # comment, used as keep-alive by some providers
+            continue
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "data":
+            data_lines.append(value)
+        elif field == "event":
+            event = value
+        elif field == "id":
+            last_id = value
+    if data_lines:
+        yield ServerSentEvent(event or "message", "\n".join(data_lines), last_id)
+
+
+def iter_sse_data(
+    response: requests.Response, done: Optional[str] = SSE_DONE
+) -> Iterator[str]:
+    """`data` of the Server-Sent Events of a streamed response until the `done`
+    marker, the response is closed once consumed (or when the generator is closed)"""
+    try:
+        for event in iter_sse(iter_lines(response)):
+            if done is not None and event.data == done:
+                break
+            yield event.data
+    finally:
+        response.close()
+
+
+def iter_json_lines(response: requests.Response) -> Iterator[Any]:
+    """Objects of a newline delimited JSON streamed response"""
+    try:
+        for line in iter_lines(response):
+            if line.strip():
+                yield json.loads(line)
+    finally:
+        response.close()
+
+
+async def aiter_stream(stream: Iterator[T]) -> AsyncIterator[T]:
+    """Async iterator over a sync generator (eg: `StreamChat.stream`)
+
+    Each item is read in a thread only when the consumer asks for it, so a slow
+    consumer never makes the provider stream buffered in memory."""
+    try:
+        while True:
+            item = await run_in_thread(next, stream, _EXHAUSTED)
+            if item is _EXHAUSTED:
+                return
+            yield item  # type: ignore[misc]
+    finally:
+        close = getattr(stream, "close", None)
+        if close is not None:
+            try:
+                close()
+            except ValueError:
+                # still being read by a thread (the consumer was cancelled)
+                pass
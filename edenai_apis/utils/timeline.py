@@ -0,0 +1,113 @@
+"""
+Timeline compaction of video detection results.
+
+Providers return most video detections frame by frame: a label, logo or text
+visible for ten minutes is reported thousands of times. Compaction merges the
+consecutive detections of the same entity, less than `max_gap` seconds apart,
+into segments with their mean confidence:
+
+    >>> standardized_response.compact_timeline(max_gap=1.0)
+
+    - `LabelDetectionAsyncDataClass`: one `VideoLabel` per label name, with a
+      `start`/`end` timestamp per segment
+    - `LogoDetectionAsyncDataClass`, `TextDetectionAsyncDataClass`: one track per
+      logo/text, each segment kept as its first and last frames
+
+Compaction is disabled by default. It is enabled for the results returned by
+`interface.get_async_job_result` with the environment variable
+`EDENAI_VIDEO_TIMELINE_GAP=<seconds>` (or the `timeline_gap` argument).
+"""
+import os
+from typing import Any, Iterable, List, NamedTuple, Optional
+
+TIMELINE_GAP: Optional[float] = (
+    float(os.environ["EDENAI_VIDEO_TIMELINE_GAP"])
+    if os.environ.get("EDENAI_VIDEO_TIMELINE_GAP")
+    else None
+)
+
+
+class Detection(NamedTuple):
+    """Detection of an entity from `start` to `end` (seconds), `item` is the
+    detection it comes from (frame, label...)"""
+
+    start: float
+    end: float
+    confidence: Optional[float]
+    item: Any
+
+
+class Segment(NamedTuple):
+    """Consecutive detections of an entity, `confidence` is their mean
+    (`None` if none of them had a confidence)"""
+
+    start: float
+    end: float
+    confidence: Optional[float]
+    detections: int
+    first: Any
+    last: Any
+
+
+def _mean(total: float, count: int) -> Optional[float]:
+    return total / count if count else None
+
+
+def merge_detections(
+    detections: Iterable[Detection], max_gap: float
+) -> List[Segment]:
+    """Merge the detections of an entity into segments
+
+    Args:
+        detections (Iterable[Detection]): detections of the entity, in any order
+        max_gap (float): max seconds between the end of a detection and the start
+            of the next one for them to be in the same segment
+
+    Returns:
+        List[Segment]: segments, by start time
+    """
+    segments: List[Segment] = []
+    start = end = 0.0
+    first: Any = None
+    last: Any = None
+    count = confidences = 0
+    total = 0.0
+    for detection in sorted(detections, key=lambda detection: detection.start):
+        if count and detection.start - end > max_gap:
+            segments.append(
+                Segment(start, end, _mean(total, confidences), count, first, last)
+            )
+            count = confidences = 0
+            total = 0.0
+        if not count:
+            start, end, first = detection.start, detection.end, detection.item
+        end = max(end, detection.end)
+        last = detection.item
+        count += 1
+        if detection.confidence is not None:
+            total += detection.confidence
+            confidences += 1
+    if count:
+        segments.append(
+            Segment(start, end, _mean(total, confidences), count, first, last)
+        )
+    return segments
+
+
+def segment_bounds(segment: Segment) -> List[Any]:
+    """First and last frames (pydantic models with a `confidence`) of a segment,
+    or only the first one if it has a single frame, with the segment confidence"""
+    update = {"confidence": segment.confidence}
+    bounds = [segment.first.model_copy(update=update)]
+    if segment.detections > 1:
+        bounds.append(segment.last.model_copy(update=update))
+    return bounds
+
+def compact_timeline(standardized_response: Any, max_gap: Optional[float]) -> Any:
+    """Compacted `standardized_response` if it has a timeline to compact (see
+    `compact_timeline` methods of the video dataclasses), as is otherwise or if
+    `max_gap` is `None`"""
+    if max_gap is None or not hasattr(standardized_response, "compact_timeline"):
+        return standardized_response
+    return standardized_response.compact_timeline(max_gap)
+
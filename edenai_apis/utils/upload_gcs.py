@@ -1,16 +1,24 @@
 import datetime
 import logging
 import json
+import math
 import os
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from typing import Callable, Tuple
-from uuid import uuid4
 
 from google.cloud import storage
 
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.settings import keys_path
+from edenai_apis.utils.content_upload import (
+    UPLOAD_CHUNK_SIZE,
+    UPLOAD_CONCURRENCY,
+    UploadedFile,
+    deduplicated_upload,
+    deduplicated_url,
+)
 
 # Get BUCKET from an enviroment variable BUCKET_NAME
 BUCKET = os.getenv("BUCKET_NAME")
@@ -22,6 +30,9 @@ USER_PROCESS = "users_process"
 URL_SHORT_PERIOD = 3600
 URL_LONG_PERIOD = 3600 * 24 * 7
 
+# max number of objects composed into one
+MAX_COMPOSE_SOURCES = 32
+
 def set_time_and_presigned_url_process(process_type: str) -> Tuple[Callable, int, str]:
     """Returns a tuple with the appropriate function to call, the URL expiration time, and the bucket to which
     the file will be uploaded, depending on the process type
@@ -49,10 +60,62 @@ def set_time_and_presigned_url_process(process_type):
     # Replace this with the actual implementation
     return (lambda name, time: (name, time), 0, "my_bucket")
 
+def _upload_file_by_chunks(
+    bucket: storage.Bucket, blob: storage.Blob, file_path: str
+) -> None:
+    """Upload the chunks of a large file in parallel, then compose them into
+    `blob`"""
+    size = os.path.getsize(file_path)
+    chunk_size = max(UPLOAD_CHUNK_SIZE, math.ceil(size / MAX_COMPOSE_SOURCES))
+    parts = [
+        bucket.blob(f"{blob.name}.part-{index}")
+        for index in range(math.ceil(size / chunk_size))
+    ]
+
+    def upload_part(index: int) -> None:
+        with open(file_path, "rb") as file:
+            file.seek(index * chunk_size)
+            parts[index].upload_from_string(
+                file.read(chunk_size), content_type="application/octet-stream"
+            )
+
+    with ThreadPoolExecutor(max_workers=UPLOAD_CONCURRENCY) as executor:
+        list(executor.map(upload_part, range(len(parts))))
+    blob.compose(parts)
+    for part in parts:
+        try:
+            part.delete()
+        except Exception as e:
+            logging.warning(f"Could not delete {part.name}: {str(e)}")
+
+
+def upload_to_gcs_bucket(
+    bucket: storage.Bucket, file: UploadedFile, file_name: str
+) -> str:
+    """Upload a file path or BytesIO to a GCS bucket under its content key,
+    unless it is already there (see `utils.content_upload`)
+
+    Returns:
+        str: key of the file in the bucket
+    """
+
+    def upload(key: str) -> None:
+        blob = bucket.blob(key)
+        if not isinstance(file, str):
+            blob.upload_from_string(file.getvalue())
+        elif os.path.getsize(file) > UPLOAD_CHUNK_SIZE:
+            _upload_file_by_chunks(bucket, blob, file)
+        else:
+            blob.upload_from_filename(file)
+
+    return deduplicated_upload(
+        file, file_name, bucket.name, lambda key: bucket.blob(key).exists(), upload
+    )
+
+
 def upload_file_to_gcs(file_path: str, file_name: str, process_type=PROVIDER_PROCESS):
     """Upload file to GCS"""
     try:
-        filename = f"{uuid4()}_{file_name}"
         gcs_client = gcs_client_load()
         bucket_name = set_time_and_presigned_url_process(process_type)[2]
         
@@ -61,15 +124,14 @@ def upload_file_to_gcs(file_path: str, file_name: str, process_type=PROVIDER_PRO
             raise ValueError("Bucket name is empty")
 
         bucket = gcs_client.bucket(bucket_name)
-        blob = bucket.blob(filename)
 
         # Check if file_path is valid
         if not file_path:
             raise ValueError("File path is empty")
 
-        blob.upload_from_filename(file_path, rewind=True)
+        filename = upload_to_gcs_bucket(bucket, file_path, file_name)
         func_call, process_time, _ = set_time_and_presigned_url_process(process_type)
-        return func_call(blob.name, process_time)
+        return deduplicated_url(bucket_name, filename, process_time, func_call)
     except IndexError as e:
         logging.error(f"IndexError: {str(e)}")
         raise
@@ -80,7 +142,6 @@ def upload_file_to_gcs(file_path: str, file_name: str, process_type=PROVIDER_PRO
 def upload_file_bytes_to_gcs(file_bytes, file_name, bucket_name):
     """Upload file bytes to GCS"""
     try:
-        filename = f"{uuid4()}_{file_name}"
         gcs_client = gcs_client_load()
 
         process_time = URL_SHORT_PERIOD
@@ -90,21 +151,21 @@ def upload_file_bytes_to_gcs(file_bytes, file_name, bucket_name):
             raise ValueError("Bucket name is empty")
 
         bucket = gcs_client.bucket(bucket_name)
-        blob = bucket.blob(filename)
 
         # Check if file_bytes is valid
         if not file_bytes:
             raise ValueError("File bytes are empty")
 
-        blob.upload_from_string(file_bytes.getvalue())
+        filename = upload_to_gcs_bucket(bucket, file_bytes, file_name)
         logging.info(f"File {file_name} uploaded to bucket {bucket_name} successfully.")
 
-        url = blob.generate_signed_url(
-            expiration=datetime.timedelta(seconds=process_time),
-            version="v4",
-        )
+        def sign(key: str, period: int) -> str:
+            return bucket.blob(key).generate_signed_url(
+                expiration=datetime.timedelta(seconds=period),
+                version="v4",
+            )
 
-        return url
+        return deduplicated_url(bucket_name, filename, process_time, sign)
 
     except IndexError as e:
         logging.error(f"IndexError: {str(e)}")
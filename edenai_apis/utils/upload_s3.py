@@ -3,9 +3,10 @@ import json
 import os
 from io import BytesIO
 from typing import Callable, Tuple
-from uuid import uuid4
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
 from botocore.signers import CloudFrontSigner
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes, serialization
@@ -14,6 +15,13 @@ from cryptography.hazmat.primitives.asymmetric import padding
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.settings import keys_path
+from edenai_apis.utils.content_upload import (
+    UPLOAD_CHUNK_SIZE,
+    UPLOAD_CONCURRENCY,
+    UploadedFile,
+    deduplicated_upload,
+    deduplicated_url,
+)
 
 BUCKET = ""
 BUCKET_RESSOURCE = ""
@@ -27,6 +35,13 @@ USER_PROCESS = "users_process"
 URL_SHORT_PERIOD = 3600
 URL_LONG_PERIOD = 3600 * 24 * 7
 
+# files larger than one chunk are sent by multipart upload, chunks in parallel
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=UPLOAD_CHUNK_SIZE,
+    multipart_chunksize=UPLOAD_CHUNK_SIZE,
+    max_concurrency=UPLOAD_CONCURRENCY,
+)
+
 
 def set_time_and_presigned_url_process(process_type: str) -> Tuple[Callable, int, str]:
     """Returns A tuple with the adequat function to call, the url expiration time and the bucket to which
@@ -71,24 +86,58 @@ def s3_client_load():
     )
 
 
+def s3_object_exists(s3_client, bucket: str, key: str) -> bool:
+    """Whether a key is in a s3 bucket"""
+    try:
+        s3_client.head_object(Bucket=bucket, Key=key)
+    except ClientError as exc:
+        if exc.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+            return False
+        raise
+    return True
+
+
+def upload_to_s3_bucket(
+    s3_client, file: UploadedFile, bucket: str, file_name: str
+) -> str:
+    """Upload a file path or file object to a s3 bucket under its content key,
+    unless it is already there (see `utils.content_upload`)
+
+    Returns:
+        str: key of the file in the bucket
+    """
+
+    def upload(key: str) -> None:
+        if isinstance(file, str):
+            s3_client.upload_file(file, bucket, key, Config=TRANSFER_CONFIG)
+        else:
+            s3_client.upload_fileobj(file, bucket, key, Config=TRANSFER_CONFIG)
+
+    return deduplicated_upload(
+        file,
+        file_name,
+        bucket,
+        lambda key: s3_object_exists(s3_client, bucket, key),
+        upload,
+    )
+
+
 def upload_file_to_s3(file_path: str, file_name: str, process_type=PROVIDER_PROCESS):
     """Upload file to s3"""
-    filename = str(uuid4()) + "_" + str(file_name)
     s3_client = s3_client_load()
     func_call, process_time, bucket = set_time_and_presigned_url_process(process_type)
-    s3_client.upload_file(file_path, bucket, filename)
-    return func_call(filename, process_time)
+    filename = upload_to_s3_bucket(s3_client, file_path, bucket, file_name)
+    return deduplicated_url(bucket, filename, process_time, func_call)
 
 
 def upload_file_bytes_to_s3(
     file: BytesIO, file_name: str, process_type: str = PROVIDER_PROCESS
 ) -> str:
     """Upload file byte to s3"""
-    filename = str(uuid4()) + "_" + str(file_name)
     s3_client = s3_client_load()
     func_call, process_time, bucket = set_time_and_presigned_url_process(process_type)
-    s3_client.upload_fileobj(file, bucket, filename)
-    return func_call(filename, process_time)
+    filename = upload_to_s3_bucket(s3_client, file, bucket, file_name)
+    return deduplicated_url(bucket, filename, process_time, func_call)
 
 
 def get_cloud_front_file_url(filename: str, process_time: int) -> str: